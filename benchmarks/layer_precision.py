@@ -0,0 +1,72 @@
+"""
+Benchmark of the transmission precisions of the layers.
+
+Trains the bundled models and reports, for every precision, the size of the consensus message and the test
+accuracy of the model after restoring the transmitted layers, compared with fp32.
+
+Usage:
+    python benchmarks/layer_precision.py --dataset cifar10 --ann cnn5 mlp --epochs 1
+"""
+
+import argparse
+import copy
+
+from aioxmpp import JID
+
+from royalflush.datatypes.consensus import Consensus
+from royalflush.datatypes.consensus_manager import ConsensusManager
+from royalflush.datatypes.data import IidDatasetSettings
+from royalflush.message.precision import LAYER_PRECISIONS, reduce_layers_precision
+from royalflush.nn.model_factory import ModelManagerFactory
+
+
+def benchmark(dataset: str, ann: str, epochs: int, train_percent: float) -> None:
+    settings = IidDatasetSettings(seed=13, train_samples_percent=train_percent, test_samples_percent=1.0)
+    model_manager = ModelManagerFactory.get_manager(
+        dataset=dataset, settings=settings, ann=ann, training_epochs=epochs, seed=13
+    )
+    model_manager.train()
+    state = copy.deepcopy(model_manager.model.state_dict())
+    sender = JID.fromstr("benchmark@localhost")
+
+    results: list[tuple[str, int, float]] = []
+    for precision in LAYER_PRECISIONS:
+        layers, quantization = reduce_layers_precision(state, precision=precision)
+        message = Consensus(layers=layers, sender=sender, quantization=quantization).to_message()
+        message.sender = str(sender)
+        received = Consensus.from_message(message)
+        restored = {
+            key: ConsensusManager.apply_consensus_to_tensors(
+                main=state[key],
+                foreign=layer,
+                max_order=1,
+                epsilon_margin=0.0,  # epsilon = 1 so the result is the restored foreign layer
+                quantization=received.quantization.get(key),
+            ).to(state[key].dtype)
+            for key, layer in received.layers.items()
+        }
+        model_manager.replace_all_layers(restored)
+        accuracy = model_manager.test_inference().accuracy
+        results.append((precision, len(message.body), accuracy))
+    model_manager.replace_all_layers(state)
+
+    _, fp32_size, fp32_accuracy = results[0]
+    print(f"{dataset} {ann}")
+    print(f"{'precision':<14}{'bytes':>12}{'ratio':>8}{'accuracy':>10}{'delta':>10}")
+    for precision, size, accuracy in results:
+        print(f"{precision:<14}{size:>12}{fp32_size / size:>8.2f}{accuracy:>10.4f}{accuracy - fp32_accuracy:>+10.4f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of the transmission precisions of the layers.")
+    parser.add_argument("--dataset", default="cifar10", choices=["cifar10", "cifar100", "mnist"])
+    parser.add_argument("--ann", nargs="+", default=["cnn5", "mlp"], choices=["cnn5", "mlp"])
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--train-percent", type=float, default=0.1)
+    args = parser.parse_args()
+    for ann in args.ann:
+        benchmark(dataset=args.dataset, ann=ann, epochs=args.epochs, train_percent=args.train_percent)
+
+
+if __name__ == "__main__":
+    main()
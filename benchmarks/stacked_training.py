@@ -0,0 +1,82 @@
+"""
+Benchmark of the stacked training of several agents.
+
+Trains the same models once sequentially with `ModelManager.train` and once at the same time with
+`StackedTrainer`, on random data with the shape of the dataset, and reports the samples per second of both.
+
+Usage:
+    python benchmarks/stacked_training.py --dataset cifar10 --ann cnn5 mlp --agents 8 --samples 512
+"""
+
+import argparse
+import time
+
+import torch
+from torch import nn
+from torch.optim import Adam
+from torch.utils.data import DataLoader, TensorDataset
+
+from royalflush.datatypes.data import DataLoaders
+from royalflush.datatypes.models import ModelManager
+from royalflush.nn.model_factory import ModelManagerFactory
+from royalflush.nn.stacked_trainer import StackedTrainer
+
+
+def build_model_managers(dataset: str, ann: str, agents: int, samples: int) -> list[ModelManager]:
+    torch.manual_seed(13)
+    input_dim = (1, 28, 28) if dataset == "mnist" else (3, 32, 32)
+    out_classes = 100 if dataset == "cifar100" else 10
+    model_managers: list[ModelManager] = []
+    for _ in range(agents):
+        model = ModelManagerFactory.get_ann(dataset=dataset, ann=ann)
+        dataset_ = TensorDataset(torch.randn((samples,) + input_dim), torch.randint(0, out_classes, (samples,)))
+        dataloader = DataLoader(dataset_, batch_size=64, shuffle=True)
+        model_managers.append(
+            ModelManager(
+                model=model,
+                criterion=nn.CrossEntropyLoss(),
+                optimizer=Adam(model.parameters(), lr=1e-3, betas=(0.9, 0.999), eps=1e-7),
+                batch_size=64,
+                training_epochs=1,
+                dataloaders=DataLoaders(train=dataloader, validation=dataloader, test=dataloader),
+                device="cpu",
+            )
+        )
+    return model_managers
+
+
+def benchmark(dataset: str, ann: str, agents: int, samples: int, epochs: int) -> None:
+    total_samples = agents * samples * epochs
+
+    model_managers = build_model_managers(dataset=dataset, ann=ann, agents=agents, samples=samples)
+    start = time.perf_counter()
+    for model_manager in model_managers:
+        model_manager.train(epochs=epochs)
+    sequential = total_samples / (time.perf_counter() - start)
+
+    model_managers = build_model_managers(dataset=dataset, ann=ann, agents=agents, samples=samples)
+    trainer = StackedTrainer(model_managers)
+    start = time.perf_counter()
+    trainer.train(epochs=epochs)
+    stacked = total_samples / (time.perf_counter() - start)
+
+    print(f"{dataset} {ann} agents={agents} threads={torch.get_num_threads()}")
+    print(f"{'mode':<12}{'samples/s':>12}{'speedup':>10}")
+    print(f"{'sequential':<12}{sequential:>12.1f}{1:>10.2f}")
+    print(f"{'stacked':<12}{stacked:>12.1f}{stacked / sequential:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of the stacked training of several agents.")
+    parser.add_argument("--dataset", default="cifar10", choices=["cifar10", "cifar100", "mnist"])
+    parser.add_argument("--ann", nargs="+", default=["cnn5", "mlp"], choices=["cnn5", "mlp"])
+    parser.add_argument("--agents", type=int, default=8)
+    parser.add_argument("--samples", type=int, default=512, help="Training samples of each agent.")
+    parser.add_argument("--epochs", type=int, default=1)
+    args = parser.parse_args()
+    for ann in args.ann:
+        benchmark(dataset=args.dataset, ann=ann, agents=args.agents, samples=args.samples, epochs=args.epochs)
+
+
+if __name__ == "__main__":
+    main()
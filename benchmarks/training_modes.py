@@ -0,0 +1,61 @@
+"""
+Benchmark of the training modes of the model manager on CPU.
+
+Trains the bundled models in eager mode, with the compiled forward (`compile_model`) and with bf16 autocast
+(`mixed_precision`), and reports for every mode the training time, the samples per second of the last epoch, which
+excludes the compilation, and the test accuracy.
+
+Usage:
+    python benchmarks/training_modes.py --dataset cifar10 --ann cnn5 mlp --epochs 2
+"""
+
+import argparse
+import time
+
+from royalflush.datatypes.data import IidDatasetSettings
+from royalflush.nn.model_factory import ModelManagerFactory
+
+MODES: dict[str, dict[str, str | bool]] = {
+    "eager": {"mixed_precision": "fp32", "compile_model": False},
+    "compiled": {"mixed_precision": "fp32", "compile_model": True},
+    "bf16": {"mixed_precision": "bf16", "compile_model": False},
+}
+
+
+def benchmark(dataset: str, ann: str, epochs: int, train_percent: float, modes: list[str]) -> None:
+    settings = IidDatasetSettings(seed=13, train_samples_percent=train_percent, test_samples_percent=1.0)
+    print(f"{dataset} {ann}")
+    print(f"{'mode':<10}{'seconds':>10}{'samples/s':>12}{'accuracy':>10}")
+    for mode in modes:
+        model_manager = ModelManagerFactory.get_manager(
+            dataset=dataset,
+            settings=settings,
+            ann=ann,
+            training_epochs=epochs,
+            seed=13,
+            mixed_precision=str(MODES[mode]["mixed_precision"]),
+            compile_model=bool(MODES[mode]["compile_model"]),
+        )
+        start = time.perf_counter()
+        metrics = model_manager.train()
+        seconds = time.perf_counter() - start
+        samples = len(model_manager.dataloaders.train.dataset)  # type: ignore[arg-type]
+        samples_per_second = samples / metrics[-1].time_elapsed().total_seconds()
+        accuracy = model_manager.test_inference().accuracy
+        print(f"{mode:<10}{seconds:>10.2f}{samples_per_second:>12.1f}{accuracy:>10.4f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark of the training modes of the model manager on CPU.")
+    parser.add_argument("--dataset", default="cifar10", choices=["cifar10", "cifar100", "mnist"])
+    parser.add_argument("--ann", nargs="+", default=["cnn5", "mlp"], choices=["cnn5", "mlp"])
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--train-percent", type=float, default=0.1)
+    args = parser.parse_args()
+    for ann in args.ann:
+        benchmark(dataset=args.dataset, ann=ann, epochs=args.epochs, train_percent=args.train_percent, modes=args.modes)
+
+
+if __name__ == "__main__":
+    main()
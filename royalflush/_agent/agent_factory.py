@@ -45,6 +45,27 @@ def create_dataset_settings(distribution: str, num_clients: int, client_index: i
     raise NotImplementedError(f"Distribution of dataset {dist_lower} does not exist.")
 
 
+def shard_agents(localparts: List[str], shard_index: int, num_shards: int) -> List[str]:
+    """
+    Selects the agents run by a shard. The agents are assigned to the shards in round-robin order, so the shards
+    have the same number of agents (plus or minus one).
+
+    Args:
+        localparts (List[str]): The localparts of all the agents of the experiment, in the order of the graph.
+        shard_index (int): Index of the shard, from 0 to `num_shards - 1`.
+        num_shards (int): Number of shards.
+
+    Raises:
+        ValueError: If the shard index is not in [0, num_shards).
+
+    Returns:
+        List[str]: The localparts of the agents of the shard.
+    """
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(f"The shard index must be in [0, {num_shards}) and it is {shard_index}.")
+    return localparts[shard_index::num_shards]
+
+
 def create_experiment_agent(
     algorithm: str,
     jid: str,
@@ -58,6 +79,7 @@ def create_experiment_agent(
     coordinator: JID,
     max_rounds: int = 70,
     verify_security: bool = False,
+    transport: str = "xmpp",
 ) -> PremioFlAgent:
     if algorithm.lower() == "acol":
         return AcolAgent(
@@ -72,6 +94,7 @@ def create_experiment_agent(
             coordinator=coordinator,
             max_rounds=max_rounds,
             verify_security=verify_security,
+            transport=transport,
         )
     if algorithm.lower() == "macofl":
         return MacoflAgent(
@@ -86,6 +109,7 @@ def create_experiment_agent(
             coordinator=coordinator,
             max_rounds=max_rounds,
             verify_security=verify_security,
+            transport=transport,
         )
     if algorithm.lower() == "pmacofl_min":
         return PmacoflMinAgent(
@@ -100,6 +124,7 @@ def create_experiment_agent(
             coordinator=coordinator,
             max_rounds=max_rounds,
             verify_security=verify_security,
+            transport=transport,
         )
     if algorithm.lower() == "pmacofl_max":
         return PmacoflMaxAgent(
@@ -114,6 +139,7 @@ def create_experiment_agent(
             coordinator=coordinator,
             max_rounds=max_rounds,
             verify_security=verify_security,
+            transport=transport,
         )
     raise NotImplementedError(f"Algorithm {algorithm.lower()} not recognized.")
 
@@ -140,9 +166,13 @@ class AgentFactory:
         self.max_message_size = max_message_size
         self.verify_security = verify_security
 
-    def create_agents(self) -> List[PremioFlAgent]:
+    def create_agents(self, shard_index: int = 0, num_shards: int = 1) -> List[PremioFlAgent]:
         """
         Create and return a list of FL agents based on the Experiment data and graph structure.
+
+        Args:
+            shard_index (int, optional): Index of the shard whose agents are created. Defaults to 0.
+            num_shards (int, optional): Number of shards of the experiment. Defaults to 1 (all the agents).
         """
         algorithm_rounds = self.experiment.algorithm_rounds or 120
         consensus_iterations = self.experiment.consensus_iterations or 10
@@ -160,7 +190,10 @@ class AgentFactory:
         logger.debug(f"The minimum order (not used) based on the graph is: {min_order}.")
         logger.info(f"The maximum order based on the graph is: {max_order}.")
 
+        shard_localparts = set(shard_agents(list(agent_localparts.keys()), shard_index, num_shards))
         for index, localpart in enumerate(agent_localparts.keys()):
+            if localpart not in shard_localparts:
+                continue
             agent_jid = JID.fromstr(f"{localpart}@{self.experiment.xmpp_domain}")
             neighbor_localparts = agent_localparts[localpart]
             neighbours = [JID.fromstr(f"{n}@{self.experiment.xmpp_domain}") for n in neighbor_localparts]
@@ -179,6 +212,11 @@ class AgentFactory:
                 ann=self.experiment.ann,
                 training_epochs=self.experiment.training_epochs,
                 seed=self.experiment.seed,
+                double_buffered=self.experiment.double_buffered,
+                training_executor=self.experiment.training_executor,
+                mixed_precision=self.experiment.mixed_precision,
+                compile_model=self.experiment.compile_model,
+                gradient_check_interval=self.experiment.gradient_check_interval,
             )
 
             # Create consensus manager
@@ -187,6 +225,14 @@ class AgentFactory:
                 max_order=max_order,
                 max_seconds_to_accept_consensus=24 * 60 * 60,
                 consensus_iterations=consensus_iterations,
+                layer_format=self.experiment.layer_format,
+                compression=self.experiment.compression,
+                layer_precision=self.experiment.layer_precision,
+                sparsification_ratio=self.experiment.sparsification_ratio,
+                delta_encoding=self.experiment.delta_encoding,
+                batched_consensus=self.experiment.batched_consensus,
+                inbox_capacity=self.experiment.inbox_capacity,
+                inbox_overflow=self.experiment.inbox_overflow,
             )
 
             # Create similarity manager
@@ -212,6 +258,7 @@ class AgentFactory:
                 coordinator=self.coordinator_jid,
                 max_rounds=algorithm_rounds,
                 verify_security=self.verify_security,
+                transport=self.experiment.transport,
             )
             agents.append(agent)
 
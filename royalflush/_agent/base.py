@@ -1,9 +1,10 @@
+import json
 import traceback
 from abc import ABCMeta, abstractmethod
 from queue import Queue
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional
 
-from aioxmpp import JID, PresenceType
+from aioxmpp import JID, PresenceState, PresenceType
 from aioxmpp.stanza import Presence
 from spade.agent import Agent
 from spade.message import Message
@@ -11,6 +12,7 @@ from spade.template import Template
 from torch import Tensor
 
 from .._behaviour.coordination import PresenceNodeFSM
+from .._behaviour.multipart import MultipartRetransmissionBehaviour
 from .._behaviour.premiofl.fsm import PremioFsmBehaviour
 from .._behaviour.premiofl.layer_receiver import LayerReceiverBehaviour
 from .._behaviour.premiofl.similarity_receiver import SimilarityReceiverBehaviour
@@ -22,8 +24,11 @@ from ..log.data import DataSplitLogManager
 from ..log.general import GeneralLogManager
 from ..log.message import MessageLogManager
 from ..log.nn import NnConvergenceLogManager, NnInferenceLogManager, NnTrainLogManager
+from ..message.compression import COMPRESSION_CODECS, negotiate_compression_codec
+from ..message.loopback import LOOPBACK_TRANSPORT, TRANSPORTS
 from ..message.message import RfMessage
 from ..message.multipart import MultipartHandler
+from ..message.precision import reduce_layers_precision
 from ..similarity.similarity_manager import SimilarityManager
 from ..similarity.similarity_vector import SimilarityVector
 
@@ -40,11 +45,15 @@ class AgentBase(Agent):
         web_address: str = "0.0.0.0",
         web_port: int = 10000,
         verify_security: bool = False,
+        transport: str = "xmpp",
     ):
+        if transport.lower() not in TRANSPORTS:
+            raise NotImplementedError(f"Transport {transport} is not valid. Valid transports: {TRANSPORTS}.")
         extra_log_name = f"agent.{JID.fromstr(jid).localpart}"
         self.logger = GeneralLogManager(extra_logger_name=extra_log_name)
         self.message_logger = MessageLogManager(extra_logger_name=extra_log_name)
         self.max_message_size = max_message_size
+        self.transport = transport.lower()
         self.web_address = web_address
         self.web_port = web_port
         self._multipart_handler = MultipartHandler()
@@ -52,15 +61,38 @@ class AgentBase(Agent):
 
     async def setup(self) -> None:
         self.setup_presence_handlers()
+        self.add_behaviour(MultipartRetransmissionBehaviour(), Template(metadata={"rf.multipart": "nack"}))
+        if self.transport == "loopback":
+            LOOPBACK_TRANSPORT.register(self)
+
+    async def stop(self) -> None:
+        LOOPBACK_TRANSPORT.unregister(self)
+        await super().stop()
+
+    def is_loopback_reachable(self, jid: JID) -> bool:
+        """
+        Returns whether the messages to the agent are delivered through the in-process loopback transport
+        instead of XMPP.
+
+        Args:
+            jid (JID): The receiver of the messages.
+
+        Returns:
+            bool: True if this agent uses the loopback transport and the receiver runs in the same process.
+        """
+        return self.transport == "loopback" and LOOPBACK_TRANSPORT.is_reachable(jid)
 
     async def send(self, message: Message, behaviour: Optional["CyclicBehaviour"] = None) -> None:
-        messages = self._multipart_handler.generate_multipart_messages(
+        if self.is_loopback_reachable(message.to):
+            # The message is not split because it is not serialized or sent through the XMPP server
+            LOOPBACK_TRANSPORT.deliver(message)
+            self.logger.debug(f"Message ({message.sender.bare()}) -> ({message.to.bare()}): through loopback")
+            return
+        messages = self._multipart_handler.iter_multipart_messages(
             content=message.body,
             max_size=self.max_message_size,
             message_base=message,
         )
-        if messages is None:
-            messages = [message]
         for msg in messages:
             if behaviour is not None:
                 await behaviour.send(msg=msg)
@@ -68,7 +100,7 @@ class AgentBase(Agent):
                 futures = self.dispatch(msg=msg)
                 for f in futures:
                     f.result()
-            self.logger.debug(f"Message ({msg.sender.bare()}) -> ({msg.to.bare()}): {msg.body}")
+            self.logger.debug(f"Message ({msg.sender.bare()}) -> ({msg.to.bare()}): with length {len(msg.body)}")
 
     async def receive(self, behaviour: "CyclicBehaviour", timeout: None | float = 0) -> RfMessage | None:
         """
@@ -91,7 +123,14 @@ class AgentBase(Agent):
             if is_multipart:
                 header = self._multipart_handler.get_header(msg.body)
                 self.logger.debug(f"Multipart message received from {msg.sender}: {header} with length {len(msg.body)}")
+                stats = self._multipart_handler.get_stats()
                 multipart_msg = self._multipart_handler.rebuild_multipart(message=msg)
+                new_stats = self._multipart_handler.get_stats()
+                if (
+                    new_stats["expired_transfers"] > stats["expired_transfers"]
+                    or new_stats["evicted_transfers"] > stats["evicted_transfers"]
+                ):
+                    self.logger.warning(f"Incomplete multipart messages removed: {new_stats}")
                 is_multipart_completed = multipart_msg is not None
                 if is_multipart_completed:
                     return RfMessage.from_message(
@@ -141,6 +180,7 @@ class AgentNodeBase(AgentBase):
         web_address: str = "0.0.0.0",
         web_port: int = 10000,
         verify_security: bool = False,
+        transport: str = "xmpp",
     ):
 
         self.observers = [] if observers is None else observers
@@ -155,6 +195,7 @@ class AgentNodeBase(AgentBase):
             web_address=web_address,
             web_port=web_port,
             verify_security=verify_security,
+            transport=transport,
         )
 
     async def setup(self) -> None:
@@ -197,6 +238,45 @@ class AgentNodeBase(AgentBase):
             return False
         return all(data["subscription"] == "both" for data in contacts.values())
 
+    def get_capabilities(self) -> dict[str, Any]:
+        """
+        Returns the capabilities that this agent advertises to its neighbours in the presence status,
+        e.g. the compression codecs that it is able to decode.
+
+        Returns:
+            dict[str, Any]: The capabilities or an empty dict if there is nothing to advertise.
+        """
+        return {}
+
+    def set_available_with_capabilities(self) -> None:
+        """
+        Sets the agent as available and broadcasts its capabilities in the presence status.
+        """
+        capabilities = self.get_capabilities()
+        status = json.dumps(capabilities) if capabilities else None
+        self.presence.set_presence(state=PresenceState(available=True, show=self.presence.state.show), status=status)
+
+    def get_neighbour_capabilities(self, neighbour: JID) -> None | dict[str, Any]:
+        """
+        Returns the capabilities advertised by the neighbour in its presence status.
+
+        Args:
+            neighbour (JID): The neighbour.
+
+        Returns:
+            None | dict[str, Any]: The capabilities or None if the neighbour has not advertised them.
+        """
+        contacts: dict[JID, dict[str, str | Presence]] = self.presence.get_contacts()
+        contact_info = contacts.get(neighbour.bare(), {})
+        presence = contact_info.get("presence")
+        if not isinstance(presence, Presence) or not presence.status:
+            return None
+        try:
+            capabilities = json.loads(presence.status.any())
+        except (ValueError, TypeError):
+            return None
+        return capabilities if isinstance(capabilities, dict) else None
+
     def get_available_neighbours(self) -> list[JID]:
         available_contacts: list[JID] = []
         contacts: dict[JID, dict[str, str | Presence]] = self.presence.get_contacts()
@@ -227,6 +307,7 @@ class CoalitionAgentNodeBase(AgentNodeBase):
         web_address: str = "0.0.0.0",
         web_port: int = 10000,
         verify_security: bool = False,
+        transport: str = "xmpp",
     ) -> None:
         self.coalition_id = coalition_id
         neighbours = [] if neighbours is None else neighbours
@@ -252,6 +333,7 @@ class CoalitionAgentNodeBase(AgentNodeBase):
             web_address,
             web_port,
             verify_security,
+            transport,
         )
 
     def get_coalition_neighbours(self) -> list[JID]:
@@ -278,6 +360,7 @@ class PremioFlAgent(AgentNodeBase, metaclass=ABCMeta):
         web_address: str = "0.0.0.0",
         web_port: int = 10000,
         verify_security: bool = False,
+        transport: str = "xmpp",
     ):
         localpart: str = str(JID.fromstr(jid).localpart)
         extra_name = f"agent.{localpart}"
@@ -332,8 +415,27 @@ class PremioFlAgent(AgentNodeBase, metaclass=ABCMeta):
             web_address,
             web_port,
             verify_security,
+            transport,
         )
 
+    def get_capabilities(self) -> dict[str, Any]:
+        return {"compression": list(COMPRESSION_CODECS.keys())}
+
+    def get_compression_codec(self, neighbour: JID) -> str:
+        """
+        Negotiates the compression codec of the link with the neighbour: the codec configured in the
+        consensus manager if the neighbour advertised it and "none" otherwise.
+
+        Args:
+            neighbour (JID): The neighbour that will receive the layers.
+
+        Returns:
+            str: The name of the compression codec.
+        """
+        capabilities = self.get_neighbour_capabilities(neighbour)
+        supported = None if capabilities is None else capabilities.get("compression")
+        return negotiate_compression_codec(preferred=self.consensus_manager.compression, supported=supported)
+
     def select_neighbours(self) -> list[JID]:
         """
         Get the selected available neighbours to share the model layers, based on the implementation criteria.
@@ -422,23 +524,115 @@ class PremioFlAgent(AgentNodeBase, metaclass=ABCMeta):
         metadata: None | dict[str, str] = None,
         behaviour: Optional["CyclicBehaviour"] = None,
     ) -> None:
-        ct = Consensus(layers=layers, sender=self.jid, request_reply=request_reply)
-        msg = ct.to_message()
+        consensus_manager = self.consensus_manager
+        sparsifier = consensus_manager.sparsifier
+        loopback = self.is_loopback_reachable(neighbour)
+        # The loopback transport does not encode the layers, so there is no codec to negotiate
+        compression = "none" if loopback else self.get_compression_codec(neighbour)
+        acknowledged_version = consensus_manager.delta_manager.get_acknowledgement(neighbour)
+        sparse_acknowledged_version = consensus_manager.get_sparse_acknowledgement(neighbour)
+        if loopback and sparsifier is None and not consensus_manager.delta_encoding:
+            # The neighbours in this process share a snapshot of the layers per model version instead of a payload
+            cache_key: tuple[Hashable, ...] = (tuple(layers.keys()), consensus_manager.layer_precision, "loopback")
+            payload = consensus_manager.payload_cache.get(version=self.model_manager.version, key=cache_key)
+            if payload is None:
+                reduced_layers, quantization = reduce_layers_precision(
+                    layers, precision=consensus_manager.layer_precision
+                )
+                payload = {
+                    "layers": {name: layer.detach().clone() for name, layer in reduced_layers.items()},
+                    "quantization": quantization,
+                }
+                consensus_manager.payload_cache.put(version=self.model_manager.version, key=cache_key, payload=payload)
+            ct = Consensus(
+                layers=payload["layers"],
+                sender=self.jid,
+                request_reply=request_reply,
+                quantization=payload["quantization"],
+                acknowledged_version=acknowledged_version,
+                sparse_acknowledged_version=sparse_acknowledged_version,
+            )
+            msg = ct.to_loopback_message()
+        elif sparsifier is None and not consensus_manager.delta_encoding:
+            # The payload does not depend on the neighbour, so it is encoded once per model version
+            cache_key = (
+                tuple(layers.keys()),
+                consensus_manager.layer_precision,
+                consensus_manager.layer_format,
+                compression,
+            )
+            payload = consensus_manager.payload_cache.get(version=self.model_manager.version, key=cache_key)
+            if payload is None:
+                reduced_layers, quantization = reduce_layers_precision(
+                    layers, precision=consensus_manager.layer_precision
+                )
+                payload = Consensus(layers=reduced_layers, quantization=quantization).encode_payload(
+                    layer_format=consensus_manager.layer_format, compression=compression
+                )
+                consensus_manager.payload_cache.put(version=self.model_manager.version, key=cache_key, payload=payload)
+            ct = Consensus(
+                layers=layers,
+                sender=self.jid,
+                request_reply=request_reply,
+                acknowledged_version=acknowledged_version,
+                sparse_acknowledged_version=sparse_acknowledged_version,
+            )
+            msg = ct.to_message(layer_format=consensus_manager.layer_format, compression=compression, payload=payload)
+        else:
+            dtypes = {name: layer.dtype for name, layer in layers.items()}
+            indices: Dict[str, Tensor] = {}
+            sparse_version: None | int = None
+            sparse_base_version: None | int = None
+            if sparsifier is not None:
+                layers, indices, sparse_base_version = sparsifier.sparsify(neighbour, layers)
+            layers, quantization = reduce_layers_precision(layers, precision=consensus_manager.layer_precision)
+            if sparsifier is not None:
+                # The references only move forward when the neighbour acknowledges this version
+                sparse_version = sparsifier.update_references(
+                    neighbour, sparse_base_version, layers, indices, quantization=quantization, dtypes=dtypes
+                )
+            version: None | int = None
+            delta_bases: Dict[str, int] = {}
+            if consensus_manager.delta_encoding:
+                version, layers, delta_bases = consensus_manager.delta_manager.encode(neighbour, layers)
+            ct = Consensus(
+                layers=layers,
+                sender=self.jid,
+                request_reply=request_reply,
+                quantization=quantization,
+                sparse_indices=indices,
+                sparse_stream=sparsifier is not None,
+                version=version,
+                delta_bases=delta_bases,
+                acknowledged_version=acknowledged_version,
+                sparse_version=sparse_version,
+                sparse_base_version=sparse_base_version,
+                sparse_acknowledged_version=sparse_acknowledged_version,
+            )
+            if loopback:
+                ct.layers = {name: layer.detach().clone() for name, layer in ct.layers.items()}
+                msg = ct.to_loopback_message()
+            else:
+                msg = ct.to_message(layer_format=consensus_manager.layer_format, compression=compression)
         msg.sender = str(self.jid.bare())
         msg.to = str(neighbour.bare())
         msg.thread = thread
         msg.metadata = metadata
         tag = "-REQREPLY" if request_reply else ""
-        await self.__send_message(message=msg, behaviour=behaviour, log_tag=f"-LAYERS{tag}")
+        await self.__send_message(
+            message=msg, behaviour=behaviour, log_tag=f"-LAYERS{tag}", size=Consensus.get_message_size(msg)
+        )
 
-    async def __send_message(self, message: Message, behaviour: "CyclicBehaviour", log_tag: str = "") -> None:
+    async def __send_message(
+        self, message: Message, behaviour: "CyclicBehaviour", log_tag: str = "", size: None | int = None
+    ) -> None:
         await self.send(message=message, behaviour=behaviour)
         self.message_logger.log(
             current_round=self.current_round,
             sender=message.sender,
             to=message.to,
             msg_type=f"SEND{log_tag}",
-            size=len(message.body),
+            size=len(message.body) if size is None else size,
             thread=message.thread,
         )
 
@@ -447,4 +641,6 @@ class PremioFlAgent(AgentNodeBase, metaclass=ABCMeta):
 
     async def stop(self) -> None:
         await super().stop()
+        if self.model_manager.executor is not None:
+            self.model_manager.executor.shutdown(wait=False)
         self.logger.info("Agent stopped.")
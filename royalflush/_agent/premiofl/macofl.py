@@ -28,6 +28,7 @@ class MacoflAgent(PremioFlAgent):
         web_address: str = "0.0.0.0",
         web_port: int = 10000,
         verify_security: bool = False,
+        transport: str = "xmpp",
     ):
         super().__init__(
             jid,
@@ -43,6 +44,7 @@ class MacoflAgent(PremioFlAgent):
             web_address,
             web_port,
             verify_security,
+            transport,
         )
 
     def _select_neighbours(self, neighbours: list[JID]) -> list[JID]:
@@ -58,7 +60,7 @@ class MacoflAgent(PremioFlAgent):
     ) -> dict[JID, Dict[str, Tensor]]:
         result: dict[JID, Dict[str, Tensor]] = {}
         for n in neighbours_vectors.keys():
-            layers: Dict[str, Tensor] = Dict()
+            layers: Dict[str, Tensor] = {}
             layer_name = random.choice(list(self.model_manager.model.state_dict().keys()))
             layers[layer_name] = self.model_manager.model.state_dict()[layer_name]
             result[n] = layers
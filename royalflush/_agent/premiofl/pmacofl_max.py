@@ -28,6 +28,7 @@ class PmacoflMaxAgent(PremioFlAgent):
         web_address: str = "0.0.0.0",
         web_port: int = 10000,
         verify_security: bool = False,
+        transport: str = "xmpp",
     ):
         super().__init__(
             jid,
@@ -43,6 +44,7 @@ class PmacoflMaxAgent(PremioFlAgent):
             web_address,
             web_port,
             verify_security,
+            transport,
         )
 
     def _select_neighbours(self, neighbours: list[JID]) -> list[JID]:
@@ -77,6 +79,6 @@ class PmacoflMaxAgent(PremioFlAgent):
 
             if max_layer:
                 layer_tensor = self.model_manager.model.state_dict()[max_layer]
-                result[neighbour] = Dict({max_layer: layer_tensor})
+                result[neighbour] = {max_layer: layer_tensor}
 
         return result
@@ -28,6 +28,7 @@ class PmacoflMinAgent(PremioFlAgent):
         web_address: str = "0.0.0.0",
         web_port: int = 10000,
         verify_security: bool = False,
+        transport: str = "xmpp",
     ):
         super().__init__(
             jid,
@@ -43,6 +44,7 @@ class PmacoflMinAgent(PremioFlAgent):
             web_address,
             web_port,
             verify_security,
+            transport,
         )
 
     def _select_neighbours(self, neighbours: list[JID]) -> list[JID]:
@@ -77,6 +79,6 @@ class PmacoflMinAgent(PremioFlAgent):
 
             if min_layer:
                 layer_tensor = self.model_manager.model.state_dict()[min_layer]
-                result[neighbour] = Dict({min_layer: layer_tensor})
+                result[neighbour] = {min_layer: layer_tensor}
 
         return result
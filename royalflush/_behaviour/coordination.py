@@ -25,8 +25,8 @@ class AvailableNodeState(State):
     async def on_start(self) -> None:
         if self.loops < 1:
             agent: "AgentNodeBase" = self.agent
-            agent.presence.set_available()
-            agent.logger.debug("Available.")
+            agent.set_available_with_capabilities()
+            agent.logger.debug(f"Available with capabilities: {agent.get_capabilities()}.")
             coordinator = str(self.coordinator.bare())
             message = Message(to=coordinator, sender=str(agent.jid.bare()))
             message.body = "ready to subscribe"
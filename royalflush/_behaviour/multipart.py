@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING
+
+from spade.behaviour import CyclicBehaviour
+
+if TYPE_CHECKING:
+    from .._agent.base import AgentBase
+
+
+class MultipartRetransmissionBehaviour(CyclicBehaviour):
+    """
+    Requests the missing parts of the incomplete multipart messages with NACK messages and retransmits the parts
+    requested by the NACK messages of other agents.
+    """
+
+    def __init__(self, period: float = 0.25) -> None:
+        self.agent: "AgentBase"
+        self.period = period
+        super().__init__()
+
+    async def run(self) -> None:
+        handler = self.agent._multipart_handler
+        msg = await self.receive(timeout=self.period)
+        if msg:
+            uuid4, part_numbers = handler.parse_nack_message(msg)
+            parts = handler.get_sent_parts(uuid4=uuid4, part_numbers=part_numbers)
+            for part in parts:
+                await self.send(part)
+            self.agent.logger.debug(
+                f"NACK from {msg.sender.bare()} of multipart {uuid4}: {len(parts)}/{len(part_numbers)} parts resent."
+            )
+
+        for sender, uuid4, missing_parts in handler.get_missing_parts_to_request():
+            await self.send(handler.generate_nack_message(to=sender, uuid4=uuid4, part_numbers=missing_parts))
+            self.agent.logger.debug(f"NACK to {sender.bare()} of multipart {uuid4} with missing parts {missing_parts}.")
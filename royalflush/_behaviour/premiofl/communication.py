@@ -93,7 +93,16 @@ class CommunicationState(State):
         self.agent.similarity_manager.clear_waiting_responses(neighbours, thread)
         for neighbour in neighbours:
             await self.send_similarity_vector(thread=thread, vector=vector, neighbour=neighbour)
-        return await self.agent.similarity_manager.wait_similarity_vectors()
+        all_responses_received = await self.agent.similarity_manager.wait_similarity_vectors()
+        latencies = {
+            jid.localpart: round(seconds, 3)
+            for jid, seconds in self.agent.similarity_manager.response_latencies.items()
+        }
+        self.agent.logger.debug(
+            f"[{self.agent.current_round}] Similarity vector response latencies: {latencies}. Without response: "
+            + f"{[jid.localpart for jid in self.agent.similarity_manager.waiting_responses.keys()]}."
+        )
+        return all_responses_received
 
     async def send_similarity_vector(
         self,
@@ -27,12 +27,23 @@ class LayerReceiverBehaviour(CyclicBehaviour):
                 sender=msg.sender,
                 to=msg.to,
                 msg_type="RECV-LAYERS",
-                size=len(msg.body),
+                size=Consensus.get_message_size(msg),
                 thread=msg.thread,
             )
             consensus_tr = Consensus.from_message(message=msg)
             consensus_tr.sender = msg.sender.bare()
             consensus_tr.received_time_z = datetime.now(tz=timezone.utc)  # zulu = utc+0
+            if not self.agent.consensus_manager.decode_delta_layers(consensus=consensus_tr):
+                self.agent.logger.warning(
+                    f"[{self.agent.current_round}] Consensus message from {msg.sender.bare()} discarded because"
+                    + " the base version of its delta encoded layers is not available."
+                )
+                return
+            if not self.agent.consensus_manager.reconstruct_sparse_layers(consensus=consensus_tr):
+                self.agent.logger.warning(
+                    f"[{self.agent.current_round}] Sparse layers from {msg.sender.bare()} discarded because the"
+                    + " base version of the sparse stream is not available."
+                )
 
             if not consensus_tr.sent_time_z:
                 error_msg = (
@@ -49,7 +60,11 @@ class LayerReceiverBehaviour(CyclicBehaviour):
                     f"[{self.agent.current_round}] Consensus message accepted in LayerReceiverBehaviour with "
                     + f"time elapsed {time_elapsed.total_seconds():.2f}"
                 )
-                self.agent.consensus_manager.add_consensus(consensus=consensus_tr, thread=msg.thread)
+                if not self.agent.consensus_manager.add_consensus(consensus=consensus_tr, thread=msg.thread):
+                    self.agent.logger.warning(
+                        f"[{self.agent.current_round}] Consensus message from {msg.sender.bare()} discarded because"
+                        + " the consensus inbox is full."
+                    )
 
             else:
                 self.agent.logger.debug(
@@ -57,14 +72,13 @@ class LayerReceiverBehaviour(CyclicBehaviour):
                     + f" time elapsed is {time_elapsed.total_seconds():.2f} and maximum is {max_seconds_consensus:.2f}"
                 )
 
-            if not self.agent.model_manager.is_training():
+            if self.agent.model_manager.can_serve_layers():
                 # Send consensus messages that require my response
                 pending_to_send = self.agent.consensus_manager.prepare_replies_to_send(
                     # sender=self.agent.jid.bare()
                 )
                 for consensus, thread in pending_to_send:
-                    layers = self.agent.model_manager.get_layers(layers=list(consensus.layers.keys()))
-                    await self.send_layers(neighbour=consensus.sender, layers=layers, thread=thread)
+                    await self.send_layers(neighbour=consensus.sender, layers=consensus.layers, thread=thread)
 
     async def send_layers(
         self,
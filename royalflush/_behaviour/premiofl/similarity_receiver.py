@@ -48,7 +48,14 @@ class SimilarityReceiverBehaviour(CyclicBehaviour):
                 + f"{seconds_since_message_sent.total_seconds():.2f}"
             )
 
-            if vector.request_reply:
+            if vector.request_reply and not self.agent.model_manager.can_serve_layers():
+                # The model is being trained in the training executor, the reply is sent when the training finishes
+                self.agent.similarity_manager.to_response.append((msg.sender.bare(), msg.thread))
+                self.agent.logger.debug(
+                    f"[{self.agent.current_round}] Similarity vector ({msg.thread}) reply to "
+                    + f"{msg.sender.bare()} deferred until the training finishes."
+                )
+            elif vector.request_reply:
                 reply_vector = self.agent.similarity_manager.get_own_similarity_vector()
                 if not reply_vector:
                     raise RuntimeError("Trying to compute the similarity vector without similarity function.")
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from spade.behaviour import State
 
 from ...datatypes.metrics import ModelMetrics
+from ...utils.training_scheduler import TRAINING_SCHEDULER
 
 if TYPE_CHECKING:
     from ..._agent.base import PremioFlAgent
@@ -35,17 +36,35 @@ class TrainState(State):
         else:
             self.agent.logger.info(f"[{self.agent.current_round}] Starting round id: " + f"{self.agent.current_round}")
 
+    def train_and_evaluate(self) -> tuple[list[ModelMetrics], ModelMetrics, ModelMetrics]:
+        """
+        Trains the model and computes the validation and test metrics. It runs in the training executor of the
+        model manager, within a slot of the training scheduler of the process.
+
+        Returns:
+            tuple[list[ModelMetrics], ModelMetrics, ModelMetrics]: The metrics of each training epoch, the
+            validation metrics and the test metrics.
+        """
+        model_manager = self.agent.model_manager
+        metrics_train = model_manager.train(
+            train_logger=self.agent.nn_train_logger,
+            weight_logger=self.agent.nn_convergence_logger,
+        )
+        return metrics_train, model_manager.inference(), model_manager.test_inference()
+
     async def run(self) -> None:
         try:
             if not self.agent.are_max_iterations_reached():
                 # Train the model
                 self.agent.logger.debug(f"[{self.agent.current_round}] Starting training...")
-                metrics_train = self.agent.model_manager.train(
-                    train_logger=self.agent.nn_train_logger,
-                    weight_logger=self.agent.nn_convergence_logger,
-                )
-                metrics_validation = self.agent.model_manager.inference()
-                metrics_test = self.agent.model_manager.test_inference()
+                # The session is opened before the executor starts, so the layers are not served from the model
+                # while it is being trained
+                model_manager = self.agent.model_manager
+                with model_manager.training_session():
+                    metrics_train, metrics_validation, metrics_test = await model_manager.run_in_executor(
+                        TRAINING_SCHEDULER.run, self.agent.name, self.train_and_evaluate
+                    )
+                await self.send_deferred_replies()
                 self.agent.nn_inference_logger.log(metrics_validation=metrics_validation, metrics_test=metrics_test)
 
                 self.log_train_results(trains=metrics_train)
@@ -56,6 +75,36 @@ class TrainState(State):
             self.agent.logger.exception(e)
             traceback.print_exc()
 
+    async def send_deferred_replies(self) -> None:
+        """
+        Sends the replies to the similarity vectors and layers requested while the model was being trained in the
+        training executor, which could not be computed from the model during the training.
+        """
+        similarity_manager = self.agent.similarity_manager
+        while similarity_manager.to_response:
+            neighbour, thread = similarity_manager.to_response.pop(0)
+            vector = similarity_manager.get_own_similarity_vector()
+            if vector is None:
+                raise RuntimeError("Trying to compute the similarity vector without similarity function.")
+            vector.owner = self.agent.jid
+            await self.agent.send_similarity_vector(
+                neighbour=neighbour,
+                vector=vector,
+                thread=thread,
+                metadata={"rf.conversation": "similarity"},
+                behaviour=self,
+            )
+        for consensus, layers_thread in self.agent.consensus_manager.prepare_replies_to_send():
+            if consensus.sender is not None:
+                await self.agent.send_local_layers(
+                    neighbour=consensus.sender,
+                    request_reply=False,
+                    layers=consensus.layers,
+                    thread=layers_thread,
+                    metadata={"rf.conversation": "layers"},
+                    behaviour=self,
+                )
+
     def log_train_results(self, trains: list[ModelMetrics]) -> None:
         if trains:
             start_t = trains[0].start_time_z
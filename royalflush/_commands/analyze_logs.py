@@ -12,6 +12,26 @@ def load_dataset(file_path: str) -> pd.DataFrame:
     return pd.read_csv(file_path)
 
 
+def load_run_dataset(folder: Path, name: str) -> pd.DataFrame:
+    """
+    Loads a CSV log of a run. The shards of a sharded run write their own files with a `.shard<index>` suffix
+    (e.g. `nn_convergence.shard0.csv`), so all the files of the log are merged.
+
+    Args:
+        folder (Path): The raw folder of the run.
+        name (str): The name of the log without extension (e.g. "nn_convergence").
+
+    Returns:
+        pd.DataFrame: The rows of all the files of the log, empty if there are none.
+    """
+    file_paths = sorted(path for path in folder.glob(f"{name}*.csv") if path.stat().st_size > 0)
+    datasets = [load_dataset(str(path)) for path in file_paths]
+    datasets = [dataset for dataset in datasets if not dataset.empty]
+    if not datasets:
+        return pd.DataFrame()
+    return pd.concat(datasets, ignore_index=True)
+
+
 def extract_agent_name(data: pd.DataFrame) -> pd.DataFrame:
     data["agent_name"] = data["agent"].str.split("@").str[0]
     return data
@@ -156,8 +176,10 @@ def analyze_logs_cmd(
     if ctx.obj.get("VERBOSE"):
         click.echo(f"Analyzing logs in folder: {folder_path}")
 
-    file_path = str(input_path / "nn_convergence.csv")
-    data = load_dataset(file_path)
+    data = load_run_dataset(input_path, "nn_convergence")
+    if data.empty:
+        click.echo(f"Error: there are no convergence logs in '{input_path}'.")
+        return
     data = extract_agent_name(data)
 
     data = preprocess_data(
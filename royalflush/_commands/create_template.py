@@ -33,7 +33,26 @@ def create_template_cmd(_: click.Context, template_file: str) -> None:
         "graph_path": "/data/user/graphs/star.gml",
         "dataset": "cifar100",
         "distribution": "non_iid diritchlet 0.1",
-        "ann": "cnn5"
+        "ann": "cnn5",
+        "layer_format": "binary",
+        "compression": "none",
+        "layer_precision": "fp32",
+        "sparsification_ratio": null,
+        "delta_encoding": false,
+        "batched_consensus": false,
+        "double_buffered": false,
+        "training_executor": "inline",
+        "shards": 1,
+        "transport": "xmpp",
+        "mixed_precision": "fp32",
+        "compile_model": false,
+        "gradient_check_interval": 0,
+        "max_concurrent_trainings": null,
+        "training_threads": null,
+        "training_interop_threads": null,
+        "cpu_affinity": false,
+        "inbox_capacity": null,
+        "inbox_overflow": "drop_oldest"
     }
 
     Args:
@@ -60,6 +79,25 @@ def create_template_cmd(_: click.Context, template_file: str) -> None:
         "dataset": "cifar100",
         "distribution": "non_iid diritchlet 0.1",
         "ann": "cnn5",
+        "layer_format": "binary",
+        "compression": "none",
+        "layer_precision": "fp32",
+        "sparsification_ratio": None,
+        "delta_encoding": False,
+        "batched_consensus": False,
+        "double_buffered": False,
+        "training_executor": "inline",
+        "shards": 1,
+        "transport": "xmpp",
+        "mixed_precision": "fp32",
+        "compile_model": False,
+        "gradient_check_interval": 0,
+        "max_concurrent_trainings": None,
+        "training_threads": None,
+        "training_interop_threads": None,
+        "cpu_affinity": False,
+        "inbox_capacity": None,
+        "inbox_overflow": "drop_oldest",
     }
 
     try:
@@ -3,13 +3,17 @@
 import asyncio
 import json
 import logging
+import multiprocessing
+import os
 import sys
 import traceback
+from multiprocessing.process import BaseProcess
 from pathlib import Path
 from typing import Any, Dict
 
 import click
 import spade
+import torch
 from aioxmpp import JID
 
 from royalflush import __version__
@@ -21,9 +25,10 @@ from .._agent.observer import ObserverAgent
 from ..datatypes.experiment import Experiment
 from ..log.general import GeneralLogManager
 from ..log.log import setup_loggers
+from ..utils.training_scheduler import TRAINING_SCHEDULER, TrainingScheduler
 
 
-async def main(experiment: Experiment) -> None:
+async def main(experiment: Experiment, log_folder: None | Path = None) -> None:
 
     xmpp_domain = experiment.xmpp_domain
     max_message_size = 250_000  # shall not be close to 262 144
@@ -73,26 +78,32 @@ async def main(experiment: Experiment) -> None:
         )
         observers.append(obs)
 
-    # Agent Factory
-    logger.debug("Initializating agents...")
-    agent_factory = AgentFactory(
-        experiment=experiment,
-        coordinator_jid=JID.fromstr(coordinator_jid_str),
-        observer_jids=observer_jids,
-        max_message_size=max_message_size,
-    )
+    # The agents run in the shard processes or in this process with the launcher
+    launcher: None | LauncherAgent = None
+    shards: list[BaseProcess] = []
+    if experiment.shards == 1:
+        configure_training_scheduler(experiment=experiment)
+
+        # Agent Factory
+        logger.debug("Initializating agents...")
+        agent_factory = AgentFactory(
+            experiment=experiment,
+            coordinator_jid=JID.fromstr(coordinator_jid_str),
+            observer_jids=observer_jids,
+            max_message_size=max_message_size,
+        )
 
-    # Launcher
-    logger.debug(f"Initializating launcher {launcher_jid_str}...")
-    launcher = LauncherAgent(
-        jid=launcher_jid_str,
-        password="123",
-        max_message_size=max_message_size,
-        agents=agent_factory.create_agents(),
-        agents_coordinator=coordinator.jid,
-        agents_observers=observer_jids,
-        verify_security=False,
-    )
+        # Launcher
+        logger.debug(f"Initializating launcher {launcher_jid_str}...")
+        launcher = LauncherAgent(
+            jid=launcher_jid_str,
+            password="123",
+            max_message_size=max_message_size,
+            agents=agent_factory.create_agents(),
+            agents_coordinator=coordinator.jid,
+            agents_observers=observer_jids,
+            verify_security=False,
+        )
 
     try:
         logger.info("Starting observers...")
@@ -106,13 +117,28 @@ async def main(experiment: Experiment) -> None:
         await asyncio.sleep(0.2)
         logger.info("Coordinator initialized.")
 
-        logger.info("Starting launcher...")
-        await launcher.start()
-        await asyncio.sleep(0.2)
-        logger.info("Launcher initialized.")
+        if launcher is not None:
+            logger.info("Starting launcher...")
+            await launcher.start()
+            await asyncio.sleep(0.2)
+            logger.info("Launcher initialized.")
+        else:
+            logger.info(f"Starting {experiment.shards} shards...")
+            shards = start_shards(
+                experiment=experiment,
+                coordinator_jid=coordinator.jid,
+                observer_jids=observer_jids,
+                max_message_size=max_message_size,
+                log_folder=log_folder,
+            )
+            logger.info("Shards initialized.")
 
         await asyncio.sleep(5)
-        while not coordinator.ready_to_start_algorithm or any(ag.is_alive() for ag in launcher.agents):
+        while (
+            not coordinator.ready_to_start_algorithm
+            or (launcher is not None and any(ag.is_alive() for ag in launcher.agents))
+            or any(shard.is_alive() for shard in shards)
+        ):
             await asyncio.sleep(5)
 
     except KeyboardInterrupt as e:
@@ -127,19 +153,184 @@ async def main(experiment: Experiment) -> None:
         logger.info("Stopping...")
         if coordinator.is_alive():
             await coordinator.stop()
+        if launcher is not None:
+            if launcher.is_alive():
+                await launcher.stop()
+            for ag in launcher.agents:
+                if ag.is_alive():
+                    await ag.stop()
+        for shard in shards:
+            if shard.is_alive():
+                shard.terminate()
+            shard.join()
+        logger.info("Run finished.")
+        sys.exit(0)
+
+
+def start_shards(
+    experiment: Experiment,
+    coordinator_jid: JID,
+    observer_jids: list[JID],
+    max_message_size: int,
+    log_folder: None | Path,
+) -> list[BaseProcess]:
+    """
+    Starts a process for each shard of the experiment. The coordinator and the observers stay in the main process
+    and synchronize the agents of all the shards through their presence.
+
+    Args:
+        experiment (Experiment): The experiment.
+        coordinator_jid (JID): JID of the coordinator.
+        observer_jids (list[JID]): JIDs of the observers.
+        max_message_size (int): Maximum size of the messages of the agents.
+        log_folder (None | Path): Folder of the logs of the run.
+
+    Returns:
+        list[BaseProcess]: The started processes.
+    """
+    # The CPUs of the process, which can be fewer than os.cpu_count() with a restricted affinity
+    available_cpus = TrainingScheduler.get_available_cpus()
+    torch_threads = max(1, len(available_cpus) // experiment.shards)
+    shard_cpus = TrainingScheduler.split_cpus(available_cpus, experiment.shards)
+    context = multiprocessing.get_context("spawn")
+    processes: list[BaseProcess] = []
+    for shard_index in range(experiment.shards):
+        process = context.Process(
+            target=run_shard,
+            name=f"royalflush-shard-{shard_index}",
+            kwargs={
+                "experiment": experiment,
+                "shard_index": shard_index,
+                "coordinator_jid": str(coordinator_jid.bare()),
+                "observer_jids": [str(jid.bare()) for jid in observer_jids],
+                "max_message_size": max_message_size,
+                "torch_threads": torch_threads,
+                "cpus": shard_cpus[shard_index],
+                "log_folder": log_folder,
+            },
+        )
+        process.start()
+        processes.append(process)
+    return processes
+
+
+def run_shard(
+    experiment: Experiment,
+    shard_index: int,
+    coordinator_jid: str,
+    observer_jids: list[str],
+    max_message_size: int,
+    torch_threads: int,
+    cpus: list[int],
+    log_folder: None | Path,
+) -> None:
+    """
+    Entry point of the process of a shard: runs the agents of the shard with their own launcher and event loop.
+    With the CPU affinity of the experiment, the process is pinned to the CPUs of the shard.
+
+    Args:
+        experiment (Experiment): The experiment.
+        shard_index (int): Index of the shard.
+        coordinator_jid (str): JID of the coordinator.
+        observer_jids (list[str]): JIDs of the observers.
+        max_message_size (int): Maximum size of the messages of the agents.
+        torch_threads (int): Number of intra-op threads of torch in the process.
+        cpus (list[int]): CPUs of the shard, shared by the slots of its training scheduler.
+        log_folder (None | Path): Folder of the logs of the run.
+    """
+    try:
+        setup_loggers(general_level=logging.INFO, raw_folder=log_folder, file_suffix=f".shard{shard_index}")
+        torch.set_num_threads(torch_threads)
+        if experiment.cpu_affinity and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+        configure_training_scheduler(experiment=experiment, cpus=cpus)
+        spade.run(
+            shard_main(
+                experiment=experiment,
+                shard_index=shard_index,
+                coordinator_jid=JID.fromstr(coordinator_jid),
+                observer_jids=[JID.fromstr(jid) for jid in observer_jids],
+                max_message_size=max_message_size,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        traceback.print_exc()
+
+
+async def shard_main(
+    experiment: Experiment,
+    shard_index: int,
+    coordinator_jid: JID,
+    observer_jids: list[JID],
+    max_message_size: int,
+) -> None:
+    logger = GeneralLogManager(extra_logger_name=f"shard{shard_index}")
+    agent_factory = AgentFactory(
+        experiment=experiment,
+        coordinator_jid=coordinator_jid,
+        observer_jids=observer_jids,
+        max_message_size=max_message_size,
+    )
+    launcher = LauncherAgent(
+        jid=f"launcher{shard_index}__{experiment.uuid4}@{experiment.xmpp_domain}",
+        password="123",
+        max_message_size=max_message_size,
+        agents=agent_factory.create_agents(shard_index=shard_index, num_shards=experiment.shards),
+        agents_coordinator=coordinator_jid,
+        agents_observers=observer_jids,
+        verify_security=False,
+    )
+    logger.info(f"Shard {shard_index} with agents: {[str(ag.jid.localpart) for ag in launcher.agents]}")
+    try:
+        await launcher.start()
+        await asyncio.sleep(5)
+        while any(ag.is_alive() for ag in launcher.agents):
+            await asyncio.sleep(5)
+    except Exception as e:
+        logger.exception(e)
+        traceback.print_exc()
+    finally:
         if launcher.is_alive():
             await launcher.stop()
         for ag in launcher.agents:
             if ag.is_alive():
                 await ag.stop()
-        logger.info("Run finished.")
-        sys.exit(0)
+        logger.info(f"Shard {shard_index} finished.")
+
+
+def configure_training_scheduler(experiment: Experiment, cpus: None | list[int] = None) -> None:
+    """
+    Configures the training scheduler of the process with the settings of the experiment. The inline training
+    executor runs the trainings one at a time on the event loop, so the slots and the CPU affinity are only applied
+    with the thread executor, and they are ignored with a warning otherwise.
+
+    Args:
+        experiment (Experiment): The experiment.
+        cpus (None | list[int], optional): CPUs of the agents of the process. Defaults to None (all the CPUs of
+            the process).
+    """
+    thread_executor = experiment.training_executor == "thread"
+    if not thread_executor and (experiment.max_concurrent_trainings is not None or experiment.cpu_affinity):
+        TRAINING_SCHEDULER.logger.warning(
+            f"Training scheduler: max_concurrent_trainings and cpu_affinity are ignored with the "
+            f"{experiment.training_executor} training executor, which already runs one training at a time on the "
+            f"event loop. Use the thread training executor to apply them."
+        )
+    TRAINING_SCHEDULER.configure(
+        max_concurrent=experiment.max_concurrent_trainings if thread_executor else None,
+        threads=experiment.training_threads,
+        interop_threads=experiment.training_interop_threads,
+        cpu_affinity=experiment.cpu_affinity and thread_executor,
+        cpus=cpus,
+    )
 
 
 def init_experiment(experiment: Experiment) -> None:
     try:
-        setup_loggers(general_level=logging.INFO)
-        spade.run(main(experiment=experiment))
+        log_folder = setup_loggers(general_level=logging.INFO)
+        spade.run(main(experiment=experiment, log_folder=log_folder))
     except KeyboardInterrupt:
         pass
     except Exception:
@@ -0,0 +1,81 @@
+"""Command to simulate the RoyalFlush experiment without XMPP."""
+
+import json
+import logging
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import click
+
+from royalflush import __version__
+
+from ..datatypes.experiment import Experiment
+from ..log.general import GeneralLogManager
+from ..log.log import setup_loggers
+from ..simulation.engine import NetworkModel
+from ..simulation.simulator import PremioFlSimulation
+
+
+def init_simulation(experiment: Experiment, network: NetworkModel) -> None:
+    try:
+        log_folder = setup_loggers(general_level=logging.INFO)
+        logger = GeneralLogManager(extra_logger_name="main")
+        logger.info(f"Royal FLush version: {__version__}")
+        logger.info(f"Python version: {sys.version}")
+        logger.info(f"Experiment details: {repr(experiment)}")
+        seconds = PremioFlSimulation.from_experiment(experiment=experiment, network=network).run()
+        click.echo(f"Simulation completed in {seconds:.2f} virtual seconds. Logs saved in '{log_folder.parent}'.")
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        traceback.print_exc()
+
+
+@click.command(name="simulate")
+@click.argument("experiment_file", type=click.Path())
+@click.option("--latency", type=float, default=0.0, show_default=True, help="Latency of the links in seconds.")
+@click.option("--bandwidth", type=float, help="Bandwidth of the links in bytes per second. Unlimited by default.")
+@click.pass_context
+def simulate_cmd(ctx: click.Context, experiment_file: str, latency: float, bandwidth: Optional[float]) -> None:
+    """
+    Simulate the RoyalFlush experiment of the JSON file with a virtual clock, without SPADE agents or an XMPP
+    server. The logs have the same files and columns as the logs of the run command.
+
+    Usage:
+        royalflush simulate experiment.json --latency 0.05 --bandwidth 12500000
+
+    Args:
+        ctx (click.Context): The Click context object.
+        experiment_file (str): Path to the JSON experiment file to load.
+        latency (float): Latency of the links in seconds.
+        bandwidth (Optional[float]): Bandwidth of the links in bytes per second.
+    """
+    file_path: Path = Path(experiment_file)
+    if not file_path.is_file():
+        click.echo(f"Error: File '{experiment_file}' does not exist or it is not a file.")
+        return
+
+    if file_path.suffix.lower() != ".json":
+        click.echo("Error: Only .json experiment files are supported.")
+        return
+
+    try:
+        config_data: Dict[str, Any] = json.loads(file_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        click.echo(f"Error loading JSON data: {exc}")
+        return
+
+    try:
+        network = NetworkModel(latency=latency, bandwidth=bandwidth)
+    except ValueError as exc:
+        click.echo(f"Error: {exc}")
+        return
+
+    experiment = Experiment.from_json(config_data)
+
+    if ctx.obj.get("VERBOSE"):
+        click.echo(f"Experiment loaded: {experiment}")
+
+    init_simulation(experiment=experiment, network=network)
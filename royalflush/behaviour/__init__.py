@@ -1,3 +1,3 @@
-from .._behaviour import coordination, launcher, observer
+from .._behaviour import coordination, launcher, multipart, observer
 
-__all__ = ["coordination", "launcher", "observer"]
+__all__ = ["coordination", "launcher", "multipart", "observer"]
@@ -7,6 +7,7 @@ import click
 from royalflush._commands.analyze_logs import analyze_logs_cmd
 from royalflush._commands.create_template import create_template_cmd
 from royalflush._commands.run import run_cmd
+from royalflush._commands.simulate import simulate_cmd
 from royalflush._commands.version import version_cmd
 
 
@@ -28,6 +29,7 @@ def create_cli() -> click.Group:
 
     # Add subcommands to the main group
     cli_fn.add_command(run_cmd)
+    cli_fn.add_command(simulate_cmd)
     cli_fn.add_command(analyze_logs_cmd)
     cli_fn.add_command(version_cmd)
     cli_fn.add_command(create_template_cmd)
@@ -1,11 +1,13 @@
 from .._commands.analyze_logs import analyze_logs_cmd
 from .._commands.create_template import create_template_cmd
 from .._commands.run import run_cmd
+from .._commands.simulate import simulate_cmd
 from .._commands.version import version_cmd
 
 __all__ = [
     "analyze_logs_cmd",
     "create_template_cmd",
     "run_cmd",
+    "simulate_cmd",
     "version_cmd",
 ]
@@ -1,7 +1,14 @@
 from . import data
+from .compiled_forward import CompiledForwardCache
 from .consensus import Consensus
+from .consensus_inbox import ConsensusInbox
 from .consensus_manager import ConsensusManager
+from .delta import DeltaManager
 from .experiment import Experiment, ExperimentRawData
+from .flat_state import FlatModelState
+from .gradient_monitor import GradientMonitor
 from .graph import GraphManager
-from .metrics import ModelMetrics
+from .metrics import MetricsAccumulator, ModelMetrics
 from .models import ModelManager
+from .payload_cache import PayloadCache
+from .sparsification import TopKSparsifier
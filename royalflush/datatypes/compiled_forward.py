@@ -0,0 +1,71 @@
+import copy
+import threading
+from typing import Callable, Dict, Hashable
+
+import torch
+from torch import Tensor, nn
+from torch.func import functional_call
+
+CompiledForward = Callable[[Dict[str, Tensor], Tensor], Tensor]
+
+
+class CompiledForwardCache:
+    """
+    Forward functions compiled with `torch.compile` and shared by the models with the same architecture. Each
+    function calls a template of the architecture with `torch.func.functional_call`, so the parameters and buffers
+    of each model are inputs of the compiled graph instead of attributes guarded by identity, and the agents of a
+    process compile each architecture once instead of once per model.
+    """
+
+    def __init__(self) -> None:
+        self.__functions: Dict[Hashable, CompiledForward] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def get_signature(model: nn.Module, training: bool) -> Hashable:
+        """
+        Args:
+            model (nn.Module): The model.
+            training (bool): Whether the forward pass is in training mode.
+
+        Returns:
+            Hashable: The class of the model, the name, shape, dtype and device of its tensors and the mode.
+        """
+        tensors = tuple(
+            (name, tuple(tensor.shape), tensor.dtype, tensor.device.type)
+            for name, tensor in model.state_dict(keep_vars=True).items()
+        )
+        return type(model), tensors, training
+
+    def get(self, model: nn.Module, training: bool) -> CompiledForward:
+        """
+        Returns the compiled forward function of the architecture of the model, compiling it the first time.
+
+        Args:
+            model (nn.Module): The model.
+            training (bool): Whether the forward pass is in training mode, such as with dropout.
+
+        Returns:
+            CompiledForward: A function of the parameters and buffers of a model with this architecture and the
+            input that returns the output of the model.
+        """
+        signature = CompiledForwardCache.get_signature(model=model, training=training)
+        with self.__lock:
+            if signature not in self.__functions:
+                template = copy.deepcopy(model).train(training)  # Only the architecture and mode are used
+
+                def forward(tensors: Dict[str, Tensor], inputs: Tensor) -> Tensor:
+                    return functional_call(template, tensors, (inputs,))
+
+                self.__functions[signature] = torch.compile(forward)
+            return self.__functions[signature]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__functions.clear()
+
+    def __len__(self) -> int:
+        return len(self.__functions)
+
+
+COMPILED_FORWARD_CACHE = CompiledForwardCache()
@@ -1,3 +1,4 @@
+import base64
 import copy
 import json
 from datetime import datetime, timezone
@@ -7,6 +8,9 @@ from aioxmpp import JID
 from spade.message import Message
 from torch import Tensor
 
+from ..message.compression import NoneCodec, get_compression_codec
+from ..message.layer_format import PickleLayerFormat, get_layer_format
+from ..message.message import RfMessage
 from .models import ModelManager
 
 
@@ -24,8 +28,34 @@ class Consensus:
         received_time_z: None | datetime = None,
         processed_start_time_z: None | datetime = None,
         processed_end_time_z: None | datetime = None,
+        quantization: None | Dict[str, tuple[Tensor, Tensor]] = None,
+        sparse_indices: None | Dict[str, Tensor] = None,
+        sparse_stream: bool = False,
+        version: None | int = None,
+        delta_bases: None | Dict[str, int] = None,
+        acknowledged_version: None | int = None,
+        sparse_version: None | int = None,
+        sparse_base_version: None | int = None,
+        sparse_acknowledged_version: None | int = None,
     ):
         self.layers = layers
+        self.quantization: Dict[str, tuple[Tensor, Tensor]] = (
+            {} if quantization is None else quantization
+        )  # Scale and zero-point of the int8 quantized layers
+        self.sparse_indices: Dict[str, Tensor] = (
+            {} if sparse_indices is None else sparse_indices
+        )  # Flat indices of the sparse layers, whose values are deltas of the previous layers sent
+        self.sparse_stream = sparse_stream  # The receiver must keep the layers to reconstruct the sparse layers
+        self.version = version  # Sequence number of the message in the link, used by the delta encoding
+        self.delta_bases: Dict[str, int] = (
+            {} if delta_bases is None else delta_bases
+        )  # Version of the base of the layers sent as XOR deltas
+        self.acknowledged_version = acknowledged_version  # Last version received from the receiver of this message
+        self.sparse_version = sparse_version  # Sequence number of the message in the sparse stream of the link
+        self.sparse_base_version = sparse_base_version  # Version of the references of the sparse layers
+        self.sparse_acknowledged_version = (
+            sparse_acknowledged_version  # Last sparse version reconstructed from the receiver of this message
+        )
         self.sender = sender
         self.request_reply = request_reply if request_reply is not None else False
         self.sent_time_z = sent_time_z
@@ -38,11 +68,66 @@ class Consensus:
         self.__check_utc(self.processed_start_time_z)
         self.__check_utc(self.processed_end_time_z)
 
-    def to_message(self, message: None | Message = None) -> Message:
+    def encode_payload(self, layer_format: str = "binary", compression: str = "none") -> Dict[str, Any]:
+        """
+        Encodes the tensors of the consensus: the layers, the quantization parameters and the sparse indices. The
+        payload only depends on the tensors, so it can be reused by `to_message` to send the same layers to several
+        neighbours.
+
+        Args:
+            layer_format (str, optional): Name of the layer format. Defaults to "binary".
+            compression (str, optional): Name of the compression codec. Defaults to "none".
+
+        Returns:
+            Dict[str, Any]: The encoded payload fields of the message content.
+        """
+        payload: Dict[str, Any] = {}
+        payload["layers"] = Consensus.encode_layers(
+            layers=self.layers, layer_format=layer_format, compression=compression
+        )
+        payload["layers_format"] = layer_format
+        payload["layers_compression"] = compression
+        if self.quantization:
+            quantization_layers: Dict[str, Tensor] = {}
+            for name, (scale, zero_point) in self.quantization.items():
+                quantization_layers[f"{name}#scale"] = scale
+                quantization_layers[f"{name}#zero_point"] = zero_point
+            payload["layers_quantization"] = Consensus.encode_layers(
+                layers=quantization_layers, layer_format=layer_format, compression=compression
+            )
+        if self.sparse_indices:
+            payload["layers_sparse_indices"] = Consensus.encode_layers(
+                layers=self.sparse_indices, layer_format=layer_format, compression=compression
+            )
+        return payload
+
+    def to_message(
+        self,
+        message: None | Message = None,
+        layer_format: str = "binary",
+        compression: str = "none",
+        payload: None | Dict[str, Any] = None,
+    ) -> Message:
         msg = Message() if message is None else copy.deepcopy(message)
-        content: dict[str, Any] = {}
-        base64_layers = ModelManager.export_layers(self.layers)
-        content["layers"] = base64_layers
+        content: dict[str, Any] = (
+            self.encode_payload(layer_format=layer_format, compression=compression)
+            if payload is None
+            else dict(payload)
+        )
+        if self.sparse_stream:
+            content["sparse_stream"] = True
+        if self.version is not None:
+            content["version"] = self.version
+        if self.delta_bases:
+            content["delta_bases"] = self.delta_bases
+        if self.acknowledged_version is not None:
+            content["acknowledged_version"] = self.acknowledged_version
+        if self.sparse_version is not None:
+            content["sparse_version"] = self.sparse_version
+        if self.sparse_base_version is not None:
+            content["sparse_base_version"] = self.sparse_base_version
+        if self.sparse_acknowledged_version is not None:
+            content["sparse_acknowledged_version"] = self.sparse_acknowledged_version
         content["sender"] = str(self.sender.bare()) if self.sender is not None else None
         content["request_reply"] = self.request_reply
         sent_time_z = datetime.now(tz=timezone.utc) if self.sent_time_z is None else self.sent_time_z
@@ -50,12 +135,110 @@ class Consensus:
         msg.body = json.dumps(content)
         return msg
 
+    def get_tensors_size(self) -> int:
+        """
+        Returns:
+            int: The bytes of the tensors of the consensus: the layers, the quantization parameters and the sparse
+            indices.
+        """
+        size = sum(layer.numel() * layer.element_size() for layer in self.layers.values())
+        size += sum(
+            scale.numel() * scale.element_size() + zero_point.numel() * zero_point.element_size()
+            for scale, zero_point in self.quantization.values()
+        )
+        size += sum(indices.numel() * indices.element_size() for indices in self.sparse_indices.values())
+        return size
+
+    @staticmethod
+    def get_message_size(message: Message) -> int:
+        """
+        Returns the size of a consensus message for the message logs. The loopback messages carry the consensus
+        instead of a body, so their size is the bytes of its tensors.
+
+        Args:
+            message (Message): The message.
+
+        Returns:
+            int: The bytes of the tensors of a loopback message or the length of the body otherwise.
+        """
+        if isinstance(message, RfMessage) and isinstance(message.attachment, Consensus):
+            return message.attachment.get_tensors_size()
+        return len(message.body)
+
+    def to_loopback_message(self) -> RfMessage:
+        """
+        Builds the message to send the consensus through the loopback transport. The consensus is attached to the
+        message by reference instead of being encoded in the body, so the tensors must not be modified after
+        sending them: the caller must attach snapshots of the layers of the model.
+
+        Returns:
+            RfMessage: The message with the consensus attached and an empty body.
+        """
+        sent_time_z = datetime.now(tz=timezone.utc) if self.sent_time_z is None else self.sent_time_z
+        attachment = Consensus(
+            layers=self.layers,
+            sender=self.sender,
+            request_reply=self.request_reply,
+            sent_time_z=sent_time_z,
+            quantization=self.quantization,
+            sparse_indices=self.sparse_indices,
+            sparse_stream=self.sparse_stream,
+            version=self.version,
+            delta_bases=self.delta_bases,
+            acknowledged_version=self.acknowledged_version,
+            sparse_version=self.sparse_version,
+            sparse_base_version=self.sparse_base_version,
+            sparse_acknowledged_version=self.sparse_acknowledged_version,
+        )
+        return RfMessage(body="", attachment=attachment)
+
     @staticmethod
     def from_message(message: Message) -> "Consensus":
+        if isinstance(message, RfMessage) and isinstance(message.attachment, Consensus):
+            attachment: Consensus = message.attachment
+            return Consensus(
+                layers=dict(attachment.layers),
+                sender=message.sender,
+                request_reply=attachment.request_reply,
+                sent_time_z=attachment.sent_time_z,
+                received_time_z=datetime.now(tz=timezone.utc),
+                quantization=dict(attachment.quantization),
+                sparse_indices=dict(attachment.sparse_indices),
+                sparse_stream=attachment.sparse_stream,
+                version=attachment.version,
+                delta_bases=dict(attachment.delta_bases),
+                acknowledged_version=attachment.acknowledged_version,
+                sparse_version=attachment.sparse_version,
+                sparse_base_version=attachment.sparse_base_version,
+                sparse_acknowledged_version=attachment.sparse_acknowledged_version,
+            )
         content: dict[str, Any] = json.loads(message.body)
-        base64_layers: str = content["layers"]
         request_reply: bool = bool(content["request_reply"])
-        layers = ModelManager.import_layers(base64_layers)
+        layers = Consensus.decode_layers(
+            encoded_layers=content["layers"],
+            layer_format=content.get("layers_format", PickleLayerFormat.name),
+            compression=content.get("layers_compression", NoneCodec.name),
+        )
+        quantization: Dict[str, tuple[Tensor, Tensor]] = {}
+        if "layers_quantization" in content:
+            quantization_layers = Consensus.decode_layers(
+                encoded_layers=content["layers_quantization"],
+                layer_format=content.get("layers_format", PickleLayerFormat.name),
+                compression=content.get("layers_compression", NoneCodec.name),
+            )
+            for name in layers.keys():
+                if f"{name}#scale" in quantization_layers:
+                    quantization[name] = (
+                        quantization_layers[f"{name}#scale"],
+                        quantization_layers[f"{name}#zero_point"],
+                    )
+        sparse_indices: Dict[str, Tensor] = {}
+        if "layers_sparse_indices" in content:
+            sparse_indices = Consensus.decode_layers(
+                encoded_layers=content["layers_sparse_indices"],
+                layer_format=content.get("layers_format", PickleLayerFormat.name),
+                compression=content.get("layers_compression", NoneCodec.name),
+            )
         sent_time_z: datetime = datetime.strptime(content["sent_time_z"], "%Y-%m-%dT%H:%M:%S.%fZ").replace(
             tzinfo=timezone.utc
         )
@@ -82,8 +265,56 @@ class Consensus:
             received_time_z=received_time_z,
             processed_start_time_z=processed_start_time_z,
             processed_end_time_z=processed_end_time_z,
+            quantization=quantization,
+            sparse_indices=sparse_indices,
+            sparse_stream=bool(content.get("sparse_stream", False)),
+            version=content.get("version", None),
+            delta_bases=content.get("delta_bases", None),
+            acknowledged_version=content.get("acknowledged_version", None),
+            sparse_version=content.get("sparse_version", None),
+            sparse_base_version=content.get("sparse_base_version", None),
+            sparse_acknowledged_version=content.get("sparse_acknowledged_version", None),
         )
 
+    @staticmethod
+    def encode_layers(layers: Dict[str, Tensor], layer_format: str = "binary", compression: str = "none") -> str:
+        """
+        Serializes the layers with the given layer format, compresses them with the given codec and
+        encodes the result as base64, because the XMPP message body must be text.
+
+        Args:
+            layers (Dict[str, Tensor]): The layers to encode.
+            layer_format (str, optional): Name of the layer format. Defaults to "binary".
+            compression (str, optional): Name of the compression codec. Defaults to "none".
+
+        Returns:
+            str: The base64 encoded layers.
+        """
+        payload = get_layer_format(layer_format).encode(layers)
+        payload = get_compression_codec(compression).compress(payload)
+        return base64.b64encode(payload).decode(encoding="ascii")
+
+    @staticmethod
+    def decode_layers(
+        encoded_layers: str, layer_format: str = "binary", compression: str = "none"
+    ) -> Dict[str, Tensor]:
+        """
+        Decodes the layers encoded with `Consensus.encode_layers`.
+
+        Args:
+            encoded_layers (str): The base64 encoded layers.
+            layer_format (str, optional): Name of the layer format. Defaults to "binary".
+            compression (str, optional): Name of the compression codec. Defaults to "none".
+
+        Returns:
+            Dict[str, Tensor]: The decoded layers.
+        """
+        if layer_format == PickleLayerFormat.name and compression == NoneCodec.name:
+            return ModelManager.import_layers(encoded_layers)
+        compressed = base64.b64decode(encoded_layers.encode(encoding="ascii"))
+        payload = get_compression_codec(compression).decompress(compressed)
+        return get_layer_format(layer_format).decode(payload)
+
     def __str__(self) -> str:
         content: dict[str, Any] = {}
         base64_layers = ModelManager.export_layers(self.layers)
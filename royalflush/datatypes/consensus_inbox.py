@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Hashable
+
+from .consensus import Consensus
+
+INBOX_OVERFLOW_POLICIES: list[str] = ["drop_oldest", "drop_newest"]
+
+
+class ConsensusInbox:
+    """
+    Pending consensus received from the neighbours, in order of arrival.
+
+    If `replace_by_sender` is True, the inbox keeps only the latest consensus of each sender: a new consensus
+    replaces the pending one of the same sender in O(1) and keeps its position. If the inbox is full when a new
+    entry arrives, the overflow policy removes the oldest entry ("drop_oldest") or discards the new consensus
+    ("drop_newest").
+    """
+
+    def __init__(
+        self, replace_by_sender: bool = True, capacity: None | int = None, overflow: str = "drop_oldest"
+    ) -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"The capacity of the consensus inbox must be greater than 0 and it is {capacity}.")
+        if overflow.lower() not in INBOX_OVERFLOW_POLICIES:
+            raise NotImplementedError(
+                f"Inbox overflow policy {overflow} is not valid. Valid policies: {INBOX_OVERFLOW_POLICIES}."
+            )
+        self.replace_by_sender = replace_by_sender
+        self.capacity = capacity
+        self.overflow = overflow.lower()
+        self.dropped: int = 0
+        self.__entries: OrderedDict[Hashable, Consensus] = OrderedDict()
+        self.__next_sequence: int = 0  # Key of the entries that are not replaced by sender
+
+    def put(self, consensus: Consensus) -> bool:
+        """
+        Adds a consensus to the inbox.
+
+        Args:
+            consensus (Consensus): The received consensus.
+
+        Returns:
+            bool: False if the consensus is discarded by the overflow policy.
+        """
+        key: Hashable
+        if self.replace_by_sender and consensus.sender is not None:
+            key = str(consensus.sender.bare())
+            if key in self.__entries:
+                self.__entries[key] = consensus
+                return True
+        else:
+            key = self.__next_sequence
+            self.__next_sequence += 1
+        if self.capacity is not None and len(self.__entries) >= self.capacity:
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return False
+            self.__entries.popitem(last=False)
+        self.__entries[key] = consensus
+        return True
+
+    def pop_all(self) -> list[Consensus]:
+        """
+        Removes all the pending consensus.
+
+        Returns:
+            list[Consensus]: The pending consensus in order of arrival.
+        """
+        entries = list(self.__entries.values())
+        self.__entries.clear()
+        return entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
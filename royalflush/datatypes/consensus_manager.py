@@ -1,6 +1,6 @@
 import asyncio
-from datetime import datetime, timedelta, timezone
-from queue import Queue
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from aioxmpp import JID
@@ -8,7 +8,14 @@ from torch import Tensor
 
 from ..datatypes.models import ModelManager
 from ..log.nn import NnConvergenceLogManager
+from ..message.compression import get_compression_codec
+from ..message.layer_format import get_layer_format
+from ..message.precision import check_layer_precision, restore_layer_precision
 from .consensus import Consensus
+from .consensus_inbox import ConsensusInbox
+from .delta import DeltaManager
+from .payload_cache import PayloadCache
+from .sparsification import SPARSE_STREAM_CACHE_SIZE, TopKSparsifier, copy_sparse_base, update_sparse_references
 
 
 # NOTE: Make a Manager(Abstract) that can store data, waiting data, etc. of a Generic type T
@@ -25,25 +32,48 @@ class ConsensusManager:
         consensus_iterations: int = 1,
         logger: Optional[NnConvergenceLogManager] = None,
         only_one_consensus_model_per_agent: bool = True,
+        layer_format: str = "binary",
+        compression: str = "none",
+        layer_precision: str = "fp32",
+        sparsification_ratio: None | float = None,
+        delta_encoding: bool = False,
+        batched_consensus: bool = False,
+        inbox_capacity: None | int = None,
+        inbox_overflow: str = "drop_oldest",
     ) -> None:
         self.model_manager = model_manager
         self.max_order = max_order
         self.max_seconds_to_accept_consensus = max_seconds_to_accept_consensus
         self.wait_for_responses_timeout = wait_for_responses_timeout
         self.epsilon_margin = epsilon_margin
-        self.received_consensus: Queue[Consensus] = Queue()
+        self.received_consensus = ConsensusInbox(
+            replace_by_sender=only_one_consensus_model_per_agent, capacity=inbox_capacity, overflow=inbox_overflow
+        )  # Pending consensus in order of arrival
         self.waiting_responses: dict[JID, list[str]] = (
             {}
         )  # Neighbours I am waiting for. list[str] are the layers requested to the neighbour JID.
-        self.to_response: Queue[tuple[Consensus, str | None]] = (
-            Queue()
+        self.to_response: deque[tuple[Consensus, str | None]] = (
+            deque()
         )  # Neighbours waiting to my response. [str] is the thread and [Consensus] because stores layers.
         self.max_iterations = consensus_iterations
         self.__completed_iterations: int = 0
         self.__last_algorithm_iteration: int = -1
         self.__logger = logger
         self.only_one_consensus_model_per_agent = only_one_consensus_model_per_agent
-        self.latest_consensus_by_agent: dict[str, Consensus] = {}  # str -> bare JID
+        self.layer_format = get_layer_format(layer_format).name  # Wire format of the layers sent
+        self.compression = get_compression_codec(compression).name  # Preferred codec, negotiated per link
+        self.layer_precision = check_layer_precision(layer_precision)  # Precision of the layers sent
+        self.sparsifier: None | TopKSparsifier = (
+            None if sparsification_ratio is None else TopKSparsifier(ratio=sparsification_ratio)
+        )  # Top-k sparsification of the layers sent
+        # str -> bare JID. Last versions of the layers reconstructed from the sparse stream of each sender
+        self.sparse_references: dict[str, OrderedDict[int, Dict[str, Tensor]]] = {}
+        self.last_sparse_version: dict[str, int] = {}
+        self.delta_encoding = delta_encoding  # Send the layers as XOR deltas of the last acknowledged version
+        self.delta_manager = DeltaManager()  # Always decodes, the neighbours may use delta encoding
+        self.payload_cache = PayloadCache()  # Encoded layers reused across neighbours and replies
+        self.batched_consensus = batched_consensus  # Apply all the pending consensus in one weighted sum
+        self.__responses_received = asyncio.Event()  # Set when the last awaited neighbour answers
 
     @property
     def logger(self) -> Optional[NnConvergenceLogManager]:
@@ -55,68 +85,167 @@ class ConsensusManager:
 
     def prepare_replies_to_send(self) -> list[tuple[Consensus, str | None]]:
         responses: list[tuple[Consensus, str | None]] = []
-        while self.to_response.qsize() > 0:
-            consensus, thread = self.to_response.get()
+        while self.to_response:
+            consensus, thread = self.to_response.popleft()
             response = Consensus(
-                layers=self.model_manager.get_layers(list(consensus.layers.keys())),
+                layers=self.model_manager.get_published_layers(list(consensus.layers.keys())),
                 request_reply=False,
                 sender=consensus.sender,
             )
             responses.append((response, thread))
-            self.to_response.task_done()
         return responses
 
-    def add_consensus(self, consensus: Consensus, thread: None | str) -> None:
+    def decode_delta_layers(self, consensus: Consensus) -> bool:
+        """
+        Processes the acknowledgement of the consensus and decodes its layers if they were sent with delta
+        encoding. It must be called for every message received, even if the consensus is discarded afterwards.
+
+        Args:
+            consensus (Consensus): The received consensus. Its layers are replaced by the decoded layers.
+
+        Returns:
+            bool: False if the layers can not be decoded because a base version is not available.
+        """
+        if consensus.sender is None:
+            return True
+        if consensus.acknowledged_version is not None:
+            self.delta_manager.acknowledge(consensus.sender, version=consensus.acknowledged_version)
+        if consensus.version is None:
+            return True
+        decoded = self.delta_manager.decode(
+            consensus.sender, version=consensus.version, layers=consensus.layers, bases=consensus.delta_bases
+        )
+        if decoded is None:
+            return False
+        consensus.layers = decoded
+        consensus.delta_bases = {}
+        return True
+
+    def reconstruct_sparse_layers(self, consensus: Consensus) -> bool:
+        """
+        Processes the sparse acknowledgement of the consensus and reconstructs its layers if it belongs to a sparse
+        stream, adding the received sparse deltas to a copy of the layers of the base version received from the
+        same sender. The reconstructed layers are stored as a new version that is acknowledged in the next messages
+        sent to the sender. It must be called for every message received, even if the consensus is discarded
+        afterwards, to stay synchronized with the sender.
+
+        Args:
+            consensus (Consensus): The received consensus. Its layers are replaced by copies of the reconstructed
+                layers.
+
+        Returns:
+            bool: False if the sparse layers can not be reconstructed because the base version is not available.
+            In that case the sparse layers are removed and the version is not acknowledged, so the sender sends
+            dense layers when its base is too old.
+        """
+        if consensus.sender is None:
+            return True
+        if self.sparsifier is not None and consensus.sparse_acknowledged_version is not None:
+            self.sparsifier.acknowledge(consensus.sender, version=consensus.sparse_acknowledged_version)
+        if not consensus.sparse_stream:
+            return True
+        key = str(consensus.sender.bare())
+        versions = self.sparse_references.setdefault(key, OrderedDict())
+        base = {} if consensus.sparse_base_version is None else versions.get(consensus.sparse_base_version)
+        # The dtypes are taken from the initial state, the model could be being trained in the training executor
+        state = self.model_manager.initial_state
+        references = copy_sparse_base({} if base is None else base, indices=consensus.sparse_indices)
+        updated = update_sparse_references(
+            references=references,
+            layers=consensus.layers,
+            indices=consensus.sparse_indices,
+            quantization=consensus.quantization,
+            dtypes={name: state[name].dtype for name in consensus.layers.keys() if name in state},
+        )
+        if base is not None and consensus.sparse_version is not None:
+            versions[consensus.sparse_version] = references
+            while len(versions) > SPARSE_STREAM_CACHE_SIZE:
+                versions.popitem(last=False)
+            self.last_sparse_version[key] = max(consensus.sparse_version, self.last_sparse_version.get(key, -1))
+        # The stored references are the bases of the next messages, so the consensus must not modify them
+        consensus.layers = {name: layer.clone() for name, layer in updated.items()}
+        consensus.sparse_indices = {}
+        consensus.quantization = {}
+        return base is not None
+
+    def get_sparse_acknowledgement(self, neighbour: JID) -> None | int:
+        """
+        Returns the last sparse version reconstructed from the neighbour, to acknowledge it in the next message sent.
+
+        Args:
+            neighbour (JID): The neighbour.
+
+        Returns:
+            None | int: The version or None if no sparse version has been reconstructed from the neighbour.
+        """
+        return self.last_sparse_version.get(str(neighbour.bare()))
+
+    def add_consensus(self, consensus: Consensus, thread: None | str) -> bool:
+        """
+        Adds a received consensus to the inbox and to the replies to send if it requests a reply.
+
+        Args:
+            consensus (Consensus): The received consensus.
+            thread (None | str): The thread of the message.
+
+        Returns:
+            bool: False if the consensus is discarded because the inbox is full.
+        """
         if (
             consensus.sender
             and consensus.sender.bare() in self.waiting_responses
             and list(consensus.layers.keys()) == self.waiting_responses[consensus.sender.bare()]
         ):
             del self.waiting_responses[consensus.sender.bare()]
+            if not self.waiting_responses:
+                self.__responses_received.set()
         elif consensus.request_reply:
-            self.to_response.put((consensus, thread))
-
-        if self.only_one_consensus_model_per_agent and consensus.sender:
-            sender_bare = str(consensus.sender.bare())
-            # Replace the existing entry
-            self.latest_consensus_by_agent[sender_bare] = consensus
-            self._rebuild_received_consensus_queue()
-        else:
-            self.received_consensus.put(consensus)
+            self.to_response.append((consensus, thread))
+        return self.received_consensus.put(consensus)
 
     async def wait_receive_consensus(self, timeout: None | float = None) -> bool:
+        """
+        Waits until all the awaited neighbours answer or the timeout expires. It is woken up by `add_consensus`
+        when the last awaited neighbour answers, without polling.
+
+        Args:
+            timeout (None | float, optional): Maximum seconds to wait. Defaults to None
+                (`wait_for_responses_timeout`).
+
+        Returns:
+            bool: True if all the awaited neighbours answered.
+        """
         to = timeout if timeout is not None else self.wait_for_responses_timeout
-        start_time_z = datetime.now(tz=timezone.utc)
-        stop_time_reached = False
-        while self.waiting_responses and not stop_time_reached:
-            await asyncio.sleep(delay=2)
-            stop_time_z = datetime.now(tz=timezone.utc) + timedelta(seconds=to)
-            stop_time_reached = stop_time_z >= start_time_z
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + to
+        while self.waiting_responses:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            self.__responses_received.clear()
+            try:
+                await asyncio.wait_for(self.__responses_received.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
         return len(list(self.waiting_responses.keys())) == 0
 
     def apply_consensus(self, consensus: Consensus) -> None:
         if self.model_manager.is_training():
             raise RuntimeError("Trying to apply consensus while training the model.")
-        # full_model -> this agent's model.
-        # layers -> layers to consensuate from the other agent.
-        consensuated_model = ConsensusManager.apply_consensus_to_model_with_layers(
-            full_model=self.model_manager.model.state_dict(),
+        # The layers of this agent's model are updated in-place with the layers of the other agent.
+        self.model_manager.lerp_layers(
             layers=consensus.layers,
-            max_order=self.max_order,
-            epsilon_margin=self.epsilon_margin,
+            weight=ConsensusManager.get_epsilon(max_order=self.max_order, epsilon_margin=self.epsilon_margin),
+            quantization=consensus.quantization,
         )
-        self.model_manager.replace_all_layers(new_layers=consensuated_model)
 
     def apply_all_consensus(
         self,
     ) -> list[Consensus]:
+        if self.batched_consensus:
+            return self.apply_all_consensus_batched()
         consumed_consensus_transmissions: list[Consensus] = []
-        while self.received_consensus.qsize() > 0:
-            ct = self.received_consensus.get()
-            sender_bare = str(ct.sender.bare()) if ct.sender else None
-            if self.only_one_consensus_model_per_agent and sender_bare in self.latest_consensus_by_agent:
-                del self.latest_consensus_by_agent[sender_bare]
-
+        for ct in self.received_consensus.pop_all():
             if self.__logger is not None:
                 current_state: dict[str, Tensor] = self.model_manager.model.state_dict()
                 self.__logger.log_weights(
@@ -131,7 +260,43 @@ class ConsensusManager:
                     timestamp_z=ct.processed_end_time_z, description="POST-CONSENSUS", model=current_state
                 )
             consumed_consensus_transmissions.append(ct)
-            self.received_consensus.task_done()
+        return consumed_consensus_transmissions
+
+    def apply_all_consensus_batched(self) -> list[Consensus]:
+        """
+        Applies all the pending consensus at once, with one weighted sum per layer instead of one pass over the
+        model per consensus. The result is the same as applying them sequentially in the order of the inbox. The
+        weights are logged once before and once after the consensus.
+
+        Raises:
+            RuntimeError: If the model is being trained.
+
+        Returns:
+            list[Consensus]: The applied consensus.
+        """
+        if self.model_manager.is_training():
+            raise RuntimeError("Trying to apply consensus while training the model.")
+        consumed_consensus_transmissions = self.received_consensus.pop_all()
+        if not consumed_consensus_transmissions:
+            return consumed_consensus_transmissions
+
+        start_time_z = datetime.now(tz=timezone.utc)
+        if self.__logger is not None:
+            self.__logger.log_weights(
+                timestamp_z=start_time_z, description="PRE-CONSENSUS", model=self.model_manager.model.state_dict()
+            )
+        self.model_manager.lerp_all_layers(
+            contributions=[(ct.layers, ct.quantization) for ct in consumed_consensus_transmissions],
+            weight=ConsensusManager.get_epsilon(max_order=self.max_order, epsilon_margin=self.epsilon_margin),
+        )
+        end_time_z = datetime.now(tz=timezone.utc)
+        for ct in consumed_consensus_transmissions:
+            ct.processed_start_time_z = start_time_z
+            ct.processed_end_time_z = end_time_z
+        if self.__logger is not None:
+            self.__logger.log_weights(
+                timestamp_z=end_time_z, description="POST-CONSENSUS", model=self.model_manager.model.state_dict()
+            )
         return consumed_consensus_transmissions
 
     # def apply_all_consensus(
@@ -163,6 +328,7 @@ class ConsensusManager:
         layers: Dict[str, Tensor],
         max_order: int = 2,
         epsilon_margin: float = 0.05,
+        quantization: None | Dict[str, tuple[Tensor, Tensor]] = None,
     ) -> Dict[str, Tensor]:
         """
         Applies a layer-wise consensus operation between a full model and a subset of layers from another agent.
@@ -175,6 +341,8 @@ class ConsensusManager:
             layers (Dict[str, Tensor]): A dictionary of layers from another agent to be used for consensus.
             max_order (int, optional): Maximum order of the graph network. Determines the consensus strength. Defaults to 2.
             epsilon_margin (float, optional): Margin to ensure epsilon < 1 / max_order. Defaults to 0.05.
+            quantization (None | Dict[str, tuple[Tensor, Tensor]], optional): Scale and zero-point of the int8
+                quantized layers. Defaults to None.
 
         Returns:
             Dict[str, Tensor]: A new Dict representing the consensuated model.
@@ -187,14 +355,39 @@ class ConsensusManager:
                     foreign=layers[key],
                     max_order=max_order,
                     epsilon_margin=epsilon_margin,
+                    quantization=None if quantization is None else quantization.get(key),
                 )
             else:
                 consensuated_result[key] = full_model[key]
         return consensuated_result
 
+    @staticmethod
+    def get_epsilon(max_order: int, epsilon_margin: float = 0.05) -> float:
+        """
+        Computes the weight of the foreign layers in the consensus.
+
+        Args:
+            max_order (int): Maximum order of the graph network.
+            epsilon_margin (float, optional): A margin to be sure that epsilon < 1 / max_graph_degree. Defaults to 0.05.
+
+        Raises:
+            ValueError: If `max_order` is lower than 1.
+
+        Returns:
+            float: The epsilon of the consensus.
+        """
+        if max_order <= 0:
+            raise ValueError(f"Max order of consensus must be greater than 0 and it is {max_order}.")
+        # epsilon_margin because must be LESS than 1 / max_order
+        return 1 / max_order - epsilon_margin
+
     @staticmethod
     def apply_consensus_to_tensors(
-        main: Tensor, foreign: Tensor, max_order: int, epsilon_margin: float = 0.05
+        main: Tensor,
+        foreign: Tensor,
+        max_order: int,
+        epsilon_margin: float = 0.05,
+        quantization: None | tuple[Tensor, Tensor] = None,
     ) -> Tensor:
         """
         Computes a new consensuated `pytorch.Tensor` without modifying the input tensors.
@@ -204,6 +397,9 @@ class ConsensusManager:
             foreign (Tensor): Input `torch.Tensor` that will be multiplied by epsilon. This must be the other agent's Tensor.
             max_order (int): Maximum order of the graph network.
             epsilon_margin (float, optional): A margin to be sure that epsilon < 1 / max_graph_degree. Defaults to 0.05.
+            quantization (None | tuple[Tensor, Tensor], optional): Scale and zero-point if the foreign Tensor was
+                quantized to int8. Reduced precision Tensors are restored to the dtype of the main Tensor before
+                the consensus. Defaults to None.
 
         Raises:
             ValueError: If `max_order` is lower than 1.
@@ -211,10 +407,8 @@ class ConsensusManager:
         Returns:
             Tensor: The resulting Tensor after consensus.
         """
-        if max_order <= 0:
-            raise ValueError(f"Max order of consensus must be greater than 0 and it is {max_order}.")
-        # epsilon_margin because must be LESS than 1 / max_order
-        epsilon = 1 / max_order - epsilon_margin
+        epsilon = ConsensusManager.get_epsilon(max_order=max_order, epsilon_margin=epsilon_margin)
+        foreign = restore_layer_precision(foreign, dtype=main.dtype, quantization=quantization)
         return (1 - epsilon) * main + epsilon * foreign
 
     def add_one_completed_iteration(self, algorithm_rounds: int) -> int:
@@ -233,19 +427,6 @@ class ConsensusManager:
             self.__completed_iterations = 0
         return self.__completed_iterations
 
-    def _rebuild_received_consensus_queue(self) -> None:
-        # Clear the queue
-        while not self.received_consensus.empty():
-            try:
-                self.received_consensus.get_nowait()
-                self.received_consensus.task_done()
-            except Exception:
-                break
-
-        # Rebuild with the latest ones
-        for consensus in self.latest_consensus_by_agent.values():
-            self.received_consensus.put(consensus)
-
     # def do_consensus_and_log(self, ct: Consensus) -> None:
     #     self.log_weights(description="PRE-CONSENSUS", timestamp=datetime.now(tz=timezone.utc))
     #     ct.processed_start_time_z = datetime.now(tz=timezone.utc)
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from typing import Dict
+
+import torch
+from aioxmpp import JID
+from torch import Tensor
+
+XOR_DTYPES: Dict[int, torch.dtype] = {
+    1: torch.uint8,
+    2: torch.int16,
+    4: torch.int32,
+    8: torch.int64,
+}
+
+
+def xor_layers(layer: Tensor, base: Tensor) -> Tensor:
+    """
+    Computes the bitwise XOR of two tensors with the same shape and dtype. The XOR is its own inverse, so
+    `xor_layers(xor_layers(layer, base), base)` is `layer`. Unchanged values produce zero bytes, which are
+    removed by the compression codecs.
+
+    Args:
+        layer (Tensor): The tensor.
+        base (Tensor): The base tensor.
+
+    Returns:
+        Tensor: The XOR delta with the dtype of the tensors.
+    """
+    if layer.dtype == torch.bool:
+        return torch.bitwise_xor(layer, base)
+    xor_dtype = XOR_DTYPES[layer.element_size()]
+    return torch.bitwise_xor(layer.contiguous().view(xor_dtype), base.contiguous().view(xor_dtype)).view(layer.dtype)
+
+
+class DeltaManager:
+    """
+    Delta encoding of the layers sent to every neighbour against the last version acknowledged by the neighbour.
+
+    Every message sent to a neighbour has a version, a sequence number of the link. The receiver keeps the layers
+    of the last `cache_size` versions received from each sender and acknowledges the last version received in the
+    messages that it sends back. The sender sends the layers as XOR deltas of the last acknowledged version of each
+    layer, and sends them complete if there is not an acknowledged version or if the receiver could have already
+    removed it from its cache.
+    """
+
+    def __init__(self, cache_size: int = 3) -> None:
+        if cache_size < 1:
+            raise ValueError(f"The delta encoding cache size must be greater than 0 and it is {cache_size}.")
+        self.cache_size = cache_size
+        # Sender side, str -> bare JID
+        self.next_version: dict[str, int] = {}
+        self.sent: dict[str, OrderedDict[int, Dict[str, Tensor]]] = {}  # Versions sent and not acknowledged
+        self.acknowledged: dict[str, Dict[str, tuple[int, Tensor]]] = {}  # Last acknowledged version of each layer
+        # Receiver side, str -> bare JID
+        self.received: dict[str, Dict[str, OrderedDict[int, Tensor]]] = {}  # Last versions of each layer
+        self.last_received_version: dict[str, int] = {}
+
+    def encode(self, neighbour: JID, layers: Dict[str, Tensor]) -> tuple[int, Dict[str, Tensor], Dict[str, int]]:
+        """
+        Encodes the layers to send to the neighbour.
+
+        Args:
+            neighbour (JID): The neighbour.
+            layers (Dict[str, Tensor]): The layers to send, with the precision of the transmission.
+
+        Returns:
+            tuple[int, Dict[str, Tensor], Dict[str, int]]: The version of the message, the layers to send and the
+            base version of every layer sent as a delta.
+        """
+        key = str(neighbour.bare())
+        version = self.next_version.get(key, 0)
+        self.next_version[key] = version + 1
+        acknowledged = self.acknowledged.get(key, {})
+        encoded: Dict[str, Tensor] = {}
+        bases: Dict[str, int] = {}
+        for name, layer in layers.items():
+            layer = layer.detach()
+            if name in acknowledged:
+                base_version, base = acknowledged[name]
+                if version - base_version < self.cache_size and base.shape == layer.shape and base.dtype == layer.dtype:
+                    encoded[name] = xor_layers(layer, base)
+                    bases[name] = base_version
+                    continue
+            encoded[name] = layer
+        sent = self.sent.setdefault(key, OrderedDict())
+        sent[version] = {name: layer.detach().clone() for name, layer in layers.items()}
+        while len(sent) > self.cache_size:
+            sent.popitem(last=False)
+        return version, encoded, bases
+
+    def acknowledge(self, neighbour: JID, version: int) -> None:
+        """
+        Marks the version as received by the neighbour, so its layers can be used as bases of the deltas.
+
+        Args:
+            neighbour (JID): The neighbour.
+            version (int): The last version received by the neighbour.
+        """
+        key = str(neighbour.bare())
+        sent = self.sent.get(key, OrderedDict())
+        if version not in sent:
+            return
+        acknowledged = self.acknowledged.setdefault(key, {})
+        for name, layer in sent[version].items():
+            if name not in acknowledged or acknowledged[name][0] < version:
+                acknowledged[name] = (version, layer)
+        for sent_version in list(sent.keys()):
+            if sent_version <= version:
+                del sent[sent_version]
+
+    def decode(
+        self, sender: JID, version: int, layers: Dict[str, Tensor], bases: Dict[str, int]
+    ) -> None | Dict[str, Tensor]:
+        """
+        Decodes the layers received from the sender and stores them as the given version.
+
+        Args:
+            sender (JID): The sender.
+            version (int): The version of the message.
+            layers (Dict[str, Tensor]): The received layers.
+            bases (Dict[str, int]): The base version of every layer received as a delta.
+
+        Returns:
+            None | Dict[str, Tensor]: The decoded layers or None if a base version is not in the cache. In that
+            case the version is not acknowledged, so the sender sends complete layers when its base is too old.
+        """
+        key = str(sender.bare())
+        cache = self.received.setdefault(key, {})
+        decoded: Dict[str, Tensor] = {}
+        for name, layer in layers.items():
+            if name in bases:
+                base = cache.get(name, OrderedDict()).get(bases[name])
+                if base is None:
+                    return None
+                decoded[name] = xor_layers(layer, base)
+            else:
+                decoded[name] = layer
+        for name, layer in decoded.items():
+            versions = cache.setdefault(name, OrderedDict())
+            versions[version] = layer
+            while len(versions) > self.cache_size:
+                versions.popitem(last=False)
+        self.last_received_version[key] = max(version, self.last_received_version.get(key, -1))
+        return decoded
+
+    def get_acknowledgement(self, neighbour: JID) -> None | int:
+        """
+        Returns the last version received from the neighbour, to acknowledge it in the next message sent.
+
+        Args:
+            neighbour (JID): The neighbour.
+
+        Returns:
+            None | int: The version or None if no version has been received from the neighbour.
+        """
+        return self.last_received_version.get(str(neighbour.bare()))
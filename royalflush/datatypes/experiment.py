@@ -4,6 +4,7 @@ import random
 import uuid
 from typing import Any, Dict, Optional
 
+from ..datatypes.consensus_inbox import INBOX_OVERFLOW_POLICIES
 from ..datatypes.graph import GraphManager
 
 
@@ -26,6 +27,26 @@ class ExperimentRawData:
         seed (int | None): Can be:
             - None, if random seed should be used.
             - int number, to use that seed.
+        layer_format (str): Wire format of the layers sent between agents ('binary' or 'pickle').
+        compression (str): Preferred compression codec of the layers ('none', 'zlib', 'lzma' or 'shuffle_zlib').
+        layer_precision (str): Precision of the layers sent ('fp32', 'fp16', 'bf16', 'int8' or 'int8_channel').
+        sparsification_ratio (Optional[float]): Ratio of the entries of each layer sent with top-k sparsification
+            or None to send the dense layers.
+        delta_encoding (bool): Send the layers as XOR deltas of the last version acknowledged by each neighbour.
+        batched_consensus (bool): Apply all the pending consensus in one weighted sum per layer.
+        double_buffered (bool): Serve the layer requests received while training from a snapshot of the model published before training.
+        training_executor (str): Executor of the training and inference of the agents ('inline' or 'thread').
+        shards (int): Number of processes that run the agents (1 runs all the agents in the main process).
+        transport (str): Transport of the messages between the agents of the same process ('xmpp' or 'loopback').
+        mixed_precision (str): Precision of the forward and backward passes of the training and inference ('fp32' or 'bf16' autocast).
+        compile_model (bool): Run the forward and backward passes with a model compiled with torch.compile, shared by the agents with the same architecture.
+        gradient_check_interval (int): Training steps between the samples of the gradient norms besides the first step of each epoch (0 for only the first step).
+        max_concurrent_trainings (Optional[int]): Maximum number of agents of a process that train at the same time (None for unlimited).
+        training_threads (Optional[int]): Intra-op torch threads of each training (None for the CPUs of its slot).
+        training_interop_threads (Optional[int]): Inter-op torch threads of the process (None to keep the default of torch).
+        cpu_affinity (bool): Pin each training to the CPUs of its slot, which needs max_concurrent_trainings.
+        inbox_capacity (Optional[int]): Maximum number of pending consensus of each agent (None for unlimited).
+        inbox_overflow (str): Policy of a full consensus inbox ('drop_oldest' or 'drop_newest').
         uuid4 (str | None): Can be:
             - None, if the agents do not use a uuid4 part in their names,
             - "generate_new_uuid4", if the experiment will generate new UUID4,
@@ -51,6 +72,25 @@ class ExperimentRawData:
         self.distribution: str = data.get("distribution", "")
         self.ann: str = data.get("ann", "")
         self.seed: Optional[int] = data.get("seed", None)
+        self.layer_format: str = data.get("layer_format", "binary").lower()
+        self.compression: str = data.get("compression", "none").lower()
+        self.layer_precision: str = data.get("layer_precision", "fp32").lower()
+        self.sparsification_ratio: Optional[float] = data.get("sparsification_ratio", None)
+        self.delta_encoding: bool = bool(data.get("delta_encoding", False))
+        self.batched_consensus: bool = bool(data.get("batched_consensus", False))
+        self.double_buffered: bool = bool(data.get("double_buffered", False))
+        self.training_executor: str = data.get("training_executor", "inline").lower()
+        self.shards: int = int(data.get("shards", 1))
+        self.transport: str = data.get("transport", "xmpp").lower()
+        self.mixed_precision: str = data.get("mixed_precision", "fp32").lower()
+        self.compile_model: bool = bool(data.get("compile_model", False))
+        self.gradient_check_interval: int = int(data.get("gradient_check_interval", 0))
+        self.max_concurrent_trainings: Optional[int] = data.get("max_concurrent_trainings", None)
+        self.training_threads: Optional[int] = data.get("training_threads", None)
+        self.training_interop_threads: Optional[int] = data.get("training_interop_threads", None)
+        self.cpu_affinity: bool = bool(data.get("cpu_affinity", False))
+        self.inbox_capacity: Optional[int] = data.get("inbox_capacity", None)
+        self.inbox_overflow: str = data.get("inbox_overflow", "drop_oldest").lower()
 
     @classmethod
     def from_json(cls, json_data: Dict[str, Any]) -> "ExperimentRawData":
@@ -78,7 +118,26 @@ class ExperimentRawData:
             f"dataset={self.dataset}, "
             f"distribution={self.distribution}, "
             f"ann={self.ann}, "
-            f"seed={self.seed}>"
+            f"seed={self.seed}, "
+            f"layer_format={self.layer_format}, "
+            f"compression={self.compression}, "
+            f"layer_precision={self.layer_precision}, "
+            f"sparsification_ratio={self.sparsification_ratio}, "
+            f"delta_encoding={self.delta_encoding}, "
+            f"batched_consensus={self.batched_consensus}, "
+            f"double_buffered={self.double_buffered}, "
+            f"training_executor={self.training_executor}, "
+            f"shards={self.shards}, "
+            f"transport={self.transport}, "
+            f"mixed_precision={self.mixed_precision}, "
+            f"compile_model={self.compile_model}, "
+            f"gradient_check_interval={self.gradient_check_interval}, "
+            f"max_concurrent_trainings={self.max_concurrent_trainings}, "
+            f"training_threads={self.training_threads}, "
+            f"training_interop_threads={self.training_interop_threads}, "
+            f"cpu_affinity={self.cpu_affinity}, "
+            f"inbox_capacity={self.inbox_capacity}, "
+            f"inbox_overflow={self.inbox_overflow}>"
         )
 
 
@@ -99,6 +158,26 @@ class Experiment:
         seed (Optional[int]): Random seed. Can be:
             - None, if a random seed should be used.
             - int, to use a specific seed.
+        layer_format (str): Wire format of the layers sent between agents ('binary' or 'pickle').
+        compression (str): Preferred compression codec of the layers ('none', 'zlib', 'lzma' or 'shuffle_zlib').
+        layer_precision (str): Precision of the layers sent ('fp32', 'fp16', 'bf16', 'int8' or 'int8_channel').
+        sparsification_ratio (Optional[float]): Ratio of the entries of each layer sent with top-k sparsification
+            or None to send the dense layers.
+        delta_encoding (bool): Send the layers as XOR deltas of the last version acknowledged by each neighbour.
+        batched_consensus (bool): Apply all the pending consensus in one weighted sum per layer.
+        double_buffered (bool): Serve the layer requests received while training from a snapshot of the model published before training.
+        training_executor (str): Executor of the training and inference of the agents ('inline' or 'thread').
+        shards (int): Number of processes that run the agents (1 runs all the agents in the main process).
+        transport (str): Transport of the messages between the agents of the same process ('xmpp' or 'loopback').
+        mixed_precision (str): Precision of the forward and backward passes of the training and inference ('fp32' or 'bf16' autocast).
+        compile_model (bool): Run the forward and backward passes with a model compiled with torch.compile, shared by the agents with the same architecture.
+        gradient_check_interval (int): Training steps between the samples of the gradient norms besides the first step of each epoch (0 for only the first step).
+        max_concurrent_trainings (Optional[int]): Maximum number of agents of a process that train at the same time (None for unlimited).
+        training_threads (Optional[int]): Intra-op torch threads of each training (None for the CPUs of its slot).
+        training_interop_threads (Optional[int]): Inter-op torch threads of the process (None to keep the default of torch).
+        cpu_affinity (bool): Pin each training to the CPUs of its slot, which needs max_concurrent_trainings.
+        inbox_capacity (Optional[int]): Maximum number of pending consensus of each agent (None for unlimited).
+        inbox_overflow (str): Policy of a full consensus inbox ('drop_oldest' or 'drop_newest').
         uuid4 (Optional[uuid.UUID]): Experiment's unique identifier. Can be:
             - None, if not using UUID4.
             - Generated UUID4, if "generate_new_uuid4" is provided.
@@ -118,6 +197,25 @@ class Experiment:
         ann: str,
         seed: Optional[int],
         uuid4: Optional[str] = None,
+        layer_format: str = "binary",
+        compression: str = "none",
+        layer_precision: str = "fp32",
+        sparsification_ratio: Optional[float] = None,
+        delta_encoding: bool = False,
+        batched_consensus: bool = False,
+        double_buffered: bool = False,
+        training_executor: str = "inline",
+        shards: int = 1,
+        transport: str = "xmpp",
+        mixed_precision: str = "fp32",
+        compile_model: bool = False,
+        gradient_check_interval: int = 0,
+        max_concurrent_trainings: Optional[int] = None,
+        training_threads: Optional[int] = None,
+        training_interop_threads: Optional[int] = None,
+        cpu_affinity: bool = False,
+        inbox_capacity: Optional[int] = None,
+        inbox_overflow: str = "drop_oldest",
     ) -> None:
         """
         Initializes an Experiment instance.
@@ -134,6 +232,42 @@ class Experiment:
             ann (str): Neural network architecture.
             seed (Optional[int]): Randomness seed or None if random.
             uuid4 (Optional[str]): UUID4 string, "generate_new_uuid4" to generate one or None to not use it.
+            layer_format (str, optional): Wire format of the layers. Defaults to "binary".
+            compression (str, optional): Preferred compression codec of the layers. Defaults to "none".
+            layer_precision (str, optional): Precision of the layers sent. Defaults to "fp32".
+            sparsification_ratio (Optional[float], optional): Ratio of the entries of each layer sent with top-k
+                sparsification. Defaults to None (dense layers).
+            delta_encoding (bool, optional): Send the layers as XOR deltas of the last version acknowledged by
+                each neighbour. Defaults to False.
+            batched_consensus (bool, optional): Apply all the pending consensus in one weighted sum per layer.
+                Defaults to False.
+            double_buffered (bool, optional): Serve the layer requests received while training from a snapshot of
+                the model published before training. Defaults to False.
+            training_executor (str, optional): Executor of the training and inference of the agents ("inline" or
+                "thread"). Defaults to "inline".
+            shards (int, optional): Number of processes that run the agents. Defaults to 1 (all the agents run in
+                the main process).
+            transport (str, optional): Transport of the messages between the agents of the same process ("xmpp" or
+                "loopback"). Defaults to "xmpp".
+            mixed_precision (str, optional): Precision of the forward and backward passes of the training and
+                inference ("fp32" or "bf16" autocast). Defaults to "fp32".
+            compile_model (bool, optional): Run the forward and backward passes with a model compiled with
+                `torch.compile`, shared by the agents with the same architecture. Defaults to False.
+            gradient_check_interval (int, optional): Training steps between the samples of the gradient norms
+                besides the first step of each epoch. Defaults to 0 (only the first step of each epoch).
+            max_concurrent_trainings (Optional[int], optional): Maximum number of agents of a process that train
+                at the same time. Defaults to None (unlimited).
+            training_threads (Optional[int], optional): Intra-op torch threads of each training. Defaults to None
+                (the CPUs of the slot of the training, or the threads of the process without a maximum number of
+                concurrent trainings).
+            training_interop_threads (Optional[int], optional): Inter-op torch threads of the process. Defaults to
+                None (the default of torch).
+            cpu_affinity (bool, optional): Pin each training to the CPUs of its slot. It needs
+                `max_concurrent_trainings`. Defaults to False.
+            inbox_capacity (Optional[int], optional): Maximum number of pending consensus of each agent. Defaults
+                to None (unlimited).
+            inbox_overflow (str, optional): Policy of a full consensus inbox: "drop_oldest" removes the oldest
+                pending consensus and "drop_newest" discards the new one. Defaults to "drop_oldest".
         """
         raw_data_dict = {
             "algorithm": algorithm,
@@ -147,6 +281,25 @@ class Experiment:
             "ann": ann,
             "seed": seed,
             "uuid4": uuid4,
+            "layer_format": layer_format,
+            "compression": compression,
+            "layer_precision": layer_precision,
+            "sparsification_ratio": sparsification_ratio,
+            "delta_encoding": delta_encoding,
+            "batched_consensus": batched_consensus,
+            "double_buffered": double_buffered,
+            "training_executor": training_executor,
+            "shards": shards,
+            "transport": transport,
+            "mixed_precision": mixed_precision,
+            "compile_model": compile_model,
+            "gradient_check_interval": gradient_check_interval,
+            "max_concurrent_trainings": max_concurrent_trainings,
+            "training_threads": training_threads,
+            "training_interop_threads": training_interop_threads,
+            "cpu_affinity": cpu_affinity,
+            "inbox_capacity": inbox_capacity,
+            "inbox_overflow": inbox_overflow,
         }
         self.raw_data: ExperimentRawData = ExperimentRawData(data=raw_data_dict)
         self.algorithm: str = algorithm.lower()
@@ -159,6 +312,50 @@ class Experiment:
         self.distribution: str = distribution
         self.ann: str = ann
         self.seed: Optional[int] = seed if seed is not None else random.randint(0, 2**32 - 1)
+        self.layer_format: str = layer_format.lower()
+        self.compression: str = compression.lower()
+        self.layer_precision: str = layer_precision.lower()
+        self.sparsification_ratio: Optional[float] = sparsification_ratio
+        self.delta_encoding: bool = delta_encoding
+        self.batched_consensus: bool = batched_consensus
+        self.double_buffered: bool = double_buffered
+        self.training_executor: str = training_executor.lower()
+        self.shards: int = shards
+        self.transport: str = transport.lower()
+        self.mixed_precision: str = mixed_precision.lower()
+        self.compile_model: bool = compile_model
+        self.gradient_check_interval: int = gradient_check_interval
+        self.max_concurrent_trainings: Optional[int] = max_concurrent_trainings
+        self.training_threads: Optional[int] = training_threads
+        self.training_interop_threads: Optional[int] = training_interop_threads
+        self.cpu_affinity: bool = cpu_affinity
+        self.inbox_capacity: Optional[int] = inbox_capacity
+        self.inbox_overflow: str = inbox_overflow.lower()
+        if self.shards < 1:
+            raise ValueError(f"The number of shards must be greater than 0 and it is {self.shards}.")
+        if self.gradient_check_interval < 0:
+            raise ValueError(
+                f"The gradient check interval must be greater or equal to 0 and it is {self.gradient_check_interval}."
+            )
+        if self.max_concurrent_trainings is not None and self.max_concurrent_trainings < 1:
+            raise ValueError(
+                f"The maximum number of concurrent trainings must be greater than 0 and it is "
+                f"{self.max_concurrent_trainings}."
+            )
+        if self.training_threads is not None and self.training_threads < 1:
+            raise ValueError(f"The training threads must be greater than 0 and they are {self.training_threads}.")
+        if self.training_interop_threads is not None and self.training_interop_threads < 1:
+            raise ValueError(
+                f"The training inter-op threads must be greater than 0 and they are {self.training_interop_threads}."
+            )
+        if self.cpu_affinity and self.max_concurrent_trainings is None:
+            raise ValueError("The CPU affinity needs a maximum number of concurrent trainings.")
+        if self.inbox_capacity is not None and self.inbox_capacity < 1:
+            raise ValueError(f"The inbox capacity must be greater than 0 and it is {self.inbox_capacity}.")
+        if self.inbox_overflow not in INBOX_OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Inbox overflow policy {self.inbox_overflow} is not valid. Valid policies: {INBOX_OVERFLOW_POLICIES}."
+            )
 
         # Handle UUID4 logic
         self.uuid4: Optional[uuid.UUID] = None
@@ -212,6 +409,25 @@ class Experiment:
             ann=raw_data.ann,
             seed=raw_data.seed,
             uuid4=raw_data.uuid4,
+            layer_format=raw_data.layer_format,
+            compression=raw_data.compression,
+            layer_precision=raw_data.layer_precision,
+            sparsification_ratio=raw_data.sparsification_ratio,
+            delta_encoding=raw_data.delta_encoding,
+            batched_consensus=raw_data.batched_consensus,
+            double_buffered=raw_data.double_buffered,
+            training_executor=raw_data.training_executor,
+            shards=raw_data.shards,
+            transport=raw_data.transport,
+            mixed_precision=raw_data.mixed_precision,
+            compile_model=raw_data.compile_model,
+            gradient_check_interval=raw_data.gradient_check_interval,
+            max_concurrent_trainings=raw_data.max_concurrent_trainings,
+            training_threads=raw_data.training_threads,
+            training_interop_threads=raw_data.training_interop_threads,
+            cpu_affinity=raw_data.cpu_affinity,
+            inbox_capacity=raw_data.inbox_capacity,
+            inbox_overflow=raw_data.inbox_overflow,
         )
 
     @classmethod
@@ -241,5 +457,24 @@ class Experiment:
             f"dataset={self.dataset}, "
             f"distribution={self.distribution}, "
             f"ann={self.ann}, "
-            f"seed={self.seed}>"
+            f"seed={self.seed}, "
+            f"layer_format={self.layer_format}, "
+            f"compression={self.compression}, "
+            f"layer_precision={self.layer_precision}, "
+            f"sparsification_ratio={self.sparsification_ratio}, "
+            f"delta_encoding={self.delta_encoding}, "
+            f"batched_consensus={self.batched_consensus}, "
+            f"double_buffered={self.double_buffered}, "
+            f"training_executor={self.training_executor}, "
+            f"shards={self.shards}, "
+            f"transport={self.transport}, "
+            f"mixed_precision={self.mixed_precision}, "
+            f"compile_model={self.compile_model}, "
+            f"gradient_check_interval={self.gradient_check_interval}, "
+            f"max_concurrent_trainings={self.max_concurrent_trainings}, "
+            f"training_threads={self.training_threads}, "
+            f"training_interop_threads={self.training_interop_threads}, "
+            f"cpu_affinity={self.cpu_affinity}, "
+            f"inbox_capacity={self.inbox_capacity}, "
+            f"inbox_overflow={self.inbox_overflow}>"
         )
@@ -0,0 +1,158 @@
+from typing import Dict
+
+import torch
+from torch import Tensor, nn
+
+from ..message.precision import restore_layer_precision
+
+
+class FlatModelState:
+    """
+    Stores the parameters and buffers of a model in one contiguous flat buffer per dtype and device. The tensors of
+    the model are rebound as views of the flat buffers, so the layers can be updated in-place with multi-tensor
+    kernels without building a new state dict and loading it with `load_state_dict`.
+    """
+
+    def __init__(self, model: nn.Module) -> None:
+        self.model = model
+        self.buffers: Dict[tuple[torch.dtype, torch.device], Tensor] = {}
+        self.tensors: Dict[str, Tensor] = {}  # Views of the flat buffers by state dict name
+        self.bind()
+
+    def bind(self) -> None:
+        """
+        Copies the parameters and buffers of the model into new flat buffers and rebinds them as views.
+        """
+        state = self.model.state_dict(keep_vars=True)
+        seen: set[int] = set()  # Tied tensors are stored once
+        groups: Dict[tuple[torch.dtype, torch.device], list[Tensor]] = {}
+        for tensor in state.values():
+            if id(tensor) not in seen:
+                seen.add(id(tensor))
+                groups.setdefault((tensor.dtype, tensor.device), []).append(tensor)
+
+        views: Dict[int, Tensor] = {}
+        self.buffers = {}
+        for (dtype, device), tensors in groups.items():
+            flat = torch.empty(sum(tensor.numel() for tensor in tensors), dtype=dtype, device=device)
+            offset = 0
+            for tensor in tensors:
+                view = flat[offset : offset + tensor.numel()].view(tensor.shape)
+                view.copy_(tensor.detach())
+                views[id(tensor)] = view
+                offset += tensor.numel()
+            self.buffers[(dtype, device)] = flat
+
+        for name, tensor in state.items():
+            view = views[id(tensor)]
+            module_name, _, attribute = name.rpartition(".")
+            module = self.model.get_submodule(module_name)
+            if isinstance(tensor, nn.Parameter):
+                tensor.data = view
+            else:
+                module._buffers[attribute] = view
+        self.tensors = {name: tensor.detach() for name, tensor in self.model.state_dict(keep_vars=True).items()}
+
+    def is_bound(self) -> bool:
+        """
+        Checks that the tensors of the model are still the views of the flat buffers. They are not after moving
+        the model to another device or loading a state dict with `assign=True`.
+
+        Returns:
+            bool: True if every tensor of the model is a view of the flat buffers.
+        """
+        state = self.model.state_dict(keep_vars=True)
+        return state.keys() == self.tensors.keys() and all(
+            tensor.data_ptr() == self.tensors[name].data_ptr() for name, tensor in state.items()
+        )
+
+    def lerp_(
+        self,
+        layers: Dict[str, Tensor],
+        weight: float,
+        quantization: None | Dict[str, tuple[Tensor, Tensor]] = None,
+    ) -> None:
+        """
+        Updates in-place the layers of the model to `(1 - weight) * layer + weight * foreign` with one fused
+        `torch._foreach_lerp_` call per dtype and device of the flat buffers.
+
+        Args:
+            layers (Dict[str, Tensor]): The foreign layers. Layers that are not in the model are ignored.
+            weight (float): The weight of the foreign layers.
+            quantization (None | Dict[str, tuple[Tensor, Tensor]], optional): Scale and zero-point of the int8
+                quantized layers. Defaults to None.
+        """
+        if not self.is_bound():
+            self.bind()
+        groups: Dict[tuple[torch.dtype, torch.device], tuple[list[Tensor], list[Tensor]]] = {}
+        for name, foreign in layers.items():
+            if name not in self.tensors:
+                continue
+            main = self.tensors[name]
+            layer_quantization = None if quantization is None else quantization.get(name)
+            if not main.is_floating_point():
+                # Same result as the out-of-place consensus, truncated to the dtype of the layer
+                main.copy_((1 - weight) * main + weight * foreign.to(main.device))
+                continue
+            foreign = restore_layer_precision(foreign, dtype=main.dtype, quantization=layer_quantization).to(
+                main.device
+            )
+            mains, foreigns = groups.setdefault((main.dtype, main.device), ([], []))
+            mains.append(main)
+            foreigns.append(foreign)
+        for mains, foreigns in groups.values():
+            torch._foreach_lerp_(mains, foreigns, weight)
+
+    def lerp_all_(
+        self,
+        contributions: list[tuple[Dict[str, Tensor], None | Dict[str, tuple[Tensor, Tensor]]]],
+        weight: float,
+    ) -> None:
+        """
+        Applies in-place several consensus in one weighted sum per layer, with the same result as applying them
+        sequentially with `lerp_`. A layer received from `k` neighbours becomes
+        `(1 - weight) ** k * layer + sum(weight * (1 - weight) ** j_i * foreign_i)`, where `j_i` is the number of
+        later contributions that contain the layer. The scaling of the layers is fused per dtype and device, and
+        the foreign layers with the same coefficient are added with one `torch._foreach_add_` call.
+
+        Args:
+            contributions (list[tuple[Dict[str, Tensor], None | Dict[str, tuple[Tensor, Tensor]]]]): The foreign
+                layers and their quantization, in the order of the sequential consensus.
+            weight (float): The weight of the foreign layers.
+        """
+        if not self.is_bound():
+            self.bind()
+        remaining: Dict[str, int] = {}  # Contributions not processed yet that contain each layer
+        for layers, _ in contributions:
+            for name in layers.keys():
+                if name in self.tensors:
+                    remaining[name] = remaining.get(name, 0) + 1
+
+        scales: Dict[tuple[torch.dtype, torch.device], tuple[list[Tensor], list[float]]] = {}
+        for name, count in remaining.items():
+            main = self.tensors[name]
+            if main.is_floating_point():
+                mains, coefficients = scales.setdefault((main.dtype, main.device), ([], []))
+                mains.append(main)
+                coefficients.append((1 - weight) ** count)
+        for mains, coefficients in scales.values():
+            torch._foreach_mul_(mains, coefficients)
+
+        for layers, quantization in contributions:
+            additions: Dict[tuple[torch.dtype, torch.device, float], tuple[list[Tensor], list[Tensor]]] = {}
+            for name, foreign in layers.items():
+                if name not in self.tensors:
+                    continue
+                main = self.tensors[name]
+                remaining[name] -= 1
+                if not main.is_floating_point():
+                    main.copy_((1 - weight) * main + weight * foreign.to(main.device))
+                    continue
+                layer_quantization = None if quantization is None else quantization.get(name)
+                foreign = restore_layer_precision(foreign, dtype=main.dtype, quantization=layer_quantization)
+                coefficient = weight * (1 - weight) ** remaining[name]
+                mains, foreigns = additions.setdefault((main.dtype, main.device, coefficient), ([], []))
+                mains.append(main)
+                foreigns.append(foreign.to(main.device))
+            for (_, _, coefficient), (mains, foreigns) in additions.items():
+                torch._foreach_add_(mains, foreigns, alpha=coefficient)
@@ -0,0 +1,105 @@
+import logging
+import math
+from typing import Dict
+
+import torch
+from torch import Tensor, nn
+
+
+class GradientMonitor:
+    """
+    Samples the gradient norms of every parameter of a model on the first training step of each epoch and every
+    `interval` steps, instead of inspecting the gradients after every backward pass. The norms are computed with a
+    fused `torch._foreach_norm` and stored in a ring buffer on the device of the model, with one row per sample and
+    one column per parameter, so they can feed the convergence logs or the selection of the layers.
+    """
+
+    def __init__(self, model: nn.Module, interval: int = 0, capacity: int = 256) -> None:
+        """
+        Args:
+            model (nn.Module): The model whose gradients are sampled.
+            interval (int, optional): Steps between samples besides the first step of each epoch. Defaults to 0
+                (only the first step of each epoch).
+            capacity (int, optional): Number of samples kept in the buffer. Defaults to 256.
+
+        Raises:
+            ValueError: If the interval is negative or the capacity is not positive.
+        """
+        if interval < 0:
+            raise ValueError(
+                f"The interval of the gradient monitor must be greater or equal to 0 and it is {interval}."
+            )
+        if capacity <= 0:
+            raise ValueError(f"The capacity of the gradient monitor must be greater than 0 and it is {capacity}.")
+        self.interval = interval
+        self.capacity = capacity
+        named_parameters = [(name, param) for name, param in model.named_parameters() if param.requires_grad]
+        self.names: list[str] = [name for name, _ in named_parameters]
+        self.params: list[nn.Parameter] = [param for _, param in named_parameters]
+        self.norms: None | Tensor = None  # (capacity, parameters) gradient norms, NaN if there is no gradient
+        self.steps: None | Tensor = None  # Training step of each row
+        self.step: int = 0  # Training steps seen by the monitor
+        self.samples: int = 0  # Samples recorded, including the ones overwritten in the ring buffer
+
+    def on_step(self, first_of_epoch: bool = False) -> None:
+        """
+        Counts a training step and samples the gradients if it is the first step of the epoch or the interval has
+        elapsed. It must be called after the backward pass and before the gradients are cleared.
+
+        Args:
+            first_of_epoch (bool, optional): Whether it is the first step of the epoch. Defaults to False.
+        """
+        self.step += 1
+        if first_of_epoch or (self.interval > 0 and self.step % self.interval == 0):
+            self.record()
+
+    def record(self) -> None:
+        """
+        Stores the norms of the current gradients in the next row of the buffer, and logs a warning if no
+        gradient was computed.
+        """
+        present = [i for i, param in enumerate(self.params) if param.grad is not None]
+        grads = [param.grad for param in self.params if param.grad is not None]
+        if not present:
+            logging.getLogger(__name__).warning(
+                "No gradients are being computed during training. Ensure loss.backward() is called and "
+                f"optimizer.step() is executed. None gradients for parameters: {self.names}"
+            )
+            return
+        if self.norms is None or self.steps is None:
+            device = grads[0].device
+            self.norms = torch.full((self.capacity, len(self.params)), float("nan"), device=device)
+            self.steps = torch.full((self.capacity,), -1, dtype=torch.long)
+        row = self.samples % self.capacity
+        norms = torch.stack(torch._foreach_norm(grads)).to(self.norms.dtype)
+        self.norms[row].fill_(float("nan"))
+        if len(present) == len(self.params):
+            self.norms[row].copy_(norms)
+        else:
+            self.norms[row, present] = norms
+        self.steps[row] = self.step
+        self.samples += 1
+
+    def history(self) -> tuple[Tensor, Tensor]:
+        """
+        Returns:
+            tuple[Tensor, Tensor]: The training steps and the gradient norms of the samples in the buffer, from
+            the oldest to the newest.
+        """
+        if self.norms is None or self.steps is None:
+            return torch.empty(0, dtype=torch.long), torch.empty(0, len(self.params))
+        if self.samples <= self.capacity:
+            return self.steps[: self.samples], self.norms[: self.samples]
+        order = torch.arange(self.samples, self.samples + self.capacity) % self.capacity
+        return self.steps[order], self.norms[order.to(self.norms.device)]
+
+    def latest(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: The gradient norm of each parameter in the last sample, without the parameters that
+            had no gradient. It is empty if there are no samples.
+        """
+        if self.norms is None or self.samples == 0:
+            return {}
+        norms = self.norms[(self.samples - 1) % self.capacity].tolist()
+        return {name: norm for name, norm in zip(self.names, norms) if not math.isnan(norm)}
@@ -2,7 +2,9 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Optional
 
+import torch
 from sklearn.metrics import f1_score, precision_score, recall_score
+from torch import Tensor
 
 
 @dataclass
@@ -55,3 +57,120 @@ class ModelMetrics:
             start_time_z=start_time_z,
             end_time_z=end_time_z,
         )
+
+    @classmethod
+    def from_confusion_matrix(
+        cls,
+        confusion_matrix: Tensor,
+        total_loss: float,
+        num_batches: int,
+        start_time_z: datetime,
+        end_time_z: datetime,
+    ) -> "ModelMetrics":
+        """
+        Computes the metrics from a confusion matrix with the true labels in the rows and the predicted labels in
+        the columns. The macro averages are the same as the ones of `compute_metrics`: they only include the
+        classes that appear in the true or the predicted labels, and the undefined ratios are 0.
+
+        Args:
+            confusion_matrix (Tensor): Square matrix with the number of samples of each true and predicted label.
+            total_loss (float): Sum of the losses of the batches.
+            num_batches (int): Number of batches.
+            start_time_z (datetime): Start time of the evaluation.
+            end_time_z (datetime): End time of the evaluation.
+
+        Raises:
+            ValueError: If the confusion matrix is empty.
+
+        Returns:
+            ModelMetrics: The metrics.
+        """
+        confusion = confusion_matrix.to(device="cpu", dtype=torch.float64)
+        total = confusion.sum()
+        if total == 0:
+            raise ValueError("Empty confusion matrix provided.")
+        true_positives = confusion.diagonal()
+        predicted = confusion.sum(dim=0)
+        actual = confusion.sum(dim=1)
+        present = (predicted + actual) > 0
+        zero = torch.zeros_like(true_positives)
+        precision = torch.where(predicted > 0, true_positives / predicted.clamp(min=1), zero)[present].mean()
+        recall = torch.where(actual > 0, true_positives / actual.clamp(min=1), zero)[present].mean()
+        f1_denominator = predicted + actual
+        f1 = torch.where(f1_denominator > 0, 2 * true_positives / f1_denominator.clamp(min=1), zero)[present].mean()
+        accuracy, precision_value, recall_value, f1_value = torch.stack(
+            [true_positives.sum() / total, precision, recall, f1]
+        ).tolist()
+        return cls(
+            accuracy=accuracy,
+            loss=total_loss / num_batches,
+            precision=precision_value,
+            recall=recall_value,
+            f1_score=f1_value,
+            start_time_z=start_time_z,
+            end_time_z=end_time_z,
+        )
+
+
+class MetricsAccumulator:
+    """
+    Streaming accumulator of the metrics of a training epoch or an inference. The confusion matrix and the sum of
+    the losses are kept on the device of the model and updated per batch without synchronizing with the host, and
+    the metrics are computed once with `compute`.
+    """
+
+    def __init__(self) -> None:
+        self.confusion_matrix: None | Tensor = None
+        self.total_loss: None | Tensor = None
+        self.num_batches: int = 0
+
+    def update(self, outputs: Tensor, labels: Tensor, loss: Tensor, mask: None | Tensor = None) -> None:
+        """
+        Adds a batch to the confusion matrix and its loss to the sum of the losses.
+
+        Args:
+            outputs (Tensor): The logits of the batch, with the classes in the second dimension.
+            labels (Tensor): The true labels of the batch.
+            loss (Tensor): The loss of the batch.
+            mask (None | Tensor, optional): 1 for the samples to count and 0 for the padding. Defaults to None
+                (all the samples).
+        """
+        num_classes = outputs.shape[1]
+        predicted = outputs.detach().argmax(dim=1)
+        indices = labels.long() * num_classes + predicted
+        if mask is None:
+            counts = torch.bincount(indices, minlength=num_classes * num_classes)
+        else:
+            counts = torch.bincount(indices, weights=mask, minlength=num_classes * num_classes).long()
+        if self.confusion_matrix is None or self.total_loss is None:
+            self.confusion_matrix = torch.zeros((num_classes, num_classes), dtype=torch.long, device=outputs.device)
+            self.total_loss = torch.zeros((), dtype=torch.float64, device=outputs.device)
+        self.confusion_matrix += counts.view(num_classes, num_classes)
+        self.total_loss += loss.detach()
+        self.num_batches += 1
+
+    def compute(self, start_time_z: datetime, end_time_z: datetime, num_batches: None | int = None) -> ModelMetrics:
+        """
+        Computes the metrics of the accumulated batches.
+
+        Args:
+            start_time_z (datetime): Start time of the epoch or the inference.
+            end_time_z (datetime): End time of the epoch or the inference.
+            num_batches (None | int, optional): Number of batches to average the loss. Defaults to None (the
+                number of updates).
+
+        Raises:
+            ValueError: If no batch was accumulated.
+
+        Returns:
+            ModelMetrics: The metrics.
+        """
+        if self.confusion_matrix is None or self.total_loss is None:
+            raise ValueError("No batches were accumulated in the metrics.")
+        return ModelMetrics.from_confusion_matrix(
+            confusion_matrix=self.confusion_matrix,
+            total_loss=self.total_loss.item(),
+            num_batches=self.num_batches if num_batches is None else num_batches,
+            start_time_z=start_time_z,
+            end_time_z=end_time_z,
+        )
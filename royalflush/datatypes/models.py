@@ -1,9 +1,12 @@
+import asyncio
 import codecs
 import copy
-import logging
+import functools
 import pickle
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, TypeVar
 
 import torch
 from torch import Tensor, nn
@@ -12,11 +15,19 @@ from torch.nn.modules.loss import _Loss
 from torch.optim import Optimizer
 from torch.utils.data import DataLoader
 
-from ..datatypes.metrics import ModelMetrics
+from ..datatypes.metrics import MetricsAccumulator, ModelMetrics
 from ..log.nn import NnConvergenceLogManager, NnTrainLogManager
 
 # from ..utils.random import RandomUtils
+from .compiled_forward import COMPILED_FORWARD_CACHE, CompiledForward
 from .data import DataLoaders
+from .flat_state import FlatModelState
+from .gradient_monitor import GradientMonitor
+
+T = TypeVar("T")
+
+TRAINING_EXECUTORS: list[str] = ["inline", "thread"]
+MIXED_PRECISIONS: list[str] = ["fp32", "bf16"]
 
 
 class ModelManager:
@@ -36,6 +47,11 @@ class ModelManager:
         seed: None | int = 42,
         deterministic: bool = False,
         track_layers_weights: None | list[str] = None,
+        double_buffered: bool = False,
+        training_executor: str = "inline",
+        gradient_check_interval: int = 0,
+        mixed_precision: str = "fp32",
+        compile_model: bool = False,
     ) -> None:
         self.model = model
         self.criterion = criterion
@@ -50,41 +66,157 @@ class ModelManager:
         )
         self.model = self.model.to(self.device)
         self.__move_optimizer_to_device()
+        self.flat_state = FlatModelState(self.model)  # Parameters and buffers as views of flat buffers
         self.track_layers_weights: list[str] = [] if track_layers_weights is None else track_layers_weights
+        # Gradient norms sampled on the first step of each epoch and every `gradient_check_interval` steps
+        self.gradient_monitor = GradientMonitor(self.model, interval=gradient_check_interval)
         # NOTE when the below NOTE is completed, uncomment: RandomUtils.set_randomness(seed=self.seed)
         # NOTE Ask for a model generator and generate the model here: self.model = generator.get_model(parameters)
         self.initial_state: Dict[str, Tensor] = copy.deepcopy(model.state_dict())
         # self.pretrain_state: Dict[str, Tensor] = copy.deepcopy(
         #     self.model.state_dict()
         # )
-        self.__training: bool = False
+        self.__training_sessions: int = 0  # Nested training sessions, the model is being trained if it is not 0
+        self.version: int = 0  # Incremented every time that the weights of the model change
+        self.double_buffered = double_buffered  # Serve the layers from a published snapshot while training
+        self.published_layers: Dict[str, Tensor] = {}  # Snapshot of the model published before training
+        if training_executor.lower() not in TRAINING_EXECUTORS:
+            raise NotImplementedError(
+                f"Training executor {training_executor} is not valid. Valid executors: {TRAINING_EXECUTORS}."
+            )
+        self.training_executor = training_executor.lower()
+        self.executor: None | Executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="rf-train")
+            if self.training_executor == "thread"
+            else None
+        )  # Runs the training and inference outside the event loop of the agent
+        if mixed_precision.lower() not in MIXED_PRECISIONS:
+            raise NotImplementedError(
+                f"Mixed precision {mixed_precision} is not valid. Valid precisions: {MIXED_PRECISIONS}."
+            )
+        self.mixed_precision = mixed_precision.lower()  # bf16 autocasts the forward and backward passes
+        self.compile_model = compile_model  # Use the compiled forward shared by the models of the architecture
+        self.__compiled_forwards: Dict[bool, CompiledForward] = {}  # By training mode
 
     def is_training(self) -> bool:
-        return self.__training
+        return self.__training_sessions > 0
+
+    async def run_in_executor(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs a blocking method of the model manager, such as `train` or `inference`, in the executor of the
+        training, so the event loop of the agent keeps receiving and sending messages. Without executor the method
+        is called directly.
+
+        Args:
+            function (Callable[..., T]): The method to run.
+            *args (Any): Positional arguments of the method.
+            **kwargs (Any): Keyword arguments of the method.
+
+        Returns:
+            T: The result of the method.
+        """
+        if self.executor is None:
+            return function(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(function, *args, **kwargs))
+
+    def can_serve_layers(self) -> bool:
+        """
+        Returns:
+            bool: True if the layers can be sent to the neighbours: the model is not being trained or the
+            published snapshot is available in double-buffered mode.
+        """
+        return not self.is_training() or self.double_buffered
+
+    def publish(self) -> None:
+        """
+        Stores an immutable snapshot of the model to answer the layer requests while the model is trained.
+        """
+        self.published_layers = {name: layer.detach().clone() for name, layer in self.model.state_dict().items()}
+
+    def get_published_layers(self, layers: list[str]) -> Dict[str, Tensor]:
+        """
+        Returns the layers to send to the neighbours: the published snapshot while the model is trained in
+        double-buffered mode and the current layers otherwise.
+
+        Args:
+            layers (list[str]): The names of the layers.
+
+        Returns:
+            Dict[str, Tensor]: The layers.
+        """
+        if self.is_training() and self.double_buffered:
+            return {layer: self.published_layers[layer] for layer in layers}
+        return self.get_layers(layers)
 
     def replace_all_layers(self, new_layers: Dict[str, Tensor]) -> None:
         self.model.load_state_dict(state_dict=new_layers)
+        self.version += 1
 
-    def _check_gradients(self) -> None:
+    def lerp_layers(
+        self,
+        layers: Dict[str, Tensor],
+        weight: float,
+        quantization: None | Dict[str, tuple[Tensor, Tensor]] = None,
+    ) -> None:
         """
-        Checks if gradients are being computed for the model's parameters and logs a warning if they are not.
-        Remember to use it after calling loss.backward() and before optimizer.step().
+        Moves in-place the layers of the model towards the given layers: `(1 - weight) * layer + weight * foreign`.
+
+        Args:
+            layers (Dict[str, Tensor]): The foreign layers.
+            weight (float): The weight of the foreign layers.
+            quantization (None | Dict[str, tuple[Tensor, Tensor]], optional): Scale and zero-point of the int8
+                quantized layers. Defaults to None.
         """
-        logger = logging.getLogger(__name__)
-        no_gradients = True
-
-        params = []
-        for name, param in self.model.named_parameters():
-            if param.grad is None:
-                params.append(name)
-                # logger.warning(f"Gradient not computed for parameter: {name}")
-            else:
-                no_gradients = False
+        with torch.no_grad():
+            self.flat_state.lerp_(layers=layers, weight=weight, quantization=quantization)
+        self.version += 1
 
-        if no_gradients:
-            logger.warning(
-                f"No gradients are being computed during training. Ensure loss.backward() is called and optimizer.step() is executed. None gradients for parameters: {params}"
-            )
+    def lerp_all_layers(
+        self,
+        contributions: list[tuple[Dict[str, Tensor], None | Dict[str, tuple[Tensor, Tensor]]]],
+        weight: float,
+    ) -> None:
+        """
+        Applies `lerp_layers` with every contribution in order, computing one weighted sum per layer.
+
+        Args:
+            contributions (list[tuple[Dict[str, Tensor], None | Dict[str, tuple[Tensor, Tensor]]]]): The foreign
+                layers and their quantization.
+            weight (float): The weight of the foreign layers.
+        """
+        with torch.no_grad():
+            self.flat_state.lerp_all_(contributions=contributions, weight=weight)
+        self.version += 1
+
+    def _autocast(self) -> torch.autocast:
+        """
+        Returns:
+            torch.autocast: The autocast context of the forward pass and the loss, enabled with bf16 in "bf16"
+            mixed precision. The backward pass follows the dtypes of the forward pass.
+        """
+        return torch.autocast(
+            device_type=self.device.type, dtype=torch.bfloat16, enabled=self.mixed_precision == "bf16"
+        )
+
+    def _forward(self, images: Tensor) -> Tensor:
+        """
+        Runs the forward pass of the model in its current mode. With `compile_model`, the compiled forward of the
+        architecture is called with the parameters and buffers of the model, so it is compiled once per process
+        and mode for all the models with the same architecture.
+
+        Args:
+            images (Tensor): The input batch.
+
+        Returns:
+            Tensor: The output of the model.
+        """
+        if not self.compile_model:
+            return self.model(images)
+        training = self.model.training
+        if training not in self.__compiled_forwards:
+            self.__compiled_forwards[training] = COMPILED_FORWARD_CACHE.get(model=self.model, training=training)
+        return self.__compiled_forwards[training](self.model.state_dict(keep_vars=True), images)
 
     def train(
         self,
@@ -100,7 +232,39 @@ class ModelManager:
             weight_logger: Logger for track weight convergence.
         """
         # self.pretrain_state = copy.deepcopy(self.model.state_dict())
-        self.__training = True
+        with self.training_session():
+            return self.__train(epochs=epochs, train_logger=train_logger, weight_logger=weight_logger)
+
+    @contextmanager
+    def training_session(self) -> Iterator[None]:
+        """
+        Marks the model as being trained while the context is active: the snapshot is published in double-buffered
+        mode and the version is incremented when the training starts and when it finishes. It is used by `train`
+        and by the engines that update the weights of the model outside of `train`, such as `StackedTrainer`.
+
+        The sessions can be nested and only the outermost one publishes the snapshot and increments the version.
+        The agents open the session in the event loop before running `train` in the training executor, so the
+        layers are never read from the model while the executor is updating it.
+        """
+        outermost = self.__training_sessions == 0
+        if outermost:
+            if self.double_buffered:
+                self.publish()
+            self.version += 1
+        self.__training_sessions += 1
+        try:
+            yield
+        finally:
+            self.__training_sessions -= 1
+            if outermost:
+                self.version += 1
+
+    def __train(
+        self,
+        epochs: None | int,
+        train_logger: None | NnTrainLogManager,
+        weight_logger: None | NnConvergenceLogManager,
+    ) -> list[ModelMetrics]:
         if epochs is None:
             epochs = self.training_epochs
 
@@ -122,41 +286,33 @@ class ModelManager:
                 # correct: int = 0
                 # total_samples: int = 0
 
-                predicted_labels: list[int] = []
-                true_labels: list[int] = []
-                total_loss: float = 0.0
+                accumulator = MetricsAccumulator()  # Confusion matrix and loss on the device, without host syncs
 
                 images: Tensor
                 labels: Tensor
                 outputs: Tensor
                 loss: Tensor
-                predicted: Tensor
 
                 init_time_z = datetime.now(tz=timezone.utc)
                 dataloader: DataLoader = self.dataloaders.train
-                for images, labels in dataloader:
+                for batch, (images, labels) in enumerate(dataloader):
                     images, labels = images.to(self.device), labels.to(self.device)
                     self.optimizer.zero_grad()
-                    outputs = self.model(images)
-                    loss = self.criterion(outputs, labels)
+                    with self._autocast():
+                        outputs = self._forward(images)
+                        loss = self.criterion(outputs, labels)
                     loss.backward()
-                    self._check_gradients()
+                    self.gradient_monitor.on_step(first_of_epoch=batch == 0)
                     self.optimizer.step()
-                    total_loss += loss.item()
-                    _, predicted = torch.max(outputs.data, 1)
-                    predicted_labels.extend(predicted.cpu().numpy().tolist())
-                    true_labels.extend(labels.cpu().numpy().tolist())
+                    accumulator.update(outputs=outputs, labels=labels, loss=loss)
                     # total_samples += labels.size(0)
                     # correct += int((predicted == labels).sum().item())
 
                 # Log metrics after each epoch
-                epoch_metric: ModelMetrics = ModelMetrics.compute_metrics(
-                    true_labels=true_labels,
-                    predicted_labels=predicted_labels,
-                    total_loss=total_loss,
-                    num_batches=len(dataloader),
+                epoch_metric: ModelMetrics = accumulator.compute(
                     start_time_z=init_time_z,
                     end_time_z=datetime.now(tz=timezone.utc),
+                    num_batches=len(dataloader),
                 )
 
                 # epoch_metric: ModelMetrics = ModelMetrics(
@@ -174,13 +330,15 @@ class ModelManager:
                     weight_logger.log_weights(
                         timestamp_z=datetime.now(tz=timezone.utc), description="POST-TRAIN", model=current_state
                     )
+                    weight_logger.log_gradient_norms(
+                        timestamp_z=datetime.now(tz=timezone.utc), norms=self.gradient_monitor.latest()
+                    )
 
             return metrics
 
         finally:
             if weight_logger is not None:
                 weight_logger.epoch_or_iteration = -1
-            self.__training = False
 
     def _inference(self, dataloader: DataLoader) -> ModelMetrics:
         """
@@ -191,41 +349,30 @@ class ModelManager:
         self.model.eval()
         # correct: int = 0
         # total: int = 0
-        predicted_labels: list[int] = []
-        true_labels: list[int] = []
-        total_loss: float = 0.0
+        accumulator = MetricsAccumulator()
 
         images: Tensor
         labels: Tensor
         outputs: Tensor
         loss: Tensor
-        predicted: Tensor
 
         init_time_z = datetime.now(tz=timezone.utc)
         with torch.no_grad():
             for images, labels in dataloader:
                 images, labels = images.to(self.device), labels.to(self.device)
-                outputs = self.model(images)
-                loss = self.criterion(outputs, labels)
-                total_loss += loss.item()
-
-                _, predicted = torch.max(outputs.data, 1)
+                with self._autocast():
+                    outputs = self._forward(images)
+                    loss = self.criterion(outputs, labels)
+                accumulator.update(outputs=outputs, labels=labels, loss=loss)
                 # total += labels.size(0)
                 # correct += int((predicted == labels).sum().item())
-                predicted_labels.extend(predicted.cpu().numpy().tolist())
-                true_labels.extend(labels.cpu().numpy().tolist())
 
         end_time_z: datetime = datetime.now(tz=timezone.utc)
         # accuracy: float = correct / total
         # resulting_loss: float = total_loss / len(dataloader)
 
-        metrics: ModelMetrics = ModelMetrics.compute_metrics(
-            true_labels=true_labels,
-            predicted_labels=predicted_labels,
-            total_loss=total_loss,
-            num_batches=len(dataloader),
-            start_time_z=init_time_z,
-            end_time_z=end_time_z,
+        metrics: ModelMetrics = accumulator.compute(
+            start_time_z=init_time_z, end_time_z=end_time_z, num_batches=len(dataloader)
         )
         # metrics: ModelMetrics = ModelMetrics(
         #     accuracy=accuracy,
@@ -248,7 +395,7 @@ class ModelManager:
         return self._inference(dataloader=self.dataloaders.test)
 
     def get_layers(self, layers: list[str], deepcopy_layers: bool = False) -> Dict[str, Tensor]:
-        selected_layers: Dict[str, Tensor] = Dict()
+        selected_layers: Dict[str, Tensor] = {}
         for layer in layers:
             if deepcopy_layers:
                 selected_layers[layer] = copy.deepcopy(self.model.state_dict()[layer])
@@ -283,6 +430,7 @@ class ModelManager:
             filepath (str): The path to the file from which to load the model.
         """
         self.model.load_state_dict(torch.load(filepath))
+        self.version += 1
 
     def __move_optimizer_to_device(self) -> None:
         param: Parameter
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+
+class PayloadCache:
+    """
+    Least recently used cache of the encoded payloads of the consensus messages. The keys start with the version of
+    the model, so the payloads of previous versions are removed as soon as the model changes.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        if max_entries < 1:
+            raise ValueError(f"The payload cache size must be greater than 0 and it is {max_entries}.")
+        self.max_entries = max_entries
+        self.__payloads: OrderedDict[tuple[int, Hashable], Dict[str, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version: int, key: Hashable) -> None | Dict[str, Any]:
+        """
+        Returns the payload encoded for the version of the model.
+
+        Args:
+            version (int): The version of the model.
+            key (Hashable): The layer set, the precision, the layer format and the compression codec.
+
+        Returns:
+            None | Dict[str, Any]: The encoded payload or None if it is not in the cache.
+        """
+        payload = self.__payloads.get((version, key))
+        if payload is None:
+            self.misses += 1
+            return None
+        self.__payloads.move_to_end((version, key))
+        self.hits += 1
+        return payload
+
+    def put(self, version: int, key: Hashable, payload: Dict[str, Any]) -> None:
+        """
+        Stores the payload encoded for the version of the model and removes the payloads of other versions.
+
+        Args:
+            version (int): The version of the model.
+            key (Hashable): The layer set, the precision, the layer format and the compression codec.
+            payload (Dict[str, Any]): The payload returned by `Consensus.encode_payload`.
+        """
+        for cached_version, cached_key in list(self.__payloads.keys()):
+            if cached_version != version:
+                del self.__payloads[(cached_version, cached_key)]
+        self.__payloads[(version, key)] = payload
+        while len(self.__payloads) > self.max_entries:
+            self.__payloads.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.__payloads)
@@ -0,0 +1,206 @@
+import math
+from collections import OrderedDict
+from typing import Dict
+
+import torch
+from aioxmpp import JID
+from torch import Tensor
+
+from ..message.precision import restore_layer_precision
+
+SPARSE_STREAM_CACHE_SIZE = 3  # Versions of the references kept by the sender and the receiver of a sparse stream
+
+
+class TopKSparsifier:
+    """
+    Sparsifies the layers sent to every neighbour with top-k and local error feedback.
+
+    For every neighbour it stores a reference of each layer: the values that the neighbour has reconstructed
+    from the messages received. The first time that a layer is sent to a neighbour it is sent dense. After that,
+    only the `ratio` largest-magnitude entries of `layer - reference` are sent as flat indices and values. The
+    entries that are not sent remain in `layer - reference` (the residual), so they are carried forward and sent
+    when they become large enough.
+
+    Every message sent to a neighbour has a version, a sequence number of the sparse stream of the link, and the
+    references are only moved forward when the neighbour acknowledges a version, as the delta encoding does. The
+    sparse layers are deltas of the last acknowledged references, so a lost message does not desynchronize the
+    link: the next messages are built on references that the neighbour has. If no version is acknowledged within
+    `cache_size` messages, the neighbour could have removed the base references from its cache and the layers are
+    sent dense again.
+    """
+
+    def __init__(self, ratio: float, cache_size: int = SPARSE_STREAM_CACHE_SIZE) -> None:
+        if not 0 < ratio <= 1:
+            raise ValueError(f"The ratio of the top-k sparsification must be in (0, 1] and it is {ratio}.")
+        if cache_size < 1:
+            raise ValueError(f"The sparse stream cache size must be greater than 0 and it is {cache_size}.")
+        self.ratio = ratio
+        self.cache_size = cache_size
+        # str -> bare JID
+        self.next_version: dict[str, int] = {}
+        self.sent: dict[str, OrderedDict[int, Dict[str, Tensor]]] = {}  # References of the versions not acknowledged
+        self.references: dict[str, Dict[str, Tensor]] = {}  # References of the last acknowledged version
+        self.reference_versions: dict[str, int] = {}
+
+    def get_base_version(self, neighbour: JID) -> None | int:
+        """
+        Args:
+            neighbour (JID): The neighbour.
+
+        Returns:
+            None | int: The acknowledged version whose references are the base of the next message, or None if the
+            next message must be dense.
+        """
+        key = str(neighbour.bare())
+        base_version = self.reference_versions.get(key)
+        if base_version is None or self.next_version.get(key, 0) - base_version >= self.cache_size:
+            return None
+        return base_version
+
+    def sparsify(
+        self, neighbour: JID, layers: Dict[str, Tensor]
+    ) -> tuple[Dict[str, Tensor], Dict[str, Tensor], None | int]:
+        """
+        Computes the layers to send to the neighbour.
+
+        Args:
+            neighbour (JID): The neighbour.
+            layers (Dict[str, Tensor]): The current layers.
+
+        Returns:
+            tuple[Dict[str, Tensor], Dict[str, Tensor], None | int]: The layers to send, where the sparse layers only
+            contain the values of the selected entries, the flat indices of the sparse layers and the version of the
+            references used as base, or None if all the layers are dense.
+        """
+        base_version = self.get_base_version(neighbour)
+        references = {} if base_version is None else self.references[str(neighbour.bare())]
+        sparse_layers: Dict[str, Tensor] = {}
+        indices: Dict[str, Tensor] = {}
+        for name, layer in layers.items():
+            layer = layer.detach()
+            k = math.ceil(self.ratio * layer.numel())
+            # Indices and values of the sparse layer must be smaller than the dense layer
+            if name not in references or not layer.is_floating_point() or 2 * k >= layer.numel():
+                sparse_layers[name] = layer
+                continue
+            residual = (layer - references[name]).reshape(-1)
+            layer_indices = torch.topk(residual.abs(), k=k, sorted=False).indices
+            sparse_layers[name] = residual[layer_indices]
+            indices[name] = layer_indices.to(
+                torch.int32 if layer.numel() <= torch.iinfo(torch.int32).max else torch.int64
+            )
+        return sparse_layers, indices, base_version
+
+    def update_references(
+        self,
+        neighbour: JID,
+        base_version: None | int,
+        layers: Dict[str, Tensor],
+        indices: Dict[str, Tensor],
+        quantization: None | Dict[str, tuple[Tensor, Tensor]] = None,
+        dtypes: None | Dict[str, torch.dtype] = None,
+    ) -> int:
+        """
+        Stores the references that the neighbour reconstructs from the layers sent, after reducing their precision,
+        as a new version that is used as base once the neighbour acknowledges it.
+
+        Args:
+            neighbour (JID): The neighbour.
+            base_version (None | int): The base version returned by `sparsify`.
+            layers (Dict[str, Tensor]): The layers sent.
+            indices (Dict[str, Tensor]): The flat indices of the sparse layers sent.
+            quantization (None | Dict[str, tuple[Tensor, Tensor]], optional): Scale and zero-point of the int8
+                quantized layers sent. Defaults to None.
+            dtypes (None | Dict[str, torch.dtype], optional): The dtype of the local layers. Defaults to None.
+
+        Returns:
+            int: The version of the message.
+        """
+        key = str(neighbour.bare())
+        version = self.next_version.get(key, 0)
+        self.next_version[key] = version + 1
+        references = copy_sparse_base({} if base_version is None else self.references.get(key, {}), indices=indices)
+        update_sparse_references(
+            references=references, layers=layers, indices=indices, quantization=quantization, dtypes=dtypes
+        )
+        sent = self.sent.setdefault(key, OrderedDict())
+        sent[version] = references
+        while len(sent) > self.cache_size:
+            sent.popitem(last=False)
+        return version
+
+    def acknowledge(self, neighbour: JID, version: int) -> None:
+        """
+        Marks the version as reconstructed by the neighbour, so its references are the base of the next messages.
+
+        Args:
+            neighbour (JID): The neighbour.
+            version (int): The last version reconstructed by the neighbour.
+        """
+        key = str(neighbour.bare())
+        sent = self.sent.get(key, OrderedDict())
+        if version not in sent:
+            return
+        self.references[key] = sent[version]
+        self.reference_versions[key] = version
+        for sent_version in list(sent.keys()):
+            if sent_version <= version:
+                del sent[sent_version]
+
+
+def copy_sparse_base(base: Dict[str, Tensor], indices: Dict[str, Tensor]) -> Dict[str, Tensor]:
+    """
+    Copies the references used as base of a sparse message, so they can be updated without modifying the base. Only
+    the layers updated in-place are cloned, the rest are shared with the base.
+
+    Args:
+        base (Dict[str, Tensor]): The references of the base version.
+        indices (Dict[str, Tensor]): The flat indices of the sparse layers of the message.
+
+    Returns:
+        Dict[str, Tensor]: The references to update.
+    """
+    return {name: reference.clone() if name in indices else reference for name, reference in base.items()}
+
+
+def update_sparse_references(
+    references: Dict[str, Tensor],
+    layers: Dict[str, Tensor],
+    indices: Dict[str, Tensor],
+    quantization: None | Dict[str, tuple[Tensor, Tensor]] = None,
+    dtypes: None | Dict[str, torch.dtype] = None,
+) -> Dict[str, Tensor]:
+    """
+    Updates in-place the references with the layers of a sparse stream: dense layers replace the reference and
+    sparse layers are added to it with `index_add_`, so no dense tensor is built from the sparse layers.
+
+    Args:
+        references (Dict[str, Tensor]): The references to update.
+        layers (Dict[str, Tensor]): The dense layers or the values of the sparse layers.
+        indices (Dict[str, Tensor]): The flat indices of the sparse layers.
+        quantization (None | Dict[str, tuple[Tensor, Tensor]], optional): Scale and zero-point of the int8
+            quantized layers. Defaults to None.
+        dtypes (None | Dict[str, torch.dtype], optional): The dtype of every reference if it differs from the dtype
+            of the received layer. Defaults to None.
+
+    Returns:
+        Dict[str, Tensor]: The updated references of the layers that could be reconstructed. Sparse layers without
+        a previous reference are not included.
+    """
+    updated: Dict[str, Tensor] = {}
+    for name, layer in layers.items():
+        layer_quantization = None if quantization is None else quantization.get(name)
+        if name in indices:
+            if name not in references:
+                continue
+            reference = references[name]
+            values = restore_layer_precision(layer, dtype=reference.dtype, quantization=layer_quantization)
+            reference.view(-1).index_add_(0, indices[name].to(torch.int64), values)
+        else:
+            dtype = layer.dtype if layer_quantization is None else torch.float32
+            if dtypes is not None and name in dtypes:
+                dtype = dtypes[name]
+            reference = restore_layer_precision(layer, dtype=dtype, quantization=layer_quantization).clone()
+            references[name] = reference
+        updated[name] = reference
+    return updated
@@ -16,19 +16,42 @@ def setup_loggers(
     general_level: int = logging.DEBUG,
     csv_level: int = logging.DEBUG,
     spade_level: int = logging.ERROR,
-) -> None:
-    log_folder = Path(log_folder_path)
-    if datetime_mark:
-        log_folder = log_folder / datetime.now(tz=timezone.utc).strftime("%Y_%m_%d_T_%H_%M_%S_%f_Z")
+    raw_folder: None | str | Path = None,
+    file_suffix: str = "",
+) -> Path:
+    """
+    Sets up the general and CSV loggers of a run.
+
+    Args:
+        log_folder_path (str | Path, optional): Parent folder of the logs. Defaults to "logs".
+        datetime_mark (bool, optional): Names the folder of the run with the current datetime instead of a UUID4.
+            Defaults to True.
+        general_level (int, optional): Level of the general logger. Defaults to logging.DEBUG.
+        csv_level (int, optional): Level of the CSV loggers. Defaults to logging.DEBUG.
+        spade_level (int, optional): Level of the SPADE logger. Defaults to logging.ERROR.
+        raw_folder (None | str | Path, optional): Folder of the logs of an existing run, used by the processes of a
+            sharded run to log into the folder of the main process. Defaults to None (new folder).
+        file_suffix (str, optional): Suffix of the names of the log files (e.g. ".shard1"). Defaults to "".
+
+    Returns:
+        Path: The folder of the log files.
+    """
+    if raw_folder is None:
+        log_folder = Path(log_folder_path)
+        if datetime_mark:
+            log_folder = log_folder / datetime.now(tz=timezone.utc).strftime("%Y_%m_%d_T_%H_%M_%S_%f_Z")
+        else:
+            log_folder = log_folder / str(uuid.uuid4()).replace("-", "_")
+        log_folder = log_folder / "raw"
     else:
-        log_folder = log_folder / str(uuid.uuid4()).replace("-", "_")
-    log_folder = log_folder / "raw"
+        log_folder = Path(raw_folder)
 
     logging.getLogger("spade").setLevel(spade_level)
-    GeneralLogManager(level=general_level).setup(folder_name=log_folder, file_name="general.log")
-    AlgorithmLogManager(level=csv_level).setup(folder_name=log_folder, file_name="algorithm.csv")
-    NnInferenceLogManager(level=csv_level).setup(folder_name=log_folder, file_name="nn_inference.csv")
-    NnTrainLogManager(level=csv_level).setup(folder_name=log_folder, file_name="nn_train.csv")
-    NnConvergenceLogManager(level=csv_level).setup(folder_name=log_folder, file_name="nn_convergence.csv")
-    MessageLogManager(level=csv_level).setup(folder_name=log_folder, file_name="message.csv")
-    DataSplitLogManager(level=csv_level).setup(folder_name=log_folder, file_name="data_split.csv")
+    GeneralLogManager(level=general_level).setup(folder_name=log_folder, file_name=f"general{file_suffix}.log")
+    AlgorithmLogManager(level=csv_level).setup(folder_name=log_folder, file_name=f"algorithm{file_suffix}.csv")
+    NnInferenceLogManager(level=csv_level).setup(folder_name=log_folder, file_name=f"nn_inference{file_suffix}.csv")
+    NnTrainLogManager(level=csv_level).setup(folder_name=log_folder, file_name=f"nn_train{file_suffix}.csv")
+    NnConvergenceLogManager(level=csv_level).setup(folder_name=log_folder, file_name=f"nn_convergence{file_suffix}.csv")
+    MessageLogManager(level=csv_level).setup(folder_name=log_folder, file_name=f"message{file_suffix}.csv")
+    DataSplitLogManager(level=csv_level).setup(folder_name=log_folder, file_name=f"data_split{file_suffix}.csv")
+    return log_folder
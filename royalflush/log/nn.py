@@ -328,3 +328,19 @@ class NnConvergenceLogManager(CsvLogManager):
             self._log_weight(
                 timestamp_z=timestamp_z, description=description, layer=layer, weight=weight, weight_id=weight_id
             )
+
+    def log_gradient_norms(self, timestamp_z: Optional[datetime], norms: dict[str, float]) -> None:
+        """
+        Logs the gradient norm of each tracked layer with the description GRAD-NORM, as layer values (weight_id
+        -1).
+
+        Args:
+            timestamp_z (Optional[datetime]): The timestamp of the log. Defaults to now if None.
+            norms (dict[str, float]): The gradient norm of each layer, such as `GradientMonitor.latest`.
+        """
+        tracked = {layer for layer, _ in self._tracked_weights}
+        for layer, norm in norms.items():
+            if "rf_all_layers" in tracked or layer in tracked:
+                self._log_weight(
+                    timestamp_z=timestamp_z, description="GRAD-NORM", layer=layer, weight=norm, weight_id=-1
+                )
@@ -1,4 +1,44 @@
+from .compression import (
+    CompressionCodec,
+    LzmaCodec,
+    NoneCodec,
+    ShuffleZlibCodec,
+    ZlibCodec,
+    get_compression_codec,
+    negotiate_compression_codec,
+)
+from .layer_format import BinaryLayerFormat, LayerFormat, PickleLayerFormat, get_layer_format
+from .loopback import LoopbackTransport
 from .message import RfMessage
-from .multipart import MultipartHandler
+from .multipart import MultipartHandler, MultipartHeader, MultipartTransfer
+from .precision import (
+    check_layer_precision,
+    dequantize_int8,
+    quantize_int8,
+    reduce_layers_precision,
+    restore_layer_precision,
+)
 
-__all__ = ["MultipartHandler", "RfMessage"]
+__all__ = [
+    "BinaryLayerFormat",
+    "CompressionCodec",
+    "LayerFormat",
+    "LoopbackTransport",
+    "LzmaCodec",
+    "MultipartHandler",
+    "MultipartHeader",
+    "MultipartTransfer",
+    "NoneCodec",
+    "PickleLayerFormat",
+    "RfMessage",
+    "ShuffleZlibCodec",
+    "ZlibCodec",
+    "check_layer_precision",
+    "dequantize_int8",
+    "get_compression_codec",
+    "get_layer_format",
+    "negotiate_compression_codec",
+    "quantize_int8",
+    "reduce_layers_precision",
+    "restore_layer_precision",
+]
@@ -0,0 +1,139 @@
+import lzma
+import zlib
+from abc import ABCMeta, abstractmethod
+from typing import Dict, Iterable
+
+import numpy as np
+
+
+class CompressionCodec(object, metaclass=ABCMeta):
+    """
+    Compresses the serialized layers before they are sent. The codec name is sent with the message
+    so the receiver can decompress it.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def compress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decompress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        raise NotImplementedError
+
+
+class NoneCodec(CompressionCodec):
+
+    name = "none"
+
+    def compress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return payload
+
+    def decompress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return payload
+
+
+class ZlibCodec(CompressionCodec):
+
+    name = "zlib"
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return zlib.compress(payload, self.level)
+
+    def decompress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return zlib.decompress(payload)
+
+
+class LzmaCodec(CompressionCodec):
+
+    name = "lzma"
+
+    def __init__(self, preset: int = 1) -> None:
+        self.preset = preset
+
+    def compress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return lzma.compress(payload, preset=self.preset)
+
+    def decompress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return lzma.decompress(payload)
+
+
+class ShuffleZlibCodec(CompressionCodec):
+    """
+    Groups the i-th byte of every `element_size` bytes word together before compressing with zlib.
+    The exponent bytes of float tensors are very repetitive, so after the shuffle zlib finds much
+    longer matches than in the raw tensor bytes.
+    """
+
+    name = "shuffle_zlib"
+
+    def __init__(self, element_size: int = 4, level: int = 6) -> None:
+        self.element_size = element_size
+        self.level = level
+
+    def compress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return zlib.compress(self._shuffle(payload), self.level)
+
+    def decompress(self, payload: bytes | bytearray) -> bytes | bytearray:
+        return self._unshuffle(zlib.decompress(payload))
+
+    def _shuffle(self, payload: bytes | bytearray) -> bytes:
+        data = np.frombuffer(payload, dtype=np.uint8)
+        words = len(data) // self.element_size * self.element_size
+        shuffled = data[:words].reshape(-1, self.element_size).T
+        return shuffled.tobytes() + data[words:].tobytes()
+
+    def _unshuffle(self, payload: bytes | bytearray) -> bytes:
+        data = np.frombuffer(payload, dtype=np.uint8)
+        words = len(data) // self.element_size * self.element_size
+        unshuffled = data[:words].reshape(self.element_size, -1).T
+        return unshuffled.tobytes() + data[words:].tobytes()
+
+
+COMPRESSION_CODECS: Dict[str, CompressionCodec] = {
+    NoneCodec.name: NoneCodec(),
+    ZlibCodec.name: ZlibCodec(),
+    LzmaCodec.name: LzmaCodec(),
+    ShuffleZlibCodec.name: ShuffleZlibCodec(),
+}
+
+
+def get_compression_codec(name: str) -> CompressionCodec:
+    """
+    Returns the compression codec registered with the given name.
+
+    Args:
+        name (str): Name of the codec, e.g. "none", "zlib", "lzma" or "shuffle_zlib".
+
+    Raises:
+        NotImplementedError: If there is not a codec with that name.
+
+    Returns:
+        CompressionCodec: The compression codec.
+    """
+    if name.lower() not in COMPRESSION_CODECS:
+        raise NotImplementedError(
+            f"Compression codec {name} is not valid. Valid codecs: {list(COMPRESSION_CODECS.keys())}."
+        )
+    return COMPRESSION_CODECS[name.lower()]
+
+
+def negotiate_compression_codec(preferred: str, supported: None | Iterable[str]) -> str:
+    """
+    Returns the codec to use in a link: the preferred codec of the sender if the receiver supports it
+    and "none" otherwise, so agents that do not advertise codecs are always able to read the messages.
+
+    Args:
+        preferred (str): The codec that the sender wants to use.
+        supported (None | Iterable[str]): The codecs advertised by the receiver or None if unknown.
+
+    Returns:
+        str: The name of the codec to use.
+    """
+    if supported is not None and preferred in supported:
+        return preferred
+    return NoneCodec.name
@@ -0,0 +1,184 @@
+import pickle
+import struct
+import sys
+from abc import ABCMeta, abstractmethod
+from typing import Dict
+
+import torch
+from torch import Tensor
+
+
+class LayerFormat(object, metaclass=ABCMeta):
+    """
+    Serializes a dict of layers (layer name -> `torch.Tensor`) into bytes and back.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def encode(self, layers: Dict[str, Tensor]) -> bytes | bytearray:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, payload: bytes | bytearray) -> Dict[str, Tensor]:
+        raise NotImplementedError
+
+
+class PickleLayerFormat(LayerFormat):
+    """
+    Legacy format: the layers dict is pickled as a whole. Kept as a fallback and to decode
+    messages of older versions.
+    """
+
+    name = "pickle"
+
+    def encode(self, layers: Dict[str, Tensor]) -> bytes:
+        return pickle.dumps(layers)
+
+    def decode(self, payload: bytes | bytearray) -> Dict[str, Tensor]:
+        return pickle.loads(payload)
+
+
+class BinaryLayerFormat(LayerFormat):
+    """
+    Compact binary format. The payload is a header followed by the raw bytes of every tensor:
+
+        magic (4 bytes) | header size (uint32) | number of layers (uint32) | entries | padding | data
+
+    Each entry is: name size (uint16), name (utf-8), dtype code (uint8), number of dimensions (uint8),
+    shape (uint64 per dimension), offset (uint64) and number of bytes (uint64). Offsets are relative to
+    the start of the data section and aligned to `ALIGNMENT` bytes. Tensors are stored contiguous and in
+    little-endian order, byteswapped on big-endian hosts. They are decoded with `torch.frombuffer`, so on
+    little-endian hosts the returned tensors are views of the payload buffer. `torch.frombuffer` needs a
+    writable buffer, so a `bytes` payload is copied once into a `bytearray`; a `bytearray` payload is used
+    as is.
+    """
+
+    name = "binary"
+
+    MAGIC = b"RFL1"
+    ALIGNMENT = 64
+    DTYPES: Dict[int, torch.dtype] = {
+        0: torch.float32,
+        1: torch.float64,
+        2: torch.float16,
+        3: torch.bfloat16,
+        4: torch.uint8,
+        5: torch.int8,
+        6: torch.int16,
+        7: torch.int32,
+        8: torch.int64,
+        9: torch.bool,
+    }
+    DTYPE_CODES: Dict[torch.dtype, int] = {dtype: code for code, dtype in DTYPES.items()}
+
+    def encode(self, layers: Dict[str, Tensor]) -> bytes | bytearray:
+        header = bytearray()
+        header += struct.pack("<I", len(layers))
+        tensors: list[tuple[int, Tensor]] = []
+        offset = 0
+        for name, layer in layers.items():
+            tensor = layer.detach().cpu().contiguous()
+            if tensor.dtype not in self.DTYPE_CODES:
+                raise ValueError(f"Layer '{name}' has the unsupported dtype {tensor.dtype}.")
+            encoded_name = name.encode(encoding="utf-8")
+            nbytes = tensor.numel() * tensor.element_size()
+            header += struct.pack("<H", len(encoded_name))
+            header += encoded_name
+            header += struct.pack("<BB", self.DTYPE_CODES[tensor.dtype], tensor.dim())
+            header += struct.pack(f"<{tensor.dim()}Q", *tensor.shape)
+            header += struct.pack("<QQ", offset, nbytes)
+            tensors.append((offset, tensor))
+            offset = self._align(offset + nbytes)
+
+        data_start = self._align(len(self.MAGIC) + 4 + len(header))
+        buffer = bytearray(data_start + offset)
+        buffer[: len(self.MAGIC)] = self.MAGIC
+        struct.pack_into("<I", buffer, len(self.MAGIC), len(header))
+        buffer[len(self.MAGIC) + 4 : len(self.MAGIC) + 4 + len(header)] = header
+        if tensors:
+            data = torch.frombuffer(buffer, dtype=torch.uint8)
+            for tensor_offset, tensor in tensors:
+                raw = self._to_little_endian(tensor.reshape(-1).view(torch.uint8), tensor.element_size())
+                start = data_start + tensor_offset
+                data[start : start + raw.numel()].copy_(raw)
+        return buffer
+
+    def decode(self, payload: bytes | bytearray) -> Dict[str, Tensor]:
+        # torch.frombuffer needs a writable buffer to create writable tensors.
+        buffer = payload if isinstance(payload, bytearray) else bytearray(payload)
+        if buffer[: len(self.MAGIC)] != self.MAGIC:
+            raise ValueError("The payload is not a binary layers payload.")
+        (header_size,) = struct.unpack_from("<I", buffer, len(self.MAGIC))
+        position = len(self.MAGIC) + 4
+        data_start = self._align(position + header_size)
+        (num_layers,) = struct.unpack_from("<I", buffer, position)
+        position += 4
+
+        layers: Dict[str, Tensor] = {}
+        for _ in range(num_layers):
+            (name_size,) = struct.unpack_from("<H", buffer, position)
+            position += 2
+            name = bytes(buffer[position : position + name_size]).decode(encoding="utf-8")
+            position += name_size
+            dtype_code, dims = struct.unpack_from("<BB", buffer, position)
+            position += 2
+            shape = struct.unpack_from(f"<{dims}Q", buffer, position)
+            position += 8 * dims
+            offset, nbytes = struct.unpack_from("<QQ", buffer, position)
+            position += 16
+            dtype = self.DTYPES[dtype_code]
+            element_size = torch.empty((), dtype=dtype).element_size()
+            if nbytes == 0:
+                layers[name] = torch.empty(shape, dtype=dtype)
+            elif sys.byteorder == "little" or element_size == 1:
+                layers[name] = torch.frombuffer(
+                    buffer, dtype=dtype, count=nbytes // element_size, offset=data_start + offset
+                ).view(shape)
+            else:
+                raw = torch.frombuffer(buffer, dtype=torch.uint8, count=nbytes, offset=data_start + offset)
+                layers[name] = self._to_little_endian(raw, element_size).view(dtype).view(shape)
+        return layers
+
+    def _to_little_endian(self, raw: Tensor, element_size: int) -> Tensor:
+        """
+        Converts the native bytes of a tensor to little-endian order and back. The bytes of every element are
+        reversed on big-endian hosts, and returned unchanged on little-endian hosts.
+
+        Args:
+            raw (Tensor): The flat bytes of a tensor as `torch.uint8`.
+            element_size (int): Size in bytes of each element of the tensor.
+
+        Returns:
+            Tensor: The flat bytes, with the bytes of every element reversed on big-endian hosts.
+        """
+        if sys.byteorder == "little" or element_size == 1:
+            return raw
+        return raw.view(-1, element_size).flip(1).reshape(-1)
+
+    def _align(self, position: int) -> int:
+        return (position + self.ALIGNMENT - 1) // self.ALIGNMENT * self.ALIGNMENT
+
+
+LAYER_FORMATS: Dict[str, LayerFormat] = {
+    PickleLayerFormat.name: PickleLayerFormat(),
+    BinaryLayerFormat.name: BinaryLayerFormat(),
+}
+
+
+def get_layer_format(name: str) -> LayerFormat:
+    """
+    Returns the layer format registered with the given name.
+
+    Args:
+        name (str): Name of the format, e.g. "binary" or "pickle".
+
+    Raises:
+        NotImplementedError: If there is not a layer format with that name.
+
+    Returns:
+        LayerFormat: The layer format.
+    """
+    if name.lower() not in LAYER_FORMATS:
+        raise NotImplementedError(f"Layer format {name} is not valid. Valid formats: {list(LAYER_FORMATS.keys())}.")
+    return LAYER_FORMATS[name.lower()]
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING
+
+from aioxmpp import JID
+from spade.message import Message
+
+if TYPE_CHECKING:
+    from spade.agent import Agent
+
+TRANSPORTS: list[str] = ["xmpp", "loopback"]
+
+
+class LoopbackTransport:
+    """
+    Delivers the messages between agents that run in the same process through the mailboxes of their behaviours,
+    which are asyncio queues, without serializing them, splitting them into multipart messages or sending them to
+    the XMPP server. The messages are dispatched with `Agent.dispatch`, so they reach the behaviours whose SPADE
+    `Template` matches them, as if they had arrived through XMPP.
+
+    Only the registered agents are reachable, so the messages to agents of other processes (e.g. other shards)
+    must be sent through XMPP.
+    """
+
+    def __init__(self) -> None:
+        self.__agents: dict[str, "Agent"] = {}
+        self.delivered: int = 0
+
+    def register(self, agent: "Agent") -> None:
+        """
+        Makes the agent reachable through the loopback transport.
+
+        Args:
+            agent (Agent): The agent, which must run in the event loop of this process.
+        """
+        self.__agents[str(agent.jid.bare())] = agent
+
+    def unregister(self, agent: "Agent") -> None:
+        """
+        Removes the agent from the loopback transport if it is registered.
+
+        Args:
+            agent (Agent): The agent.
+        """
+        jid = str(agent.jid.bare())
+        if self.__agents.get(jid) is agent:
+            del self.__agents[jid]
+
+    def is_reachable(self, jid: JID) -> bool:
+        return str(jid.bare()) in self.__agents
+
+    def deliver(self, message: Message) -> bool:
+        """
+        Dispatches the message to the behaviours of the receiver whose template matches it. The message object is
+        delivered as is, so its attachments are passed by reference.
+
+        Args:
+            message (Message): The message, with the receiver set in `to`.
+
+        Returns:
+            bool: False if the receiver is not registered in the loopback transport.
+        """
+        if message.to is None or not self.is_reachable(message.to):
+            return False
+        self.__agents[str(message.to.bare())].dispatch(message)
+        self.delivered += 1
+        return True
+
+    def reset(self) -> None:
+        """
+        Unregisters all the agents.
+        """
+        self.__agents.clear()
+        self.delivered = 0
+
+
+LOOPBACK_TRANSPORT = LoopbackTransport()
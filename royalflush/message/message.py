@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict
 
 from spade.message import Message
 
@@ -14,10 +14,12 @@ class RfMessage(Message):
         metadata: Dict[str, str] | None = None,
         is_multipart: bool = False,
         is_multipart_completed: bool = False,
+        attachment: None | Any = None,
     ) -> None:
         super().__init__(to, sender, body, thread, metadata)
         self.is_multipart = is_multipart
         self.is_multipart_completed = is_multipart_completed
+        self.attachment = attachment  # Object passed by reference by the loopback transport instead of the body
 
     def to_message(self) -> Message:
         to = None if not self.to else str(self.to.bare())
@@ -42,6 +44,7 @@ class RfMessage(Message):
             metadata=message.metadata,
             is_multipart=is_multipart,
             is_multipart_completed=is_multipart_completed,
+            attachment=message.attachment if isinstance(message, RfMessage) else None,
         )
 
     @staticmethod
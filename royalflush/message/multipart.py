@@ -1,10 +1,73 @@
-import copy
+import json
+import math
+import time
 import uuid
+from collections import OrderedDict
+from typing import Iterator, NamedTuple
 
 from aioxmpp import JID
 from spade.message import Message
 
 
+class MultipartHeader(NamedTuple):
+    """
+    Parsed header of a multipart message.
+    """
+
+    part_number: int
+    total_parts: int
+    uuid4: str
+    content_start: int  # Index of the body where the content starts
+
+
+class MultipartTransfer:
+    """
+    Parts received of a multipart message. The slots of the parts are allocated when the first part arrives, and
+    a bitmap and a counter of the missing parts are updated with every part so the completion is checked in O(1).
+    """
+
+    def __init__(self, total_parts: int) -> None:
+        self.total_parts = total_parts
+        self.parts: list[str] = [""] * total_parts
+        self.received = bytearray(total_parts)  # Bitmap: 1 if the part has been received
+        self.missing_parts = total_parts
+        self.highest_part = 0  # Highest part number received
+        self.size = 0  # Length of the stored parts
+        self.created_at = time.monotonic()
+        self.updated_at = self.created_at
+        self.nacks = 0  # Retransmission requests sent
+        self.nacked_at: None | float = None
+
+    def add_part(self, part_number: int, content: str) -> None:
+        index = part_number - 1
+        if not 0 <= index < self.total_parts:
+            raise ValueError(f"Part {part_number} out of range of a multipart message of {self.total_parts} parts.")
+        if not self.received[index]:
+            self.received[index] = 1
+            self.missing_parts -= 1
+            self.highest_part = max(self.highest_part, part_number)
+        self.size += len(content) - len(self.parts[index])
+        self.parts[index] = content
+        self.updated_at = time.monotonic()
+
+    def is_complete(self) -> bool:
+        return self.missing_parts == 0
+
+    def get_missing_parts(self, below: None | int = None) -> list[int]:
+        """
+        Args:
+            below (None | int, optional): Only the missing parts lower than this part number. Defaults to None (all).
+
+        Returns:
+            list[int]: The missing part numbers, starting by 1.
+        """
+        end = self.total_parts if below is None else min(below - 1, self.total_parts)
+        return [i + 1 for i in range(end) if not self.received[i]]
+
+    def rebuild(self) -> str:
+        return "".join(self.parts)
+
+
 class MultipartHandler:
     """
     Class created to handle the SPADE agents maximum message length limitation. The aioxmpp package maximum
@@ -13,11 +76,48 @@ class MultipartHandler:
     rebuild the messages in the correct order. The header is "multipart#[index]/[total]#[uuid4]|" where "index"
     is the id of the current message (starting by 1), "total" is the number of messages needed to rebuild the
     original content and "uuid4" is the unique universal identifier (v4) of the original splitted message.
+
+    Incomplete transfers are removed when they are older than `transfer_ttl` seconds, and the least recently
+    updated ones are removed while the stored content exceeds `max_stored_size` characters, so a lost part
+    does not keep the rest of the transfer in memory forever.
+
+    Lost parts are repaired with retransmissions: the sender keeps the content of its last transfers during
+    `sent_cache_ttl` seconds, up to `max_sent_cache_transfers` transfers and `max_sent_cache_bytes` characters, and
+    the receiver requests the missing parts with a NACK message if a transfer has not been updated during
+    `nack_deadline` seconds, up to `max_nacks` times. The deadline is doubled after every NACK of the transfer.
+    The NACK requests the gaps below the highest part received, which are lost, and the tail of the transfer is
+    only requested if there are no gaps and the transfer has been idle for twice the deadline, so the tail of a
+    slow transfer is not duplicated.
     """
 
-    def __init__(self) -> None:
-        # the storage is: { "ag1@localhost": { "uuid4": [ None, "msg2" ] } }
-        self.__multipart_message_storage: dict[JID, dict[str, list[str | None]]] = {}
+    def __init__(
+        self,
+        transfer_ttl: None | float = 10 * 60,
+        max_stored_size: None | int = 256 * 1024 * 1024,
+        nack_deadline: float = 1,
+        max_nacks: int = 3,
+        sent_cache_ttl: float = 30,
+        max_sent_cache_transfers: int = 16,
+        max_sent_cache_bytes: None | int = 32 * 1024 * 1024,
+    ) -> None:
+        # the storage is: { ("ag1@localhost", "uuid4"): MultipartTransfer } sorted from least to most recently updated
+        self.__multipart_message_storage: OrderedDict[tuple[JID, str], MultipartTransfer] = OrderedDict()
+        self.transfer_ttl = transfer_ttl
+        self.max_stored_size = max_stored_size
+        self.stored_size = 0
+        self.completed_transfers = 0
+        self.expired_transfers = 0
+        self.evicted_transfers = 0
+        self.nack_deadline = nack_deadline
+        self.max_nacks = max_nacks
+        self.sent_cache_ttl = sent_cache_ttl
+        self.max_sent_cache_transfers = max_sent_cache_transfers
+        self.max_sent_cache_bytes = max_sent_cache_bytes
+        self.sent_cache_size = 0
+        # the sent cache is: { "uuid4": (time.monotonic(), message base, content, part size) }
+        self.__sent_cache: OrderedDict[str, tuple[float, Message, str, int]] = OrderedDict()
+        self.retransmitted_parts = 0
+        self.__completed_uuid4s: OrderedDict[str, None] = OrderedDict()  # To ignore late retransmitted parts
         self.__metadata_start: str = "multipart"
         self.__metadata_split_token: str = "#"
         self.__metadata_uuid: str = "xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx"
@@ -41,26 +141,91 @@ class MultipartHandler:
         return message.body.startswith(self.__metadata_start + self.__metadata_split_token)
 
     def get_header(self, content: str) -> str:
-        return content.split(self.__metadata_end_token)[0]
+        end = content.find(self.__metadata_end_token)
+        return content if end < 0 else content[:end]
 
-    def _get_part_number(self, content: str) -> int:
+    def parse_header(self, content: str) -> MultipartHeader:
+        """
+        Parses the multipart header of the content.
+
+        Args:
+            content (str): The body of a multipart message.
+
+        Returns:
+            MultipartHeader: The part number, the total parts, the uuid4 and the index where the content starts.
+        """
         header = self.get_header(content=content)
-        part_number = header.split(self.__metadata_split_token)[1].split("/")[0]
-        return int(part_number)
+        _, parts, uuid4 = header.split(self.__metadata_split_token, 2)
+        part_number, total_parts = parts.split("/")
+        return MultipartHeader(
+            part_number=int(part_number),
+            total_parts=int(total_parts),
+            uuid4=uuid4,
+            content_start=len(header) + len(self.__metadata_end_token),
+        )
+
+    def _get_part_number(self, content: str) -> int:
+        return self.parse_header(content=content).part_number
 
     def _get_total_parts(self, content: str) -> int:
-        header = self.get_header(content=content)
-        total_parts = header.split(self.__metadata_split_token)[1].split("/")[1]
-        return int(total_parts)
+        return self.parse_header(content=content).total_parts
 
     def _get_uuid4(self, content: str) -> str:
-        header = self.get_header(content=content)
-        uuid4 = header.split(self.__metadata_split_token)[2]
-        return uuid4
+        return self.parse_header(content=content).uuid4
 
     def any_multipart_waiting(self) -> bool:
         return len(self.__multipart_message_storage.keys()) > 0
 
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the multipart transfers.
+
+        Returns:
+            dict[str, int]: The transfers waiting, the stored size and the transfers completed, expired by the TTL
+            and evicted by the maximum stored size.
+        """
+        return {
+            "waiting_transfers": len(self.__multipart_message_storage),
+            "stored_size": self.stored_size,
+            "completed_transfers": self.completed_transfers,
+            "expired_transfers": self.expired_transfers,
+            "evicted_transfers": self.evicted_transfers,
+            "retransmitted_parts": self.retransmitted_parts,
+            "sent_cache_size": self.sent_cache_size,
+        }
+
+    def remove_expired_transfers(self, now: None | float = None) -> int:
+        """
+        Removes the incomplete transfers older than the TTL.
+
+        Args:
+            now (None | float, optional): Current `time.monotonic()`. Defaults to None.
+
+        Returns:
+            int: The number of transfers removed.
+        """
+        if self.transfer_ttl is None:
+            return 0
+        now = time.monotonic() if now is None else now
+        expired = [
+            key
+            for key, transfer in self.__multipart_message_storage.items()
+            if now - transfer.created_at > self.transfer_ttl
+        ]
+        for sender, uuid4 in expired:
+            self.__remove_data(sender=sender, uuid4=uuid4)
+        self.expired_transfers += len(expired)
+        return len(expired)
+
+    def __evict_transfers(self) -> None:
+        if self.max_stored_size is None:
+            return
+        # The most recently updated transfer is never evicted, it is the one that is being received
+        while self.stored_size > self.max_stored_size and len(self.__multipart_message_storage) > 1:
+            sender, uuid4 = next(iter(self.__multipart_message_storage))
+            self.__remove_data(sender=sender, uuid4=uuid4)
+            self.evicted_transfers += 1
+
     def is_multipart_complete(self, message: Message) -> bool | None:
         """
         Returns a bool to denote whether the message is complete and ready to be rebuilded.
@@ -72,30 +237,21 @@ class MultipartHandler:
         Returns:
             bool | None: True if multipart is complete, False otherwise and None if the sender has not multipart messages stored.
         """
-        sender = message.sender
-        uuid4 = self._get_uuid4(message.body)
-        if (
-            not sender in self.__multipart_message_storage
-            or not uuid4 in self.__multipart_message_storage[sender].keys()
-        ):
+        transfer = self.__get_transfer(sender=message.sender, uuid4=self._get_uuid4(message.body))
+        if transfer is None:
             return None
-        for part in self.__multipart_message_storage[sender][uuid4]:
-            if part is None:
-                return False
-        return True
+        return transfer.is_complete()
+
+    def __get_transfer(self, sender: JID, uuid4: str) -> MultipartTransfer | None:
+        return self.__multipart_message_storage.get((sender, uuid4))
 
     def _rebuild_multipart_content(self, sender: JID, uuid4: str) -> str:
-        content = ""
-        for part in self.__multipart_message_storage[sender][uuid4]:
-            content += part if part is not None else ""
-        return content
+        return self.__multipart_message_storage[(sender, uuid4)].rebuild()
 
     def __remove_data(self, sender: JID, uuid4: str) -> None:
-        if sender in self.__multipart_message_storage:
-            if uuid4 in self.__multipart_message_storage[sender].keys():
-                del self.__multipart_message_storage[sender][uuid4]
-                if len(self.__multipart_message_storage[sender].keys()) == 0:
-                    del self.__multipart_message_storage[sender]
+        transfer = self.__multipart_message_storage.pop((sender, uuid4), None)
+        if transfer is not None:
+            self.stored_size -= transfer.size
 
     def rebuild_multipart(self, message: Message) -> Message | None:
         """
@@ -112,52 +268,78 @@ class MultipartHandler:
         # NOTE multipart header: multipart#1/2#xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx|
         if self.is_multipart(message):
             sender = message.sender
-            multipart_meta = message.body.split(self.__metadata_end_token)[0]
-            part_number = self._get_part_number(message.body)
-            total_parts = self._get_total_parts(message.body)
-            uuid4 = self._get_uuid4(message.body)
-            if not sender in self.__multipart_message_storage:
-                self.__multipart_message_storage[sender] = {}
-            if not uuid4 in self.__multipart_message_storage[sender].keys():
-                self.__multipart_message_storage[sender][uuid4] = [None] * total_parts
-            self.__multipart_message_storage[sender][uuid4][part_number - 1] = message.body[
-                len(multipart_meta + self.__metadata_end_token) :
-            ]
-            if self.is_multipart_complete(message):
-                message.body = self._rebuild_multipart_content(sender=sender, uuid4=uuid4)
-                self.__remove_data(sender=sender, uuid4=uuid4)
+            header = self.parse_header(message.body)
+            self.remove_expired_transfers()
+            if header.uuid4 in self.__completed_uuid4s:
+                return None
+            key = (sender, header.uuid4)
+            if key not in self.__multipart_message_storage:
+                self.__multipart_message_storage[key] = MultipartTransfer(total_parts=header.total_parts)
+            self.__multipart_message_storage.move_to_end(key)
+            transfer = self.__multipart_message_storage[key]
+            previous_size = transfer.size
+            transfer.add_part(part_number=header.part_number, content=message.body[header.content_start :])
+            self.stored_size += transfer.size - previous_size
+            if transfer.is_complete():
+                message.body = transfer.rebuild()
+                self.__remove_data(sender=sender, uuid4=header.uuid4)
+                self.completed_transfers += 1
+                self.__completed_uuid4s[header.uuid4] = None
+                if len(self.__completed_uuid4s) > 1024:
+                    self.__completed_uuid4s.popitem(last=False)
                 return message
+            self.__evict_transfers()
         return None
 
-    def __divide_content(self, content: str, size: int) -> list[str]:
-        if size <= 0:
-            raise RuntimeError(f"The size must be a positive integer, but the current value is: {size}")
-        return [content[i : i + size] for i in range(0, len(content), size)]
+    def __part_body(self, content: str, part_size: int, part_number: int, total_parts: int, uuid4: str) -> str:
+        start = (part_number - 1) * part_size
+        return (
+            f"{self.__metadata_start}{self.__metadata_split_token}{part_number}/{total_parts}"
+            f"{self.__metadata_split_token}{uuid4}{self.__metadata_end_token}{content[start : start + part_size]}"
+        )
 
-    def _generate_multipart_content(self, content: str, max_size: int) -> list[str] | None:
+    @staticmethod
+    def _build_part_message(message_base: Message, body: str) -> Message:
+        # The metadata dict is shared by all the parts instead of copied
+        message = Message(
+            to=None if message_base.to is None else str(message_base.to),
+            sender=None if message_base.sender is None else str(message_base.sender),
+            body=body,
+            thread=message_base.thread,
+        )
+        message.metadata = message_base.metadata
+        return message
+
+    def iter_multipart_messages(self, content: str, max_size: int, message_base: Message) -> Iterator[Message]:
         """
-        Generates a list of multipart content based on the desired maximum size of each multipart message content
-        and the maximum header size of the multipart messages metadata.
+        Lazily yields the messages to send the content. If the length of the content exceeds the max_size argument,
+        the multipart messages are built one by one when they are requested, sharing the metadata of the message
+        base, so only one part is in memory besides the content. Otherwise, the message base is yielded with the
+        content in its body.
 
         Args:
-            content (str): The content to be splitted if its length exceeds the max_size.
-            max_size (int): Threshold to split the content into a list of content.
+            content (str): The information that the messages will have in its bodies.
+            max_size (int): Maximum size body length of each message.
+            message_base (Message): The message whose receiver, sender, thread and metadata are used by the parts.
 
-        Returns:
-            list[str] | None: List of multipart message content to put in the body of the SPADE messages
-            or None if the content length does not exceed the max_size tanking into account the multipart header metadata.
+        Yields:
+            Message: The messages to send.
         """
         if max_size - self.__metadata_header_size <= 0:
             raise RuntimeError(f"The max_size message must be increased at least to {self.__metadata_header_size + 1}")
+        if len(content) <= max_size:
+            message_base.body = content
+            yield message_base
+            return
 
-        if len(content) > max_size:
-            multiparts = self.__divide_content(content, max_size - self.__metadata_header_size)
-            uuid4 = str(uuid.uuid4())
-            return [
-                f"{self.__metadata_start}{self.__metadata_split_token}{i + 1}/{len(multiparts)}{self.__metadata_split_token}{uuid4}{self.__metadata_end_token}{part}"
-                for i, part in enumerate(multiparts)
-            ]
-        return None
+        part_size = max_size - self.__metadata_header_size
+        total_parts = math.ceil(len(content) / part_size)
+        uuid4 = str(uuid.uuid4())
+        message_base = self._build_part_message(message_base=message_base, body="")
+        self.__cache_sent_transfer(uuid4=uuid4, message_base=message_base, content=content, part_size=part_size)
+        for part_number in range(1, total_parts + 1):
+            body = self.__part_body(content, part_size, part_number, total_parts, uuid4)
+            yield self._build_part_message(message_base=message_base, body=body)
 
     def generate_multipart_messages(self, content: str, max_size: int, message_base: Message) -> list[Message] | None:
         """
@@ -167,17 +349,111 @@ class MultipartHandler:
         Args:
             content (str): The information that multipart messages will have in its bodies.
             max_size (int): Maximum size body length of each multipart message.
-            message_base (Message): The message that will be copied by all the multipart messages, replacing just the body.
+            message_base (Message): The message whose receiver, sender, thread and metadata are used by the parts.
 
         Returns:
             list[Message] | None: A list of multipart messages to send or None if the content does not exceed the maximum size.
         """
-        content_splits = self._generate_multipart_content(content=content, max_size=max_size)
-        if content_splits is not None:
-            multiparts_messages: list[Message] = []
-            for multipart in content_splits:
-                message = copy.deepcopy(message_base)
-                message.body = multipart
-                multiparts_messages.append(message)
-            return multiparts_messages
-        return None
+        if max_size - self.__metadata_header_size <= 0:
+            raise RuntimeError(f"The max_size message must be increased at least to {self.__metadata_header_size + 1}")
+        if len(content) <= max_size:
+            return None
+        return list(self.iter_multipart_messages(content=content, max_size=max_size, message_base=message_base))
+
+    def __cache_sent_transfer(self, uuid4: str, message_base: Message, content: str, part_size: int) -> None:
+        now = time.monotonic()
+        # The content is immutable, so it is stored without copies and the parts are rebuilt on demand
+        self.__sent_cache[uuid4] = (now, message_base, content, part_size)
+        self.sent_cache_size += len(content)
+        # The oldest transfers are removed first, and the new transfer is kept even if it exceeds the maximum size
+        while len(self.__sent_cache) > 1 and (
+            len(self.__sent_cache) > self.max_sent_cache_transfers
+            or now - next(iter(self.__sent_cache.values()))[0] > self.sent_cache_ttl
+            or (self.max_sent_cache_bytes is not None and self.sent_cache_size > self.max_sent_cache_bytes)
+        ):
+            self.__remove_sent_transfer(next(iter(self.__sent_cache)))
+
+    def __remove_sent_transfer(self, uuid4: str) -> None:
+        cached = self.__sent_cache.pop(uuid4, None)
+        if cached is not None:
+            self.sent_cache_size -= len(cached[2])
+
+    def get_sent_parts(self, uuid4: str, part_numbers: list[int]) -> list[Message]:
+        """
+        Returns the messages of the parts of a multipart message sent recently, to retransmit them.
+
+        Args:
+            uuid4 (str): The uuid4 of the multipart message.
+            part_numbers (list[int]): The part numbers, starting by 1.
+
+        Returns:
+            list[Message]: The messages of the parts or an empty list if the transfer is not in the cache.
+        """
+        if uuid4 not in self.__sent_cache:
+            return []
+        sent_at, message_base, content, part_size = self.__sent_cache[uuid4]
+        if time.monotonic() - sent_at > self.sent_cache_ttl:
+            self.__remove_sent_transfer(uuid4)
+            return []
+        total_parts = math.ceil(len(content) / part_size)
+        messages: list[Message] = []
+        for part_number in part_numbers:
+            if 1 <= part_number <= total_parts:
+                body = self.__part_body(content, part_size, part_number, total_parts, uuid4)
+                messages.append(self._build_part_message(message_base=message_base, body=body))
+        self.retransmitted_parts += len(messages)
+        return messages
+
+    def get_missing_parts_to_request(self, now: None | float = None) -> list[tuple[JID, str, list[int]]]:
+        """
+        Returns the missing parts of the incomplete transfers that have not been updated during the NACK deadline,
+        and marks them as requested. The deadline is doubled after every NACK of the transfer. The gaps below the
+        highest part received are requested first, and the missing tail is only requested when there are no gaps
+        and the transfer has been idle for twice the deadline.
+
+        Args:
+            now (None | float, optional): Current `time.monotonic()`. Defaults to None.
+
+        Returns:
+            list[tuple[JID, str, list[int]]]: The sender, the uuid4 and the missing part numbers of every transfer.
+        """
+        now = time.monotonic() if now is None else now
+        requests: list[tuple[JID, str, list[int]]] = []
+        for (sender, uuid4), transfer in self.__multipart_message_storage.items():
+            last_activity = (
+                transfer.updated_at if transfer.nacked_at is None else max(transfer.updated_at, transfer.nacked_at)
+            )
+            if transfer.nacks >= self.max_nacks:
+                continue
+            deadline = self.nack_deadline * 2**transfer.nacks
+            missing_parts = transfer.get_missing_parts(below=transfer.highest_part)
+            if not missing_parts:
+                # Only the tail is missing, which could still be on its way
+                deadline *= 2
+                missing_parts = transfer.get_missing_parts()
+            if now - last_activity >= deadline:
+                transfer.nacks += 1
+                transfer.nacked_at = now
+                requests.append((sender, uuid4, missing_parts))
+        return requests
+
+    def generate_nack_message(self, to: JID, uuid4: str, part_numbers: list[int]) -> Message:
+        """
+        Creates the message that requests the retransmission of the missing parts of a multipart message.
+
+        Args:
+            to (JID): The sender of the multipart message.
+            uuid4 (str): The uuid4 of the multipart message.
+            part_numbers (list[int]): The missing part numbers.
+
+        Returns:
+            Message: The NACK message.
+        """
+        message = Message(to=str(to.bare()), body=json.dumps({"uuid4": uuid4, "parts": part_numbers}))
+        message.set_metadata("rf.multipart", "nack")
+        return message
+
+    @staticmethod
+    def parse_nack_message(message: Message) -> tuple[str, list[int]]:
+        content = json.loads(message.body)
+        return content["uuid4"], [int(part) for part in content["parts"]]
@@ -0,0 +1,136 @@
+from typing import Dict
+
+import torch
+from torch import Tensor
+
+LAYER_PRECISIONS: Dict[str, None | torch.dtype] = {
+    "fp32": None,
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+    "int8": torch.int8,
+    "int8_channel": torch.int8,
+}
+
+INT8_MIN = -128
+INT8_MAX = 127
+
+
+def check_layer_precision(precision: str) -> str:
+    """
+    Checks that the transmission precision is valid.
+
+    Args:
+        precision (str): Name of the precision: "fp32", "fp16", "bf16", "int8" (per-tensor scale and
+            zero-point) or "int8_channel" (per-channel scale and zero-point).
+
+    Raises:
+        NotImplementedError: If the precision is not valid.
+
+    Returns:
+        str: The name of the precision in lower case.
+    """
+    if precision.lower() not in LAYER_PRECISIONS:
+        raise NotImplementedError(
+            f"Layer precision {precision} is not valid. Valid precisions: {list(LAYER_PRECISIONS.keys())}."
+        )
+    return precision.lower()
+
+
+def quantize_int8(tensor: Tensor, per_channel: bool = False) -> tuple[Tensor, Tensor, Tensor]:
+    """
+    Linear asymmetric quantization of a floating point tensor into int8 so that
+    `tensor ~= (quantized - zero_point) * scale`.
+
+    Args:
+        tensor (Tensor): The floating point tensor.
+        per_channel (bool, optional): Computes a scale and zero-point for every slice of the first dimension
+            instead of a single one for the whole tensor. Tensors with less than two dimensions are always
+            quantized per tensor. Defaults to False.
+
+    Returns:
+        tuple[Tensor, Tensor, Tensor]: The int8 tensor, the float32 scale and the int32 zero-point. The scale and
+        the zero-point are shaped to be broadcastable against the quantized tensor.
+    """
+    values = tensor.detach().to(torch.float32)
+    if per_channel and values.dim() >= 2:
+        flat = values.reshape(values.shape[0], -1)
+        shape = [values.shape[0]] + [1] * (values.dim() - 1)
+        min_value = flat.amin(dim=1).clamp(max=0).reshape(shape)
+        max_value = flat.amax(dim=1).clamp(min=0).reshape(shape)
+    else:
+        min_value = values.min().clamp(max=0) if values.numel() else torch.zeros(())
+        max_value = values.max().clamp(min=0) if values.numel() else torch.zeros(())
+    # The range always contains 0 so zeros (e.g. padding or pruned weights) are exactly represented
+    scale = ((max_value - min_value) / (INT8_MAX - INT8_MIN)).clamp(min=torch.finfo(torch.float32).tiny)
+    zero_point = (INT8_MIN - torch.round(min_value / scale)).clamp(INT8_MIN, INT8_MAX).to(torch.int32)
+    quantized = torch.round(values / scale + zero_point).clamp(INT8_MIN, INT8_MAX).to(torch.int8)
+    return quantized, scale, zero_point
+
+
+def dequantize_int8(quantized: Tensor, scale: Tensor, zero_point: Tensor, dtype: torch.dtype) -> Tensor:
+    """
+    Inverse of `quantize_int8`.
+
+    Args:
+        quantized (Tensor): The int8 tensor.
+        scale (Tensor): The scale.
+        zero_point (Tensor): The zero-point.
+        dtype (torch.dtype): The floating point dtype of the result.
+
+    Returns:
+        Tensor: The dequantized tensor.
+    """
+    return ((quantized.to(torch.float32) - zero_point) * scale).to(dtype)
+
+
+def reduce_layers_precision(
+    layers: Dict[str, Tensor], precision: str
+) -> tuple[Dict[str, Tensor], Dict[str, tuple[Tensor, Tensor]]]:
+    """
+    Reduces the precision of the floating point layers before sending them. Layers that are not floating point
+    (e.g. the number of batches tracked by a batch normalization) are not modified.
+
+    Args:
+        layers (Dict[str, Tensor]): The layers to send.
+        precision (str): Name of the transmission precision.
+
+    Returns:
+        tuple[Dict[str, Tensor], Dict[str, tuple[Tensor, Tensor]]]: The layers with the reduced precision and
+        the scale and zero-point of every int8 quantized layer.
+    """
+    precision = check_layer_precision(precision)
+    dtype = LAYER_PRECISIONS[precision]
+    if dtype is None:
+        return layers, {}
+    reduced: Dict[str, Tensor] = {}
+    quantization: Dict[str, tuple[Tensor, Tensor]] = {}
+    for name, layer in layers.items():
+        if not layer.is_floating_point():
+            reduced[name] = layer
+        elif dtype == torch.int8:
+            reduced[name], scale, zero_point = quantize_int8(layer, per_channel=precision == "int8_channel")
+            quantization[name] = (scale, zero_point)
+        else:
+            reduced[name] = layer.detach().to(dtype)
+    return reduced, quantization
+
+
+def restore_layer_precision(
+    layer: Tensor, dtype: torch.dtype, quantization: None | tuple[Tensor, Tensor] = None
+) -> Tensor:
+    """
+    Restores a received layer to the dtype of the local model.
+
+    Args:
+        layer (Tensor): The received layer.
+        dtype (torch.dtype): The dtype of the local layer.
+        quantization (None | tuple[Tensor, Tensor], optional): Scale and zero-point if the layer was quantized.
+            Defaults to None.
+
+    Returns:
+        Tensor: The layer with the local dtype.
+    """
+    if quantization is not None:
+        scale, zero_point = quantization
+        return dequantize_int8(layer, scale=scale, zero_point=zero_point, dtype=dtype)
+    return layer if layer.dtype == dtype else layer.to(dtype)
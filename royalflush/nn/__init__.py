@@ -1,2 +1,3 @@
 from . import model
 from .model_factory import ModelManagerFactory
+from .stacked_trainer import StackedTrainer
@@ -55,7 +55,16 @@ class ModelManagerFactory:
 
     @staticmethod
     def get_manager(
-        dataset: str, settings: DatasetSettings, ann: str, training_epochs: int, seed: Optional[int] = 42
+        dataset: str,
+        settings: DatasetSettings,
+        ann: str,
+        training_epochs: int,
+        seed: Optional[int] = 42,
+        double_buffered: bool = False,
+        training_executor: str = "inline",
+        mixed_precision: str = "fp32",
+        compile_model: bool = False,
+        gradient_check_interval: int = 0,
     ) -> ModelManager:
         generator = ModelManagerFactory.get_dataloader_generator(dataset=dataset)
         dataloaders = generator.get_dataloaders(dataset_settings=settings)
@@ -77,6 +86,11 @@ class ModelManagerFactory:
             dataloaders=dataloaders,
             seed=settings.seed,
             track_layers_weights=list(model.state_dict().keys()),
+            double_buffered=double_buffered,
+            training_executor=training_executor,
+            mixed_precision=mixed_precision,
+            compile_model=compile_model,
+            gradient_check_interval=gradient_check_interval,
         )
 
     @staticmethod
@@ -0,0 +1,305 @@
+import copy
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Sequence
+
+import torch
+from torch import Tensor
+from torch.func import functional_call, grad, vmap
+from torch.optim import Adam
+
+from ..datatypes.metrics import MetricsAccumulator, ModelMetrics
+from ..datatypes.models import ModelManager
+from ..log.nn import NnConvergenceLogManager, NnTrainLogManager
+
+
+class StackedTrainer:
+    """
+    Trains several model managers with the same architecture at once. The parameters of the models are stacked
+    along a new first dimension and the forward and backward passes of all the models run as one vectorized call
+    with `torch.func.functional_call` and `vmap`, so the small batches of each agent fill the vector units of the
+    CPU together.
+
+    Each model is trained on the train dataloader of its own model manager and keeps its own Adam state, updated
+    with the hyperparameters of its optimizer. The trained parameters and the Adam state are written back into
+    each model manager after every epoch, so the managers can keep training with `ModelManager.train`.
+    """
+
+    def __init__(self, model_managers: Sequence[ModelManager]) -> None:
+        """
+        Args:
+            model_managers (Sequence[ModelManager]): The model managers to train.
+
+        Raises:
+            ValueError: If there are no model managers, the models have buffers or their architectures, devices or
+                optimizer hyperparameters are different.
+            NotImplementedError: If an optimizer is not Adam or it uses options that are not supported.
+        """
+        if not model_managers:
+            raise ValueError("The stacked trainer needs at least one model manager.")
+        self.model_managers = list(model_managers)
+        reference = self.model_managers[0]
+        self.device = reference.device
+        self.names: list[str] = [name for name, _ in reference.model.named_parameters()]
+        shapes = [(name, param.shape, param.dtype) for name, param in reference.model.named_parameters()]
+        for model_manager in self.model_managers:
+            if list(model_manager.model.buffers()):
+                raise ValueError("The stacked trainer does not support models with buffers, such as BatchNorm.")
+            if type(model_manager.model) is not type(reference.model) or shapes != [
+                (name, param.shape, param.dtype) for name, param in model_manager.model.named_parameters()
+            ]:
+                raise ValueError("All the models of the stacked trainer must have the same architecture.")
+            if model_manager.device != self.device:
+                raise ValueError("All the models of the stacked trainer must be on the same device.")
+        self.hyperparameters = StackedTrainer.__get_adam_hyperparameters(reference)
+        for model_manager in self.model_managers:
+            if StackedTrainer.__get_adam_hyperparameters(model_manager) != self.hyperparameters:
+                raise ValueError("All the Adam optimizers of the stacked trainer must have the same hyperparameters.")
+        self.template = copy.deepcopy(reference.model)  # Architecture of the functional calls
+        self.criterion = copy.copy(reference.criterion)
+        self.criterion.reduction = "none"  # Loss of each sample to mask the padding of shorter batches
+
+    @staticmethod
+    def __get_adam_hyperparameters(model_manager: ModelManager) -> Dict[str, Any]:
+        optimizer = model_manager.optimizer
+        if not isinstance(optimizer, Adam):
+            raise NotImplementedError(
+                f"The stacked trainer only supports the Adam optimizer and it is {type(optimizer).__name__}."
+            )
+        if len(optimizer.param_groups) != 1:
+            raise NotImplementedError("The stacked trainer only supports optimizers with one parameter group.")
+        group = optimizer.param_groups[0]
+        if group["amsgrad"] or group["maximize"] or group.get("decoupled_weight_decay", False):
+            raise NotImplementedError("The stacked trainer does not support amsgrad, maximize or decoupled decay.")
+        lr = group["lr"]
+        beta1, beta2 = group["betas"]
+        return {
+            "lr": float(lr),
+            "beta1": float(beta1),
+            "beta2": float(beta2),
+            "eps": float(group["eps"]),
+            "weight_decay": float(group["weight_decay"]),
+        }
+
+    def __stack_state(self) -> tuple[Dict[str, Tensor], Dict[str, Tensor], Dict[str, Tensor], Tensor]:
+        """
+        Returns:
+            tuple[Dict[str, Tensor], Dict[str, Tensor], Dict[str, Tensor], Tensor]: The stacked parameters, the
+            stacked first and second moments of Adam and the number of Adam steps of each model.
+        """
+        params: Dict[str, Tensor] = {}
+        exp_avgs: Dict[str, Tensor] = {}
+        exp_avg_sqs: Dict[str, Tensor] = {}
+        steps = torch.zeros(len(self.model_managers), dtype=torch.float64, device=self.device)
+        for name in self.names:
+            model_params = [dict(m.model.named_parameters())[name] for m in self.model_managers]
+            states = [m.optimizer.state.get(p, {}) for m, p in zip(self.model_managers, model_params)]
+            params[name] = torch.stack([p.detach() for p in model_params])
+            exp_avgs[name] = torch.stack([s.get("exp_avg", torch.zeros_like(p)) for s, p in zip(states, model_params)])
+            exp_avg_sqs[name] = torch.stack(
+                [s.get("exp_avg_sq", torch.zeros_like(p)) for s, p in zip(states, model_params)]
+            )
+        for i, model_manager in enumerate(self.model_managers):
+            state = model_manager.optimizer.state.get(next(model_manager.model.parameters()), {})
+            steps[i] = float(state["step"]) if "step" in state else 0.0
+        return params, exp_avgs, exp_avg_sqs, steps
+
+    def __write_back(
+        self,
+        params: Dict[str, Tensor],
+        exp_avgs: Dict[str, Tensor],
+        exp_avg_sqs: Dict[str, Tensor],
+        steps: Tensor,
+    ) -> None:
+        """
+        Copies the stacked parameters into the models, keeping the flat buffers of the model managers, and the
+        stacked Adam state into their optimizers.
+        """
+        with torch.no_grad():
+            for i, model_manager in enumerate(self.model_managers):
+                for name, param in model_manager.model.named_parameters():
+                    param.copy_(params[name][i])
+                    model_manager.optimizer.state[param] = {
+                        "step": torch.tensor(float(steps[i])),
+                        "exp_avg": exp_avgs[name][i].clone(),
+                        "exp_avg_sq": exp_avg_sqs[name][i].clone(),
+                    }
+
+    def __adam_step(
+        self,
+        params: Dict[str, Tensor],
+        grads: Dict[str, Tensor],
+        exp_avgs: Dict[str, Tensor],
+        exp_avg_sqs: Dict[str, Tensor],
+        steps: Tensor,
+        active: Tensor,
+    ) -> None:
+        """
+        Updates in-place the stacked parameters of the active models with the Adam rule of `torch.optim.Adam`,
+        with a bias correction per model because the models may have done a different number of steps. All the
+        models are updated with fused `torch._foreach` operations and the state of the inactive ones is restored.
+        """
+        hp = self.hyperparameters
+        names = list(params.keys())
+        param_list = [params[name] for name in names]
+        grad_list = [grads[name] for name in names]
+        exp_avg_list = [exp_avgs[name] for name in names]
+        exp_avg_sq_list = [exp_avg_sqs[name] for name in names]
+        inactive = (~active).nonzero().flatten()
+        saved = [
+            [tensor.index_select(0, inactive) for tensor in tensors]
+            for tensors in (param_list, exp_avg_list, exp_avg_sq_list)
+        ]
+
+        steps += active.to(steps.dtype)
+        completed_steps = steps.clamp(min=1)
+        step_size = hp["lr"] / (1 - hp["beta1"] ** completed_steps)
+        bias_correction2_sqrt = (1 - hp["beta2"] ** completed_steps).sqrt()
+        views = [(-1,) + (1,) * (param.dim() - 1) for param in param_list]
+        with torch.no_grad():
+            if hp["weight_decay"] != 0:
+                grad_list = list(torch._foreach_add(grad_list, param_list, alpha=hp["weight_decay"]))
+            torch._foreach_lerp_(exp_avg_list, grad_list, 1 - hp["beta1"])
+            torch._foreach_mul_(exp_avg_sq_list, hp["beta2"])
+            torch._foreach_addcmul_(exp_avg_sq_list, grad_list, grad_list, value=1 - hp["beta2"])
+            denom = torch._foreach_sqrt(exp_avg_sq_list)
+            torch._foreach_div_(
+                denom, [bias_correction2_sqrt.to(p.dtype).view(view) for p, view in zip(param_list, views)]
+            )
+            torch._foreach_add_(denom, hp["eps"])
+            torch._foreach_div_(denom, [step_size.to(p.dtype).view(view) for p, view in zip(param_list, views)])
+            torch._foreach_addcdiv_(param_list, exp_avg_list, denom, value=-1)
+            if inactive.numel() > 0:
+                for tensors, saved_tensors in zip((param_list, exp_avg_list, exp_avg_sq_list), saved):
+                    for tensor, saved_tensor in zip(tensors, saved_tensors):
+                        tensor.index_copy_(0, inactive, saved_tensor)
+
+    def __iter_stacked_batches(self) -> Iterator[tuple[Tensor, Tensor, Tensor, Tensor]]:
+        """
+        Yields the next batch of every model stacked along the first dimension. The batches shorter than the
+        longest one, such as the last batch of a shard or the batches of an exhausted shard, are padded and masked.
+
+        Yields:
+            tuple[Tensor, Tensor, Tensor, Tensor]: The stacked images, labels, mask of the real samples and mask
+            of the models with a batch.
+        """
+        iterators = [iter(m.dataloaders.train) for m in self.model_managers]
+        while True:
+            batches: list[None | tuple[Tensor, Tensor]] = [next(iterator, None) for iterator in iterators]
+            if all(batch is None for batch in batches):
+                return
+            reference = next(batch for batch in batches if batch is not None)
+            size = max(batch[1].shape[0] for batch in batches if batch is not None)
+            images = reference[0].new_zeros((len(batches), size) + tuple(reference[0].shape[1:]))
+            labels = reference[1].new_zeros((len(batches), size) + tuple(reference[1].shape[1:]))
+            mask = torch.zeros(len(batches), size)
+            for i, batch in enumerate(batches):
+                if batch is not None:
+                    count = batch[1].shape[0]
+                    images[i, :count] = batch[0]
+                    labels[i, :count] = batch[1]
+                    mask[i, :count] = 1
+            yield images.to(self.device), labels.to(self.device), mask.to(self.device), mask.any(dim=1).to(self.device)
+
+    def train(
+        self,
+        epochs: None | int = None,
+        train_loggers: None | Sequence[None | NnTrainLogManager] = None,
+        weight_loggers: None | Sequence[None | NnConvergenceLogManager] = None,
+    ) -> list[list[ModelMetrics]]:
+        """
+        Trains all the models at once, with the same result as calling `ModelManager.train` on each model manager
+        up to the floating point rounding and the random numbers of the dropout layers.
+
+        Args:
+            epochs (None | int, optional): Number of epochs to train. Defaults to None (the training epochs of the
+                first model manager).
+            train_loggers (None | Sequence[None | NnTrainLogManager], optional): Logger of the metrics of each
+                model manager. Defaults to None.
+            weight_loggers (None | Sequence[None | NnConvergenceLogManager], optional): Logger of the weights of
+                each model manager. Defaults to None.
+
+        Raises:
+            ValueError: If the number of loggers is not the number of model managers.
+
+        Returns:
+            list[list[ModelMetrics]]: The metrics of each epoch of each model manager.
+        """
+        num_models = len(self.model_managers)
+        train_loggers = [None] * num_models if train_loggers is None else list(train_loggers)
+        weight_loggers = [None] * num_models if weight_loggers is None else list(weight_loggers)
+        if len(train_loggers) != num_models or len(weight_loggers) != num_models:
+            raise ValueError(f"The stacked trainer needs one logger per model manager ({num_models}).")
+        if epochs is None:
+            epochs = self.model_managers[0].training_epochs
+
+        def compute_loss(
+            params: Dict[str, Tensor], images: Tensor, labels: Tensor, mask: Tensor
+        ) -> tuple[Tensor, tuple[Tensor, Tensor]]:
+            outputs = functional_call(self.template, params, (images,))
+            loss = (self.criterion(outputs, labels) * mask).sum() / mask.sum().clamp(min=1)
+            return loss, (loss.detach(), outputs.detach())
+
+        compute_gradients = vmap(grad(compute_loss, has_aux=True), randomness="different")
+
+        with ExitStack() as sessions:
+            for model_manager in self.model_managers:
+                sessions.enter_context(model_manager.training_session())
+            return self.__train(epochs, compute_gradients, train_loggers, weight_loggers)
+
+    def __train(
+        self,
+        epochs: int,
+        compute_gradients: Callable[..., Any],
+        train_loggers: list[None | NnTrainLogManager],
+        weight_loggers: list[None | NnConvergenceLogManager],
+    ) -> list[list[ModelMetrics]]:
+        num_models = len(self.model_managers)
+        metrics: list[list[ModelMetrics]] = [[] for _ in range(num_models)]
+        try:
+            self.template.train()
+            params, exp_avgs, exp_avg_sqs, steps = self.__stack_state()
+            for epoch in range(epochs):
+                for model_manager, weight_logger in zip(self.model_managers, weight_loggers):
+                    if weight_logger is not None:
+                        weight_logger.epoch_or_iteration = epoch + 1
+                        weight_logger.log_weights(
+                            timestamp_z=datetime.now(tz=timezone.utc),
+                            description="PRE-TRAIN",
+                            model=model_manager.model.state_dict(),
+                        )
+
+                accumulators = [MetricsAccumulator() for _ in range(num_models)]
+                init_time_z = datetime.now(tz=timezone.utc)
+                for images, labels, mask, active in self.__iter_stacked_batches():
+                    grads, (losses, outputs) = compute_gradients(params, images, labels, mask)
+                    self.__adam_step(params, grads, exp_avgs, exp_avg_sqs, steps, active)
+                    for i, accumulator in enumerate(accumulators):
+                        # The padding is masked and the loss of an exhausted shard is 0
+                        accumulator.update(outputs=outputs[i], labels=labels[i], loss=losses[i], mask=mask[i])
+                self.__write_back(params, exp_avgs, exp_avg_sqs, steps)
+
+                end_time_z = datetime.now(tz=timezone.utc)
+                for i, model_manager in enumerate(self.model_managers):
+                    epoch_metric = accumulators[i].compute(
+                        start_time_z=init_time_z,
+                        end_time_z=end_time_z,
+                        num_batches=len(model_manager.dataloaders.train),
+                    )
+                    metrics[i].append(epoch_metric)
+                    train_logger = train_loggers[i]
+                    if train_logger is not None:
+                        train_logger.log_train_epoch(epoch=epoch + 1, train=epoch_metric)
+                    weight_logger = weight_loggers[i]
+                    if weight_logger is not None:
+                        weight_logger.log_weights(
+                            timestamp_z=datetime.now(tz=timezone.utc),
+                            description="POST-TRAIN",
+                            model=model_manager.model.state_dict(),
+                        )
+            return metrics
+
+        finally:
+            for weight_logger in weight_loggers:
+                if weight_logger is not None:
+                    weight_logger.epoch_or_iteration = -1
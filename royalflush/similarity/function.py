@@ -25,7 +25,7 @@ class OnesFunction(SimilarityFunction):
         layers1: Dict[str, Tensor],
         layers2: Dict[str, Tensor],
     ) -> SimilarityVector:
-        vector: Dict[str, float] = Dict()
+        vector: Dict[str, float] = {}
         for layer in layers1:
             if not layer in layers2:
                 raise ValueError(f"Layer {layer} not present in {list(layers2.keys())}.")
@@ -40,7 +40,7 @@ class EuclideanDistanceFunction(SimilarityFunction):
         layers1: Dict[str, Tensor],
         layers2: Dict[str, Tensor],
     ) -> SimilarityVector:
-        vector: Dict[str, float] = Dict()
+        vector: Dict[str, float] = {}
 
         for layer in layers1:
             if not layer in layers2:
@@ -1,5 +1,6 @@
 import asyncio
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 
 from aioxmpp import JID
 
@@ -32,9 +33,16 @@ class SimilarityManager:
             []
         )  # Neighbours waiting to my response. [tuple[JID, str]] are tuples of neighbours and threads.
         self.similarity_vectors: dict[JID, SimilarityVector] = {}
+        self.response_latencies: dict[JID, float] = (
+            {}
+        )  # Seconds since the request of the last exchange until the response of each neighbour.
+        self.__requested_at: float = time.monotonic()
+        self.__responses_received = asyncio.Event()  # Set when the last awaited neighbour answers
 
     def clear_waiting_responses(self, neighbours: list[JID], thread: str) -> None:
         self.waiting_responses = {n.bare(): thread for n in neighbours}
+        self.response_latencies = {}
+        self.__requested_at = time.monotonic()
 
     def get_own_similarity_vector(self) -> SimilarityVector | None:
         if self.function is None:
@@ -42,7 +50,7 @@ class SimilarityManager:
             #     "The agent must have a function to compute the similarity vector."
             # )
             return None
-        layer2 = self.model_manager.model.state_dict()
+        layer2 = self.model_manager.get_published_layers(list(self.model_manager.initial_state.keys()))
         vector = self.function.get_similarity_vector(
             layers1=self.model_manager.initial_state,
             layers2=layer2,
@@ -51,17 +59,37 @@ class SimilarityManager:
         return vector
 
     async def wait_similarity_vectors(self, timeout: None | float = None) -> bool:
+        """
+        Waits until all the awaited neighbours answer or the timeout expires. It is woken up by
+        `add_similarity_vector` when the last awaited neighbour answers, without polling.
+
+        Args:
+            timeout (None | float, optional): Maximum seconds to wait. Defaults to None
+                (`wait_for_responses_timeout`).
+
+        Returns:
+            bool: True if all the awaited neighbours answered.
+        """
         to = timeout if timeout is not None else self.wait_for_responses_timeout
-        stop_time_z = datetime.now(tz=timezone.utc) + timedelta(seconds=to)
-        stop_time_reached = False
-        while list(self.waiting_responses.keys()) and not stop_time_reached:
-            await asyncio.sleep(delay=2)
-            stop_time_reached = datetime.now(tz=timezone.utc) >= stop_time_z
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + to
+        while self.waiting_responses:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            self.__responses_received.clear()
+            try:
+                await asyncio.wait_for(self.__responses_received.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
         return len(list(self.waiting_responses.keys())) == 0
 
     def add_similarity_vector(self, neighbour: JID, vector: SimilarityVector, thread: None | str) -> None:
         if thread and neighbour.bare() in self.waiting_responses and thread == self.waiting_responses[neighbour.bare()]:
             del self.waiting_responses[neighbour.bare()]
+            self.response_latencies[neighbour.bare()] = time.monotonic() - self.__requested_at
+            if not self.waiting_responses:
+                self.__responses_received.set()
         self.similarity_vectors[neighbour.bare()] = vector
 
     def get_vector(self, neighbour: JID) -> SimilarityVector | None:
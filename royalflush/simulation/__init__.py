@@ -0,0 +1,4 @@
+from .engine import NetworkModel, SimulationEngine, SimulationEvent
+from .simulator import PremioFlSimulation, SimulatedAgent
+
+__all__ = ["NetworkModel", "PremioFlSimulation", "SimulatedAgent", "SimulationEngine", "SimulationEvent"]
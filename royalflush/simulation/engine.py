@@ -0,0 +1,120 @@
+import heapq
+from typing import Callable
+
+
+class SimulationEvent:
+    """
+    Callback scheduled at an instant of the virtual clock. Events of the same instant run in the order in which
+    they were scheduled.
+    """
+
+    def __init__(self, time: float, sequence: int, callback: Callable[[], None]) -> None:
+        self.time = time
+        self.sequence = sequence
+        self.callback: None | Callable[[], None] = callback
+
+    def cancel(self) -> None:
+        self.callback = None
+
+    def is_cancelled(self) -> bool:
+        return self.callback is None
+
+    def __lt__(self, other: "SimulationEvent") -> bool:
+        return (self.time, self.sequence) < (other.time, other.sequence)
+
+
+class SimulationEngine:
+    """
+    Discrete-event engine with a virtual clock in seconds. The clock jumps from one event to the next, so waiting
+    for a message or a timeout does not take real time.
+    """
+
+    def __init__(self) -> None:
+        self.now: float = 0.0
+        self.processed: int = 0
+        self.__events: list[SimulationEvent] = []
+        self.__sequence: int = 0
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> SimulationEvent:
+        """
+        Schedules a callback after a delay of virtual time.
+
+        Args:
+            delay (float): Seconds of virtual time from now.
+            callback (Callable[[], None]): The function to call.
+
+        Raises:
+            ValueError: If the delay is negative.
+
+        Returns:
+            SimulationEvent: The scheduled event, which can be cancelled.
+        """
+        if delay < 0:
+            raise ValueError(f"The delay of a simulation event must be greater or equal to 0 and it is {delay}.")
+        event = SimulationEvent(time=self.now + delay, sequence=self.__sequence, callback=callback)
+        self.__sequence += 1
+        heapq.heappush(self.__events, event)
+        return event
+
+    def run(self, until: None | float = None) -> float:
+        """
+        Processes the events in order of time until there are no events left or the next event is after `until`.
+        Cancelled events are discarded without moving the clock.
+
+        Args:
+            until (None | float, optional): Last instant of virtual time to process. Defaults to None (all the
+                events).
+
+        Returns:
+            float: The virtual time of the last processed event.
+        """
+        while self.__events:
+            event = self.__events[0]
+            if until is not None and event.time > until:
+                break
+            heapq.heappop(self.__events)
+            if event.callback is None:
+                continue
+            self.now = event.time
+            event.callback()
+            self.processed += 1
+        return self.now
+
+    def __len__(self) -> int:
+        return len(self.__events)
+
+
+class NetworkModel:
+    """
+    Links between the simulated agents with the same latency and bandwidth.
+    """
+
+    def __init__(self, latency: float = 0.0, bandwidth: None | float = None) -> None:
+        """
+        Args:
+            latency (float, optional): Seconds from sending a message until the first byte arrives. Defaults to 0.
+            bandwidth (None | float, optional): Bytes per second of each link. Defaults to None (unlimited).
+
+        Raises:
+            ValueError: If the latency is negative or the bandwidth is not positive.
+        """
+        if latency < 0:
+            raise ValueError(f"The latency must be greater or equal to 0 and it is {latency}.")
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError(f"The bandwidth must be greater than 0 and it is {bandwidth}.")
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+    def transfer_seconds(self, size: int) -> float:
+        """
+        Computes the seconds to deliver a message.
+
+        Args:
+            size (int): Size of the message in bytes.
+
+        Returns:
+            float: The latency plus the transmission time of the message.
+        """
+        if self.bandwidth is None:
+            return self.latency
+        return self.latency + size / self.bandwidth
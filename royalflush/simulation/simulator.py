@@ -0,0 +1,351 @@
+import copy
+import time
+import uuid
+from datetime import datetime, timezone
+from functools import partial
+from typing import Dict
+
+from aioxmpp import JID
+from torch import Tensor
+
+from .._agent.agent_factory import AgentFactory
+from .._agent.base import PremioFlAgent
+from ..datatypes.consensus import Consensus
+from ..datatypes.experiment import Experiment
+from ..log.general import GeneralLogManager
+from ..message.precision import reduce_layers_precision
+from ..similarity.similarity_vector import SimilarityVector
+from .engine import NetworkModel, SimulationEngine, SimulationEvent
+
+
+class SimulatedAgent:
+    """
+    State of an agent in the simulation that the SPADE behaviours keep in the FSM and in the agent.
+    """
+
+    def __init__(self, agent: PremioFlAgent) -> None:
+        self.agent = agent
+        self.training_until: float = 0.0  # Virtual time when the current training ends
+        self.round_started_at: float = 0.0
+        self.selected_neighbours: list[JID] = []
+        self.similarity_thread: None | str = None  # Thread of the similarity vector exchange in progress
+        self.similarity_timeout: None | SimulationEvent = None
+        self.finished: bool = False
+
+
+class PremioFlSimulation:
+    """
+    Runs the PremioFL algorithms of the agents over a virtual clock, without SPADE, XMPP or presence. The agents
+    are the real `PremioFlAgent` instances, which are never started: the simulation reproduces the transitions of
+    `PremioFsmBehaviour` and the receiver behaviours with the `_select_neighbours` and `_assign_layers` of each
+    algorithm, the `ConsensusManager`, the `SimilarityManager` and the CSV loggers of the agent.
+
+    The training, the inference and the consensus run for real and take their measured duration in virtual time,
+    as if every agent had its own machine. The messages take the time given by the network model. All the
+    neighbours are available from the start.
+    """
+
+    def __init__(self, agents: list[PremioFlAgent], network: None | NetworkModel = None) -> None:
+        self.engine = SimulationEngine()
+        self.network = NetworkModel() if network is None else network
+        self.nodes: dict[JID, SimulatedAgent] = {agent.jid.bare(): SimulatedAgent(agent) for agent in agents}
+        self.logger = GeneralLogManager(extra_logger_name="simulation")
+
+    @staticmethod
+    def from_experiment(experiment: Experiment, network: None | NetworkModel = None) -> "PremioFlSimulation":
+        """
+        Builds the agents of the experiment with the `AgentFactory`, as the run command does.
+
+        Args:
+            experiment (Experiment): The experiment.
+            network (None | NetworkModel, optional): The links between the agents. Defaults to None (no latency
+                and unlimited bandwidth).
+
+        Returns:
+            PremioFlSimulation: The simulation of the experiment.
+        """
+        coordinator_jid = JID.fromstr(f"coordinator__{experiment.uuid4}@{experiment.xmpp_domain}")
+        agent_factory = AgentFactory(experiment=experiment, coordinator_jid=coordinator_jid, observer_jids=[])
+        return PremioFlSimulation(agents=agent_factory.create_agents(), network=network)
+
+    def run(self) -> float:
+        """
+        Runs all the agents until they reach their maximum number of rounds.
+
+        Returns:
+            float: The virtual seconds of the simulation.
+        """
+        self.logger.info(
+            f"Starting simulation of {len(self.nodes)} agents with network latency "
+            + f"{self.network.latency} s and bandwidth {self.network.bandwidth} B/s."
+        )
+        for node in self.nodes.values():
+            self.engine.schedule(0, partial(self.start_round, node))
+        seconds = self.engine.run()
+        for node in self.nodes.values():
+            if node.agent.model_manager.executor is not None:
+                node.agent.model_manager.executor.shutdown(wait=False)
+        self.logger.info(f"Simulation completed in {seconds:.2f} virtual seconds with {self.engine.processed} events.")
+        return seconds
+
+    def is_training(self, node: SimulatedAgent) -> bool:
+        return self.engine.now < node.training_until
+
+    def get_served_layers(self, node: SimulatedAgent, layers: list[str]) -> Dict[str, Tensor]:
+        """
+        Returns the layers that the agent sends to its neighbours at the current virtual time. The model is trained
+        in one go when the training starts, so the published snapshot is served until the training ends in
+        double-buffered mode.
+
+        Args:
+            node (SimulatedAgent): The agent.
+            layers (list[str]): The names of the layers.
+
+        Returns:
+            Dict[str, Tensor]: The layers.
+        """
+        model_manager = node.agent.model_manager
+        if self.is_training(node) and model_manager.double_buffered:
+            return {layer: model_manager.published_layers[layer] for layer in layers}
+        return model_manager.get_layers(layers)
+
+    def get_similarity_vector(self, node: SimulatedAgent) -> SimilarityVector:
+        similarity_manager = node.agent.similarity_manager
+        if similarity_manager.function is None:
+            raise RuntimeError("Trying to compute the similarity vector without similarity function.")
+        initial_state = node.agent.model_manager.initial_state
+        vector = similarity_manager.function.get_similarity_vector(
+            layers1=initial_state, layers2=self.get_served_layers(node, list(initial_state.keys()))
+        )
+        vector.owner = node.agent.jid
+        vector.sent_time_z = datetime.now(tz=timezone.utc)
+        return vector
+
+    def start_round(self, node: SimulatedAgent) -> None:
+        """
+        Starts a new round and trains the model, as `TrainState` does.
+        """
+        agent = node.agent
+        if agent.current_round > 0:
+            agent.algorithm_logger.log(
+                current_round=agent.current_round,
+                agent=agent.jid.bare(),
+                seconds=self.engine.now - node.round_started_at,
+            )
+        node.round_started_at = self.engine.now
+        agent.current_round += 1
+        agent.nn_convergence_logger.current_round = agent.current_round
+        agent.nn_train_logger.current_round = agent.current_round
+        agent.nn_inference_logger.current_round = agent.current_round
+        if agent.are_max_iterations_reached():
+            node.finished = True
+            agent.logger.info(
+                f"[{agent.current_round - 1}] Stopping agent because max rounds reached: "
+                + f"{agent.current_round - 1}/{agent.max_rounds}"
+            )
+            return
+
+        start = time.perf_counter()
+        model_manager = agent.model_manager
+        model_manager.train(train_logger=agent.nn_train_logger, weight_logger=agent.nn_convergence_logger)
+        metrics_validation = model_manager.inference()
+        metrics_test = model_manager.test_inference()
+        agent.nn_inference_logger.log(metrics_validation=metrics_validation, metrics_test=metrics_test)
+        seconds = time.perf_counter() - start
+        node.training_until = self.engine.now + seconds
+        agent.logger.info(
+            f"[{agent.current_round}] Train completed in {seconds:.2f} seconds with validation accuracy "
+            + f"{metrics_validation.accuracy:.6f}."
+        )
+        self.engine.schedule(seconds, partial(self.communicate, node))
+
+    def communicate(self, node: SimulatedAgent) -> None:
+        """
+        Selects the neighbours and starts the similarity vector exchange or sends the layers, as
+        `CommunicationState` does.
+        """
+        agent = node.agent
+        self.reply_layers(node)  # Requests received while training
+        neighbours = [neighbour.bare() for neighbour in agent.neighbours if neighbour.bare() in self.nodes]
+        selected_neighbours = [neighbour.bare() for neighbour in agent._select_neighbours(neighbours)]
+        if not selected_neighbours:
+            self.engine.schedule(0, partial(self.start_round, node))
+            return
+        node.selected_neighbours = selected_neighbours
+        if agent.similarity_manager.function is None:
+            self.send_layers(node)
+            return
+
+        thread = str(uuid.uuid4())
+        vector = self.get_similarity_vector(node)
+        vector.request_reply = True
+        agent.similarity_manager.clear_waiting_responses(selected_neighbours, thread)
+        node.similarity_thread = thread
+        for neighbour in selected_neighbours:
+            self.send_similarity_vector(sender=node, receiver=self.nodes[neighbour], vector=vector, thread=thread)
+        node.similarity_timeout = self.engine.schedule(
+            agent.similarity_manager.wait_for_responses_timeout, partial(self.end_similarity_exchange, node, thread)
+        )
+
+    def end_similarity_exchange(self, node: SimulatedAgent, thread: str) -> None:
+        if node.similarity_thread != thread:
+            return
+        node.similarity_thread = None
+        if node.similarity_timeout is not None:
+            node.similarity_timeout.cancel()
+            node.similarity_timeout = None
+        self.send_layers(node)
+
+    def send_similarity_vector(
+        self, sender: SimulatedAgent, receiver: SimulatedAgent, vector: SimilarityVector, thread: str
+    ) -> None:
+        size = len(vector.to_message().body)
+        tag = "-REQREPLY" if vector.request_reply else ""
+        sender.agent.message_logger.log(
+            current_round=sender.agent.current_round,
+            sender=sender.agent.jid,
+            to=receiver.agent.jid,
+            msg_type=f"SEND-SIMILARITY{tag}",
+            size=size,
+            thread=thread,
+        )
+        self.engine.schedule(
+            self.network.transfer_seconds(size),
+            partial(self.receive_similarity_vector, sender, receiver, copy.copy(vector), thread, size),
+        )
+
+    def receive_similarity_vector(
+        self, sender: SimulatedAgent, receiver: SimulatedAgent, vector: SimilarityVector, thread: str, size: int
+    ) -> None:
+        """
+        Stores the similarity vector and replies to it, as `SimilarityReceiverBehaviour` does.
+        """
+        agent = receiver.agent
+        if receiver.finished:
+            return
+        agent.message_logger.log(
+            current_round=agent.current_round,
+            sender=sender.agent.jid,
+            to=agent.jid,
+            msg_type="RECV-SIMILARITY",
+            size=size,
+            thread=thread,
+        )
+        vector.received_time_z = datetime.now(tz=timezone.utc)
+        agent.similarity_manager.add_similarity_vector(neighbour=sender.agent.jid, vector=vector, thread=thread)
+        if vector.request_reply:
+            self.send_similarity_vector(
+                sender=receiver, receiver=sender, vector=self.get_similarity_vector(receiver), thread=thread
+            )
+        elif receiver.similarity_thread == thread and not agent.similarity_manager.waiting_responses:
+            self.end_similarity_exchange(receiver, thread)
+
+    def send_layers(self, node: SimulatedAgent) -> None:
+        """
+        Sends the layers assigned to the selected neighbours and goes to the consensus.
+        """
+        agent = node.agent
+        for neighbour, layers in agent.assign_layers(node.selected_neighbours).items():
+            if neighbour.bare() in self.nodes:
+                self.send_consensus(
+                    sender=node,
+                    receiver=self.nodes[neighbour.bare()],
+                    layers=layers,
+                    request_reply=True,
+                    thread=str(uuid.uuid4()),
+                )
+        self.engine.schedule(0, partial(self.apply_consensus, node))
+
+    def send_consensus(
+        self,
+        sender: SimulatedAgent,
+        receiver: SimulatedAgent,
+        layers: Dict[str, Tensor],
+        request_reply: bool,
+        thread: None | str,
+    ) -> None:
+        agent = sender.agent
+        layers, quantization = reduce_layers_precision(layers, precision=agent.consensus_manager.layer_precision)
+        # The tensors are copied because the model of the sender keeps changing while the message is in transit
+        consensus = Consensus(
+            layers={name: layer.detach().clone() for name, layer in layers.items()},
+            sender=agent.jid,
+            request_reply=request_reply,
+            sent_time_z=datetime.now(tz=timezone.utc),
+            quantization=quantization,
+        )
+        size = consensus.get_tensors_size()
+        tag = "-REQREPLY" if request_reply else ""
+        agent.message_logger.log(
+            current_round=agent.current_round,
+            sender=agent.jid,
+            to=receiver.agent.jid,
+            msg_type=f"SEND-LAYERS{tag}",
+            size=size,
+            thread=thread,
+        )
+        self.engine.schedule(
+            self.network.transfer_seconds(size),
+            partial(self.receive_consensus, sender, receiver, consensus, thread, size),
+        )
+
+    def receive_consensus(
+        self, sender: SimulatedAgent, receiver: SimulatedAgent, consensus: Consensus, thread: None | str, size: int
+    ) -> None:
+        """
+        Adds the consensus to the inbox and replies to it, as `LayerReceiverBehaviour` does.
+        """
+        agent = receiver.agent
+        if receiver.finished:
+            return
+        agent.message_logger.log(
+            current_round=agent.current_round,
+            sender=sender.agent.jid,
+            to=agent.jid,
+            msg_type="RECV-LAYERS",
+            size=size,
+            thread=thread,
+        )
+        consensus.sender = sender.agent.jid.bare()
+        consensus.received_time_z = datetime.now(tz=timezone.utc)
+        if not agent.consensus_manager.add_consensus(consensus=consensus, thread=thread):
+            agent.logger.warning(
+                f"[{agent.current_round}] Consensus message from {consensus.sender} discarded because"
+                + " the consensus inbox is full."
+            )
+        self.reply_layers(receiver)
+
+    def reply_layers(self, node: SimulatedAgent) -> None:
+        """
+        Sends the replies to the consensus that requested them. In single-buffered mode the replies wait until
+        the training ends.
+        """
+        if self.is_training(node) and not node.agent.model_manager.double_buffered:
+            return
+        for response, thread in node.agent.consensus_manager.prepare_replies_to_send():
+            if response.sender is None or response.sender.bare() not in self.nodes:
+                continue
+            self.send_consensus(
+                sender=node,
+                receiver=self.nodes[response.sender.bare()],
+                layers=self.get_served_layers(node, list(response.layers.keys())),
+                request_reply=False,
+                thread=thread,
+            )
+
+    def apply_consensus(self, node: SimulatedAgent) -> None:
+        """
+        Applies the received consensus and goes to the next iteration or round, as `ConsensusState` does.
+        """
+        agent = node.agent
+        consensus_manager = agent.consensus_manager
+        start = time.perf_counter()
+        applied = consensus_manager.apply_all_consensus()
+        if applied:
+            agent.logger.info(
+                f"[{agent.current_round}] Consensus completed with neighbours: "
+                + f"{[ct.sender.localpart for ct in applied if ct.sender]}."
+            )
+        consensus_manager.add_one_completed_iteration(algorithm_rounds=agent.current_round)
+        next_state = self.start_round if consensus_manager.are_max_iterations_reached() else self.communicate
+        self.engine.schedule(time.perf_counter() - start, partial(next_state, node))
@@ -1,2 +1,3 @@
 from . import plots
 from .random import RandomUtils
+from .training_scheduler import TrainingScheduler
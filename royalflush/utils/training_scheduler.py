@@ -0,0 +1,212 @@
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+import torch
+
+from ..log.general import GeneralLogManager
+
+T = TypeVar("T")
+
+
+class TrainingScheduler:
+    """
+    Schedules the trainings of the agents of a process so they do not oversubscribe the CPU through the global
+    thread pool of torch. The trainings run in a fixed number of slots: an agent waits for a free slot, and while
+    it trains its thread uses the intra-op thread budget of the slot and, optionally, is pinned to the CPUs of the
+    slot. The decisions are reported in the general log.
+
+    The budget and the affinity are applied to the thread that runs the training, which is the training executor
+    of the agent, and the previous ones are restored when the training finishes, so they do not leak into the
+    event loop or the next work of the thread. Without slots the trainings run as before.
+    """
+
+    def __init__(self) -> None:
+        self.logger = GeneralLogManager(extra_logger_name="training_scheduler")
+        self.max_concurrent: None | int = None
+        self.threads: None | int = None
+        self.cpu_affinity: bool = False
+        self.slot_cpus: list[list[int]] = []
+        self.__free_slots: "queue.SimpleQueue[int]" = queue.SimpleQueue()
+        self.__lock = threading.Lock()
+        self.waits: int = 0  # Trainings that waited for a free slot
+        self.runs: int = 0
+
+    @staticmethod
+    def get_available_cpus() -> list[int]:
+        """
+        Returns:
+            list[int]: The CPUs where this process can run.
+        """
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+
+    @staticmethod
+    def split_cpus(cpus: list[int], parts: int) -> list[list[int]]:
+        """
+        Splits the CPUs into contiguous groups of the same size, up to one CPU. If there are fewer CPUs than parts,
+        the CPUs are shared by several parts in round-robin order.
+
+        Args:
+            cpus (list[int]): The CPUs.
+            parts (int): The number of groups.
+
+        Returns:
+            list[list[int]]: The CPUs of each group.
+        """
+        if len(cpus) < parts:
+            return [[cpus[i % len(cpus)]] for i in range(parts)]
+        size, remainder = divmod(len(cpus), parts)
+        groups: list[list[int]] = []
+        start = 0
+        for i in range(parts):
+            end = start + size + (1 if i < remainder else 0)
+            groups.append(cpus[start:end])
+            start = end
+        return groups
+
+    def configure(
+        self,
+        max_concurrent: None | int = None,
+        threads: None | int = None,
+        interop_threads: None | int = None,
+        cpu_affinity: bool = False,
+        cpus: None | list[int] = None,
+    ) -> None:
+        """
+        Sets up the slots of the trainings. It must be called before the agents start.
+
+        Args:
+            max_concurrent (None | int, optional): Maximum number of agents that train at the same time. Defaults
+                to None (unlimited, without slots).
+            threads (None | int, optional): Intra-op threads of each training. Defaults to None (the CPUs of the
+                slot, or the current number of threads of torch without slots).
+            interop_threads (None | int, optional): Inter-op threads of torch in the process. Defaults to None (not
+                changed). It can only be set before torch runs inter-op work.
+            cpu_affinity (bool, optional): Pin each training to the CPUs of its slot. Defaults to False.
+            cpus (None | list[int], optional): CPUs shared by the slots. Defaults to None (the CPUs of the process).
+
+        Raises:
+            ValueError: If a number of trainings or threads is not positive, or the CPU affinity is enabled without
+                a maximum number of concurrent trainings.
+        """
+        for name, value in (
+            ("max_concurrent", max_concurrent),
+            ("threads", threads),
+            ("interop_threads", interop_threads),
+        ):
+            if value is not None and value < 1:
+                raise ValueError(f"The {name} of the training scheduler must be greater than 0 and it is {value}.")
+        if cpu_affinity and max_concurrent is None:
+            raise ValueError(
+                "The CPU affinity of the training scheduler needs a maximum number of concurrent trainings."
+            )
+        if interop_threads is not None:
+            try:
+                torch.set_num_interop_threads(interop_threads)
+            except RuntimeError as e:
+                self.logger.warning(f"Training scheduler could not set {interop_threads} inter-op threads: {e}")
+
+        with self.__lock:
+            self.max_concurrent = max_concurrent
+            self.threads = threads
+            self.cpu_affinity = cpu_affinity and hasattr(os, "sched_setaffinity")
+            available = TrainingScheduler.get_available_cpus() if cpus is None else cpus
+            self.slot_cpus = [] if max_concurrent is None else TrainingScheduler.split_cpus(available, max_concurrent)
+            self.__free_slots = queue.SimpleQueue()
+            for slot in range(len(self.slot_cpus)):
+                self.__free_slots.put(slot)
+            self.waits = 0
+            self.runs = 0
+
+        if cpu_affinity and not self.cpu_affinity:
+            self.logger.warning("Training scheduler: the CPU affinity is not supported on this platform.")
+        if max_concurrent is None:
+            self.logger.info(
+                f"Training scheduler: unlimited concurrent trainings with "
+                f"{threads or torch.get_num_threads()} intra-op threads each."
+            )
+        else:
+            for slot, slot_cpus in enumerate(self.slot_cpus):
+                self.logger.info(
+                    f"Training scheduler: slot {slot} with {self.get_threads(slot)} intra-op threads on CPUs "
+                    f"{slot_cpus}{' (pinned)' if self.cpu_affinity else ''}."
+                )
+
+    def reset(self) -> None:
+        """
+        Removes the slots, so the trainings run without limits.
+        """
+        with self.__lock:
+            self.max_concurrent = None
+            self.threads = None
+            self.cpu_affinity = False
+            self.slot_cpus = []
+            self.__free_slots = queue.SimpleQueue()
+
+    def get_threads(self, slot: None | int) -> None | int:
+        """
+        Args:
+            slot (None | int): The slot, or None without slots.
+
+        Returns:
+            None | int: The intra-op thread budget of a training in the slot, or None to keep the threads of torch.
+        """
+        if self.threads is not None or slot is None:
+            return self.threads
+        return len(self.slot_cpus[slot])
+
+    def run(self, owner: str, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs a training in the current thread when there is a free slot, with the thread budget and the CPU
+        affinity of the slot.
+
+        Args:
+            owner (str): Name of the agent that trains, for the log.
+            function (Callable[..., T]): The training.
+            *args (Any): Positional arguments of the training.
+            **kwargs (Any): Keyword arguments of the training.
+
+        Returns:
+            T: The result of the training.
+        """
+        free_slots = self.__free_slots
+        slot: None | int = None
+        if self.slot_cpus:
+            start = time.perf_counter()
+            try:
+                slot = free_slots.get_nowait()
+            except queue.Empty:
+                with self.__lock:
+                    self.waits += 1
+                self.logger.info(f"Training scheduler: {owner} waits for a free slot.")
+                slot = free_slots.get()
+                self.logger.info(
+                    f"Training scheduler: {owner} gets slot {slot} after {time.perf_counter() - start:.2f} seconds."
+                )
+        threads = self.get_threads(slot)
+        self.logger.debug(f"Training scheduler: {owner} trains in slot {slot} with {threads} intra-op threads.")
+        previous_threads = torch.get_num_threads()
+        previous_affinity: None | set[int] = None
+        try:
+            if threads is not None and previous_threads != threads:
+                torch.set_num_threads(threads)
+            if slot is not None and self.cpu_affinity:
+                previous_affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, self.slot_cpus[slot])  # The current thread on Linux
+            with self.__lock:
+                self.runs += 1
+            return function(*args, **kwargs)
+        finally:
+            if torch.get_num_threads() != previous_threads:
+                torch.set_num_threads(previous_threads)
+            if previous_affinity is not None:
+                os.sched_setaffinity(0, previous_affinity)
+            if slot is not None:
+                free_slots.put(slot)
+
+
+TRAINING_SCHEDULER = TrainingScheduler()
@@ -0,0 +1,18 @@
+graph [
+  node [
+    id 0
+    label "a0"
+    jid "a0@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 1
+    label "a1"
+    jid "a1@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+]
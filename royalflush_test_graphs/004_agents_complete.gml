@@ -0,0 +1,50 @@
+graph [
+  node [
+    id 0
+    label "a0"
+    jid "a0@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 1
+    label "a1"
+    jid "a1@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 2
+    label "a2"
+    jid "a2@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 3
+    label "a3"
+    jid "a3@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+  edge [
+    source 0
+    target 2
+  ]
+  edge [
+    source 0
+    target 3
+  ]
+  edge [
+    source 1
+    target 2
+  ]
+  edge [
+    source 1
+    target 3
+  ]
+  edge [
+    source 2
+    target 3
+  ]
+]
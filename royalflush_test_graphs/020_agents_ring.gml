@@ -0,0 +1,202 @@
+graph [
+  node [
+    id 0
+    label "a0"
+    jid "a0@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 1
+    label "a1"
+    jid "a1@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 2
+    label "a2"
+    jid "a2@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 3
+    label "a3"
+    jid "a3@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 4
+    label "a4"
+    jid "a4@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 5
+    label "a5"
+    jid "a5@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 6
+    label "a6"
+    jid "a6@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 7
+    label "a7"
+    jid "a7@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 8
+    label "a8"
+    jid "a8@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 9
+    label "a9"
+    jid "a9@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 10
+    label "a10"
+    jid "a10@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 11
+    label "a11"
+    jid "a11@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 12
+    label "a12"
+    jid "a12@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 13
+    label "a13"
+    jid "a13@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 14
+    label "a14"
+    jid "a14@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 15
+    label "a15"
+    jid "a15@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 16
+    label "a16"
+    jid "a16@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 17
+    label "a17"
+    jid "a17@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 18
+    label "a18"
+    jid "a18@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 19
+    label "a19"
+    jid "a19@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+  edge [
+    source 0
+    target 19
+  ]
+  edge [
+    source 1
+    target 2
+  ]
+  edge [
+    source 2
+    target 3
+  ]
+  edge [
+    source 3
+    target 4
+  ]
+  edge [
+    source 4
+    target 5
+  ]
+  edge [
+    source 5
+    target 6
+  ]
+  edge [
+    source 6
+    target 7
+  ]
+  edge [
+    source 7
+    target 8
+  ]
+  edge [
+    source 8
+    target 9
+  ]
+  edge [
+    source 9
+    target 10
+  ]
+  edge [
+    source 10
+    target 11
+  ]
+  edge [
+    source 11
+    target 12
+  ]
+  edge [
+    source 12
+    target 13
+  ]
+  edge [
+    source 13
+    target 14
+  ]
+  edge [
+    source 14
+    target 15
+  ]
+  edge [
+    source 15
+    target 16
+  ]
+  edge [
+    source 16
+    target 17
+  ]
+  edge [
+    source 17
+    target 18
+  ]
+  edge [
+    source 18
+    target 19
+  ]
+]
@@ -0,0 +1,5202 @@
+graph [
+  node [
+    id 0
+    label "a0"
+    jid "a0@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 1
+    label "a1"
+    jid "a1@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 2
+    label "a2"
+    jid "a2@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 3
+    label "a3"
+    jid "a3@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 4
+    label "a4"
+    jid "a4@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 5
+    label "a5"
+    jid "a5@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 6
+    label "a6"
+    jid "a6@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 7
+    label "a7"
+    jid "a7@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 8
+    label "a8"
+    jid "a8@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 9
+    label "a9"
+    jid "a9@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 10
+    label "a10"
+    jid "a10@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 11
+    label "a11"
+    jid "a11@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 12
+    label "a12"
+    jid "a12@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 13
+    label "a13"
+    jid "a13@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 14
+    label "a14"
+    jid "a14@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 15
+    label "a15"
+    jid "a15@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 16
+    label "a16"
+    jid "a16@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 17
+    label "a17"
+    jid "a17@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 18
+    label "a18"
+    jid "a18@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 19
+    label "a19"
+    jid "a19@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 20
+    label "a20"
+    jid "a20@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 21
+    label "a21"
+    jid "a21@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 22
+    label "a22"
+    jid "a22@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 23
+    label "a23"
+    jid "a23@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 24
+    label "a24"
+    jid "a24@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 25
+    label "a25"
+    jid "a25@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 26
+    label "a26"
+    jid "a26@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 27
+    label "a27"
+    jid "a27@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 28
+    label "a28"
+    jid "a28@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 29
+    label "a29"
+    jid "a29@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 30
+    label "a30"
+    jid "a30@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 31
+    label "a31"
+    jid "a31@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 32
+    label "a32"
+    jid "a32@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 33
+    label "a33"
+    jid "a33@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 34
+    label "a34"
+    jid "a34@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 35
+    label "a35"
+    jid "a35@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 36
+    label "a36"
+    jid "a36@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 37
+    label "a37"
+    jid "a37@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 38
+    label "a38"
+    jid "a38@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 39
+    label "a39"
+    jid "a39@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 40
+    label "a40"
+    jid "a40@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 41
+    label "a41"
+    jid "a41@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 42
+    label "a42"
+    jid "a42@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 43
+    label "a43"
+    jid "a43@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 44
+    label "a44"
+    jid "a44@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 45
+    label "a45"
+    jid "a45@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 46
+    label "a46"
+    jid "a46@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 47
+    label "a47"
+    jid "a47@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 48
+    label "a48"
+    jid "a48@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 49
+    label "a49"
+    jid "a49@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+  edge [
+    source 0
+    target 2
+  ]
+  edge [
+    source 0
+    target 3
+  ]
+  edge [
+    source 0
+    target 4
+  ]
+  edge [
+    source 0
+    target 5
+  ]
+  edge [
+    source 0
+    target 6
+  ]
+  edge [
+    source 0
+    target 7
+  ]
+  edge [
+    source 0
+    target 8
+  ]
+  edge [
+    source 0
+    target 9
+  ]
+  edge [
+    source 0
+    target 10
+  ]
+  edge [
+    source 0
+    target 11
+  ]
+  edge [
+    source 0
+    target 12
+  ]
+  edge [
+    source 0
+    target 13
+  ]
+  edge [
+    source 0
+    target 14
+  ]
+  edge [
+    source 0
+    target 15
+  ]
+  edge [
+    source 0
+    target 16
+  ]
+  edge [
+    source 0
+    target 17
+  ]
+  edge [
+    source 0
+    target 18
+  ]
+  edge [
+    source 0
+    target 19
+  ]
+  edge [
+    source 0
+    target 20
+  ]
+  edge [
+    source 0
+    target 21
+  ]
+  edge [
+    source 0
+    target 22
+  ]
+  edge [
+    source 0
+    target 23
+  ]
+  edge [
+    source 0
+    target 24
+  ]
+  edge [
+    source 0
+    target 25
+  ]
+  edge [
+    source 0
+    target 26
+  ]
+  edge [
+    source 0
+    target 27
+  ]
+  edge [
+    source 0
+    target 28
+  ]
+  edge [
+    source 0
+    target 29
+  ]
+  edge [
+    source 0
+    target 30
+  ]
+  edge [
+    source 0
+    target 31
+  ]
+  edge [
+    source 0
+    target 32
+  ]
+  edge [
+    source 0
+    target 33
+  ]
+  edge [
+    source 0
+    target 34
+  ]
+  edge [
+    source 0
+    target 35
+  ]
+  edge [
+    source 0
+    target 36
+  ]
+  edge [
+    source 0
+    target 37
+  ]
+  edge [
+    source 0
+    target 38
+  ]
+  edge [
+    source 0
+    target 39
+  ]
+  edge [
+    source 0
+    target 40
+  ]
+  edge [
+    source 0
+    target 41
+  ]
+  edge [
+    source 0
+    target 42
+  ]
+  edge [
+    source 0
+    target 43
+  ]
+  edge [
+    source 0
+    target 44
+  ]
+  edge [
+    source 0
+    target 45
+  ]
+  edge [
+    source 0
+    target 46
+  ]
+  edge [
+    source 0
+    target 47
+  ]
+  edge [
+    source 0
+    target 48
+  ]
+  edge [
+    source 0
+    target 49
+  ]
+  edge [
+    source 1
+    target 2
+  ]
+  edge [
+    source 1
+    target 3
+  ]
+  edge [
+    source 1
+    target 4
+  ]
+  edge [
+    source 1
+    target 5
+  ]
+  edge [
+    source 1
+    target 6
+  ]
+  edge [
+    source 1
+    target 7
+  ]
+  edge [
+    source 1
+    target 8
+  ]
+  edge [
+    source 1
+    target 9
+  ]
+  edge [
+    source 1
+    target 10
+  ]
+  edge [
+    source 1
+    target 11
+  ]
+  edge [
+    source 1
+    target 12
+  ]
+  edge [
+    source 1
+    target 13
+  ]
+  edge [
+    source 1
+    target 14
+  ]
+  edge [
+    source 1
+    target 15
+  ]
+  edge [
+    source 1
+    target 16
+  ]
+  edge [
+    source 1
+    target 17
+  ]
+  edge [
+    source 1
+    target 18
+  ]
+  edge [
+    source 1
+    target 19
+  ]
+  edge [
+    source 1
+    target 20
+  ]
+  edge [
+    source 1
+    target 21
+  ]
+  edge [
+    source 1
+    target 22
+  ]
+  edge [
+    source 1
+    target 23
+  ]
+  edge [
+    source 1
+    target 24
+  ]
+  edge [
+    source 1
+    target 25
+  ]
+  edge [
+    source 1
+    target 26
+  ]
+  edge [
+    source 1
+    target 27
+  ]
+  edge [
+    source 1
+    target 28
+  ]
+  edge [
+    source 1
+    target 29
+  ]
+  edge [
+    source 1
+    target 30
+  ]
+  edge [
+    source 1
+    target 31
+  ]
+  edge [
+    source 1
+    target 32
+  ]
+  edge [
+    source 1
+    target 33
+  ]
+  edge [
+    source 1
+    target 34
+  ]
+  edge [
+    source 1
+    target 35
+  ]
+  edge [
+    source 1
+    target 36
+  ]
+  edge [
+    source 1
+    target 37
+  ]
+  edge [
+    source 1
+    target 38
+  ]
+  edge [
+    source 1
+    target 39
+  ]
+  edge [
+    source 1
+    target 40
+  ]
+  edge [
+    source 1
+    target 41
+  ]
+  edge [
+    source 1
+    target 42
+  ]
+  edge [
+    source 1
+    target 43
+  ]
+  edge [
+    source 1
+    target 44
+  ]
+  edge [
+    source 1
+    target 45
+  ]
+  edge [
+    source 1
+    target 46
+  ]
+  edge [
+    source 1
+    target 47
+  ]
+  edge [
+    source 1
+    target 48
+  ]
+  edge [
+    source 1
+    target 49
+  ]
+  edge [
+    source 2
+    target 3
+  ]
+  edge [
+    source 2
+    target 4
+  ]
+  edge [
+    source 2
+    target 5
+  ]
+  edge [
+    source 2
+    target 6
+  ]
+  edge [
+    source 2
+    target 7
+  ]
+  edge [
+    source 2
+    target 8
+  ]
+  edge [
+    source 2
+    target 9
+  ]
+  edge [
+    source 2
+    target 10
+  ]
+  edge [
+    source 2
+    target 11
+  ]
+  edge [
+    source 2
+    target 12
+  ]
+  edge [
+    source 2
+    target 13
+  ]
+  edge [
+    source 2
+    target 14
+  ]
+  edge [
+    source 2
+    target 15
+  ]
+  edge [
+    source 2
+    target 16
+  ]
+  edge [
+    source 2
+    target 17
+  ]
+  edge [
+    source 2
+    target 18
+  ]
+  edge [
+    source 2
+    target 19
+  ]
+  edge [
+    source 2
+    target 20
+  ]
+  edge [
+    source 2
+    target 21
+  ]
+  edge [
+    source 2
+    target 22
+  ]
+  edge [
+    source 2
+    target 23
+  ]
+  edge [
+    source 2
+    target 24
+  ]
+  edge [
+    source 2
+    target 25
+  ]
+  edge [
+    source 2
+    target 26
+  ]
+  edge [
+    source 2
+    target 27
+  ]
+  edge [
+    source 2
+    target 28
+  ]
+  edge [
+    source 2
+    target 29
+  ]
+  edge [
+    source 2
+    target 30
+  ]
+  edge [
+    source 2
+    target 31
+  ]
+  edge [
+    source 2
+    target 32
+  ]
+  edge [
+    source 2
+    target 33
+  ]
+  edge [
+    source 2
+    target 34
+  ]
+  edge [
+    source 2
+    target 35
+  ]
+  edge [
+    source 2
+    target 36
+  ]
+  edge [
+    source 2
+    target 37
+  ]
+  edge [
+    source 2
+    target 38
+  ]
+  edge [
+    source 2
+    target 39
+  ]
+  edge [
+    source 2
+    target 40
+  ]
+  edge [
+    source 2
+    target 41
+  ]
+  edge [
+    source 2
+    target 42
+  ]
+  edge [
+    source 2
+    target 43
+  ]
+  edge [
+    source 2
+    target 44
+  ]
+  edge [
+    source 2
+    target 45
+  ]
+  edge [
+    source 2
+    target 46
+  ]
+  edge [
+    source 2
+    target 47
+  ]
+  edge [
+    source 2
+    target 48
+  ]
+  edge [
+    source 2
+    target 49
+  ]
+  edge [
+    source 3
+    target 4
+  ]
+  edge [
+    source 3
+    target 5
+  ]
+  edge [
+    source 3
+    target 6
+  ]
+  edge [
+    source 3
+    target 7
+  ]
+  edge [
+    source 3
+    target 8
+  ]
+  edge [
+    source 3
+    target 9
+  ]
+  edge [
+    source 3
+    target 10
+  ]
+  edge [
+    source 3
+    target 11
+  ]
+  edge [
+    source 3
+    target 12
+  ]
+  edge [
+    source 3
+    target 13
+  ]
+  edge [
+    source 3
+    target 14
+  ]
+  edge [
+    source 3
+    target 15
+  ]
+  edge [
+    source 3
+    target 16
+  ]
+  edge [
+    source 3
+    target 17
+  ]
+  edge [
+    source 3
+    target 18
+  ]
+  edge [
+    source 3
+    target 19
+  ]
+  edge [
+    source 3
+    target 20
+  ]
+  edge [
+    source 3
+    target 21
+  ]
+  edge [
+    source 3
+    target 22
+  ]
+  edge [
+    source 3
+    target 23
+  ]
+  edge [
+    source 3
+    target 24
+  ]
+  edge [
+    source 3
+    target 25
+  ]
+  edge [
+    source 3
+    target 26
+  ]
+  edge [
+    source 3
+    target 27
+  ]
+  edge [
+    source 3
+    target 28
+  ]
+  edge [
+    source 3
+    target 29
+  ]
+  edge [
+    source 3
+    target 30
+  ]
+  edge [
+    source 3
+    target 31
+  ]
+  edge [
+    source 3
+    target 32
+  ]
+  edge [
+    source 3
+    target 33
+  ]
+  edge [
+    source 3
+    target 34
+  ]
+  edge [
+    source 3
+    target 35
+  ]
+  edge [
+    source 3
+    target 36
+  ]
+  edge [
+    source 3
+    target 37
+  ]
+  edge [
+    source 3
+    target 38
+  ]
+  edge [
+    source 3
+    target 39
+  ]
+  edge [
+    source 3
+    target 40
+  ]
+  edge [
+    source 3
+    target 41
+  ]
+  edge [
+    source 3
+    target 42
+  ]
+  edge [
+    source 3
+    target 43
+  ]
+  edge [
+    source 3
+    target 44
+  ]
+  edge [
+    source 3
+    target 45
+  ]
+  edge [
+    source 3
+    target 46
+  ]
+  edge [
+    source 3
+    target 47
+  ]
+  edge [
+    source 3
+    target 48
+  ]
+  edge [
+    source 3
+    target 49
+  ]
+  edge [
+    source 4
+    target 5
+  ]
+  edge [
+    source 4
+    target 6
+  ]
+  edge [
+    source 4
+    target 7
+  ]
+  edge [
+    source 4
+    target 8
+  ]
+  edge [
+    source 4
+    target 9
+  ]
+  edge [
+    source 4
+    target 10
+  ]
+  edge [
+    source 4
+    target 11
+  ]
+  edge [
+    source 4
+    target 12
+  ]
+  edge [
+    source 4
+    target 13
+  ]
+  edge [
+    source 4
+    target 14
+  ]
+  edge [
+    source 4
+    target 15
+  ]
+  edge [
+    source 4
+    target 16
+  ]
+  edge [
+    source 4
+    target 17
+  ]
+  edge [
+    source 4
+    target 18
+  ]
+  edge [
+    source 4
+    target 19
+  ]
+  edge [
+    source 4
+    target 20
+  ]
+  edge [
+    source 4
+    target 21
+  ]
+  edge [
+    source 4
+    target 22
+  ]
+  edge [
+    source 4
+    target 23
+  ]
+  edge [
+    source 4
+    target 24
+  ]
+  edge [
+    source 4
+    target 25
+  ]
+  edge [
+    source 4
+    target 26
+  ]
+  edge [
+    source 4
+    target 27
+  ]
+  edge [
+    source 4
+    target 28
+  ]
+  edge [
+    source 4
+    target 29
+  ]
+  edge [
+    source 4
+    target 30
+  ]
+  edge [
+    source 4
+    target 31
+  ]
+  edge [
+    source 4
+    target 32
+  ]
+  edge [
+    source 4
+    target 33
+  ]
+  edge [
+    source 4
+    target 34
+  ]
+  edge [
+    source 4
+    target 35
+  ]
+  edge [
+    source 4
+    target 36
+  ]
+  edge [
+    source 4
+    target 37
+  ]
+  edge [
+    source 4
+    target 38
+  ]
+  edge [
+    source 4
+    target 39
+  ]
+  edge [
+    source 4
+    target 40
+  ]
+  edge [
+    source 4
+    target 41
+  ]
+  edge [
+    source 4
+    target 42
+  ]
+  edge [
+    source 4
+    target 43
+  ]
+  edge [
+    source 4
+    target 44
+  ]
+  edge [
+    source 4
+    target 45
+  ]
+  edge [
+    source 4
+    target 46
+  ]
+  edge [
+    source 4
+    target 47
+  ]
+  edge [
+    source 4
+    target 48
+  ]
+  edge [
+    source 4
+    target 49
+  ]
+  edge [
+    source 5
+    target 6
+  ]
+  edge [
+    source 5
+    target 7
+  ]
+  edge [
+    source 5
+    target 8
+  ]
+  edge [
+    source 5
+    target 9
+  ]
+  edge [
+    source 5
+    target 10
+  ]
+  edge [
+    source 5
+    target 11
+  ]
+  edge [
+    source 5
+    target 12
+  ]
+  edge [
+    source 5
+    target 13
+  ]
+  edge [
+    source 5
+    target 14
+  ]
+  edge [
+    source 5
+    target 15
+  ]
+  edge [
+    source 5
+    target 16
+  ]
+  edge [
+    source 5
+    target 17
+  ]
+  edge [
+    source 5
+    target 18
+  ]
+  edge [
+    source 5
+    target 19
+  ]
+  edge [
+    source 5
+    target 20
+  ]
+  edge [
+    source 5
+    target 21
+  ]
+  edge [
+    source 5
+    target 22
+  ]
+  edge [
+    source 5
+    target 23
+  ]
+  edge [
+    source 5
+    target 24
+  ]
+  edge [
+    source 5
+    target 25
+  ]
+  edge [
+    source 5
+    target 26
+  ]
+  edge [
+    source 5
+    target 27
+  ]
+  edge [
+    source 5
+    target 28
+  ]
+  edge [
+    source 5
+    target 29
+  ]
+  edge [
+    source 5
+    target 30
+  ]
+  edge [
+    source 5
+    target 31
+  ]
+  edge [
+    source 5
+    target 32
+  ]
+  edge [
+    source 5
+    target 33
+  ]
+  edge [
+    source 5
+    target 34
+  ]
+  edge [
+    source 5
+    target 35
+  ]
+  edge [
+    source 5
+    target 36
+  ]
+  edge [
+    source 5
+    target 37
+  ]
+  edge [
+    source 5
+    target 38
+  ]
+  edge [
+    source 5
+    target 39
+  ]
+  edge [
+    source 5
+    target 40
+  ]
+  edge [
+    source 5
+    target 41
+  ]
+  edge [
+    source 5
+    target 42
+  ]
+  edge [
+    source 5
+    target 43
+  ]
+  edge [
+    source 5
+    target 44
+  ]
+  edge [
+    source 5
+    target 45
+  ]
+  edge [
+    source 5
+    target 46
+  ]
+  edge [
+    source 5
+    target 47
+  ]
+  edge [
+    source 5
+    target 48
+  ]
+  edge [
+    source 5
+    target 49
+  ]
+  edge [
+    source 6
+    target 7
+  ]
+  edge [
+    source 6
+    target 8
+  ]
+  edge [
+    source 6
+    target 9
+  ]
+  edge [
+    source 6
+    target 10
+  ]
+  edge [
+    source 6
+    target 11
+  ]
+  edge [
+    source 6
+    target 12
+  ]
+  edge [
+    source 6
+    target 13
+  ]
+  edge [
+    source 6
+    target 14
+  ]
+  edge [
+    source 6
+    target 15
+  ]
+  edge [
+    source 6
+    target 16
+  ]
+  edge [
+    source 6
+    target 17
+  ]
+  edge [
+    source 6
+    target 18
+  ]
+  edge [
+    source 6
+    target 19
+  ]
+  edge [
+    source 6
+    target 20
+  ]
+  edge [
+    source 6
+    target 21
+  ]
+  edge [
+    source 6
+    target 22
+  ]
+  edge [
+    source 6
+    target 23
+  ]
+  edge [
+    source 6
+    target 24
+  ]
+  edge [
+    source 6
+    target 25
+  ]
+  edge [
+    source 6
+    target 26
+  ]
+  edge [
+    source 6
+    target 27
+  ]
+  edge [
+    source 6
+    target 28
+  ]
+  edge [
+    source 6
+    target 29
+  ]
+  edge [
+    source 6
+    target 30
+  ]
+  edge [
+    source 6
+    target 31
+  ]
+  edge [
+    source 6
+    target 32
+  ]
+  edge [
+    source 6
+    target 33
+  ]
+  edge [
+    source 6
+    target 34
+  ]
+  edge [
+    source 6
+    target 35
+  ]
+  edge [
+    source 6
+    target 36
+  ]
+  edge [
+    source 6
+    target 37
+  ]
+  edge [
+    source 6
+    target 38
+  ]
+  edge [
+    source 6
+    target 39
+  ]
+  edge [
+    source 6
+    target 40
+  ]
+  edge [
+    source 6
+    target 41
+  ]
+  edge [
+    source 6
+    target 42
+  ]
+  edge [
+    source 6
+    target 43
+  ]
+  edge [
+    source 6
+    target 44
+  ]
+  edge [
+    source 6
+    target 45
+  ]
+  edge [
+    source 6
+    target 46
+  ]
+  edge [
+    source 6
+    target 47
+  ]
+  edge [
+    source 6
+    target 48
+  ]
+  edge [
+    source 6
+    target 49
+  ]
+  edge [
+    source 7
+    target 8
+  ]
+  edge [
+    source 7
+    target 9
+  ]
+  edge [
+    source 7
+    target 10
+  ]
+  edge [
+    source 7
+    target 11
+  ]
+  edge [
+    source 7
+    target 12
+  ]
+  edge [
+    source 7
+    target 13
+  ]
+  edge [
+    source 7
+    target 14
+  ]
+  edge [
+    source 7
+    target 15
+  ]
+  edge [
+    source 7
+    target 16
+  ]
+  edge [
+    source 7
+    target 17
+  ]
+  edge [
+    source 7
+    target 18
+  ]
+  edge [
+    source 7
+    target 19
+  ]
+  edge [
+    source 7
+    target 20
+  ]
+  edge [
+    source 7
+    target 21
+  ]
+  edge [
+    source 7
+    target 22
+  ]
+  edge [
+    source 7
+    target 23
+  ]
+  edge [
+    source 7
+    target 24
+  ]
+  edge [
+    source 7
+    target 25
+  ]
+  edge [
+    source 7
+    target 26
+  ]
+  edge [
+    source 7
+    target 27
+  ]
+  edge [
+    source 7
+    target 28
+  ]
+  edge [
+    source 7
+    target 29
+  ]
+  edge [
+    source 7
+    target 30
+  ]
+  edge [
+    source 7
+    target 31
+  ]
+  edge [
+    source 7
+    target 32
+  ]
+  edge [
+    source 7
+    target 33
+  ]
+  edge [
+    source 7
+    target 34
+  ]
+  edge [
+    source 7
+    target 35
+  ]
+  edge [
+    source 7
+    target 36
+  ]
+  edge [
+    source 7
+    target 37
+  ]
+  edge [
+    source 7
+    target 38
+  ]
+  edge [
+    source 7
+    target 39
+  ]
+  edge [
+    source 7
+    target 40
+  ]
+  edge [
+    source 7
+    target 41
+  ]
+  edge [
+    source 7
+    target 42
+  ]
+  edge [
+    source 7
+    target 43
+  ]
+  edge [
+    source 7
+    target 44
+  ]
+  edge [
+    source 7
+    target 45
+  ]
+  edge [
+    source 7
+    target 46
+  ]
+  edge [
+    source 7
+    target 47
+  ]
+  edge [
+    source 7
+    target 48
+  ]
+  edge [
+    source 7
+    target 49
+  ]
+  edge [
+    source 8
+    target 9
+  ]
+  edge [
+    source 8
+    target 10
+  ]
+  edge [
+    source 8
+    target 11
+  ]
+  edge [
+    source 8
+    target 12
+  ]
+  edge [
+    source 8
+    target 13
+  ]
+  edge [
+    source 8
+    target 14
+  ]
+  edge [
+    source 8
+    target 15
+  ]
+  edge [
+    source 8
+    target 16
+  ]
+  edge [
+    source 8
+    target 17
+  ]
+  edge [
+    source 8
+    target 18
+  ]
+  edge [
+    source 8
+    target 19
+  ]
+  edge [
+    source 8
+    target 20
+  ]
+  edge [
+    source 8
+    target 21
+  ]
+  edge [
+    source 8
+    target 22
+  ]
+  edge [
+    source 8
+    target 23
+  ]
+  edge [
+    source 8
+    target 24
+  ]
+  edge [
+    source 8
+    target 25
+  ]
+  edge [
+    source 8
+    target 26
+  ]
+  edge [
+    source 8
+    target 27
+  ]
+  edge [
+    source 8
+    target 28
+  ]
+  edge [
+    source 8
+    target 29
+  ]
+  edge [
+    source 8
+    target 30
+  ]
+  edge [
+    source 8
+    target 31
+  ]
+  edge [
+    source 8
+    target 32
+  ]
+  edge [
+    source 8
+    target 33
+  ]
+  edge [
+    source 8
+    target 34
+  ]
+  edge [
+    source 8
+    target 35
+  ]
+  edge [
+    source 8
+    target 36
+  ]
+  edge [
+    source 8
+    target 37
+  ]
+  edge [
+    source 8
+    target 38
+  ]
+  edge [
+    source 8
+    target 39
+  ]
+  edge [
+    source 8
+    target 40
+  ]
+  edge [
+    source 8
+    target 41
+  ]
+  edge [
+    source 8
+    target 42
+  ]
+  edge [
+    source 8
+    target 43
+  ]
+  edge [
+    source 8
+    target 44
+  ]
+  edge [
+    source 8
+    target 45
+  ]
+  edge [
+    source 8
+    target 46
+  ]
+  edge [
+    source 8
+    target 47
+  ]
+  edge [
+    source 8
+    target 48
+  ]
+  edge [
+    source 8
+    target 49
+  ]
+  edge [
+    source 9
+    target 10
+  ]
+  edge [
+    source 9
+    target 11
+  ]
+  edge [
+    source 9
+    target 12
+  ]
+  edge [
+    source 9
+    target 13
+  ]
+  edge [
+    source 9
+    target 14
+  ]
+  edge [
+    source 9
+    target 15
+  ]
+  edge [
+    source 9
+    target 16
+  ]
+  edge [
+    source 9
+    target 17
+  ]
+  edge [
+    source 9
+    target 18
+  ]
+  edge [
+    source 9
+    target 19
+  ]
+  edge [
+    source 9
+    target 20
+  ]
+  edge [
+    source 9
+    target 21
+  ]
+  edge [
+    source 9
+    target 22
+  ]
+  edge [
+    source 9
+    target 23
+  ]
+  edge [
+    source 9
+    target 24
+  ]
+  edge [
+    source 9
+    target 25
+  ]
+  edge [
+    source 9
+    target 26
+  ]
+  edge [
+    source 9
+    target 27
+  ]
+  edge [
+    source 9
+    target 28
+  ]
+  edge [
+    source 9
+    target 29
+  ]
+  edge [
+    source 9
+    target 30
+  ]
+  edge [
+    source 9
+    target 31
+  ]
+  edge [
+    source 9
+    target 32
+  ]
+  edge [
+    source 9
+    target 33
+  ]
+  edge [
+    source 9
+    target 34
+  ]
+  edge [
+    source 9
+    target 35
+  ]
+  edge [
+    source 9
+    target 36
+  ]
+  edge [
+    source 9
+    target 37
+  ]
+  edge [
+    source 9
+    target 38
+  ]
+  edge [
+    source 9
+    target 39
+  ]
+  edge [
+    source 9
+    target 40
+  ]
+  edge [
+    source 9
+    target 41
+  ]
+  edge [
+    source 9
+    target 42
+  ]
+  edge [
+    source 9
+    target 43
+  ]
+  edge [
+    source 9
+    target 44
+  ]
+  edge [
+    source 9
+    target 45
+  ]
+  edge [
+    source 9
+    target 46
+  ]
+  edge [
+    source 9
+    target 47
+  ]
+  edge [
+    source 9
+    target 48
+  ]
+  edge [
+    source 9
+    target 49
+  ]
+  edge [
+    source 10
+    target 11
+  ]
+  edge [
+    source 10
+    target 12
+  ]
+  edge [
+    source 10
+    target 13
+  ]
+  edge [
+    source 10
+    target 14
+  ]
+  edge [
+    source 10
+    target 15
+  ]
+  edge [
+    source 10
+    target 16
+  ]
+  edge [
+    source 10
+    target 17
+  ]
+  edge [
+    source 10
+    target 18
+  ]
+  edge [
+    source 10
+    target 19
+  ]
+  edge [
+    source 10
+    target 20
+  ]
+  edge [
+    source 10
+    target 21
+  ]
+  edge [
+    source 10
+    target 22
+  ]
+  edge [
+    source 10
+    target 23
+  ]
+  edge [
+    source 10
+    target 24
+  ]
+  edge [
+    source 10
+    target 25
+  ]
+  edge [
+    source 10
+    target 26
+  ]
+  edge [
+    source 10
+    target 27
+  ]
+  edge [
+    source 10
+    target 28
+  ]
+  edge [
+    source 10
+    target 29
+  ]
+  edge [
+    source 10
+    target 30
+  ]
+  edge [
+    source 10
+    target 31
+  ]
+  edge [
+    source 10
+    target 32
+  ]
+  edge [
+    source 10
+    target 33
+  ]
+  edge [
+    source 10
+    target 34
+  ]
+  edge [
+    source 10
+    target 35
+  ]
+  edge [
+    source 10
+    target 36
+  ]
+  edge [
+    source 10
+    target 37
+  ]
+  edge [
+    source 10
+    target 38
+  ]
+  edge [
+    source 10
+    target 39
+  ]
+  edge [
+    source 10
+    target 40
+  ]
+  edge [
+    source 10
+    target 41
+  ]
+  edge [
+    source 10
+    target 42
+  ]
+  edge [
+    source 10
+    target 43
+  ]
+  edge [
+    source 10
+    target 44
+  ]
+  edge [
+    source 10
+    target 45
+  ]
+  edge [
+    source 10
+    target 46
+  ]
+  edge [
+    source 10
+    target 47
+  ]
+  edge [
+    source 10
+    target 48
+  ]
+  edge [
+    source 10
+    target 49
+  ]
+  edge [
+    source 11
+    target 12
+  ]
+  edge [
+    source 11
+    target 13
+  ]
+  edge [
+    source 11
+    target 14
+  ]
+  edge [
+    source 11
+    target 15
+  ]
+  edge [
+    source 11
+    target 16
+  ]
+  edge [
+    source 11
+    target 17
+  ]
+  edge [
+    source 11
+    target 18
+  ]
+  edge [
+    source 11
+    target 19
+  ]
+  edge [
+    source 11
+    target 20
+  ]
+  edge [
+    source 11
+    target 21
+  ]
+  edge [
+    source 11
+    target 22
+  ]
+  edge [
+    source 11
+    target 23
+  ]
+  edge [
+    source 11
+    target 24
+  ]
+  edge [
+    source 11
+    target 25
+  ]
+  edge [
+    source 11
+    target 26
+  ]
+  edge [
+    source 11
+    target 27
+  ]
+  edge [
+    source 11
+    target 28
+  ]
+  edge [
+    source 11
+    target 29
+  ]
+  edge [
+    source 11
+    target 30
+  ]
+  edge [
+    source 11
+    target 31
+  ]
+  edge [
+    source 11
+    target 32
+  ]
+  edge [
+    source 11
+    target 33
+  ]
+  edge [
+    source 11
+    target 34
+  ]
+  edge [
+    source 11
+    target 35
+  ]
+  edge [
+    source 11
+    target 36
+  ]
+  edge [
+    source 11
+    target 37
+  ]
+  edge [
+    source 11
+    target 38
+  ]
+  edge [
+    source 11
+    target 39
+  ]
+  edge [
+    source 11
+    target 40
+  ]
+  edge [
+    source 11
+    target 41
+  ]
+  edge [
+    source 11
+    target 42
+  ]
+  edge [
+    source 11
+    target 43
+  ]
+  edge [
+    source 11
+    target 44
+  ]
+  edge [
+    source 11
+    target 45
+  ]
+  edge [
+    source 11
+    target 46
+  ]
+  edge [
+    source 11
+    target 47
+  ]
+  edge [
+    source 11
+    target 48
+  ]
+  edge [
+    source 11
+    target 49
+  ]
+  edge [
+    source 12
+    target 13
+  ]
+  edge [
+    source 12
+    target 14
+  ]
+  edge [
+    source 12
+    target 15
+  ]
+  edge [
+    source 12
+    target 16
+  ]
+  edge [
+    source 12
+    target 17
+  ]
+  edge [
+    source 12
+    target 18
+  ]
+  edge [
+    source 12
+    target 19
+  ]
+  edge [
+    source 12
+    target 20
+  ]
+  edge [
+    source 12
+    target 21
+  ]
+  edge [
+    source 12
+    target 22
+  ]
+  edge [
+    source 12
+    target 23
+  ]
+  edge [
+    source 12
+    target 24
+  ]
+  edge [
+    source 12
+    target 25
+  ]
+  edge [
+    source 12
+    target 26
+  ]
+  edge [
+    source 12
+    target 27
+  ]
+  edge [
+    source 12
+    target 28
+  ]
+  edge [
+    source 12
+    target 29
+  ]
+  edge [
+    source 12
+    target 30
+  ]
+  edge [
+    source 12
+    target 31
+  ]
+  edge [
+    source 12
+    target 32
+  ]
+  edge [
+    source 12
+    target 33
+  ]
+  edge [
+    source 12
+    target 34
+  ]
+  edge [
+    source 12
+    target 35
+  ]
+  edge [
+    source 12
+    target 36
+  ]
+  edge [
+    source 12
+    target 37
+  ]
+  edge [
+    source 12
+    target 38
+  ]
+  edge [
+    source 12
+    target 39
+  ]
+  edge [
+    source 12
+    target 40
+  ]
+  edge [
+    source 12
+    target 41
+  ]
+  edge [
+    source 12
+    target 42
+  ]
+  edge [
+    source 12
+    target 43
+  ]
+  edge [
+    source 12
+    target 44
+  ]
+  edge [
+    source 12
+    target 45
+  ]
+  edge [
+    source 12
+    target 46
+  ]
+  edge [
+    source 12
+    target 47
+  ]
+  edge [
+    source 12
+    target 48
+  ]
+  edge [
+    source 12
+    target 49
+  ]
+  edge [
+    source 13
+    target 14
+  ]
+  edge [
+    source 13
+    target 15
+  ]
+  edge [
+    source 13
+    target 16
+  ]
+  edge [
+    source 13
+    target 17
+  ]
+  edge [
+    source 13
+    target 18
+  ]
+  edge [
+    source 13
+    target 19
+  ]
+  edge [
+    source 13
+    target 20
+  ]
+  edge [
+    source 13
+    target 21
+  ]
+  edge [
+    source 13
+    target 22
+  ]
+  edge [
+    source 13
+    target 23
+  ]
+  edge [
+    source 13
+    target 24
+  ]
+  edge [
+    source 13
+    target 25
+  ]
+  edge [
+    source 13
+    target 26
+  ]
+  edge [
+    source 13
+    target 27
+  ]
+  edge [
+    source 13
+    target 28
+  ]
+  edge [
+    source 13
+    target 29
+  ]
+  edge [
+    source 13
+    target 30
+  ]
+  edge [
+    source 13
+    target 31
+  ]
+  edge [
+    source 13
+    target 32
+  ]
+  edge [
+    source 13
+    target 33
+  ]
+  edge [
+    source 13
+    target 34
+  ]
+  edge [
+    source 13
+    target 35
+  ]
+  edge [
+    source 13
+    target 36
+  ]
+  edge [
+    source 13
+    target 37
+  ]
+  edge [
+    source 13
+    target 38
+  ]
+  edge [
+    source 13
+    target 39
+  ]
+  edge [
+    source 13
+    target 40
+  ]
+  edge [
+    source 13
+    target 41
+  ]
+  edge [
+    source 13
+    target 42
+  ]
+  edge [
+    source 13
+    target 43
+  ]
+  edge [
+    source 13
+    target 44
+  ]
+  edge [
+    source 13
+    target 45
+  ]
+  edge [
+    source 13
+    target 46
+  ]
+  edge [
+    source 13
+    target 47
+  ]
+  edge [
+    source 13
+    target 48
+  ]
+  edge [
+    source 13
+    target 49
+  ]
+  edge [
+    source 14
+    target 15
+  ]
+  edge [
+    source 14
+    target 16
+  ]
+  edge [
+    source 14
+    target 17
+  ]
+  edge [
+    source 14
+    target 18
+  ]
+  edge [
+    source 14
+    target 19
+  ]
+  edge [
+    source 14
+    target 20
+  ]
+  edge [
+    source 14
+    target 21
+  ]
+  edge [
+    source 14
+    target 22
+  ]
+  edge [
+    source 14
+    target 23
+  ]
+  edge [
+    source 14
+    target 24
+  ]
+  edge [
+    source 14
+    target 25
+  ]
+  edge [
+    source 14
+    target 26
+  ]
+  edge [
+    source 14
+    target 27
+  ]
+  edge [
+    source 14
+    target 28
+  ]
+  edge [
+    source 14
+    target 29
+  ]
+  edge [
+    source 14
+    target 30
+  ]
+  edge [
+    source 14
+    target 31
+  ]
+  edge [
+    source 14
+    target 32
+  ]
+  edge [
+    source 14
+    target 33
+  ]
+  edge [
+    source 14
+    target 34
+  ]
+  edge [
+    source 14
+    target 35
+  ]
+  edge [
+    source 14
+    target 36
+  ]
+  edge [
+    source 14
+    target 37
+  ]
+  edge [
+    source 14
+    target 38
+  ]
+  edge [
+    source 14
+    target 39
+  ]
+  edge [
+    source 14
+    target 40
+  ]
+  edge [
+    source 14
+    target 41
+  ]
+  edge [
+    source 14
+    target 42
+  ]
+  edge [
+    source 14
+    target 43
+  ]
+  edge [
+    source 14
+    target 44
+  ]
+  edge [
+    source 14
+    target 45
+  ]
+  edge [
+    source 14
+    target 46
+  ]
+  edge [
+    source 14
+    target 47
+  ]
+  edge [
+    source 14
+    target 48
+  ]
+  edge [
+    source 14
+    target 49
+  ]
+  edge [
+    source 15
+    target 16
+  ]
+  edge [
+    source 15
+    target 17
+  ]
+  edge [
+    source 15
+    target 18
+  ]
+  edge [
+    source 15
+    target 19
+  ]
+  edge [
+    source 15
+    target 20
+  ]
+  edge [
+    source 15
+    target 21
+  ]
+  edge [
+    source 15
+    target 22
+  ]
+  edge [
+    source 15
+    target 23
+  ]
+  edge [
+    source 15
+    target 24
+  ]
+  edge [
+    source 15
+    target 25
+  ]
+  edge [
+    source 15
+    target 26
+  ]
+  edge [
+    source 15
+    target 27
+  ]
+  edge [
+    source 15
+    target 28
+  ]
+  edge [
+    source 15
+    target 29
+  ]
+  edge [
+    source 15
+    target 30
+  ]
+  edge [
+    source 15
+    target 31
+  ]
+  edge [
+    source 15
+    target 32
+  ]
+  edge [
+    source 15
+    target 33
+  ]
+  edge [
+    source 15
+    target 34
+  ]
+  edge [
+    source 15
+    target 35
+  ]
+  edge [
+    source 15
+    target 36
+  ]
+  edge [
+    source 15
+    target 37
+  ]
+  edge [
+    source 15
+    target 38
+  ]
+  edge [
+    source 15
+    target 39
+  ]
+  edge [
+    source 15
+    target 40
+  ]
+  edge [
+    source 15
+    target 41
+  ]
+  edge [
+    source 15
+    target 42
+  ]
+  edge [
+    source 15
+    target 43
+  ]
+  edge [
+    source 15
+    target 44
+  ]
+  edge [
+    source 15
+    target 45
+  ]
+  edge [
+    source 15
+    target 46
+  ]
+  edge [
+    source 15
+    target 47
+  ]
+  edge [
+    source 15
+    target 48
+  ]
+  edge [
+    source 15
+    target 49
+  ]
+  edge [
+    source 16
+    target 17
+  ]
+  edge [
+    source 16
+    target 18
+  ]
+  edge [
+    source 16
+    target 19
+  ]
+  edge [
+    source 16
+    target 20
+  ]
+  edge [
+    source 16
+    target 21
+  ]
+  edge [
+    source 16
+    target 22
+  ]
+  edge [
+    source 16
+    target 23
+  ]
+  edge [
+    source 16
+    target 24
+  ]
+  edge [
+    source 16
+    target 25
+  ]
+  edge [
+    source 16
+    target 26
+  ]
+  edge [
+    source 16
+    target 27
+  ]
+  edge [
+    source 16
+    target 28
+  ]
+  edge [
+    source 16
+    target 29
+  ]
+  edge [
+    source 16
+    target 30
+  ]
+  edge [
+    source 16
+    target 31
+  ]
+  edge [
+    source 16
+    target 32
+  ]
+  edge [
+    source 16
+    target 33
+  ]
+  edge [
+    source 16
+    target 34
+  ]
+  edge [
+    source 16
+    target 35
+  ]
+  edge [
+    source 16
+    target 36
+  ]
+  edge [
+    source 16
+    target 37
+  ]
+  edge [
+    source 16
+    target 38
+  ]
+  edge [
+    source 16
+    target 39
+  ]
+  edge [
+    source 16
+    target 40
+  ]
+  edge [
+    source 16
+    target 41
+  ]
+  edge [
+    source 16
+    target 42
+  ]
+  edge [
+    source 16
+    target 43
+  ]
+  edge [
+    source 16
+    target 44
+  ]
+  edge [
+    source 16
+    target 45
+  ]
+  edge [
+    source 16
+    target 46
+  ]
+  edge [
+    source 16
+    target 47
+  ]
+  edge [
+    source 16
+    target 48
+  ]
+  edge [
+    source 16
+    target 49
+  ]
+  edge [
+    source 17
+    target 18
+  ]
+  edge [
+    source 17
+    target 19
+  ]
+  edge [
+    source 17
+    target 20
+  ]
+  edge [
+    source 17
+    target 21
+  ]
+  edge [
+    source 17
+    target 22
+  ]
+  edge [
+    source 17
+    target 23
+  ]
+  edge [
+    source 17
+    target 24
+  ]
+  edge [
+    source 17
+    target 25
+  ]
+  edge [
+    source 17
+    target 26
+  ]
+  edge [
+    source 17
+    target 27
+  ]
+  edge [
+    source 17
+    target 28
+  ]
+  edge [
+    source 17
+    target 29
+  ]
+  edge [
+    source 17
+    target 30
+  ]
+  edge [
+    source 17
+    target 31
+  ]
+  edge [
+    source 17
+    target 32
+  ]
+  edge [
+    source 17
+    target 33
+  ]
+  edge [
+    source 17
+    target 34
+  ]
+  edge [
+    source 17
+    target 35
+  ]
+  edge [
+    source 17
+    target 36
+  ]
+  edge [
+    source 17
+    target 37
+  ]
+  edge [
+    source 17
+    target 38
+  ]
+  edge [
+    source 17
+    target 39
+  ]
+  edge [
+    source 17
+    target 40
+  ]
+  edge [
+    source 17
+    target 41
+  ]
+  edge [
+    source 17
+    target 42
+  ]
+  edge [
+    source 17
+    target 43
+  ]
+  edge [
+    source 17
+    target 44
+  ]
+  edge [
+    source 17
+    target 45
+  ]
+  edge [
+    source 17
+    target 46
+  ]
+  edge [
+    source 17
+    target 47
+  ]
+  edge [
+    source 17
+    target 48
+  ]
+  edge [
+    source 17
+    target 49
+  ]
+  edge [
+    source 18
+    target 19
+  ]
+  edge [
+    source 18
+    target 20
+  ]
+  edge [
+    source 18
+    target 21
+  ]
+  edge [
+    source 18
+    target 22
+  ]
+  edge [
+    source 18
+    target 23
+  ]
+  edge [
+    source 18
+    target 24
+  ]
+  edge [
+    source 18
+    target 25
+  ]
+  edge [
+    source 18
+    target 26
+  ]
+  edge [
+    source 18
+    target 27
+  ]
+  edge [
+    source 18
+    target 28
+  ]
+  edge [
+    source 18
+    target 29
+  ]
+  edge [
+    source 18
+    target 30
+  ]
+  edge [
+    source 18
+    target 31
+  ]
+  edge [
+    source 18
+    target 32
+  ]
+  edge [
+    source 18
+    target 33
+  ]
+  edge [
+    source 18
+    target 34
+  ]
+  edge [
+    source 18
+    target 35
+  ]
+  edge [
+    source 18
+    target 36
+  ]
+  edge [
+    source 18
+    target 37
+  ]
+  edge [
+    source 18
+    target 38
+  ]
+  edge [
+    source 18
+    target 39
+  ]
+  edge [
+    source 18
+    target 40
+  ]
+  edge [
+    source 18
+    target 41
+  ]
+  edge [
+    source 18
+    target 42
+  ]
+  edge [
+    source 18
+    target 43
+  ]
+  edge [
+    source 18
+    target 44
+  ]
+  edge [
+    source 18
+    target 45
+  ]
+  edge [
+    source 18
+    target 46
+  ]
+  edge [
+    source 18
+    target 47
+  ]
+  edge [
+    source 18
+    target 48
+  ]
+  edge [
+    source 18
+    target 49
+  ]
+  edge [
+    source 19
+    target 20
+  ]
+  edge [
+    source 19
+    target 21
+  ]
+  edge [
+    source 19
+    target 22
+  ]
+  edge [
+    source 19
+    target 23
+  ]
+  edge [
+    source 19
+    target 24
+  ]
+  edge [
+    source 19
+    target 25
+  ]
+  edge [
+    source 19
+    target 26
+  ]
+  edge [
+    source 19
+    target 27
+  ]
+  edge [
+    source 19
+    target 28
+  ]
+  edge [
+    source 19
+    target 29
+  ]
+  edge [
+    source 19
+    target 30
+  ]
+  edge [
+    source 19
+    target 31
+  ]
+  edge [
+    source 19
+    target 32
+  ]
+  edge [
+    source 19
+    target 33
+  ]
+  edge [
+    source 19
+    target 34
+  ]
+  edge [
+    source 19
+    target 35
+  ]
+  edge [
+    source 19
+    target 36
+  ]
+  edge [
+    source 19
+    target 37
+  ]
+  edge [
+    source 19
+    target 38
+  ]
+  edge [
+    source 19
+    target 39
+  ]
+  edge [
+    source 19
+    target 40
+  ]
+  edge [
+    source 19
+    target 41
+  ]
+  edge [
+    source 19
+    target 42
+  ]
+  edge [
+    source 19
+    target 43
+  ]
+  edge [
+    source 19
+    target 44
+  ]
+  edge [
+    source 19
+    target 45
+  ]
+  edge [
+    source 19
+    target 46
+  ]
+  edge [
+    source 19
+    target 47
+  ]
+  edge [
+    source 19
+    target 48
+  ]
+  edge [
+    source 19
+    target 49
+  ]
+  edge [
+    source 20
+    target 21
+  ]
+  edge [
+    source 20
+    target 22
+  ]
+  edge [
+    source 20
+    target 23
+  ]
+  edge [
+    source 20
+    target 24
+  ]
+  edge [
+    source 20
+    target 25
+  ]
+  edge [
+    source 20
+    target 26
+  ]
+  edge [
+    source 20
+    target 27
+  ]
+  edge [
+    source 20
+    target 28
+  ]
+  edge [
+    source 20
+    target 29
+  ]
+  edge [
+    source 20
+    target 30
+  ]
+  edge [
+    source 20
+    target 31
+  ]
+  edge [
+    source 20
+    target 32
+  ]
+  edge [
+    source 20
+    target 33
+  ]
+  edge [
+    source 20
+    target 34
+  ]
+  edge [
+    source 20
+    target 35
+  ]
+  edge [
+    source 20
+    target 36
+  ]
+  edge [
+    source 20
+    target 37
+  ]
+  edge [
+    source 20
+    target 38
+  ]
+  edge [
+    source 20
+    target 39
+  ]
+  edge [
+    source 20
+    target 40
+  ]
+  edge [
+    source 20
+    target 41
+  ]
+  edge [
+    source 20
+    target 42
+  ]
+  edge [
+    source 20
+    target 43
+  ]
+  edge [
+    source 20
+    target 44
+  ]
+  edge [
+    source 20
+    target 45
+  ]
+  edge [
+    source 20
+    target 46
+  ]
+  edge [
+    source 20
+    target 47
+  ]
+  edge [
+    source 20
+    target 48
+  ]
+  edge [
+    source 20
+    target 49
+  ]
+  edge [
+    source 21
+    target 22
+  ]
+  edge [
+    source 21
+    target 23
+  ]
+  edge [
+    source 21
+    target 24
+  ]
+  edge [
+    source 21
+    target 25
+  ]
+  edge [
+    source 21
+    target 26
+  ]
+  edge [
+    source 21
+    target 27
+  ]
+  edge [
+    source 21
+    target 28
+  ]
+  edge [
+    source 21
+    target 29
+  ]
+  edge [
+    source 21
+    target 30
+  ]
+  edge [
+    source 21
+    target 31
+  ]
+  edge [
+    source 21
+    target 32
+  ]
+  edge [
+    source 21
+    target 33
+  ]
+  edge [
+    source 21
+    target 34
+  ]
+  edge [
+    source 21
+    target 35
+  ]
+  edge [
+    source 21
+    target 36
+  ]
+  edge [
+    source 21
+    target 37
+  ]
+  edge [
+    source 21
+    target 38
+  ]
+  edge [
+    source 21
+    target 39
+  ]
+  edge [
+    source 21
+    target 40
+  ]
+  edge [
+    source 21
+    target 41
+  ]
+  edge [
+    source 21
+    target 42
+  ]
+  edge [
+    source 21
+    target 43
+  ]
+  edge [
+    source 21
+    target 44
+  ]
+  edge [
+    source 21
+    target 45
+  ]
+  edge [
+    source 21
+    target 46
+  ]
+  edge [
+    source 21
+    target 47
+  ]
+  edge [
+    source 21
+    target 48
+  ]
+  edge [
+    source 21
+    target 49
+  ]
+  edge [
+    source 22
+    target 23
+  ]
+  edge [
+    source 22
+    target 24
+  ]
+  edge [
+    source 22
+    target 25
+  ]
+  edge [
+    source 22
+    target 26
+  ]
+  edge [
+    source 22
+    target 27
+  ]
+  edge [
+    source 22
+    target 28
+  ]
+  edge [
+    source 22
+    target 29
+  ]
+  edge [
+    source 22
+    target 30
+  ]
+  edge [
+    source 22
+    target 31
+  ]
+  edge [
+    source 22
+    target 32
+  ]
+  edge [
+    source 22
+    target 33
+  ]
+  edge [
+    source 22
+    target 34
+  ]
+  edge [
+    source 22
+    target 35
+  ]
+  edge [
+    source 22
+    target 36
+  ]
+  edge [
+    source 22
+    target 37
+  ]
+  edge [
+    source 22
+    target 38
+  ]
+  edge [
+    source 22
+    target 39
+  ]
+  edge [
+    source 22
+    target 40
+  ]
+  edge [
+    source 22
+    target 41
+  ]
+  edge [
+    source 22
+    target 42
+  ]
+  edge [
+    source 22
+    target 43
+  ]
+  edge [
+    source 22
+    target 44
+  ]
+  edge [
+    source 22
+    target 45
+  ]
+  edge [
+    source 22
+    target 46
+  ]
+  edge [
+    source 22
+    target 47
+  ]
+  edge [
+    source 22
+    target 48
+  ]
+  edge [
+    source 22
+    target 49
+  ]
+  edge [
+    source 23
+    target 24
+  ]
+  edge [
+    source 23
+    target 25
+  ]
+  edge [
+    source 23
+    target 26
+  ]
+  edge [
+    source 23
+    target 27
+  ]
+  edge [
+    source 23
+    target 28
+  ]
+  edge [
+    source 23
+    target 29
+  ]
+  edge [
+    source 23
+    target 30
+  ]
+  edge [
+    source 23
+    target 31
+  ]
+  edge [
+    source 23
+    target 32
+  ]
+  edge [
+    source 23
+    target 33
+  ]
+  edge [
+    source 23
+    target 34
+  ]
+  edge [
+    source 23
+    target 35
+  ]
+  edge [
+    source 23
+    target 36
+  ]
+  edge [
+    source 23
+    target 37
+  ]
+  edge [
+    source 23
+    target 38
+  ]
+  edge [
+    source 23
+    target 39
+  ]
+  edge [
+    source 23
+    target 40
+  ]
+  edge [
+    source 23
+    target 41
+  ]
+  edge [
+    source 23
+    target 42
+  ]
+  edge [
+    source 23
+    target 43
+  ]
+  edge [
+    source 23
+    target 44
+  ]
+  edge [
+    source 23
+    target 45
+  ]
+  edge [
+    source 23
+    target 46
+  ]
+  edge [
+    source 23
+    target 47
+  ]
+  edge [
+    source 23
+    target 48
+  ]
+  edge [
+    source 23
+    target 49
+  ]
+  edge [
+    source 24
+    target 25
+  ]
+  edge [
+    source 24
+    target 26
+  ]
+  edge [
+    source 24
+    target 27
+  ]
+  edge [
+    source 24
+    target 28
+  ]
+  edge [
+    source 24
+    target 29
+  ]
+  edge [
+    source 24
+    target 30
+  ]
+  edge [
+    source 24
+    target 31
+  ]
+  edge [
+    source 24
+    target 32
+  ]
+  edge [
+    source 24
+    target 33
+  ]
+  edge [
+    source 24
+    target 34
+  ]
+  edge [
+    source 24
+    target 35
+  ]
+  edge [
+    source 24
+    target 36
+  ]
+  edge [
+    source 24
+    target 37
+  ]
+  edge [
+    source 24
+    target 38
+  ]
+  edge [
+    source 24
+    target 39
+  ]
+  edge [
+    source 24
+    target 40
+  ]
+  edge [
+    source 24
+    target 41
+  ]
+  edge [
+    source 24
+    target 42
+  ]
+  edge [
+    source 24
+    target 43
+  ]
+  edge [
+    source 24
+    target 44
+  ]
+  edge [
+    source 24
+    target 45
+  ]
+  edge [
+    source 24
+    target 46
+  ]
+  edge [
+    source 24
+    target 47
+  ]
+  edge [
+    source 24
+    target 48
+  ]
+  edge [
+    source 24
+    target 49
+  ]
+  edge [
+    source 25
+    target 26
+  ]
+  edge [
+    source 25
+    target 27
+  ]
+  edge [
+    source 25
+    target 28
+  ]
+  edge [
+    source 25
+    target 29
+  ]
+  edge [
+    source 25
+    target 30
+  ]
+  edge [
+    source 25
+    target 31
+  ]
+  edge [
+    source 25
+    target 32
+  ]
+  edge [
+    source 25
+    target 33
+  ]
+  edge [
+    source 25
+    target 34
+  ]
+  edge [
+    source 25
+    target 35
+  ]
+  edge [
+    source 25
+    target 36
+  ]
+  edge [
+    source 25
+    target 37
+  ]
+  edge [
+    source 25
+    target 38
+  ]
+  edge [
+    source 25
+    target 39
+  ]
+  edge [
+    source 25
+    target 40
+  ]
+  edge [
+    source 25
+    target 41
+  ]
+  edge [
+    source 25
+    target 42
+  ]
+  edge [
+    source 25
+    target 43
+  ]
+  edge [
+    source 25
+    target 44
+  ]
+  edge [
+    source 25
+    target 45
+  ]
+  edge [
+    source 25
+    target 46
+  ]
+  edge [
+    source 25
+    target 47
+  ]
+  edge [
+    source 25
+    target 48
+  ]
+  edge [
+    source 25
+    target 49
+  ]
+  edge [
+    source 26
+    target 27
+  ]
+  edge [
+    source 26
+    target 28
+  ]
+  edge [
+    source 26
+    target 29
+  ]
+  edge [
+    source 26
+    target 30
+  ]
+  edge [
+    source 26
+    target 31
+  ]
+  edge [
+    source 26
+    target 32
+  ]
+  edge [
+    source 26
+    target 33
+  ]
+  edge [
+    source 26
+    target 34
+  ]
+  edge [
+    source 26
+    target 35
+  ]
+  edge [
+    source 26
+    target 36
+  ]
+  edge [
+    source 26
+    target 37
+  ]
+  edge [
+    source 26
+    target 38
+  ]
+  edge [
+    source 26
+    target 39
+  ]
+  edge [
+    source 26
+    target 40
+  ]
+  edge [
+    source 26
+    target 41
+  ]
+  edge [
+    source 26
+    target 42
+  ]
+  edge [
+    source 26
+    target 43
+  ]
+  edge [
+    source 26
+    target 44
+  ]
+  edge [
+    source 26
+    target 45
+  ]
+  edge [
+    source 26
+    target 46
+  ]
+  edge [
+    source 26
+    target 47
+  ]
+  edge [
+    source 26
+    target 48
+  ]
+  edge [
+    source 26
+    target 49
+  ]
+  edge [
+    source 27
+    target 28
+  ]
+  edge [
+    source 27
+    target 29
+  ]
+  edge [
+    source 27
+    target 30
+  ]
+  edge [
+    source 27
+    target 31
+  ]
+  edge [
+    source 27
+    target 32
+  ]
+  edge [
+    source 27
+    target 33
+  ]
+  edge [
+    source 27
+    target 34
+  ]
+  edge [
+    source 27
+    target 35
+  ]
+  edge [
+    source 27
+    target 36
+  ]
+  edge [
+    source 27
+    target 37
+  ]
+  edge [
+    source 27
+    target 38
+  ]
+  edge [
+    source 27
+    target 39
+  ]
+  edge [
+    source 27
+    target 40
+  ]
+  edge [
+    source 27
+    target 41
+  ]
+  edge [
+    source 27
+    target 42
+  ]
+  edge [
+    source 27
+    target 43
+  ]
+  edge [
+    source 27
+    target 44
+  ]
+  edge [
+    source 27
+    target 45
+  ]
+  edge [
+    source 27
+    target 46
+  ]
+  edge [
+    source 27
+    target 47
+  ]
+  edge [
+    source 27
+    target 48
+  ]
+  edge [
+    source 27
+    target 49
+  ]
+  edge [
+    source 28
+    target 29
+  ]
+  edge [
+    source 28
+    target 30
+  ]
+  edge [
+    source 28
+    target 31
+  ]
+  edge [
+    source 28
+    target 32
+  ]
+  edge [
+    source 28
+    target 33
+  ]
+  edge [
+    source 28
+    target 34
+  ]
+  edge [
+    source 28
+    target 35
+  ]
+  edge [
+    source 28
+    target 36
+  ]
+  edge [
+    source 28
+    target 37
+  ]
+  edge [
+    source 28
+    target 38
+  ]
+  edge [
+    source 28
+    target 39
+  ]
+  edge [
+    source 28
+    target 40
+  ]
+  edge [
+    source 28
+    target 41
+  ]
+  edge [
+    source 28
+    target 42
+  ]
+  edge [
+    source 28
+    target 43
+  ]
+  edge [
+    source 28
+    target 44
+  ]
+  edge [
+    source 28
+    target 45
+  ]
+  edge [
+    source 28
+    target 46
+  ]
+  edge [
+    source 28
+    target 47
+  ]
+  edge [
+    source 28
+    target 48
+  ]
+  edge [
+    source 28
+    target 49
+  ]
+  edge [
+    source 29
+    target 30
+  ]
+  edge [
+    source 29
+    target 31
+  ]
+  edge [
+    source 29
+    target 32
+  ]
+  edge [
+    source 29
+    target 33
+  ]
+  edge [
+    source 29
+    target 34
+  ]
+  edge [
+    source 29
+    target 35
+  ]
+  edge [
+    source 29
+    target 36
+  ]
+  edge [
+    source 29
+    target 37
+  ]
+  edge [
+    source 29
+    target 38
+  ]
+  edge [
+    source 29
+    target 39
+  ]
+  edge [
+    source 29
+    target 40
+  ]
+  edge [
+    source 29
+    target 41
+  ]
+  edge [
+    source 29
+    target 42
+  ]
+  edge [
+    source 29
+    target 43
+  ]
+  edge [
+    source 29
+    target 44
+  ]
+  edge [
+    source 29
+    target 45
+  ]
+  edge [
+    source 29
+    target 46
+  ]
+  edge [
+    source 29
+    target 47
+  ]
+  edge [
+    source 29
+    target 48
+  ]
+  edge [
+    source 29
+    target 49
+  ]
+  edge [
+    source 30
+    target 31
+  ]
+  edge [
+    source 30
+    target 32
+  ]
+  edge [
+    source 30
+    target 33
+  ]
+  edge [
+    source 30
+    target 34
+  ]
+  edge [
+    source 30
+    target 35
+  ]
+  edge [
+    source 30
+    target 36
+  ]
+  edge [
+    source 30
+    target 37
+  ]
+  edge [
+    source 30
+    target 38
+  ]
+  edge [
+    source 30
+    target 39
+  ]
+  edge [
+    source 30
+    target 40
+  ]
+  edge [
+    source 30
+    target 41
+  ]
+  edge [
+    source 30
+    target 42
+  ]
+  edge [
+    source 30
+    target 43
+  ]
+  edge [
+    source 30
+    target 44
+  ]
+  edge [
+    source 30
+    target 45
+  ]
+  edge [
+    source 30
+    target 46
+  ]
+  edge [
+    source 30
+    target 47
+  ]
+  edge [
+    source 30
+    target 48
+  ]
+  edge [
+    source 30
+    target 49
+  ]
+  edge [
+    source 31
+    target 32
+  ]
+  edge [
+    source 31
+    target 33
+  ]
+  edge [
+    source 31
+    target 34
+  ]
+  edge [
+    source 31
+    target 35
+  ]
+  edge [
+    source 31
+    target 36
+  ]
+  edge [
+    source 31
+    target 37
+  ]
+  edge [
+    source 31
+    target 38
+  ]
+  edge [
+    source 31
+    target 39
+  ]
+  edge [
+    source 31
+    target 40
+  ]
+  edge [
+    source 31
+    target 41
+  ]
+  edge [
+    source 31
+    target 42
+  ]
+  edge [
+    source 31
+    target 43
+  ]
+  edge [
+    source 31
+    target 44
+  ]
+  edge [
+    source 31
+    target 45
+  ]
+  edge [
+    source 31
+    target 46
+  ]
+  edge [
+    source 31
+    target 47
+  ]
+  edge [
+    source 31
+    target 48
+  ]
+  edge [
+    source 31
+    target 49
+  ]
+  edge [
+    source 32
+    target 33
+  ]
+  edge [
+    source 32
+    target 34
+  ]
+  edge [
+    source 32
+    target 35
+  ]
+  edge [
+    source 32
+    target 36
+  ]
+  edge [
+    source 32
+    target 37
+  ]
+  edge [
+    source 32
+    target 38
+  ]
+  edge [
+    source 32
+    target 39
+  ]
+  edge [
+    source 32
+    target 40
+  ]
+  edge [
+    source 32
+    target 41
+  ]
+  edge [
+    source 32
+    target 42
+  ]
+  edge [
+    source 32
+    target 43
+  ]
+  edge [
+    source 32
+    target 44
+  ]
+  edge [
+    source 32
+    target 45
+  ]
+  edge [
+    source 32
+    target 46
+  ]
+  edge [
+    source 32
+    target 47
+  ]
+  edge [
+    source 32
+    target 48
+  ]
+  edge [
+    source 32
+    target 49
+  ]
+  edge [
+    source 33
+    target 34
+  ]
+  edge [
+    source 33
+    target 35
+  ]
+  edge [
+    source 33
+    target 36
+  ]
+  edge [
+    source 33
+    target 37
+  ]
+  edge [
+    source 33
+    target 38
+  ]
+  edge [
+    source 33
+    target 39
+  ]
+  edge [
+    source 33
+    target 40
+  ]
+  edge [
+    source 33
+    target 41
+  ]
+  edge [
+    source 33
+    target 42
+  ]
+  edge [
+    source 33
+    target 43
+  ]
+  edge [
+    source 33
+    target 44
+  ]
+  edge [
+    source 33
+    target 45
+  ]
+  edge [
+    source 33
+    target 46
+  ]
+  edge [
+    source 33
+    target 47
+  ]
+  edge [
+    source 33
+    target 48
+  ]
+  edge [
+    source 33
+    target 49
+  ]
+  edge [
+    source 34
+    target 35
+  ]
+  edge [
+    source 34
+    target 36
+  ]
+  edge [
+    source 34
+    target 37
+  ]
+  edge [
+    source 34
+    target 38
+  ]
+  edge [
+    source 34
+    target 39
+  ]
+  edge [
+    source 34
+    target 40
+  ]
+  edge [
+    source 34
+    target 41
+  ]
+  edge [
+    source 34
+    target 42
+  ]
+  edge [
+    source 34
+    target 43
+  ]
+  edge [
+    source 34
+    target 44
+  ]
+  edge [
+    source 34
+    target 45
+  ]
+  edge [
+    source 34
+    target 46
+  ]
+  edge [
+    source 34
+    target 47
+  ]
+  edge [
+    source 34
+    target 48
+  ]
+  edge [
+    source 34
+    target 49
+  ]
+  edge [
+    source 35
+    target 36
+  ]
+  edge [
+    source 35
+    target 37
+  ]
+  edge [
+    source 35
+    target 38
+  ]
+  edge [
+    source 35
+    target 39
+  ]
+  edge [
+    source 35
+    target 40
+  ]
+  edge [
+    source 35
+    target 41
+  ]
+  edge [
+    source 35
+    target 42
+  ]
+  edge [
+    source 35
+    target 43
+  ]
+  edge [
+    source 35
+    target 44
+  ]
+  edge [
+    source 35
+    target 45
+  ]
+  edge [
+    source 35
+    target 46
+  ]
+  edge [
+    source 35
+    target 47
+  ]
+  edge [
+    source 35
+    target 48
+  ]
+  edge [
+    source 35
+    target 49
+  ]
+  edge [
+    source 36
+    target 37
+  ]
+  edge [
+    source 36
+    target 38
+  ]
+  edge [
+    source 36
+    target 39
+  ]
+  edge [
+    source 36
+    target 40
+  ]
+  edge [
+    source 36
+    target 41
+  ]
+  edge [
+    source 36
+    target 42
+  ]
+  edge [
+    source 36
+    target 43
+  ]
+  edge [
+    source 36
+    target 44
+  ]
+  edge [
+    source 36
+    target 45
+  ]
+  edge [
+    source 36
+    target 46
+  ]
+  edge [
+    source 36
+    target 47
+  ]
+  edge [
+    source 36
+    target 48
+  ]
+  edge [
+    source 36
+    target 49
+  ]
+  edge [
+    source 37
+    target 38
+  ]
+  edge [
+    source 37
+    target 39
+  ]
+  edge [
+    source 37
+    target 40
+  ]
+  edge [
+    source 37
+    target 41
+  ]
+  edge [
+    source 37
+    target 42
+  ]
+  edge [
+    source 37
+    target 43
+  ]
+  edge [
+    source 37
+    target 44
+  ]
+  edge [
+    source 37
+    target 45
+  ]
+  edge [
+    source 37
+    target 46
+  ]
+  edge [
+    source 37
+    target 47
+  ]
+  edge [
+    source 37
+    target 48
+  ]
+  edge [
+    source 37
+    target 49
+  ]
+  edge [
+    source 38
+    target 39
+  ]
+  edge [
+    source 38
+    target 40
+  ]
+  edge [
+    source 38
+    target 41
+  ]
+  edge [
+    source 38
+    target 42
+  ]
+  edge [
+    source 38
+    target 43
+  ]
+  edge [
+    source 38
+    target 44
+  ]
+  edge [
+    source 38
+    target 45
+  ]
+  edge [
+    source 38
+    target 46
+  ]
+  edge [
+    source 38
+    target 47
+  ]
+  edge [
+    source 38
+    target 48
+  ]
+  edge [
+    source 38
+    target 49
+  ]
+  edge [
+    source 39
+    target 40
+  ]
+  edge [
+    source 39
+    target 41
+  ]
+  edge [
+    source 39
+    target 42
+  ]
+  edge [
+    source 39
+    target 43
+  ]
+  edge [
+    source 39
+    target 44
+  ]
+  edge [
+    source 39
+    target 45
+  ]
+  edge [
+    source 39
+    target 46
+  ]
+  edge [
+    source 39
+    target 47
+  ]
+  edge [
+    source 39
+    target 48
+  ]
+  edge [
+    source 39
+    target 49
+  ]
+  edge [
+    source 40
+    target 41
+  ]
+  edge [
+    source 40
+    target 42
+  ]
+  edge [
+    source 40
+    target 43
+  ]
+  edge [
+    source 40
+    target 44
+  ]
+  edge [
+    source 40
+    target 45
+  ]
+  edge [
+    source 40
+    target 46
+  ]
+  edge [
+    source 40
+    target 47
+  ]
+  edge [
+    source 40
+    target 48
+  ]
+  edge [
+    source 40
+    target 49
+  ]
+  edge [
+    source 41
+    target 42
+  ]
+  edge [
+    source 41
+    target 43
+  ]
+  edge [
+    source 41
+    target 44
+  ]
+  edge [
+    source 41
+    target 45
+  ]
+  edge [
+    source 41
+    target 46
+  ]
+  edge [
+    source 41
+    target 47
+  ]
+  edge [
+    source 41
+    target 48
+  ]
+  edge [
+    source 41
+    target 49
+  ]
+  edge [
+    source 42
+    target 43
+  ]
+  edge [
+    source 42
+    target 44
+  ]
+  edge [
+    source 42
+    target 45
+  ]
+  edge [
+    source 42
+    target 46
+  ]
+  edge [
+    source 42
+    target 47
+  ]
+  edge [
+    source 42
+    target 48
+  ]
+  edge [
+    source 42
+    target 49
+  ]
+  edge [
+    source 43
+    target 44
+  ]
+  edge [
+    source 43
+    target 45
+  ]
+  edge [
+    source 43
+    target 46
+  ]
+  edge [
+    source 43
+    target 47
+  ]
+  edge [
+    source 43
+    target 48
+  ]
+  edge [
+    source 43
+    target 49
+  ]
+  edge [
+    source 44
+    target 45
+  ]
+  edge [
+    source 44
+    target 46
+  ]
+  edge [
+    source 44
+    target 47
+  ]
+  edge [
+    source 44
+    target 48
+  ]
+  edge [
+    source 44
+    target 49
+  ]
+  edge [
+    source 45
+    target 46
+  ]
+  edge [
+    source 45
+    target 47
+  ]
+  edge [
+    source 45
+    target 48
+  ]
+  edge [
+    source 45
+    target 49
+  ]
+  edge [
+    source 46
+    target 47
+  ]
+  edge [
+    source 46
+    target 48
+  ]
+  edge [
+    source 46
+    target 49
+  ]
+  edge [
+    source 47
+    target 48
+  ]
+  edge [
+    source 47
+    target 49
+  ]
+  edge [
+    source 48
+    target 49
+  ]
+]
@@ -0,0 +1,502 @@
+graph [
+  node [
+    id 0
+    label "a0"
+    jid "a0@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 1
+    label "a1"
+    jid "a1@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 2
+    label "a2"
+    jid "a2@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 3
+    label "a3"
+    jid "a3@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 4
+    label "a4"
+    jid "a4@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 5
+    label "a5"
+    jid "a5@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 6
+    label "a6"
+    jid "a6@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 7
+    label "a7"
+    jid "a7@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 8
+    label "a8"
+    jid "a8@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 9
+    label "a9"
+    jid "a9@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 10
+    label "a10"
+    jid "a10@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 11
+    label "a11"
+    jid "a11@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 12
+    label "a12"
+    jid "a12@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 13
+    label "a13"
+    jid "a13@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 14
+    label "a14"
+    jid "a14@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 15
+    label "a15"
+    jid "a15@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 16
+    label "a16"
+    jid "a16@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 17
+    label "a17"
+    jid "a17@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 18
+    label "a18"
+    jid "a18@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 19
+    label "a19"
+    jid "a19@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 20
+    label "a20"
+    jid "a20@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 21
+    label "a21"
+    jid "a21@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 22
+    label "a22"
+    jid "a22@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 23
+    label "a23"
+    jid "a23@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 24
+    label "a24"
+    jid "a24@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 25
+    label "a25"
+    jid "a25@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 26
+    label "a26"
+    jid "a26@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 27
+    label "a27"
+    jid "a27@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 28
+    label "a28"
+    jid "a28@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 29
+    label "a29"
+    jid "a29@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 30
+    label "a30"
+    jid "a30@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 31
+    label "a31"
+    jid "a31@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 32
+    label "a32"
+    jid "a32@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 33
+    label "a33"
+    jid "a33@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 34
+    label "a34"
+    jid "a34@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 35
+    label "a35"
+    jid "a35@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 36
+    label "a36"
+    jid "a36@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 37
+    label "a37"
+    jid "a37@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 38
+    label "a38"
+    jid "a38@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 39
+    label "a39"
+    jid "a39@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 40
+    label "a40"
+    jid "a40@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 41
+    label "a41"
+    jid "a41@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 42
+    label "a42"
+    jid "a42@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 43
+    label "a43"
+    jid "a43@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 44
+    label "a44"
+    jid "a44@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 45
+    label "a45"
+    jid "a45@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 46
+    label "a46"
+    jid "a46@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 47
+    label "a47"
+    jid "a47@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 48
+    label "a48"
+    jid "a48@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 49
+    label "a49"
+    jid "a49@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+  edge [
+    source 0
+    target 49
+  ]
+  edge [
+    source 1
+    target 2
+  ]
+  edge [
+    source 2
+    target 3
+  ]
+  edge [
+    source 3
+    target 4
+  ]
+  edge [
+    source 4
+    target 5
+  ]
+  edge [
+    source 5
+    target 6
+  ]
+  edge [
+    source 6
+    target 7
+  ]
+  edge [
+    source 7
+    target 8
+  ]
+  edge [
+    source 8
+    target 9
+  ]
+  edge [
+    source 9
+    target 10
+  ]
+  edge [
+    source 10
+    target 11
+  ]
+  edge [
+    source 11
+    target 12
+  ]
+  edge [
+    source 12
+    target 13
+  ]
+  edge [
+    source 13
+    target 14
+  ]
+  edge [
+    source 14
+    target 15
+  ]
+  edge [
+    source 15
+    target 16
+  ]
+  edge [
+    source 16
+    target 17
+  ]
+  edge [
+    source 17
+    target 18
+  ]
+  edge [
+    source 18
+    target 19
+  ]
+  edge [
+    source 19
+    target 20
+  ]
+  edge [
+    source 20
+    target 21
+  ]
+  edge [
+    source 21
+    target 22
+  ]
+  edge [
+    source 22
+    target 23
+  ]
+  edge [
+    source 23
+    target 24
+  ]
+  edge [
+    source 24
+    target 25
+  ]
+  edge [
+    source 25
+    target 26
+  ]
+  edge [
+    source 26
+    target 27
+  ]
+  edge [
+    source 27
+    target 28
+  ]
+  edge [
+    source 28
+    target 29
+  ]
+  edge [
+    source 29
+    target 30
+  ]
+  edge [
+    source 30
+    target 31
+  ]
+  edge [
+    source 31
+    target 32
+  ]
+  edge [
+    source 32
+    target 33
+  ]
+  edge [
+    source 33
+    target 34
+  ]
+  edge [
+    source 34
+    target 35
+  ]
+  edge [
+    source 35
+    target 36
+  ]
+  edge [
+    source 36
+    target 37
+  ]
+  edge [
+    source 37
+    target 38
+  ]
+  edge [
+    source 38
+    target 39
+  ]
+  edge [
+    source 39
+    target 40
+  ]
+  edge [
+    source 40
+    target 41
+  ]
+  edge [
+    source 41
+    target 42
+  ]
+  edge [
+    source 42
+    target 43
+  ]
+  edge [
+    source 43
+    target 44
+  ]
+  edge [
+    source 44
+    target 45
+  ]
+  edge [
+    source 45
+    target 46
+  ]
+  edge [
+    source 46
+    target 47
+  ]
+  edge [
+    source 47
+    target 48
+  ]
+  edge [
+    source 48
+    target 49
+  ]
+]
@@ -0,0 +1,11552 @@
+graph [
+  node [
+    id 0
+    label "a0"
+    jid "a0@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 1
+    label "a1"
+    jid "a1@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 2
+    label "a2"
+    jid "a2@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 3
+    label "a3"
+    jid "a3@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 4
+    label "a4"
+    jid "a4@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 5
+    label "a5"
+    jid "a5@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 6
+    label "a6"
+    jid "a6@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 7
+    label "a7"
+    jid "a7@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 8
+    label "a8"
+    jid "a8@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 9
+    label "a9"
+    jid "a9@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 10
+    label "a10"
+    jid "a10@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 11
+    label "a11"
+    jid "a11@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 12
+    label "a12"
+    jid "a12@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 13
+    label "a13"
+    jid "a13@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 14
+    label "a14"
+    jid "a14@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 15
+    label "a15"
+    jid "a15@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 16
+    label "a16"
+    jid "a16@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 17
+    label "a17"
+    jid "a17@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 18
+    label "a18"
+    jid "a18@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 19
+    label "a19"
+    jid "a19@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 20
+    label "a20"
+    jid "a20@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 21
+    label "a21"
+    jid "a21@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 22
+    label "a22"
+    jid "a22@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 23
+    label "a23"
+    jid "a23@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 24
+    label "a24"
+    jid "a24@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 25
+    label "a25"
+    jid "a25@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 26
+    label "a26"
+    jid "a26@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 27
+    label "a27"
+    jid "a27@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 28
+    label "a28"
+    jid "a28@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 29
+    label "a29"
+    jid "a29@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 30
+    label "a30"
+    jid "a30@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 31
+    label "a31"
+    jid "a31@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 32
+    label "a32"
+    jid "a32@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 33
+    label "a33"
+    jid "a33@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 34
+    label "a34"
+    jid "a34@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 35
+    label "a35"
+    jid "a35@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 36
+    label "a36"
+    jid "a36@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 37
+    label "a37"
+    jid "a37@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 38
+    label "a38"
+    jid "a38@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 39
+    label "a39"
+    jid "a39@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 40
+    label "a40"
+    jid "a40@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 41
+    label "a41"
+    jid "a41@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 42
+    label "a42"
+    jid "a42@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 43
+    label "a43"
+    jid "a43@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 44
+    label "a44"
+    jid "a44@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 45
+    label "a45"
+    jid "a45@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 46
+    label "a46"
+    jid "a46@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 47
+    label "a47"
+    jid "a47@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 48
+    label "a48"
+    jid "a48@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 49
+    label "a49"
+    jid "a49@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 50
+    label "a50"
+    jid "a50@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 51
+    label "a51"
+    jid "a51@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 52
+    label "a52"
+    jid "a52@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 53
+    label "a53"
+    jid "a53@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 54
+    label "a54"
+    jid "a54@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 55
+    label "a55"
+    jid "a55@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 56
+    label "a56"
+    jid "a56@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 57
+    label "a57"
+    jid "a57@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 58
+    label "a58"
+    jid "a58@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 59
+    label "a59"
+    jid "a59@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 60
+    label "a60"
+    jid "a60@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 61
+    label "a61"
+    jid "a61@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 62
+    label "a62"
+    jid "a62@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 63
+    label "a63"
+    jid "a63@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 64
+    label "a64"
+    jid "a64@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 65
+    label "a65"
+    jid "a65@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 66
+    label "a66"
+    jid "a66@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 67
+    label "a67"
+    jid "a67@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 68
+    label "a68"
+    jid "a68@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 69
+    label "a69"
+    jid "a69@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 70
+    label "a70"
+    jid "a70@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 71
+    label "a71"
+    jid "a71@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 72
+    label "a72"
+    jid "a72@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 73
+    label "a73"
+    jid "a73@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 74
+    label "a74"
+    jid "a74@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+  edge [
+    source 0
+    target 2
+  ]
+  edge [
+    source 0
+    target 3
+  ]
+  edge [
+    source 0
+    target 4
+  ]
+  edge [
+    source 0
+    target 5
+  ]
+  edge [
+    source 0
+    target 6
+  ]
+  edge [
+    source 0
+    target 7
+  ]
+  edge [
+    source 0
+    target 8
+  ]
+  edge [
+    source 0
+    target 9
+  ]
+  edge [
+    source 0
+    target 10
+  ]
+  edge [
+    source 0
+    target 11
+  ]
+  edge [
+    source 0
+    target 12
+  ]
+  edge [
+    source 0
+    target 13
+  ]
+  edge [
+    source 0
+    target 14
+  ]
+  edge [
+    source 0
+    target 15
+  ]
+  edge [
+    source 0
+    target 16
+  ]
+  edge [
+    source 0
+    target 17
+  ]
+  edge [
+    source 0
+    target 18
+  ]
+  edge [
+    source 0
+    target 19
+  ]
+  edge [
+    source 0
+    target 20
+  ]
+  edge [
+    source 0
+    target 21
+  ]
+  edge [
+    source 0
+    target 22
+  ]
+  edge [
+    source 0
+    target 23
+  ]
+  edge [
+    source 0
+    target 24
+  ]
+  edge [
+    source 0
+    target 25
+  ]
+  edge [
+    source 0
+    target 26
+  ]
+  edge [
+    source 0
+    target 27
+  ]
+  edge [
+    source 0
+    target 28
+  ]
+  edge [
+    source 0
+    target 29
+  ]
+  edge [
+    source 0
+    target 30
+  ]
+  edge [
+    source 0
+    target 31
+  ]
+  edge [
+    source 0
+    target 32
+  ]
+  edge [
+    source 0
+    target 33
+  ]
+  edge [
+    source 0
+    target 34
+  ]
+  edge [
+    source 0
+    target 35
+  ]
+  edge [
+    source 0
+    target 36
+  ]
+  edge [
+    source 0
+    target 37
+  ]
+  edge [
+    source 0
+    target 38
+  ]
+  edge [
+    source 0
+    target 39
+  ]
+  edge [
+    source 0
+    target 40
+  ]
+  edge [
+    source 0
+    target 41
+  ]
+  edge [
+    source 0
+    target 42
+  ]
+  edge [
+    source 0
+    target 43
+  ]
+  edge [
+    source 0
+    target 44
+  ]
+  edge [
+    source 0
+    target 45
+  ]
+  edge [
+    source 0
+    target 46
+  ]
+  edge [
+    source 0
+    target 47
+  ]
+  edge [
+    source 0
+    target 48
+  ]
+  edge [
+    source 0
+    target 49
+  ]
+  edge [
+    source 0
+    target 50
+  ]
+  edge [
+    source 0
+    target 51
+  ]
+  edge [
+    source 0
+    target 52
+  ]
+  edge [
+    source 0
+    target 53
+  ]
+  edge [
+    source 0
+    target 54
+  ]
+  edge [
+    source 0
+    target 55
+  ]
+  edge [
+    source 0
+    target 56
+  ]
+  edge [
+    source 0
+    target 57
+  ]
+  edge [
+    source 0
+    target 58
+  ]
+  edge [
+    source 0
+    target 59
+  ]
+  edge [
+    source 0
+    target 60
+  ]
+  edge [
+    source 0
+    target 61
+  ]
+  edge [
+    source 0
+    target 62
+  ]
+  edge [
+    source 0
+    target 63
+  ]
+  edge [
+    source 0
+    target 64
+  ]
+  edge [
+    source 0
+    target 65
+  ]
+  edge [
+    source 0
+    target 66
+  ]
+  edge [
+    source 0
+    target 67
+  ]
+  edge [
+    source 0
+    target 68
+  ]
+  edge [
+    source 0
+    target 69
+  ]
+  edge [
+    source 0
+    target 70
+  ]
+  edge [
+    source 0
+    target 71
+  ]
+  edge [
+    source 0
+    target 72
+  ]
+  edge [
+    source 0
+    target 73
+  ]
+  edge [
+    source 0
+    target 74
+  ]
+  edge [
+    source 1
+    target 2
+  ]
+  edge [
+    source 1
+    target 3
+  ]
+  edge [
+    source 1
+    target 4
+  ]
+  edge [
+    source 1
+    target 5
+  ]
+  edge [
+    source 1
+    target 6
+  ]
+  edge [
+    source 1
+    target 7
+  ]
+  edge [
+    source 1
+    target 8
+  ]
+  edge [
+    source 1
+    target 9
+  ]
+  edge [
+    source 1
+    target 10
+  ]
+  edge [
+    source 1
+    target 11
+  ]
+  edge [
+    source 1
+    target 12
+  ]
+  edge [
+    source 1
+    target 13
+  ]
+  edge [
+    source 1
+    target 14
+  ]
+  edge [
+    source 1
+    target 15
+  ]
+  edge [
+    source 1
+    target 16
+  ]
+  edge [
+    source 1
+    target 17
+  ]
+  edge [
+    source 1
+    target 18
+  ]
+  edge [
+    source 1
+    target 19
+  ]
+  edge [
+    source 1
+    target 20
+  ]
+  edge [
+    source 1
+    target 21
+  ]
+  edge [
+    source 1
+    target 22
+  ]
+  edge [
+    source 1
+    target 23
+  ]
+  edge [
+    source 1
+    target 24
+  ]
+  edge [
+    source 1
+    target 25
+  ]
+  edge [
+    source 1
+    target 26
+  ]
+  edge [
+    source 1
+    target 27
+  ]
+  edge [
+    source 1
+    target 28
+  ]
+  edge [
+    source 1
+    target 29
+  ]
+  edge [
+    source 1
+    target 30
+  ]
+  edge [
+    source 1
+    target 31
+  ]
+  edge [
+    source 1
+    target 32
+  ]
+  edge [
+    source 1
+    target 33
+  ]
+  edge [
+    source 1
+    target 34
+  ]
+  edge [
+    source 1
+    target 35
+  ]
+  edge [
+    source 1
+    target 36
+  ]
+  edge [
+    source 1
+    target 37
+  ]
+  edge [
+    source 1
+    target 38
+  ]
+  edge [
+    source 1
+    target 39
+  ]
+  edge [
+    source 1
+    target 40
+  ]
+  edge [
+    source 1
+    target 41
+  ]
+  edge [
+    source 1
+    target 42
+  ]
+  edge [
+    source 1
+    target 43
+  ]
+  edge [
+    source 1
+    target 44
+  ]
+  edge [
+    source 1
+    target 45
+  ]
+  edge [
+    source 1
+    target 46
+  ]
+  edge [
+    source 1
+    target 47
+  ]
+  edge [
+    source 1
+    target 48
+  ]
+  edge [
+    source 1
+    target 49
+  ]
+  edge [
+    source 1
+    target 50
+  ]
+  edge [
+    source 1
+    target 51
+  ]
+  edge [
+    source 1
+    target 52
+  ]
+  edge [
+    source 1
+    target 53
+  ]
+  edge [
+    source 1
+    target 54
+  ]
+  edge [
+    source 1
+    target 55
+  ]
+  edge [
+    source 1
+    target 56
+  ]
+  edge [
+    source 1
+    target 57
+  ]
+  edge [
+    source 1
+    target 58
+  ]
+  edge [
+    source 1
+    target 59
+  ]
+  edge [
+    source 1
+    target 60
+  ]
+  edge [
+    source 1
+    target 61
+  ]
+  edge [
+    source 1
+    target 62
+  ]
+  edge [
+    source 1
+    target 63
+  ]
+  edge [
+    source 1
+    target 64
+  ]
+  edge [
+    source 1
+    target 65
+  ]
+  edge [
+    source 1
+    target 66
+  ]
+  edge [
+    source 1
+    target 67
+  ]
+  edge [
+    source 1
+    target 68
+  ]
+  edge [
+    source 1
+    target 69
+  ]
+  edge [
+    source 1
+    target 70
+  ]
+  edge [
+    source 1
+    target 71
+  ]
+  edge [
+    source 1
+    target 72
+  ]
+  edge [
+    source 1
+    target 73
+  ]
+  edge [
+    source 1
+    target 74
+  ]
+  edge [
+    source 2
+    target 3
+  ]
+  edge [
+    source 2
+    target 4
+  ]
+  edge [
+    source 2
+    target 5
+  ]
+  edge [
+    source 2
+    target 6
+  ]
+  edge [
+    source 2
+    target 7
+  ]
+  edge [
+    source 2
+    target 8
+  ]
+  edge [
+    source 2
+    target 9
+  ]
+  edge [
+    source 2
+    target 10
+  ]
+  edge [
+    source 2
+    target 11
+  ]
+  edge [
+    source 2
+    target 12
+  ]
+  edge [
+    source 2
+    target 13
+  ]
+  edge [
+    source 2
+    target 14
+  ]
+  edge [
+    source 2
+    target 15
+  ]
+  edge [
+    source 2
+    target 16
+  ]
+  edge [
+    source 2
+    target 17
+  ]
+  edge [
+    source 2
+    target 18
+  ]
+  edge [
+    source 2
+    target 19
+  ]
+  edge [
+    source 2
+    target 20
+  ]
+  edge [
+    source 2
+    target 21
+  ]
+  edge [
+    source 2
+    target 22
+  ]
+  edge [
+    source 2
+    target 23
+  ]
+  edge [
+    source 2
+    target 24
+  ]
+  edge [
+    source 2
+    target 25
+  ]
+  edge [
+    source 2
+    target 26
+  ]
+  edge [
+    source 2
+    target 27
+  ]
+  edge [
+    source 2
+    target 28
+  ]
+  edge [
+    source 2
+    target 29
+  ]
+  edge [
+    source 2
+    target 30
+  ]
+  edge [
+    source 2
+    target 31
+  ]
+  edge [
+    source 2
+    target 32
+  ]
+  edge [
+    source 2
+    target 33
+  ]
+  edge [
+    source 2
+    target 34
+  ]
+  edge [
+    source 2
+    target 35
+  ]
+  edge [
+    source 2
+    target 36
+  ]
+  edge [
+    source 2
+    target 37
+  ]
+  edge [
+    source 2
+    target 38
+  ]
+  edge [
+    source 2
+    target 39
+  ]
+  edge [
+    source 2
+    target 40
+  ]
+  edge [
+    source 2
+    target 41
+  ]
+  edge [
+    source 2
+    target 42
+  ]
+  edge [
+    source 2
+    target 43
+  ]
+  edge [
+    source 2
+    target 44
+  ]
+  edge [
+    source 2
+    target 45
+  ]
+  edge [
+    source 2
+    target 46
+  ]
+  edge [
+    source 2
+    target 47
+  ]
+  edge [
+    source 2
+    target 48
+  ]
+  edge [
+    source 2
+    target 49
+  ]
+  edge [
+    source 2
+    target 50
+  ]
+  edge [
+    source 2
+    target 51
+  ]
+  edge [
+    source 2
+    target 52
+  ]
+  edge [
+    source 2
+    target 53
+  ]
+  edge [
+    source 2
+    target 54
+  ]
+  edge [
+    source 2
+    target 55
+  ]
+  edge [
+    source 2
+    target 56
+  ]
+  edge [
+    source 2
+    target 57
+  ]
+  edge [
+    source 2
+    target 58
+  ]
+  edge [
+    source 2
+    target 59
+  ]
+  edge [
+    source 2
+    target 60
+  ]
+  edge [
+    source 2
+    target 61
+  ]
+  edge [
+    source 2
+    target 62
+  ]
+  edge [
+    source 2
+    target 63
+  ]
+  edge [
+    source 2
+    target 64
+  ]
+  edge [
+    source 2
+    target 65
+  ]
+  edge [
+    source 2
+    target 66
+  ]
+  edge [
+    source 2
+    target 67
+  ]
+  edge [
+    source 2
+    target 68
+  ]
+  edge [
+    source 2
+    target 69
+  ]
+  edge [
+    source 2
+    target 70
+  ]
+  edge [
+    source 2
+    target 71
+  ]
+  edge [
+    source 2
+    target 72
+  ]
+  edge [
+    source 2
+    target 73
+  ]
+  edge [
+    source 2
+    target 74
+  ]
+  edge [
+    source 3
+    target 4
+  ]
+  edge [
+    source 3
+    target 5
+  ]
+  edge [
+    source 3
+    target 6
+  ]
+  edge [
+    source 3
+    target 7
+  ]
+  edge [
+    source 3
+    target 8
+  ]
+  edge [
+    source 3
+    target 9
+  ]
+  edge [
+    source 3
+    target 10
+  ]
+  edge [
+    source 3
+    target 11
+  ]
+  edge [
+    source 3
+    target 12
+  ]
+  edge [
+    source 3
+    target 13
+  ]
+  edge [
+    source 3
+    target 14
+  ]
+  edge [
+    source 3
+    target 15
+  ]
+  edge [
+    source 3
+    target 16
+  ]
+  edge [
+    source 3
+    target 17
+  ]
+  edge [
+    source 3
+    target 18
+  ]
+  edge [
+    source 3
+    target 19
+  ]
+  edge [
+    source 3
+    target 20
+  ]
+  edge [
+    source 3
+    target 21
+  ]
+  edge [
+    source 3
+    target 22
+  ]
+  edge [
+    source 3
+    target 23
+  ]
+  edge [
+    source 3
+    target 24
+  ]
+  edge [
+    source 3
+    target 25
+  ]
+  edge [
+    source 3
+    target 26
+  ]
+  edge [
+    source 3
+    target 27
+  ]
+  edge [
+    source 3
+    target 28
+  ]
+  edge [
+    source 3
+    target 29
+  ]
+  edge [
+    source 3
+    target 30
+  ]
+  edge [
+    source 3
+    target 31
+  ]
+  edge [
+    source 3
+    target 32
+  ]
+  edge [
+    source 3
+    target 33
+  ]
+  edge [
+    source 3
+    target 34
+  ]
+  edge [
+    source 3
+    target 35
+  ]
+  edge [
+    source 3
+    target 36
+  ]
+  edge [
+    source 3
+    target 37
+  ]
+  edge [
+    source 3
+    target 38
+  ]
+  edge [
+    source 3
+    target 39
+  ]
+  edge [
+    source 3
+    target 40
+  ]
+  edge [
+    source 3
+    target 41
+  ]
+  edge [
+    source 3
+    target 42
+  ]
+  edge [
+    source 3
+    target 43
+  ]
+  edge [
+    source 3
+    target 44
+  ]
+  edge [
+    source 3
+    target 45
+  ]
+  edge [
+    source 3
+    target 46
+  ]
+  edge [
+    source 3
+    target 47
+  ]
+  edge [
+    source 3
+    target 48
+  ]
+  edge [
+    source 3
+    target 49
+  ]
+  edge [
+    source 3
+    target 50
+  ]
+  edge [
+    source 3
+    target 51
+  ]
+  edge [
+    source 3
+    target 52
+  ]
+  edge [
+    source 3
+    target 53
+  ]
+  edge [
+    source 3
+    target 54
+  ]
+  edge [
+    source 3
+    target 55
+  ]
+  edge [
+    source 3
+    target 56
+  ]
+  edge [
+    source 3
+    target 57
+  ]
+  edge [
+    source 3
+    target 58
+  ]
+  edge [
+    source 3
+    target 59
+  ]
+  edge [
+    source 3
+    target 60
+  ]
+  edge [
+    source 3
+    target 61
+  ]
+  edge [
+    source 3
+    target 62
+  ]
+  edge [
+    source 3
+    target 63
+  ]
+  edge [
+    source 3
+    target 64
+  ]
+  edge [
+    source 3
+    target 65
+  ]
+  edge [
+    source 3
+    target 66
+  ]
+  edge [
+    source 3
+    target 67
+  ]
+  edge [
+    source 3
+    target 68
+  ]
+  edge [
+    source 3
+    target 69
+  ]
+  edge [
+    source 3
+    target 70
+  ]
+  edge [
+    source 3
+    target 71
+  ]
+  edge [
+    source 3
+    target 72
+  ]
+  edge [
+    source 3
+    target 73
+  ]
+  edge [
+    source 3
+    target 74
+  ]
+  edge [
+    source 4
+    target 5
+  ]
+  edge [
+    source 4
+    target 6
+  ]
+  edge [
+    source 4
+    target 7
+  ]
+  edge [
+    source 4
+    target 8
+  ]
+  edge [
+    source 4
+    target 9
+  ]
+  edge [
+    source 4
+    target 10
+  ]
+  edge [
+    source 4
+    target 11
+  ]
+  edge [
+    source 4
+    target 12
+  ]
+  edge [
+    source 4
+    target 13
+  ]
+  edge [
+    source 4
+    target 14
+  ]
+  edge [
+    source 4
+    target 15
+  ]
+  edge [
+    source 4
+    target 16
+  ]
+  edge [
+    source 4
+    target 17
+  ]
+  edge [
+    source 4
+    target 18
+  ]
+  edge [
+    source 4
+    target 19
+  ]
+  edge [
+    source 4
+    target 20
+  ]
+  edge [
+    source 4
+    target 21
+  ]
+  edge [
+    source 4
+    target 22
+  ]
+  edge [
+    source 4
+    target 23
+  ]
+  edge [
+    source 4
+    target 24
+  ]
+  edge [
+    source 4
+    target 25
+  ]
+  edge [
+    source 4
+    target 26
+  ]
+  edge [
+    source 4
+    target 27
+  ]
+  edge [
+    source 4
+    target 28
+  ]
+  edge [
+    source 4
+    target 29
+  ]
+  edge [
+    source 4
+    target 30
+  ]
+  edge [
+    source 4
+    target 31
+  ]
+  edge [
+    source 4
+    target 32
+  ]
+  edge [
+    source 4
+    target 33
+  ]
+  edge [
+    source 4
+    target 34
+  ]
+  edge [
+    source 4
+    target 35
+  ]
+  edge [
+    source 4
+    target 36
+  ]
+  edge [
+    source 4
+    target 37
+  ]
+  edge [
+    source 4
+    target 38
+  ]
+  edge [
+    source 4
+    target 39
+  ]
+  edge [
+    source 4
+    target 40
+  ]
+  edge [
+    source 4
+    target 41
+  ]
+  edge [
+    source 4
+    target 42
+  ]
+  edge [
+    source 4
+    target 43
+  ]
+  edge [
+    source 4
+    target 44
+  ]
+  edge [
+    source 4
+    target 45
+  ]
+  edge [
+    source 4
+    target 46
+  ]
+  edge [
+    source 4
+    target 47
+  ]
+  edge [
+    source 4
+    target 48
+  ]
+  edge [
+    source 4
+    target 49
+  ]
+  edge [
+    source 4
+    target 50
+  ]
+  edge [
+    source 4
+    target 51
+  ]
+  edge [
+    source 4
+    target 52
+  ]
+  edge [
+    source 4
+    target 53
+  ]
+  edge [
+    source 4
+    target 54
+  ]
+  edge [
+    source 4
+    target 55
+  ]
+  edge [
+    source 4
+    target 56
+  ]
+  edge [
+    source 4
+    target 57
+  ]
+  edge [
+    source 4
+    target 58
+  ]
+  edge [
+    source 4
+    target 59
+  ]
+  edge [
+    source 4
+    target 60
+  ]
+  edge [
+    source 4
+    target 61
+  ]
+  edge [
+    source 4
+    target 62
+  ]
+  edge [
+    source 4
+    target 63
+  ]
+  edge [
+    source 4
+    target 64
+  ]
+  edge [
+    source 4
+    target 65
+  ]
+  edge [
+    source 4
+    target 66
+  ]
+  edge [
+    source 4
+    target 67
+  ]
+  edge [
+    source 4
+    target 68
+  ]
+  edge [
+    source 4
+    target 69
+  ]
+  edge [
+    source 4
+    target 70
+  ]
+  edge [
+    source 4
+    target 71
+  ]
+  edge [
+    source 4
+    target 72
+  ]
+  edge [
+    source 4
+    target 73
+  ]
+  edge [
+    source 4
+    target 74
+  ]
+  edge [
+    source 5
+    target 6
+  ]
+  edge [
+    source 5
+    target 7
+  ]
+  edge [
+    source 5
+    target 8
+  ]
+  edge [
+    source 5
+    target 9
+  ]
+  edge [
+    source 5
+    target 10
+  ]
+  edge [
+    source 5
+    target 11
+  ]
+  edge [
+    source 5
+    target 12
+  ]
+  edge [
+    source 5
+    target 13
+  ]
+  edge [
+    source 5
+    target 14
+  ]
+  edge [
+    source 5
+    target 15
+  ]
+  edge [
+    source 5
+    target 16
+  ]
+  edge [
+    source 5
+    target 17
+  ]
+  edge [
+    source 5
+    target 18
+  ]
+  edge [
+    source 5
+    target 19
+  ]
+  edge [
+    source 5
+    target 20
+  ]
+  edge [
+    source 5
+    target 21
+  ]
+  edge [
+    source 5
+    target 22
+  ]
+  edge [
+    source 5
+    target 23
+  ]
+  edge [
+    source 5
+    target 24
+  ]
+  edge [
+    source 5
+    target 25
+  ]
+  edge [
+    source 5
+    target 26
+  ]
+  edge [
+    source 5
+    target 27
+  ]
+  edge [
+    source 5
+    target 28
+  ]
+  edge [
+    source 5
+    target 29
+  ]
+  edge [
+    source 5
+    target 30
+  ]
+  edge [
+    source 5
+    target 31
+  ]
+  edge [
+    source 5
+    target 32
+  ]
+  edge [
+    source 5
+    target 33
+  ]
+  edge [
+    source 5
+    target 34
+  ]
+  edge [
+    source 5
+    target 35
+  ]
+  edge [
+    source 5
+    target 36
+  ]
+  edge [
+    source 5
+    target 37
+  ]
+  edge [
+    source 5
+    target 38
+  ]
+  edge [
+    source 5
+    target 39
+  ]
+  edge [
+    source 5
+    target 40
+  ]
+  edge [
+    source 5
+    target 41
+  ]
+  edge [
+    source 5
+    target 42
+  ]
+  edge [
+    source 5
+    target 43
+  ]
+  edge [
+    source 5
+    target 44
+  ]
+  edge [
+    source 5
+    target 45
+  ]
+  edge [
+    source 5
+    target 46
+  ]
+  edge [
+    source 5
+    target 47
+  ]
+  edge [
+    source 5
+    target 48
+  ]
+  edge [
+    source 5
+    target 49
+  ]
+  edge [
+    source 5
+    target 50
+  ]
+  edge [
+    source 5
+    target 51
+  ]
+  edge [
+    source 5
+    target 52
+  ]
+  edge [
+    source 5
+    target 53
+  ]
+  edge [
+    source 5
+    target 54
+  ]
+  edge [
+    source 5
+    target 55
+  ]
+  edge [
+    source 5
+    target 56
+  ]
+  edge [
+    source 5
+    target 57
+  ]
+  edge [
+    source 5
+    target 58
+  ]
+  edge [
+    source 5
+    target 59
+  ]
+  edge [
+    source 5
+    target 60
+  ]
+  edge [
+    source 5
+    target 61
+  ]
+  edge [
+    source 5
+    target 62
+  ]
+  edge [
+    source 5
+    target 63
+  ]
+  edge [
+    source 5
+    target 64
+  ]
+  edge [
+    source 5
+    target 65
+  ]
+  edge [
+    source 5
+    target 66
+  ]
+  edge [
+    source 5
+    target 67
+  ]
+  edge [
+    source 5
+    target 68
+  ]
+  edge [
+    source 5
+    target 69
+  ]
+  edge [
+    source 5
+    target 70
+  ]
+  edge [
+    source 5
+    target 71
+  ]
+  edge [
+    source 5
+    target 72
+  ]
+  edge [
+    source 5
+    target 73
+  ]
+  edge [
+    source 5
+    target 74
+  ]
+  edge [
+    source 6
+    target 7
+  ]
+  edge [
+    source 6
+    target 8
+  ]
+  edge [
+    source 6
+    target 9
+  ]
+  edge [
+    source 6
+    target 10
+  ]
+  edge [
+    source 6
+    target 11
+  ]
+  edge [
+    source 6
+    target 12
+  ]
+  edge [
+    source 6
+    target 13
+  ]
+  edge [
+    source 6
+    target 14
+  ]
+  edge [
+    source 6
+    target 15
+  ]
+  edge [
+    source 6
+    target 16
+  ]
+  edge [
+    source 6
+    target 17
+  ]
+  edge [
+    source 6
+    target 18
+  ]
+  edge [
+    source 6
+    target 19
+  ]
+  edge [
+    source 6
+    target 20
+  ]
+  edge [
+    source 6
+    target 21
+  ]
+  edge [
+    source 6
+    target 22
+  ]
+  edge [
+    source 6
+    target 23
+  ]
+  edge [
+    source 6
+    target 24
+  ]
+  edge [
+    source 6
+    target 25
+  ]
+  edge [
+    source 6
+    target 26
+  ]
+  edge [
+    source 6
+    target 27
+  ]
+  edge [
+    source 6
+    target 28
+  ]
+  edge [
+    source 6
+    target 29
+  ]
+  edge [
+    source 6
+    target 30
+  ]
+  edge [
+    source 6
+    target 31
+  ]
+  edge [
+    source 6
+    target 32
+  ]
+  edge [
+    source 6
+    target 33
+  ]
+  edge [
+    source 6
+    target 34
+  ]
+  edge [
+    source 6
+    target 35
+  ]
+  edge [
+    source 6
+    target 36
+  ]
+  edge [
+    source 6
+    target 37
+  ]
+  edge [
+    source 6
+    target 38
+  ]
+  edge [
+    source 6
+    target 39
+  ]
+  edge [
+    source 6
+    target 40
+  ]
+  edge [
+    source 6
+    target 41
+  ]
+  edge [
+    source 6
+    target 42
+  ]
+  edge [
+    source 6
+    target 43
+  ]
+  edge [
+    source 6
+    target 44
+  ]
+  edge [
+    source 6
+    target 45
+  ]
+  edge [
+    source 6
+    target 46
+  ]
+  edge [
+    source 6
+    target 47
+  ]
+  edge [
+    source 6
+    target 48
+  ]
+  edge [
+    source 6
+    target 49
+  ]
+  edge [
+    source 6
+    target 50
+  ]
+  edge [
+    source 6
+    target 51
+  ]
+  edge [
+    source 6
+    target 52
+  ]
+  edge [
+    source 6
+    target 53
+  ]
+  edge [
+    source 6
+    target 54
+  ]
+  edge [
+    source 6
+    target 55
+  ]
+  edge [
+    source 6
+    target 56
+  ]
+  edge [
+    source 6
+    target 57
+  ]
+  edge [
+    source 6
+    target 58
+  ]
+  edge [
+    source 6
+    target 59
+  ]
+  edge [
+    source 6
+    target 60
+  ]
+  edge [
+    source 6
+    target 61
+  ]
+  edge [
+    source 6
+    target 62
+  ]
+  edge [
+    source 6
+    target 63
+  ]
+  edge [
+    source 6
+    target 64
+  ]
+  edge [
+    source 6
+    target 65
+  ]
+  edge [
+    source 6
+    target 66
+  ]
+  edge [
+    source 6
+    target 67
+  ]
+  edge [
+    source 6
+    target 68
+  ]
+  edge [
+    source 6
+    target 69
+  ]
+  edge [
+    source 6
+    target 70
+  ]
+  edge [
+    source 6
+    target 71
+  ]
+  edge [
+    source 6
+    target 72
+  ]
+  edge [
+    source 6
+    target 73
+  ]
+  edge [
+    source 6
+    target 74
+  ]
+  edge [
+    source 7
+    target 8
+  ]
+  edge [
+    source 7
+    target 9
+  ]
+  edge [
+    source 7
+    target 10
+  ]
+  edge [
+    source 7
+    target 11
+  ]
+  edge [
+    source 7
+    target 12
+  ]
+  edge [
+    source 7
+    target 13
+  ]
+  edge [
+    source 7
+    target 14
+  ]
+  edge [
+    source 7
+    target 15
+  ]
+  edge [
+    source 7
+    target 16
+  ]
+  edge [
+    source 7
+    target 17
+  ]
+  edge [
+    source 7
+    target 18
+  ]
+  edge [
+    source 7
+    target 19
+  ]
+  edge [
+    source 7
+    target 20
+  ]
+  edge [
+    source 7
+    target 21
+  ]
+  edge [
+    source 7
+    target 22
+  ]
+  edge [
+    source 7
+    target 23
+  ]
+  edge [
+    source 7
+    target 24
+  ]
+  edge [
+    source 7
+    target 25
+  ]
+  edge [
+    source 7
+    target 26
+  ]
+  edge [
+    source 7
+    target 27
+  ]
+  edge [
+    source 7
+    target 28
+  ]
+  edge [
+    source 7
+    target 29
+  ]
+  edge [
+    source 7
+    target 30
+  ]
+  edge [
+    source 7
+    target 31
+  ]
+  edge [
+    source 7
+    target 32
+  ]
+  edge [
+    source 7
+    target 33
+  ]
+  edge [
+    source 7
+    target 34
+  ]
+  edge [
+    source 7
+    target 35
+  ]
+  edge [
+    source 7
+    target 36
+  ]
+  edge [
+    source 7
+    target 37
+  ]
+  edge [
+    source 7
+    target 38
+  ]
+  edge [
+    source 7
+    target 39
+  ]
+  edge [
+    source 7
+    target 40
+  ]
+  edge [
+    source 7
+    target 41
+  ]
+  edge [
+    source 7
+    target 42
+  ]
+  edge [
+    source 7
+    target 43
+  ]
+  edge [
+    source 7
+    target 44
+  ]
+  edge [
+    source 7
+    target 45
+  ]
+  edge [
+    source 7
+    target 46
+  ]
+  edge [
+    source 7
+    target 47
+  ]
+  edge [
+    source 7
+    target 48
+  ]
+  edge [
+    source 7
+    target 49
+  ]
+  edge [
+    source 7
+    target 50
+  ]
+  edge [
+    source 7
+    target 51
+  ]
+  edge [
+    source 7
+    target 52
+  ]
+  edge [
+    source 7
+    target 53
+  ]
+  edge [
+    source 7
+    target 54
+  ]
+  edge [
+    source 7
+    target 55
+  ]
+  edge [
+    source 7
+    target 56
+  ]
+  edge [
+    source 7
+    target 57
+  ]
+  edge [
+    source 7
+    target 58
+  ]
+  edge [
+    source 7
+    target 59
+  ]
+  edge [
+    source 7
+    target 60
+  ]
+  edge [
+    source 7
+    target 61
+  ]
+  edge [
+    source 7
+    target 62
+  ]
+  edge [
+    source 7
+    target 63
+  ]
+  edge [
+    source 7
+    target 64
+  ]
+  edge [
+    source 7
+    target 65
+  ]
+  edge [
+    source 7
+    target 66
+  ]
+  edge [
+    source 7
+    target 67
+  ]
+  edge [
+    source 7
+    target 68
+  ]
+  edge [
+    source 7
+    target 69
+  ]
+  edge [
+    source 7
+    target 70
+  ]
+  edge [
+    source 7
+    target 71
+  ]
+  edge [
+    source 7
+    target 72
+  ]
+  edge [
+    source 7
+    target 73
+  ]
+  edge [
+    source 7
+    target 74
+  ]
+  edge [
+    source 8
+    target 9
+  ]
+  edge [
+    source 8
+    target 10
+  ]
+  edge [
+    source 8
+    target 11
+  ]
+  edge [
+    source 8
+    target 12
+  ]
+  edge [
+    source 8
+    target 13
+  ]
+  edge [
+    source 8
+    target 14
+  ]
+  edge [
+    source 8
+    target 15
+  ]
+  edge [
+    source 8
+    target 16
+  ]
+  edge [
+    source 8
+    target 17
+  ]
+  edge [
+    source 8
+    target 18
+  ]
+  edge [
+    source 8
+    target 19
+  ]
+  edge [
+    source 8
+    target 20
+  ]
+  edge [
+    source 8
+    target 21
+  ]
+  edge [
+    source 8
+    target 22
+  ]
+  edge [
+    source 8
+    target 23
+  ]
+  edge [
+    source 8
+    target 24
+  ]
+  edge [
+    source 8
+    target 25
+  ]
+  edge [
+    source 8
+    target 26
+  ]
+  edge [
+    source 8
+    target 27
+  ]
+  edge [
+    source 8
+    target 28
+  ]
+  edge [
+    source 8
+    target 29
+  ]
+  edge [
+    source 8
+    target 30
+  ]
+  edge [
+    source 8
+    target 31
+  ]
+  edge [
+    source 8
+    target 32
+  ]
+  edge [
+    source 8
+    target 33
+  ]
+  edge [
+    source 8
+    target 34
+  ]
+  edge [
+    source 8
+    target 35
+  ]
+  edge [
+    source 8
+    target 36
+  ]
+  edge [
+    source 8
+    target 37
+  ]
+  edge [
+    source 8
+    target 38
+  ]
+  edge [
+    source 8
+    target 39
+  ]
+  edge [
+    source 8
+    target 40
+  ]
+  edge [
+    source 8
+    target 41
+  ]
+  edge [
+    source 8
+    target 42
+  ]
+  edge [
+    source 8
+    target 43
+  ]
+  edge [
+    source 8
+    target 44
+  ]
+  edge [
+    source 8
+    target 45
+  ]
+  edge [
+    source 8
+    target 46
+  ]
+  edge [
+    source 8
+    target 47
+  ]
+  edge [
+    source 8
+    target 48
+  ]
+  edge [
+    source 8
+    target 49
+  ]
+  edge [
+    source 8
+    target 50
+  ]
+  edge [
+    source 8
+    target 51
+  ]
+  edge [
+    source 8
+    target 52
+  ]
+  edge [
+    source 8
+    target 53
+  ]
+  edge [
+    source 8
+    target 54
+  ]
+  edge [
+    source 8
+    target 55
+  ]
+  edge [
+    source 8
+    target 56
+  ]
+  edge [
+    source 8
+    target 57
+  ]
+  edge [
+    source 8
+    target 58
+  ]
+  edge [
+    source 8
+    target 59
+  ]
+  edge [
+    source 8
+    target 60
+  ]
+  edge [
+    source 8
+    target 61
+  ]
+  edge [
+    source 8
+    target 62
+  ]
+  edge [
+    source 8
+    target 63
+  ]
+  edge [
+    source 8
+    target 64
+  ]
+  edge [
+    source 8
+    target 65
+  ]
+  edge [
+    source 8
+    target 66
+  ]
+  edge [
+    source 8
+    target 67
+  ]
+  edge [
+    source 8
+    target 68
+  ]
+  edge [
+    source 8
+    target 69
+  ]
+  edge [
+    source 8
+    target 70
+  ]
+  edge [
+    source 8
+    target 71
+  ]
+  edge [
+    source 8
+    target 72
+  ]
+  edge [
+    source 8
+    target 73
+  ]
+  edge [
+    source 8
+    target 74
+  ]
+  edge [
+    source 9
+    target 10
+  ]
+  edge [
+    source 9
+    target 11
+  ]
+  edge [
+    source 9
+    target 12
+  ]
+  edge [
+    source 9
+    target 13
+  ]
+  edge [
+    source 9
+    target 14
+  ]
+  edge [
+    source 9
+    target 15
+  ]
+  edge [
+    source 9
+    target 16
+  ]
+  edge [
+    source 9
+    target 17
+  ]
+  edge [
+    source 9
+    target 18
+  ]
+  edge [
+    source 9
+    target 19
+  ]
+  edge [
+    source 9
+    target 20
+  ]
+  edge [
+    source 9
+    target 21
+  ]
+  edge [
+    source 9
+    target 22
+  ]
+  edge [
+    source 9
+    target 23
+  ]
+  edge [
+    source 9
+    target 24
+  ]
+  edge [
+    source 9
+    target 25
+  ]
+  edge [
+    source 9
+    target 26
+  ]
+  edge [
+    source 9
+    target 27
+  ]
+  edge [
+    source 9
+    target 28
+  ]
+  edge [
+    source 9
+    target 29
+  ]
+  edge [
+    source 9
+    target 30
+  ]
+  edge [
+    source 9
+    target 31
+  ]
+  edge [
+    source 9
+    target 32
+  ]
+  edge [
+    source 9
+    target 33
+  ]
+  edge [
+    source 9
+    target 34
+  ]
+  edge [
+    source 9
+    target 35
+  ]
+  edge [
+    source 9
+    target 36
+  ]
+  edge [
+    source 9
+    target 37
+  ]
+  edge [
+    source 9
+    target 38
+  ]
+  edge [
+    source 9
+    target 39
+  ]
+  edge [
+    source 9
+    target 40
+  ]
+  edge [
+    source 9
+    target 41
+  ]
+  edge [
+    source 9
+    target 42
+  ]
+  edge [
+    source 9
+    target 43
+  ]
+  edge [
+    source 9
+    target 44
+  ]
+  edge [
+    source 9
+    target 45
+  ]
+  edge [
+    source 9
+    target 46
+  ]
+  edge [
+    source 9
+    target 47
+  ]
+  edge [
+    source 9
+    target 48
+  ]
+  edge [
+    source 9
+    target 49
+  ]
+  edge [
+    source 9
+    target 50
+  ]
+  edge [
+    source 9
+    target 51
+  ]
+  edge [
+    source 9
+    target 52
+  ]
+  edge [
+    source 9
+    target 53
+  ]
+  edge [
+    source 9
+    target 54
+  ]
+  edge [
+    source 9
+    target 55
+  ]
+  edge [
+    source 9
+    target 56
+  ]
+  edge [
+    source 9
+    target 57
+  ]
+  edge [
+    source 9
+    target 58
+  ]
+  edge [
+    source 9
+    target 59
+  ]
+  edge [
+    source 9
+    target 60
+  ]
+  edge [
+    source 9
+    target 61
+  ]
+  edge [
+    source 9
+    target 62
+  ]
+  edge [
+    source 9
+    target 63
+  ]
+  edge [
+    source 9
+    target 64
+  ]
+  edge [
+    source 9
+    target 65
+  ]
+  edge [
+    source 9
+    target 66
+  ]
+  edge [
+    source 9
+    target 67
+  ]
+  edge [
+    source 9
+    target 68
+  ]
+  edge [
+    source 9
+    target 69
+  ]
+  edge [
+    source 9
+    target 70
+  ]
+  edge [
+    source 9
+    target 71
+  ]
+  edge [
+    source 9
+    target 72
+  ]
+  edge [
+    source 9
+    target 73
+  ]
+  edge [
+    source 9
+    target 74
+  ]
+  edge [
+    source 10
+    target 11
+  ]
+  edge [
+    source 10
+    target 12
+  ]
+  edge [
+    source 10
+    target 13
+  ]
+  edge [
+    source 10
+    target 14
+  ]
+  edge [
+    source 10
+    target 15
+  ]
+  edge [
+    source 10
+    target 16
+  ]
+  edge [
+    source 10
+    target 17
+  ]
+  edge [
+    source 10
+    target 18
+  ]
+  edge [
+    source 10
+    target 19
+  ]
+  edge [
+    source 10
+    target 20
+  ]
+  edge [
+    source 10
+    target 21
+  ]
+  edge [
+    source 10
+    target 22
+  ]
+  edge [
+    source 10
+    target 23
+  ]
+  edge [
+    source 10
+    target 24
+  ]
+  edge [
+    source 10
+    target 25
+  ]
+  edge [
+    source 10
+    target 26
+  ]
+  edge [
+    source 10
+    target 27
+  ]
+  edge [
+    source 10
+    target 28
+  ]
+  edge [
+    source 10
+    target 29
+  ]
+  edge [
+    source 10
+    target 30
+  ]
+  edge [
+    source 10
+    target 31
+  ]
+  edge [
+    source 10
+    target 32
+  ]
+  edge [
+    source 10
+    target 33
+  ]
+  edge [
+    source 10
+    target 34
+  ]
+  edge [
+    source 10
+    target 35
+  ]
+  edge [
+    source 10
+    target 36
+  ]
+  edge [
+    source 10
+    target 37
+  ]
+  edge [
+    source 10
+    target 38
+  ]
+  edge [
+    source 10
+    target 39
+  ]
+  edge [
+    source 10
+    target 40
+  ]
+  edge [
+    source 10
+    target 41
+  ]
+  edge [
+    source 10
+    target 42
+  ]
+  edge [
+    source 10
+    target 43
+  ]
+  edge [
+    source 10
+    target 44
+  ]
+  edge [
+    source 10
+    target 45
+  ]
+  edge [
+    source 10
+    target 46
+  ]
+  edge [
+    source 10
+    target 47
+  ]
+  edge [
+    source 10
+    target 48
+  ]
+  edge [
+    source 10
+    target 49
+  ]
+  edge [
+    source 10
+    target 50
+  ]
+  edge [
+    source 10
+    target 51
+  ]
+  edge [
+    source 10
+    target 52
+  ]
+  edge [
+    source 10
+    target 53
+  ]
+  edge [
+    source 10
+    target 54
+  ]
+  edge [
+    source 10
+    target 55
+  ]
+  edge [
+    source 10
+    target 56
+  ]
+  edge [
+    source 10
+    target 57
+  ]
+  edge [
+    source 10
+    target 58
+  ]
+  edge [
+    source 10
+    target 59
+  ]
+  edge [
+    source 10
+    target 60
+  ]
+  edge [
+    source 10
+    target 61
+  ]
+  edge [
+    source 10
+    target 62
+  ]
+  edge [
+    source 10
+    target 63
+  ]
+  edge [
+    source 10
+    target 64
+  ]
+  edge [
+    source 10
+    target 65
+  ]
+  edge [
+    source 10
+    target 66
+  ]
+  edge [
+    source 10
+    target 67
+  ]
+  edge [
+    source 10
+    target 68
+  ]
+  edge [
+    source 10
+    target 69
+  ]
+  edge [
+    source 10
+    target 70
+  ]
+  edge [
+    source 10
+    target 71
+  ]
+  edge [
+    source 10
+    target 72
+  ]
+  edge [
+    source 10
+    target 73
+  ]
+  edge [
+    source 10
+    target 74
+  ]
+  edge [
+    source 11
+    target 12
+  ]
+  edge [
+    source 11
+    target 13
+  ]
+  edge [
+    source 11
+    target 14
+  ]
+  edge [
+    source 11
+    target 15
+  ]
+  edge [
+    source 11
+    target 16
+  ]
+  edge [
+    source 11
+    target 17
+  ]
+  edge [
+    source 11
+    target 18
+  ]
+  edge [
+    source 11
+    target 19
+  ]
+  edge [
+    source 11
+    target 20
+  ]
+  edge [
+    source 11
+    target 21
+  ]
+  edge [
+    source 11
+    target 22
+  ]
+  edge [
+    source 11
+    target 23
+  ]
+  edge [
+    source 11
+    target 24
+  ]
+  edge [
+    source 11
+    target 25
+  ]
+  edge [
+    source 11
+    target 26
+  ]
+  edge [
+    source 11
+    target 27
+  ]
+  edge [
+    source 11
+    target 28
+  ]
+  edge [
+    source 11
+    target 29
+  ]
+  edge [
+    source 11
+    target 30
+  ]
+  edge [
+    source 11
+    target 31
+  ]
+  edge [
+    source 11
+    target 32
+  ]
+  edge [
+    source 11
+    target 33
+  ]
+  edge [
+    source 11
+    target 34
+  ]
+  edge [
+    source 11
+    target 35
+  ]
+  edge [
+    source 11
+    target 36
+  ]
+  edge [
+    source 11
+    target 37
+  ]
+  edge [
+    source 11
+    target 38
+  ]
+  edge [
+    source 11
+    target 39
+  ]
+  edge [
+    source 11
+    target 40
+  ]
+  edge [
+    source 11
+    target 41
+  ]
+  edge [
+    source 11
+    target 42
+  ]
+  edge [
+    source 11
+    target 43
+  ]
+  edge [
+    source 11
+    target 44
+  ]
+  edge [
+    source 11
+    target 45
+  ]
+  edge [
+    source 11
+    target 46
+  ]
+  edge [
+    source 11
+    target 47
+  ]
+  edge [
+    source 11
+    target 48
+  ]
+  edge [
+    source 11
+    target 49
+  ]
+  edge [
+    source 11
+    target 50
+  ]
+  edge [
+    source 11
+    target 51
+  ]
+  edge [
+    source 11
+    target 52
+  ]
+  edge [
+    source 11
+    target 53
+  ]
+  edge [
+    source 11
+    target 54
+  ]
+  edge [
+    source 11
+    target 55
+  ]
+  edge [
+    source 11
+    target 56
+  ]
+  edge [
+    source 11
+    target 57
+  ]
+  edge [
+    source 11
+    target 58
+  ]
+  edge [
+    source 11
+    target 59
+  ]
+  edge [
+    source 11
+    target 60
+  ]
+  edge [
+    source 11
+    target 61
+  ]
+  edge [
+    source 11
+    target 62
+  ]
+  edge [
+    source 11
+    target 63
+  ]
+  edge [
+    source 11
+    target 64
+  ]
+  edge [
+    source 11
+    target 65
+  ]
+  edge [
+    source 11
+    target 66
+  ]
+  edge [
+    source 11
+    target 67
+  ]
+  edge [
+    source 11
+    target 68
+  ]
+  edge [
+    source 11
+    target 69
+  ]
+  edge [
+    source 11
+    target 70
+  ]
+  edge [
+    source 11
+    target 71
+  ]
+  edge [
+    source 11
+    target 72
+  ]
+  edge [
+    source 11
+    target 73
+  ]
+  edge [
+    source 11
+    target 74
+  ]
+  edge [
+    source 12
+    target 13
+  ]
+  edge [
+    source 12
+    target 14
+  ]
+  edge [
+    source 12
+    target 15
+  ]
+  edge [
+    source 12
+    target 16
+  ]
+  edge [
+    source 12
+    target 17
+  ]
+  edge [
+    source 12
+    target 18
+  ]
+  edge [
+    source 12
+    target 19
+  ]
+  edge [
+    source 12
+    target 20
+  ]
+  edge [
+    source 12
+    target 21
+  ]
+  edge [
+    source 12
+    target 22
+  ]
+  edge [
+    source 12
+    target 23
+  ]
+  edge [
+    source 12
+    target 24
+  ]
+  edge [
+    source 12
+    target 25
+  ]
+  edge [
+    source 12
+    target 26
+  ]
+  edge [
+    source 12
+    target 27
+  ]
+  edge [
+    source 12
+    target 28
+  ]
+  edge [
+    source 12
+    target 29
+  ]
+  edge [
+    source 12
+    target 30
+  ]
+  edge [
+    source 12
+    target 31
+  ]
+  edge [
+    source 12
+    target 32
+  ]
+  edge [
+    source 12
+    target 33
+  ]
+  edge [
+    source 12
+    target 34
+  ]
+  edge [
+    source 12
+    target 35
+  ]
+  edge [
+    source 12
+    target 36
+  ]
+  edge [
+    source 12
+    target 37
+  ]
+  edge [
+    source 12
+    target 38
+  ]
+  edge [
+    source 12
+    target 39
+  ]
+  edge [
+    source 12
+    target 40
+  ]
+  edge [
+    source 12
+    target 41
+  ]
+  edge [
+    source 12
+    target 42
+  ]
+  edge [
+    source 12
+    target 43
+  ]
+  edge [
+    source 12
+    target 44
+  ]
+  edge [
+    source 12
+    target 45
+  ]
+  edge [
+    source 12
+    target 46
+  ]
+  edge [
+    source 12
+    target 47
+  ]
+  edge [
+    source 12
+    target 48
+  ]
+  edge [
+    source 12
+    target 49
+  ]
+  edge [
+    source 12
+    target 50
+  ]
+  edge [
+    source 12
+    target 51
+  ]
+  edge [
+    source 12
+    target 52
+  ]
+  edge [
+    source 12
+    target 53
+  ]
+  edge [
+    source 12
+    target 54
+  ]
+  edge [
+    source 12
+    target 55
+  ]
+  edge [
+    source 12
+    target 56
+  ]
+  edge [
+    source 12
+    target 57
+  ]
+  edge [
+    source 12
+    target 58
+  ]
+  edge [
+    source 12
+    target 59
+  ]
+  edge [
+    source 12
+    target 60
+  ]
+  edge [
+    source 12
+    target 61
+  ]
+  edge [
+    source 12
+    target 62
+  ]
+  edge [
+    source 12
+    target 63
+  ]
+  edge [
+    source 12
+    target 64
+  ]
+  edge [
+    source 12
+    target 65
+  ]
+  edge [
+    source 12
+    target 66
+  ]
+  edge [
+    source 12
+    target 67
+  ]
+  edge [
+    source 12
+    target 68
+  ]
+  edge [
+    source 12
+    target 69
+  ]
+  edge [
+    source 12
+    target 70
+  ]
+  edge [
+    source 12
+    target 71
+  ]
+  edge [
+    source 12
+    target 72
+  ]
+  edge [
+    source 12
+    target 73
+  ]
+  edge [
+    source 12
+    target 74
+  ]
+  edge [
+    source 13
+    target 14
+  ]
+  edge [
+    source 13
+    target 15
+  ]
+  edge [
+    source 13
+    target 16
+  ]
+  edge [
+    source 13
+    target 17
+  ]
+  edge [
+    source 13
+    target 18
+  ]
+  edge [
+    source 13
+    target 19
+  ]
+  edge [
+    source 13
+    target 20
+  ]
+  edge [
+    source 13
+    target 21
+  ]
+  edge [
+    source 13
+    target 22
+  ]
+  edge [
+    source 13
+    target 23
+  ]
+  edge [
+    source 13
+    target 24
+  ]
+  edge [
+    source 13
+    target 25
+  ]
+  edge [
+    source 13
+    target 26
+  ]
+  edge [
+    source 13
+    target 27
+  ]
+  edge [
+    source 13
+    target 28
+  ]
+  edge [
+    source 13
+    target 29
+  ]
+  edge [
+    source 13
+    target 30
+  ]
+  edge [
+    source 13
+    target 31
+  ]
+  edge [
+    source 13
+    target 32
+  ]
+  edge [
+    source 13
+    target 33
+  ]
+  edge [
+    source 13
+    target 34
+  ]
+  edge [
+    source 13
+    target 35
+  ]
+  edge [
+    source 13
+    target 36
+  ]
+  edge [
+    source 13
+    target 37
+  ]
+  edge [
+    source 13
+    target 38
+  ]
+  edge [
+    source 13
+    target 39
+  ]
+  edge [
+    source 13
+    target 40
+  ]
+  edge [
+    source 13
+    target 41
+  ]
+  edge [
+    source 13
+    target 42
+  ]
+  edge [
+    source 13
+    target 43
+  ]
+  edge [
+    source 13
+    target 44
+  ]
+  edge [
+    source 13
+    target 45
+  ]
+  edge [
+    source 13
+    target 46
+  ]
+  edge [
+    source 13
+    target 47
+  ]
+  edge [
+    source 13
+    target 48
+  ]
+  edge [
+    source 13
+    target 49
+  ]
+  edge [
+    source 13
+    target 50
+  ]
+  edge [
+    source 13
+    target 51
+  ]
+  edge [
+    source 13
+    target 52
+  ]
+  edge [
+    source 13
+    target 53
+  ]
+  edge [
+    source 13
+    target 54
+  ]
+  edge [
+    source 13
+    target 55
+  ]
+  edge [
+    source 13
+    target 56
+  ]
+  edge [
+    source 13
+    target 57
+  ]
+  edge [
+    source 13
+    target 58
+  ]
+  edge [
+    source 13
+    target 59
+  ]
+  edge [
+    source 13
+    target 60
+  ]
+  edge [
+    source 13
+    target 61
+  ]
+  edge [
+    source 13
+    target 62
+  ]
+  edge [
+    source 13
+    target 63
+  ]
+  edge [
+    source 13
+    target 64
+  ]
+  edge [
+    source 13
+    target 65
+  ]
+  edge [
+    source 13
+    target 66
+  ]
+  edge [
+    source 13
+    target 67
+  ]
+  edge [
+    source 13
+    target 68
+  ]
+  edge [
+    source 13
+    target 69
+  ]
+  edge [
+    source 13
+    target 70
+  ]
+  edge [
+    source 13
+    target 71
+  ]
+  edge [
+    source 13
+    target 72
+  ]
+  edge [
+    source 13
+    target 73
+  ]
+  edge [
+    source 13
+    target 74
+  ]
+  edge [
+    source 14
+    target 15
+  ]
+  edge [
+    source 14
+    target 16
+  ]
+  edge [
+    source 14
+    target 17
+  ]
+  edge [
+    source 14
+    target 18
+  ]
+  edge [
+    source 14
+    target 19
+  ]
+  edge [
+    source 14
+    target 20
+  ]
+  edge [
+    source 14
+    target 21
+  ]
+  edge [
+    source 14
+    target 22
+  ]
+  edge [
+    source 14
+    target 23
+  ]
+  edge [
+    source 14
+    target 24
+  ]
+  edge [
+    source 14
+    target 25
+  ]
+  edge [
+    source 14
+    target 26
+  ]
+  edge [
+    source 14
+    target 27
+  ]
+  edge [
+    source 14
+    target 28
+  ]
+  edge [
+    source 14
+    target 29
+  ]
+  edge [
+    source 14
+    target 30
+  ]
+  edge [
+    source 14
+    target 31
+  ]
+  edge [
+    source 14
+    target 32
+  ]
+  edge [
+    source 14
+    target 33
+  ]
+  edge [
+    source 14
+    target 34
+  ]
+  edge [
+    source 14
+    target 35
+  ]
+  edge [
+    source 14
+    target 36
+  ]
+  edge [
+    source 14
+    target 37
+  ]
+  edge [
+    source 14
+    target 38
+  ]
+  edge [
+    source 14
+    target 39
+  ]
+  edge [
+    source 14
+    target 40
+  ]
+  edge [
+    source 14
+    target 41
+  ]
+  edge [
+    source 14
+    target 42
+  ]
+  edge [
+    source 14
+    target 43
+  ]
+  edge [
+    source 14
+    target 44
+  ]
+  edge [
+    source 14
+    target 45
+  ]
+  edge [
+    source 14
+    target 46
+  ]
+  edge [
+    source 14
+    target 47
+  ]
+  edge [
+    source 14
+    target 48
+  ]
+  edge [
+    source 14
+    target 49
+  ]
+  edge [
+    source 14
+    target 50
+  ]
+  edge [
+    source 14
+    target 51
+  ]
+  edge [
+    source 14
+    target 52
+  ]
+  edge [
+    source 14
+    target 53
+  ]
+  edge [
+    source 14
+    target 54
+  ]
+  edge [
+    source 14
+    target 55
+  ]
+  edge [
+    source 14
+    target 56
+  ]
+  edge [
+    source 14
+    target 57
+  ]
+  edge [
+    source 14
+    target 58
+  ]
+  edge [
+    source 14
+    target 59
+  ]
+  edge [
+    source 14
+    target 60
+  ]
+  edge [
+    source 14
+    target 61
+  ]
+  edge [
+    source 14
+    target 62
+  ]
+  edge [
+    source 14
+    target 63
+  ]
+  edge [
+    source 14
+    target 64
+  ]
+  edge [
+    source 14
+    target 65
+  ]
+  edge [
+    source 14
+    target 66
+  ]
+  edge [
+    source 14
+    target 67
+  ]
+  edge [
+    source 14
+    target 68
+  ]
+  edge [
+    source 14
+    target 69
+  ]
+  edge [
+    source 14
+    target 70
+  ]
+  edge [
+    source 14
+    target 71
+  ]
+  edge [
+    source 14
+    target 72
+  ]
+  edge [
+    source 14
+    target 73
+  ]
+  edge [
+    source 14
+    target 74
+  ]
+  edge [
+    source 15
+    target 16
+  ]
+  edge [
+    source 15
+    target 17
+  ]
+  edge [
+    source 15
+    target 18
+  ]
+  edge [
+    source 15
+    target 19
+  ]
+  edge [
+    source 15
+    target 20
+  ]
+  edge [
+    source 15
+    target 21
+  ]
+  edge [
+    source 15
+    target 22
+  ]
+  edge [
+    source 15
+    target 23
+  ]
+  edge [
+    source 15
+    target 24
+  ]
+  edge [
+    source 15
+    target 25
+  ]
+  edge [
+    source 15
+    target 26
+  ]
+  edge [
+    source 15
+    target 27
+  ]
+  edge [
+    source 15
+    target 28
+  ]
+  edge [
+    source 15
+    target 29
+  ]
+  edge [
+    source 15
+    target 30
+  ]
+  edge [
+    source 15
+    target 31
+  ]
+  edge [
+    source 15
+    target 32
+  ]
+  edge [
+    source 15
+    target 33
+  ]
+  edge [
+    source 15
+    target 34
+  ]
+  edge [
+    source 15
+    target 35
+  ]
+  edge [
+    source 15
+    target 36
+  ]
+  edge [
+    source 15
+    target 37
+  ]
+  edge [
+    source 15
+    target 38
+  ]
+  edge [
+    source 15
+    target 39
+  ]
+  edge [
+    source 15
+    target 40
+  ]
+  edge [
+    source 15
+    target 41
+  ]
+  edge [
+    source 15
+    target 42
+  ]
+  edge [
+    source 15
+    target 43
+  ]
+  edge [
+    source 15
+    target 44
+  ]
+  edge [
+    source 15
+    target 45
+  ]
+  edge [
+    source 15
+    target 46
+  ]
+  edge [
+    source 15
+    target 47
+  ]
+  edge [
+    source 15
+    target 48
+  ]
+  edge [
+    source 15
+    target 49
+  ]
+  edge [
+    source 15
+    target 50
+  ]
+  edge [
+    source 15
+    target 51
+  ]
+  edge [
+    source 15
+    target 52
+  ]
+  edge [
+    source 15
+    target 53
+  ]
+  edge [
+    source 15
+    target 54
+  ]
+  edge [
+    source 15
+    target 55
+  ]
+  edge [
+    source 15
+    target 56
+  ]
+  edge [
+    source 15
+    target 57
+  ]
+  edge [
+    source 15
+    target 58
+  ]
+  edge [
+    source 15
+    target 59
+  ]
+  edge [
+    source 15
+    target 60
+  ]
+  edge [
+    source 15
+    target 61
+  ]
+  edge [
+    source 15
+    target 62
+  ]
+  edge [
+    source 15
+    target 63
+  ]
+  edge [
+    source 15
+    target 64
+  ]
+  edge [
+    source 15
+    target 65
+  ]
+  edge [
+    source 15
+    target 66
+  ]
+  edge [
+    source 15
+    target 67
+  ]
+  edge [
+    source 15
+    target 68
+  ]
+  edge [
+    source 15
+    target 69
+  ]
+  edge [
+    source 15
+    target 70
+  ]
+  edge [
+    source 15
+    target 71
+  ]
+  edge [
+    source 15
+    target 72
+  ]
+  edge [
+    source 15
+    target 73
+  ]
+  edge [
+    source 15
+    target 74
+  ]
+  edge [
+    source 16
+    target 17
+  ]
+  edge [
+    source 16
+    target 18
+  ]
+  edge [
+    source 16
+    target 19
+  ]
+  edge [
+    source 16
+    target 20
+  ]
+  edge [
+    source 16
+    target 21
+  ]
+  edge [
+    source 16
+    target 22
+  ]
+  edge [
+    source 16
+    target 23
+  ]
+  edge [
+    source 16
+    target 24
+  ]
+  edge [
+    source 16
+    target 25
+  ]
+  edge [
+    source 16
+    target 26
+  ]
+  edge [
+    source 16
+    target 27
+  ]
+  edge [
+    source 16
+    target 28
+  ]
+  edge [
+    source 16
+    target 29
+  ]
+  edge [
+    source 16
+    target 30
+  ]
+  edge [
+    source 16
+    target 31
+  ]
+  edge [
+    source 16
+    target 32
+  ]
+  edge [
+    source 16
+    target 33
+  ]
+  edge [
+    source 16
+    target 34
+  ]
+  edge [
+    source 16
+    target 35
+  ]
+  edge [
+    source 16
+    target 36
+  ]
+  edge [
+    source 16
+    target 37
+  ]
+  edge [
+    source 16
+    target 38
+  ]
+  edge [
+    source 16
+    target 39
+  ]
+  edge [
+    source 16
+    target 40
+  ]
+  edge [
+    source 16
+    target 41
+  ]
+  edge [
+    source 16
+    target 42
+  ]
+  edge [
+    source 16
+    target 43
+  ]
+  edge [
+    source 16
+    target 44
+  ]
+  edge [
+    source 16
+    target 45
+  ]
+  edge [
+    source 16
+    target 46
+  ]
+  edge [
+    source 16
+    target 47
+  ]
+  edge [
+    source 16
+    target 48
+  ]
+  edge [
+    source 16
+    target 49
+  ]
+  edge [
+    source 16
+    target 50
+  ]
+  edge [
+    source 16
+    target 51
+  ]
+  edge [
+    source 16
+    target 52
+  ]
+  edge [
+    source 16
+    target 53
+  ]
+  edge [
+    source 16
+    target 54
+  ]
+  edge [
+    source 16
+    target 55
+  ]
+  edge [
+    source 16
+    target 56
+  ]
+  edge [
+    source 16
+    target 57
+  ]
+  edge [
+    source 16
+    target 58
+  ]
+  edge [
+    source 16
+    target 59
+  ]
+  edge [
+    source 16
+    target 60
+  ]
+  edge [
+    source 16
+    target 61
+  ]
+  edge [
+    source 16
+    target 62
+  ]
+  edge [
+    source 16
+    target 63
+  ]
+  edge [
+    source 16
+    target 64
+  ]
+  edge [
+    source 16
+    target 65
+  ]
+  edge [
+    source 16
+    target 66
+  ]
+  edge [
+    source 16
+    target 67
+  ]
+  edge [
+    source 16
+    target 68
+  ]
+  edge [
+    source 16
+    target 69
+  ]
+  edge [
+    source 16
+    target 70
+  ]
+  edge [
+    source 16
+    target 71
+  ]
+  edge [
+    source 16
+    target 72
+  ]
+  edge [
+    source 16
+    target 73
+  ]
+  edge [
+    source 16
+    target 74
+  ]
+  edge [
+    source 17
+    target 18
+  ]
+  edge [
+    source 17
+    target 19
+  ]
+  edge [
+    source 17
+    target 20
+  ]
+  edge [
+    source 17
+    target 21
+  ]
+  edge [
+    source 17
+    target 22
+  ]
+  edge [
+    source 17
+    target 23
+  ]
+  edge [
+    source 17
+    target 24
+  ]
+  edge [
+    source 17
+    target 25
+  ]
+  edge [
+    source 17
+    target 26
+  ]
+  edge [
+    source 17
+    target 27
+  ]
+  edge [
+    source 17
+    target 28
+  ]
+  edge [
+    source 17
+    target 29
+  ]
+  edge [
+    source 17
+    target 30
+  ]
+  edge [
+    source 17
+    target 31
+  ]
+  edge [
+    source 17
+    target 32
+  ]
+  edge [
+    source 17
+    target 33
+  ]
+  edge [
+    source 17
+    target 34
+  ]
+  edge [
+    source 17
+    target 35
+  ]
+  edge [
+    source 17
+    target 36
+  ]
+  edge [
+    source 17
+    target 37
+  ]
+  edge [
+    source 17
+    target 38
+  ]
+  edge [
+    source 17
+    target 39
+  ]
+  edge [
+    source 17
+    target 40
+  ]
+  edge [
+    source 17
+    target 41
+  ]
+  edge [
+    source 17
+    target 42
+  ]
+  edge [
+    source 17
+    target 43
+  ]
+  edge [
+    source 17
+    target 44
+  ]
+  edge [
+    source 17
+    target 45
+  ]
+  edge [
+    source 17
+    target 46
+  ]
+  edge [
+    source 17
+    target 47
+  ]
+  edge [
+    source 17
+    target 48
+  ]
+  edge [
+    source 17
+    target 49
+  ]
+  edge [
+    source 17
+    target 50
+  ]
+  edge [
+    source 17
+    target 51
+  ]
+  edge [
+    source 17
+    target 52
+  ]
+  edge [
+    source 17
+    target 53
+  ]
+  edge [
+    source 17
+    target 54
+  ]
+  edge [
+    source 17
+    target 55
+  ]
+  edge [
+    source 17
+    target 56
+  ]
+  edge [
+    source 17
+    target 57
+  ]
+  edge [
+    source 17
+    target 58
+  ]
+  edge [
+    source 17
+    target 59
+  ]
+  edge [
+    source 17
+    target 60
+  ]
+  edge [
+    source 17
+    target 61
+  ]
+  edge [
+    source 17
+    target 62
+  ]
+  edge [
+    source 17
+    target 63
+  ]
+  edge [
+    source 17
+    target 64
+  ]
+  edge [
+    source 17
+    target 65
+  ]
+  edge [
+    source 17
+    target 66
+  ]
+  edge [
+    source 17
+    target 67
+  ]
+  edge [
+    source 17
+    target 68
+  ]
+  edge [
+    source 17
+    target 69
+  ]
+  edge [
+    source 17
+    target 70
+  ]
+  edge [
+    source 17
+    target 71
+  ]
+  edge [
+    source 17
+    target 72
+  ]
+  edge [
+    source 17
+    target 73
+  ]
+  edge [
+    source 17
+    target 74
+  ]
+  edge [
+    source 18
+    target 19
+  ]
+  edge [
+    source 18
+    target 20
+  ]
+  edge [
+    source 18
+    target 21
+  ]
+  edge [
+    source 18
+    target 22
+  ]
+  edge [
+    source 18
+    target 23
+  ]
+  edge [
+    source 18
+    target 24
+  ]
+  edge [
+    source 18
+    target 25
+  ]
+  edge [
+    source 18
+    target 26
+  ]
+  edge [
+    source 18
+    target 27
+  ]
+  edge [
+    source 18
+    target 28
+  ]
+  edge [
+    source 18
+    target 29
+  ]
+  edge [
+    source 18
+    target 30
+  ]
+  edge [
+    source 18
+    target 31
+  ]
+  edge [
+    source 18
+    target 32
+  ]
+  edge [
+    source 18
+    target 33
+  ]
+  edge [
+    source 18
+    target 34
+  ]
+  edge [
+    source 18
+    target 35
+  ]
+  edge [
+    source 18
+    target 36
+  ]
+  edge [
+    source 18
+    target 37
+  ]
+  edge [
+    source 18
+    target 38
+  ]
+  edge [
+    source 18
+    target 39
+  ]
+  edge [
+    source 18
+    target 40
+  ]
+  edge [
+    source 18
+    target 41
+  ]
+  edge [
+    source 18
+    target 42
+  ]
+  edge [
+    source 18
+    target 43
+  ]
+  edge [
+    source 18
+    target 44
+  ]
+  edge [
+    source 18
+    target 45
+  ]
+  edge [
+    source 18
+    target 46
+  ]
+  edge [
+    source 18
+    target 47
+  ]
+  edge [
+    source 18
+    target 48
+  ]
+  edge [
+    source 18
+    target 49
+  ]
+  edge [
+    source 18
+    target 50
+  ]
+  edge [
+    source 18
+    target 51
+  ]
+  edge [
+    source 18
+    target 52
+  ]
+  edge [
+    source 18
+    target 53
+  ]
+  edge [
+    source 18
+    target 54
+  ]
+  edge [
+    source 18
+    target 55
+  ]
+  edge [
+    source 18
+    target 56
+  ]
+  edge [
+    source 18
+    target 57
+  ]
+  edge [
+    source 18
+    target 58
+  ]
+  edge [
+    source 18
+    target 59
+  ]
+  edge [
+    source 18
+    target 60
+  ]
+  edge [
+    source 18
+    target 61
+  ]
+  edge [
+    source 18
+    target 62
+  ]
+  edge [
+    source 18
+    target 63
+  ]
+  edge [
+    source 18
+    target 64
+  ]
+  edge [
+    source 18
+    target 65
+  ]
+  edge [
+    source 18
+    target 66
+  ]
+  edge [
+    source 18
+    target 67
+  ]
+  edge [
+    source 18
+    target 68
+  ]
+  edge [
+    source 18
+    target 69
+  ]
+  edge [
+    source 18
+    target 70
+  ]
+  edge [
+    source 18
+    target 71
+  ]
+  edge [
+    source 18
+    target 72
+  ]
+  edge [
+    source 18
+    target 73
+  ]
+  edge [
+    source 18
+    target 74
+  ]
+  edge [
+    source 19
+    target 20
+  ]
+  edge [
+    source 19
+    target 21
+  ]
+  edge [
+    source 19
+    target 22
+  ]
+  edge [
+    source 19
+    target 23
+  ]
+  edge [
+    source 19
+    target 24
+  ]
+  edge [
+    source 19
+    target 25
+  ]
+  edge [
+    source 19
+    target 26
+  ]
+  edge [
+    source 19
+    target 27
+  ]
+  edge [
+    source 19
+    target 28
+  ]
+  edge [
+    source 19
+    target 29
+  ]
+  edge [
+    source 19
+    target 30
+  ]
+  edge [
+    source 19
+    target 31
+  ]
+  edge [
+    source 19
+    target 32
+  ]
+  edge [
+    source 19
+    target 33
+  ]
+  edge [
+    source 19
+    target 34
+  ]
+  edge [
+    source 19
+    target 35
+  ]
+  edge [
+    source 19
+    target 36
+  ]
+  edge [
+    source 19
+    target 37
+  ]
+  edge [
+    source 19
+    target 38
+  ]
+  edge [
+    source 19
+    target 39
+  ]
+  edge [
+    source 19
+    target 40
+  ]
+  edge [
+    source 19
+    target 41
+  ]
+  edge [
+    source 19
+    target 42
+  ]
+  edge [
+    source 19
+    target 43
+  ]
+  edge [
+    source 19
+    target 44
+  ]
+  edge [
+    source 19
+    target 45
+  ]
+  edge [
+    source 19
+    target 46
+  ]
+  edge [
+    source 19
+    target 47
+  ]
+  edge [
+    source 19
+    target 48
+  ]
+  edge [
+    source 19
+    target 49
+  ]
+  edge [
+    source 19
+    target 50
+  ]
+  edge [
+    source 19
+    target 51
+  ]
+  edge [
+    source 19
+    target 52
+  ]
+  edge [
+    source 19
+    target 53
+  ]
+  edge [
+    source 19
+    target 54
+  ]
+  edge [
+    source 19
+    target 55
+  ]
+  edge [
+    source 19
+    target 56
+  ]
+  edge [
+    source 19
+    target 57
+  ]
+  edge [
+    source 19
+    target 58
+  ]
+  edge [
+    source 19
+    target 59
+  ]
+  edge [
+    source 19
+    target 60
+  ]
+  edge [
+    source 19
+    target 61
+  ]
+  edge [
+    source 19
+    target 62
+  ]
+  edge [
+    source 19
+    target 63
+  ]
+  edge [
+    source 19
+    target 64
+  ]
+  edge [
+    source 19
+    target 65
+  ]
+  edge [
+    source 19
+    target 66
+  ]
+  edge [
+    source 19
+    target 67
+  ]
+  edge [
+    source 19
+    target 68
+  ]
+  edge [
+    source 19
+    target 69
+  ]
+  edge [
+    source 19
+    target 70
+  ]
+  edge [
+    source 19
+    target 71
+  ]
+  edge [
+    source 19
+    target 72
+  ]
+  edge [
+    source 19
+    target 73
+  ]
+  edge [
+    source 19
+    target 74
+  ]
+  edge [
+    source 20
+    target 21
+  ]
+  edge [
+    source 20
+    target 22
+  ]
+  edge [
+    source 20
+    target 23
+  ]
+  edge [
+    source 20
+    target 24
+  ]
+  edge [
+    source 20
+    target 25
+  ]
+  edge [
+    source 20
+    target 26
+  ]
+  edge [
+    source 20
+    target 27
+  ]
+  edge [
+    source 20
+    target 28
+  ]
+  edge [
+    source 20
+    target 29
+  ]
+  edge [
+    source 20
+    target 30
+  ]
+  edge [
+    source 20
+    target 31
+  ]
+  edge [
+    source 20
+    target 32
+  ]
+  edge [
+    source 20
+    target 33
+  ]
+  edge [
+    source 20
+    target 34
+  ]
+  edge [
+    source 20
+    target 35
+  ]
+  edge [
+    source 20
+    target 36
+  ]
+  edge [
+    source 20
+    target 37
+  ]
+  edge [
+    source 20
+    target 38
+  ]
+  edge [
+    source 20
+    target 39
+  ]
+  edge [
+    source 20
+    target 40
+  ]
+  edge [
+    source 20
+    target 41
+  ]
+  edge [
+    source 20
+    target 42
+  ]
+  edge [
+    source 20
+    target 43
+  ]
+  edge [
+    source 20
+    target 44
+  ]
+  edge [
+    source 20
+    target 45
+  ]
+  edge [
+    source 20
+    target 46
+  ]
+  edge [
+    source 20
+    target 47
+  ]
+  edge [
+    source 20
+    target 48
+  ]
+  edge [
+    source 20
+    target 49
+  ]
+  edge [
+    source 20
+    target 50
+  ]
+  edge [
+    source 20
+    target 51
+  ]
+  edge [
+    source 20
+    target 52
+  ]
+  edge [
+    source 20
+    target 53
+  ]
+  edge [
+    source 20
+    target 54
+  ]
+  edge [
+    source 20
+    target 55
+  ]
+  edge [
+    source 20
+    target 56
+  ]
+  edge [
+    source 20
+    target 57
+  ]
+  edge [
+    source 20
+    target 58
+  ]
+  edge [
+    source 20
+    target 59
+  ]
+  edge [
+    source 20
+    target 60
+  ]
+  edge [
+    source 20
+    target 61
+  ]
+  edge [
+    source 20
+    target 62
+  ]
+  edge [
+    source 20
+    target 63
+  ]
+  edge [
+    source 20
+    target 64
+  ]
+  edge [
+    source 20
+    target 65
+  ]
+  edge [
+    source 20
+    target 66
+  ]
+  edge [
+    source 20
+    target 67
+  ]
+  edge [
+    source 20
+    target 68
+  ]
+  edge [
+    source 20
+    target 69
+  ]
+  edge [
+    source 20
+    target 70
+  ]
+  edge [
+    source 20
+    target 71
+  ]
+  edge [
+    source 20
+    target 72
+  ]
+  edge [
+    source 20
+    target 73
+  ]
+  edge [
+    source 20
+    target 74
+  ]
+  edge [
+    source 21
+    target 22
+  ]
+  edge [
+    source 21
+    target 23
+  ]
+  edge [
+    source 21
+    target 24
+  ]
+  edge [
+    source 21
+    target 25
+  ]
+  edge [
+    source 21
+    target 26
+  ]
+  edge [
+    source 21
+    target 27
+  ]
+  edge [
+    source 21
+    target 28
+  ]
+  edge [
+    source 21
+    target 29
+  ]
+  edge [
+    source 21
+    target 30
+  ]
+  edge [
+    source 21
+    target 31
+  ]
+  edge [
+    source 21
+    target 32
+  ]
+  edge [
+    source 21
+    target 33
+  ]
+  edge [
+    source 21
+    target 34
+  ]
+  edge [
+    source 21
+    target 35
+  ]
+  edge [
+    source 21
+    target 36
+  ]
+  edge [
+    source 21
+    target 37
+  ]
+  edge [
+    source 21
+    target 38
+  ]
+  edge [
+    source 21
+    target 39
+  ]
+  edge [
+    source 21
+    target 40
+  ]
+  edge [
+    source 21
+    target 41
+  ]
+  edge [
+    source 21
+    target 42
+  ]
+  edge [
+    source 21
+    target 43
+  ]
+  edge [
+    source 21
+    target 44
+  ]
+  edge [
+    source 21
+    target 45
+  ]
+  edge [
+    source 21
+    target 46
+  ]
+  edge [
+    source 21
+    target 47
+  ]
+  edge [
+    source 21
+    target 48
+  ]
+  edge [
+    source 21
+    target 49
+  ]
+  edge [
+    source 21
+    target 50
+  ]
+  edge [
+    source 21
+    target 51
+  ]
+  edge [
+    source 21
+    target 52
+  ]
+  edge [
+    source 21
+    target 53
+  ]
+  edge [
+    source 21
+    target 54
+  ]
+  edge [
+    source 21
+    target 55
+  ]
+  edge [
+    source 21
+    target 56
+  ]
+  edge [
+    source 21
+    target 57
+  ]
+  edge [
+    source 21
+    target 58
+  ]
+  edge [
+    source 21
+    target 59
+  ]
+  edge [
+    source 21
+    target 60
+  ]
+  edge [
+    source 21
+    target 61
+  ]
+  edge [
+    source 21
+    target 62
+  ]
+  edge [
+    source 21
+    target 63
+  ]
+  edge [
+    source 21
+    target 64
+  ]
+  edge [
+    source 21
+    target 65
+  ]
+  edge [
+    source 21
+    target 66
+  ]
+  edge [
+    source 21
+    target 67
+  ]
+  edge [
+    source 21
+    target 68
+  ]
+  edge [
+    source 21
+    target 69
+  ]
+  edge [
+    source 21
+    target 70
+  ]
+  edge [
+    source 21
+    target 71
+  ]
+  edge [
+    source 21
+    target 72
+  ]
+  edge [
+    source 21
+    target 73
+  ]
+  edge [
+    source 21
+    target 74
+  ]
+  edge [
+    source 22
+    target 23
+  ]
+  edge [
+    source 22
+    target 24
+  ]
+  edge [
+    source 22
+    target 25
+  ]
+  edge [
+    source 22
+    target 26
+  ]
+  edge [
+    source 22
+    target 27
+  ]
+  edge [
+    source 22
+    target 28
+  ]
+  edge [
+    source 22
+    target 29
+  ]
+  edge [
+    source 22
+    target 30
+  ]
+  edge [
+    source 22
+    target 31
+  ]
+  edge [
+    source 22
+    target 32
+  ]
+  edge [
+    source 22
+    target 33
+  ]
+  edge [
+    source 22
+    target 34
+  ]
+  edge [
+    source 22
+    target 35
+  ]
+  edge [
+    source 22
+    target 36
+  ]
+  edge [
+    source 22
+    target 37
+  ]
+  edge [
+    source 22
+    target 38
+  ]
+  edge [
+    source 22
+    target 39
+  ]
+  edge [
+    source 22
+    target 40
+  ]
+  edge [
+    source 22
+    target 41
+  ]
+  edge [
+    source 22
+    target 42
+  ]
+  edge [
+    source 22
+    target 43
+  ]
+  edge [
+    source 22
+    target 44
+  ]
+  edge [
+    source 22
+    target 45
+  ]
+  edge [
+    source 22
+    target 46
+  ]
+  edge [
+    source 22
+    target 47
+  ]
+  edge [
+    source 22
+    target 48
+  ]
+  edge [
+    source 22
+    target 49
+  ]
+  edge [
+    source 22
+    target 50
+  ]
+  edge [
+    source 22
+    target 51
+  ]
+  edge [
+    source 22
+    target 52
+  ]
+  edge [
+    source 22
+    target 53
+  ]
+  edge [
+    source 22
+    target 54
+  ]
+  edge [
+    source 22
+    target 55
+  ]
+  edge [
+    source 22
+    target 56
+  ]
+  edge [
+    source 22
+    target 57
+  ]
+  edge [
+    source 22
+    target 58
+  ]
+  edge [
+    source 22
+    target 59
+  ]
+  edge [
+    source 22
+    target 60
+  ]
+  edge [
+    source 22
+    target 61
+  ]
+  edge [
+    source 22
+    target 62
+  ]
+  edge [
+    source 22
+    target 63
+  ]
+  edge [
+    source 22
+    target 64
+  ]
+  edge [
+    source 22
+    target 65
+  ]
+  edge [
+    source 22
+    target 66
+  ]
+  edge [
+    source 22
+    target 67
+  ]
+  edge [
+    source 22
+    target 68
+  ]
+  edge [
+    source 22
+    target 69
+  ]
+  edge [
+    source 22
+    target 70
+  ]
+  edge [
+    source 22
+    target 71
+  ]
+  edge [
+    source 22
+    target 72
+  ]
+  edge [
+    source 22
+    target 73
+  ]
+  edge [
+    source 22
+    target 74
+  ]
+  edge [
+    source 23
+    target 24
+  ]
+  edge [
+    source 23
+    target 25
+  ]
+  edge [
+    source 23
+    target 26
+  ]
+  edge [
+    source 23
+    target 27
+  ]
+  edge [
+    source 23
+    target 28
+  ]
+  edge [
+    source 23
+    target 29
+  ]
+  edge [
+    source 23
+    target 30
+  ]
+  edge [
+    source 23
+    target 31
+  ]
+  edge [
+    source 23
+    target 32
+  ]
+  edge [
+    source 23
+    target 33
+  ]
+  edge [
+    source 23
+    target 34
+  ]
+  edge [
+    source 23
+    target 35
+  ]
+  edge [
+    source 23
+    target 36
+  ]
+  edge [
+    source 23
+    target 37
+  ]
+  edge [
+    source 23
+    target 38
+  ]
+  edge [
+    source 23
+    target 39
+  ]
+  edge [
+    source 23
+    target 40
+  ]
+  edge [
+    source 23
+    target 41
+  ]
+  edge [
+    source 23
+    target 42
+  ]
+  edge [
+    source 23
+    target 43
+  ]
+  edge [
+    source 23
+    target 44
+  ]
+  edge [
+    source 23
+    target 45
+  ]
+  edge [
+    source 23
+    target 46
+  ]
+  edge [
+    source 23
+    target 47
+  ]
+  edge [
+    source 23
+    target 48
+  ]
+  edge [
+    source 23
+    target 49
+  ]
+  edge [
+    source 23
+    target 50
+  ]
+  edge [
+    source 23
+    target 51
+  ]
+  edge [
+    source 23
+    target 52
+  ]
+  edge [
+    source 23
+    target 53
+  ]
+  edge [
+    source 23
+    target 54
+  ]
+  edge [
+    source 23
+    target 55
+  ]
+  edge [
+    source 23
+    target 56
+  ]
+  edge [
+    source 23
+    target 57
+  ]
+  edge [
+    source 23
+    target 58
+  ]
+  edge [
+    source 23
+    target 59
+  ]
+  edge [
+    source 23
+    target 60
+  ]
+  edge [
+    source 23
+    target 61
+  ]
+  edge [
+    source 23
+    target 62
+  ]
+  edge [
+    source 23
+    target 63
+  ]
+  edge [
+    source 23
+    target 64
+  ]
+  edge [
+    source 23
+    target 65
+  ]
+  edge [
+    source 23
+    target 66
+  ]
+  edge [
+    source 23
+    target 67
+  ]
+  edge [
+    source 23
+    target 68
+  ]
+  edge [
+    source 23
+    target 69
+  ]
+  edge [
+    source 23
+    target 70
+  ]
+  edge [
+    source 23
+    target 71
+  ]
+  edge [
+    source 23
+    target 72
+  ]
+  edge [
+    source 23
+    target 73
+  ]
+  edge [
+    source 23
+    target 74
+  ]
+  edge [
+    source 24
+    target 25
+  ]
+  edge [
+    source 24
+    target 26
+  ]
+  edge [
+    source 24
+    target 27
+  ]
+  edge [
+    source 24
+    target 28
+  ]
+  edge [
+    source 24
+    target 29
+  ]
+  edge [
+    source 24
+    target 30
+  ]
+  edge [
+    source 24
+    target 31
+  ]
+  edge [
+    source 24
+    target 32
+  ]
+  edge [
+    source 24
+    target 33
+  ]
+  edge [
+    source 24
+    target 34
+  ]
+  edge [
+    source 24
+    target 35
+  ]
+  edge [
+    source 24
+    target 36
+  ]
+  edge [
+    source 24
+    target 37
+  ]
+  edge [
+    source 24
+    target 38
+  ]
+  edge [
+    source 24
+    target 39
+  ]
+  edge [
+    source 24
+    target 40
+  ]
+  edge [
+    source 24
+    target 41
+  ]
+  edge [
+    source 24
+    target 42
+  ]
+  edge [
+    source 24
+    target 43
+  ]
+  edge [
+    source 24
+    target 44
+  ]
+  edge [
+    source 24
+    target 45
+  ]
+  edge [
+    source 24
+    target 46
+  ]
+  edge [
+    source 24
+    target 47
+  ]
+  edge [
+    source 24
+    target 48
+  ]
+  edge [
+    source 24
+    target 49
+  ]
+  edge [
+    source 24
+    target 50
+  ]
+  edge [
+    source 24
+    target 51
+  ]
+  edge [
+    source 24
+    target 52
+  ]
+  edge [
+    source 24
+    target 53
+  ]
+  edge [
+    source 24
+    target 54
+  ]
+  edge [
+    source 24
+    target 55
+  ]
+  edge [
+    source 24
+    target 56
+  ]
+  edge [
+    source 24
+    target 57
+  ]
+  edge [
+    source 24
+    target 58
+  ]
+  edge [
+    source 24
+    target 59
+  ]
+  edge [
+    source 24
+    target 60
+  ]
+  edge [
+    source 24
+    target 61
+  ]
+  edge [
+    source 24
+    target 62
+  ]
+  edge [
+    source 24
+    target 63
+  ]
+  edge [
+    source 24
+    target 64
+  ]
+  edge [
+    source 24
+    target 65
+  ]
+  edge [
+    source 24
+    target 66
+  ]
+  edge [
+    source 24
+    target 67
+  ]
+  edge [
+    source 24
+    target 68
+  ]
+  edge [
+    source 24
+    target 69
+  ]
+  edge [
+    source 24
+    target 70
+  ]
+  edge [
+    source 24
+    target 71
+  ]
+  edge [
+    source 24
+    target 72
+  ]
+  edge [
+    source 24
+    target 73
+  ]
+  edge [
+    source 24
+    target 74
+  ]
+  edge [
+    source 25
+    target 26
+  ]
+  edge [
+    source 25
+    target 27
+  ]
+  edge [
+    source 25
+    target 28
+  ]
+  edge [
+    source 25
+    target 29
+  ]
+  edge [
+    source 25
+    target 30
+  ]
+  edge [
+    source 25
+    target 31
+  ]
+  edge [
+    source 25
+    target 32
+  ]
+  edge [
+    source 25
+    target 33
+  ]
+  edge [
+    source 25
+    target 34
+  ]
+  edge [
+    source 25
+    target 35
+  ]
+  edge [
+    source 25
+    target 36
+  ]
+  edge [
+    source 25
+    target 37
+  ]
+  edge [
+    source 25
+    target 38
+  ]
+  edge [
+    source 25
+    target 39
+  ]
+  edge [
+    source 25
+    target 40
+  ]
+  edge [
+    source 25
+    target 41
+  ]
+  edge [
+    source 25
+    target 42
+  ]
+  edge [
+    source 25
+    target 43
+  ]
+  edge [
+    source 25
+    target 44
+  ]
+  edge [
+    source 25
+    target 45
+  ]
+  edge [
+    source 25
+    target 46
+  ]
+  edge [
+    source 25
+    target 47
+  ]
+  edge [
+    source 25
+    target 48
+  ]
+  edge [
+    source 25
+    target 49
+  ]
+  edge [
+    source 25
+    target 50
+  ]
+  edge [
+    source 25
+    target 51
+  ]
+  edge [
+    source 25
+    target 52
+  ]
+  edge [
+    source 25
+    target 53
+  ]
+  edge [
+    source 25
+    target 54
+  ]
+  edge [
+    source 25
+    target 55
+  ]
+  edge [
+    source 25
+    target 56
+  ]
+  edge [
+    source 25
+    target 57
+  ]
+  edge [
+    source 25
+    target 58
+  ]
+  edge [
+    source 25
+    target 59
+  ]
+  edge [
+    source 25
+    target 60
+  ]
+  edge [
+    source 25
+    target 61
+  ]
+  edge [
+    source 25
+    target 62
+  ]
+  edge [
+    source 25
+    target 63
+  ]
+  edge [
+    source 25
+    target 64
+  ]
+  edge [
+    source 25
+    target 65
+  ]
+  edge [
+    source 25
+    target 66
+  ]
+  edge [
+    source 25
+    target 67
+  ]
+  edge [
+    source 25
+    target 68
+  ]
+  edge [
+    source 25
+    target 69
+  ]
+  edge [
+    source 25
+    target 70
+  ]
+  edge [
+    source 25
+    target 71
+  ]
+  edge [
+    source 25
+    target 72
+  ]
+  edge [
+    source 25
+    target 73
+  ]
+  edge [
+    source 25
+    target 74
+  ]
+  edge [
+    source 26
+    target 27
+  ]
+  edge [
+    source 26
+    target 28
+  ]
+  edge [
+    source 26
+    target 29
+  ]
+  edge [
+    source 26
+    target 30
+  ]
+  edge [
+    source 26
+    target 31
+  ]
+  edge [
+    source 26
+    target 32
+  ]
+  edge [
+    source 26
+    target 33
+  ]
+  edge [
+    source 26
+    target 34
+  ]
+  edge [
+    source 26
+    target 35
+  ]
+  edge [
+    source 26
+    target 36
+  ]
+  edge [
+    source 26
+    target 37
+  ]
+  edge [
+    source 26
+    target 38
+  ]
+  edge [
+    source 26
+    target 39
+  ]
+  edge [
+    source 26
+    target 40
+  ]
+  edge [
+    source 26
+    target 41
+  ]
+  edge [
+    source 26
+    target 42
+  ]
+  edge [
+    source 26
+    target 43
+  ]
+  edge [
+    source 26
+    target 44
+  ]
+  edge [
+    source 26
+    target 45
+  ]
+  edge [
+    source 26
+    target 46
+  ]
+  edge [
+    source 26
+    target 47
+  ]
+  edge [
+    source 26
+    target 48
+  ]
+  edge [
+    source 26
+    target 49
+  ]
+  edge [
+    source 26
+    target 50
+  ]
+  edge [
+    source 26
+    target 51
+  ]
+  edge [
+    source 26
+    target 52
+  ]
+  edge [
+    source 26
+    target 53
+  ]
+  edge [
+    source 26
+    target 54
+  ]
+  edge [
+    source 26
+    target 55
+  ]
+  edge [
+    source 26
+    target 56
+  ]
+  edge [
+    source 26
+    target 57
+  ]
+  edge [
+    source 26
+    target 58
+  ]
+  edge [
+    source 26
+    target 59
+  ]
+  edge [
+    source 26
+    target 60
+  ]
+  edge [
+    source 26
+    target 61
+  ]
+  edge [
+    source 26
+    target 62
+  ]
+  edge [
+    source 26
+    target 63
+  ]
+  edge [
+    source 26
+    target 64
+  ]
+  edge [
+    source 26
+    target 65
+  ]
+  edge [
+    source 26
+    target 66
+  ]
+  edge [
+    source 26
+    target 67
+  ]
+  edge [
+    source 26
+    target 68
+  ]
+  edge [
+    source 26
+    target 69
+  ]
+  edge [
+    source 26
+    target 70
+  ]
+  edge [
+    source 26
+    target 71
+  ]
+  edge [
+    source 26
+    target 72
+  ]
+  edge [
+    source 26
+    target 73
+  ]
+  edge [
+    source 26
+    target 74
+  ]
+  edge [
+    source 27
+    target 28
+  ]
+  edge [
+    source 27
+    target 29
+  ]
+  edge [
+    source 27
+    target 30
+  ]
+  edge [
+    source 27
+    target 31
+  ]
+  edge [
+    source 27
+    target 32
+  ]
+  edge [
+    source 27
+    target 33
+  ]
+  edge [
+    source 27
+    target 34
+  ]
+  edge [
+    source 27
+    target 35
+  ]
+  edge [
+    source 27
+    target 36
+  ]
+  edge [
+    source 27
+    target 37
+  ]
+  edge [
+    source 27
+    target 38
+  ]
+  edge [
+    source 27
+    target 39
+  ]
+  edge [
+    source 27
+    target 40
+  ]
+  edge [
+    source 27
+    target 41
+  ]
+  edge [
+    source 27
+    target 42
+  ]
+  edge [
+    source 27
+    target 43
+  ]
+  edge [
+    source 27
+    target 44
+  ]
+  edge [
+    source 27
+    target 45
+  ]
+  edge [
+    source 27
+    target 46
+  ]
+  edge [
+    source 27
+    target 47
+  ]
+  edge [
+    source 27
+    target 48
+  ]
+  edge [
+    source 27
+    target 49
+  ]
+  edge [
+    source 27
+    target 50
+  ]
+  edge [
+    source 27
+    target 51
+  ]
+  edge [
+    source 27
+    target 52
+  ]
+  edge [
+    source 27
+    target 53
+  ]
+  edge [
+    source 27
+    target 54
+  ]
+  edge [
+    source 27
+    target 55
+  ]
+  edge [
+    source 27
+    target 56
+  ]
+  edge [
+    source 27
+    target 57
+  ]
+  edge [
+    source 27
+    target 58
+  ]
+  edge [
+    source 27
+    target 59
+  ]
+  edge [
+    source 27
+    target 60
+  ]
+  edge [
+    source 27
+    target 61
+  ]
+  edge [
+    source 27
+    target 62
+  ]
+  edge [
+    source 27
+    target 63
+  ]
+  edge [
+    source 27
+    target 64
+  ]
+  edge [
+    source 27
+    target 65
+  ]
+  edge [
+    source 27
+    target 66
+  ]
+  edge [
+    source 27
+    target 67
+  ]
+  edge [
+    source 27
+    target 68
+  ]
+  edge [
+    source 27
+    target 69
+  ]
+  edge [
+    source 27
+    target 70
+  ]
+  edge [
+    source 27
+    target 71
+  ]
+  edge [
+    source 27
+    target 72
+  ]
+  edge [
+    source 27
+    target 73
+  ]
+  edge [
+    source 27
+    target 74
+  ]
+  edge [
+    source 28
+    target 29
+  ]
+  edge [
+    source 28
+    target 30
+  ]
+  edge [
+    source 28
+    target 31
+  ]
+  edge [
+    source 28
+    target 32
+  ]
+  edge [
+    source 28
+    target 33
+  ]
+  edge [
+    source 28
+    target 34
+  ]
+  edge [
+    source 28
+    target 35
+  ]
+  edge [
+    source 28
+    target 36
+  ]
+  edge [
+    source 28
+    target 37
+  ]
+  edge [
+    source 28
+    target 38
+  ]
+  edge [
+    source 28
+    target 39
+  ]
+  edge [
+    source 28
+    target 40
+  ]
+  edge [
+    source 28
+    target 41
+  ]
+  edge [
+    source 28
+    target 42
+  ]
+  edge [
+    source 28
+    target 43
+  ]
+  edge [
+    source 28
+    target 44
+  ]
+  edge [
+    source 28
+    target 45
+  ]
+  edge [
+    source 28
+    target 46
+  ]
+  edge [
+    source 28
+    target 47
+  ]
+  edge [
+    source 28
+    target 48
+  ]
+  edge [
+    source 28
+    target 49
+  ]
+  edge [
+    source 28
+    target 50
+  ]
+  edge [
+    source 28
+    target 51
+  ]
+  edge [
+    source 28
+    target 52
+  ]
+  edge [
+    source 28
+    target 53
+  ]
+  edge [
+    source 28
+    target 54
+  ]
+  edge [
+    source 28
+    target 55
+  ]
+  edge [
+    source 28
+    target 56
+  ]
+  edge [
+    source 28
+    target 57
+  ]
+  edge [
+    source 28
+    target 58
+  ]
+  edge [
+    source 28
+    target 59
+  ]
+  edge [
+    source 28
+    target 60
+  ]
+  edge [
+    source 28
+    target 61
+  ]
+  edge [
+    source 28
+    target 62
+  ]
+  edge [
+    source 28
+    target 63
+  ]
+  edge [
+    source 28
+    target 64
+  ]
+  edge [
+    source 28
+    target 65
+  ]
+  edge [
+    source 28
+    target 66
+  ]
+  edge [
+    source 28
+    target 67
+  ]
+  edge [
+    source 28
+    target 68
+  ]
+  edge [
+    source 28
+    target 69
+  ]
+  edge [
+    source 28
+    target 70
+  ]
+  edge [
+    source 28
+    target 71
+  ]
+  edge [
+    source 28
+    target 72
+  ]
+  edge [
+    source 28
+    target 73
+  ]
+  edge [
+    source 28
+    target 74
+  ]
+  edge [
+    source 29
+    target 30
+  ]
+  edge [
+    source 29
+    target 31
+  ]
+  edge [
+    source 29
+    target 32
+  ]
+  edge [
+    source 29
+    target 33
+  ]
+  edge [
+    source 29
+    target 34
+  ]
+  edge [
+    source 29
+    target 35
+  ]
+  edge [
+    source 29
+    target 36
+  ]
+  edge [
+    source 29
+    target 37
+  ]
+  edge [
+    source 29
+    target 38
+  ]
+  edge [
+    source 29
+    target 39
+  ]
+  edge [
+    source 29
+    target 40
+  ]
+  edge [
+    source 29
+    target 41
+  ]
+  edge [
+    source 29
+    target 42
+  ]
+  edge [
+    source 29
+    target 43
+  ]
+  edge [
+    source 29
+    target 44
+  ]
+  edge [
+    source 29
+    target 45
+  ]
+  edge [
+    source 29
+    target 46
+  ]
+  edge [
+    source 29
+    target 47
+  ]
+  edge [
+    source 29
+    target 48
+  ]
+  edge [
+    source 29
+    target 49
+  ]
+  edge [
+    source 29
+    target 50
+  ]
+  edge [
+    source 29
+    target 51
+  ]
+  edge [
+    source 29
+    target 52
+  ]
+  edge [
+    source 29
+    target 53
+  ]
+  edge [
+    source 29
+    target 54
+  ]
+  edge [
+    source 29
+    target 55
+  ]
+  edge [
+    source 29
+    target 56
+  ]
+  edge [
+    source 29
+    target 57
+  ]
+  edge [
+    source 29
+    target 58
+  ]
+  edge [
+    source 29
+    target 59
+  ]
+  edge [
+    source 29
+    target 60
+  ]
+  edge [
+    source 29
+    target 61
+  ]
+  edge [
+    source 29
+    target 62
+  ]
+  edge [
+    source 29
+    target 63
+  ]
+  edge [
+    source 29
+    target 64
+  ]
+  edge [
+    source 29
+    target 65
+  ]
+  edge [
+    source 29
+    target 66
+  ]
+  edge [
+    source 29
+    target 67
+  ]
+  edge [
+    source 29
+    target 68
+  ]
+  edge [
+    source 29
+    target 69
+  ]
+  edge [
+    source 29
+    target 70
+  ]
+  edge [
+    source 29
+    target 71
+  ]
+  edge [
+    source 29
+    target 72
+  ]
+  edge [
+    source 29
+    target 73
+  ]
+  edge [
+    source 29
+    target 74
+  ]
+  edge [
+    source 30
+    target 31
+  ]
+  edge [
+    source 30
+    target 32
+  ]
+  edge [
+    source 30
+    target 33
+  ]
+  edge [
+    source 30
+    target 34
+  ]
+  edge [
+    source 30
+    target 35
+  ]
+  edge [
+    source 30
+    target 36
+  ]
+  edge [
+    source 30
+    target 37
+  ]
+  edge [
+    source 30
+    target 38
+  ]
+  edge [
+    source 30
+    target 39
+  ]
+  edge [
+    source 30
+    target 40
+  ]
+  edge [
+    source 30
+    target 41
+  ]
+  edge [
+    source 30
+    target 42
+  ]
+  edge [
+    source 30
+    target 43
+  ]
+  edge [
+    source 30
+    target 44
+  ]
+  edge [
+    source 30
+    target 45
+  ]
+  edge [
+    source 30
+    target 46
+  ]
+  edge [
+    source 30
+    target 47
+  ]
+  edge [
+    source 30
+    target 48
+  ]
+  edge [
+    source 30
+    target 49
+  ]
+  edge [
+    source 30
+    target 50
+  ]
+  edge [
+    source 30
+    target 51
+  ]
+  edge [
+    source 30
+    target 52
+  ]
+  edge [
+    source 30
+    target 53
+  ]
+  edge [
+    source 30
+    target 54
+  ]
+  edge [
+    source 30
+    target 55
+  ]
+  edge [
+    source 30
+    target 56
+  ]
+  edge [
+    source 30
+    target 57
+  ]
+  edge [
+    source 30
+    target 58
+  ]
+  edge [
+    source 30
+    target 59
+  ]
+  edge [
+    source 30
+    target 60
+  ]
+  edge [
+    source 30
+    target 61
+  ]
+  edge [
+    source 30
+    target 62
+  ]
+  edge [
+    source 30
+    target 63
+  ]
+  edge [
+    source 30
+    target 64
+  ]
+  edge [
+    source 30
+    target 65
+  ]
+  edge [
+    source 30
+    target 66
+  ]
+  edge [
+    source 30
+    target 67
+  ]
+  edge [
+    source 30
+    target 68
+  ]
+  edge [
+    source 30
+    target 69
+  ]
+  edge [
+    source 30
+    target 70
+  ]
+  edge [
+    source 30
+    target 71
+  ]
+  edge [
+    source 30
+    target 72
+  ]
+  edge [
+    source 30
+    target 73
+  ]
+  edge [
+    source 30
+    target 74
+  ]
+  edge [
+    source 31
+    target 32
+  ]
+  edge [
+    source 31
+    target 33
+  ]
+  edge [
+    source 31
+    target 34
+  ]
+  edge [
+    source 31
+    target 35
+  ]
+  edge [
+    source 31
+    target 36
+  ]
+  edge [
+    source 31
+    target 37
+  ]
+  edge [
+    source 31
+    target 38
+  ]
+  edge [
+    source 31
+    target 39
+  ]
+  edge [
+    source 31
+    target 40
+  ]
+  edge [
+    source 31
+    target 41
+  ]
+  edge [
+    source 31
+    target 42
+  ]
+  edge [
+    source 31
+    target 43
+  ]
+  edge [
+    source 31
+    target 44
+  ]
+  edge [
+    source 31
+    target 45
+  ]
+  edge [
+    source 31
+    target 46
+  ]
+  edge [
+    source 31
+    target 47
+  ]
+  edge [
+    source 31
+    target 48
+  ]
+  edge [
+    source 31
+    target 49
+  ]
+  edge [
+    source 31
+    target 50
+  ]
+  edge [
+    source 31
+    target 51
+  ]
+  edge [
+    source 31
+    target 52
+  ]
+  edge [
+    source 31
+    target 53
+  ]
+  edge [
+    source 31
+    target 54
+  ]
+  edge [
+    source 31
+    target 55
+  ]
+  edge [
+    source 31
+    target 56
+  ]
+  edge [
+    source 31
+    target 57
+  ]
+  edge [
+    source 31
+    target 58
+  ]
+  edge [
+    source 31
+    target 59
+  ]
+  edge [
+    source 31
+    target 60
+  ]
+  edge [
+    source 31
+    target 61
+  ]
+  edge [
+    source 31
+    target 62
+  ]
+  edge [
+    source 31
+    target 63
+  ]
+  edge [
+    source 31
+    target 64
+  ]
+  edge [
+    source 31
+    target 65
+  ]
+  edge [
+    source 31
+    target 66
+  ]
+  edge [
+    source 31
+    target 67
+  ]
+  edge [
+    source 31
+    target 68
+  ]
+  edge [
+    source 31
+    target 69
+  ]
+  edge [
+    source 31
+    target 70
+  ]
+  edge [
+    source 31
+    target 71
+  ]
+  edge [
+    source 31
+    target 72
+  ]
+  edge [
+    source 31
+    target 73
+  ]
+  edge [
+    source 31
+    target 74
+  ]
+  edge [
+    source 32
+    target 33
+  ]
+  edge [
+    source 32
+    target 34
+  ]
+  edge [
+    source 32
+    target 35
+  ]
+  edge [
+    source 32
+    target 36
+  ]
+  edge [
+    source 32
+    target 37
+  ]
+  edge [
+    source 32
+    target 38
+  ]
+  edge [
+    source 32
+    target 39
+  ]
+  edge [
+    source 32
+    target 40
+  ]
+  edge [
+    source 32
+    target 41
+  ]
+  edge [
+    source 32
+    target 42
+  ]
+  edge [
+    source 32
+    target 43
+  ]
+  edge [
+    source 32
+    target 44
+  ]
+  edge [
+    source 32
+    target 45
+  ]
+  edge [
+    source 32
+    target 46
+  ]
+  edge [
+    source 32
+    target 47
+  ]
+  edge [
+    source 32
+    target 48
+  ]
+  edge [
+    source 32
+    target 49
+  ]
+  edge [
+    source 32
+    target 50
+  ]
+  edge [
+    source 32
+    target 51
+  ]
+  edge [
+    source 32
+    target 52
+  ]
+  edge [
+    source 32
+    target 53
+  ]
+  edge [
+    source 32
+    target 54
+  ]
+  edge [
+    source 32
+    target 55
+  ]
+  edge [
+    source 32
+    target 56
+  ]
+  edge [
+    source 32
+    target 57
+  ]
+  edge [
+    source 32
+    target 58
+  ]
+  edge [
+    source 32
+    target 59
+  ]
+  edge [
+    source 32
+    target 60
+  ]
+  edge [
+    source 32
+    target 61
+  ]
+  edge [
+    source 32
+    target 62
+  ]
+  edge [
+    source 32
+    target 63
+  ]
+  edge [
+    source 32
+    target 64
+  ]
+  edge [
+    source 32
+    target 65
+  ]
+  edge [
+    source 32
+    target 66
+  ]
+  edge [
+    source 32
+    target 67
+  ]
+  edge [
+    source 32
+    target 68
+  ]
+  edge [
+    source 32
+    target 69
+  ]
+  edge [
+    source 32
+    target 70
+  ]
+  edge [
+    source 32
+    target 71
+  ]
+  edge [
+    source 32
+    target 72
+  ]
+  edge [
+    source 32
+    target 73
+  ]
+  edge [
+    source 32
+    target 74
+  ]
+  edge [
+    source 33
+    target 34
+  ]
+  edge [
+    source 33
+    target 35
+  ]
+  edge [
+    source 33
+    target 36
+  ]
+  edge [
+    source 33
+    target 37
+  ]
+  edge [
+    source 33
+    target 38
+  ]
+  edge [
+    source 33
+    target 39
+  ]
+  edge [
+    source 33
+    target 40
+  ]
+  edge [
+    source 33
+    target 41
+  ]
+  edge [
+    source 33
+    target 42
+  ]
+  edge [
+    source 33
+    target 43
+  ]
+  edge [
+    source 33
+    target 44
+  ]
+  edge [
+    source 33
+    target 45
+  ]
+  edge [
+    source 33
+    target 46
+  ]
+  edge [
+    source 33
+    target 47
+  ]
+  edge [
+    source 33
+    target 48
+  ]
+  edge [
+    source 33
+    target 49
+  ]
+  edge [
+    source 33
+    target 50
+  ]
+  edge [
+    source 33
+    target 51
+  ]
+  edge [
+    source 33
+    target 52
+  ]
+  edge [
+    source 33
+    target 53
+  ]
+  edge [
+    source 33
+    target 54
+  ]
+  edge [
+    source 33
+    target 55
+  ]
+  edge [
+    source 33
+    target 56
+  ]
+  edge [
+    source 33
+    target 57
+  ]
+  edge [
+    source 33
+    target 58
+  ]
+  edge [
+    source 33
+    target 59
+  ]
+  edge [
+    source 33
+    target 60
+  ]
+  edge [
+    source 33
+    target 61
+  ]
+  edge [
+    source 33
+    target 62
+  ]
+  edge [
+    source 33
+    target 63
+  ]
+  edge [
+    source 33
+    target 64
+  ]
+  edge [
+    source 33
+    target 65
+  ]
+  edge [
+    source 33
+    target 66
+  ]
+  edge [
+    source 33
+    target 67
+  ]
+  edge [
+    source 33
+    target 68
+  ]
+  edge [
+    source 33
+    target 69
+  ]
+  edge [
+    source 33
+    target 70
+  ]
+  edge [
+    source 33
+    target 71
+  ]
+  edge [
+    source 33
+    target 72
+  ]
+  edge [
+    source 33
+    target 73
+  ]
+  edge [
+    source 33
+    target 74
+  ]
+  edge [
+    source 34
+    target 35
+  ]
+  edge [
+    source 34
+    target 36
+  ]
+  edge [
+    source 34
+    target 37
+  ]
+  edge [
+    source 34
+    target 38
+  ]
+  edge [
+    source 34
+    target 39
+  ]
+  edge [
+    source 34
+    target 40
+  ]
+  edge [
+    source 34
+    target 41
+  ]
+  edge [
+    source 34
+    target 42
+  ]
+  edge [
+    source 34
+    target 43
+  ]
+  edge [
+    source 34
+    target 44
+  ]
+  edge [
+    source 34
+    target 45
+  ]
+  edge [
+    source 34
+    target 46
+  ]
+  edge [
+    source 34
+    target 47
+  ]
+  edge [
+    source 34
+    target 48
+  ]
+  edge [
+    source 34
+    target 49
+  ]
+  edge [
+    source 34
+    target 50
+  ]
+  edge [
+    source 34
+    target 51
+  ]
+  edge [
+    source 34
+    target 52
+  ]
+  edge [
+    source 34
+    target 53
+  ]
+  edge [
+    source 34
+    target 54
+  ]
+  edge [
+    source 34
+    target 55
+  ]
+  edge [
+    source 34
+    target 56
+  ]
+  edge [
+    source 34
+    target 57
+  ]
+  edge [
+    source 34
+    target 58
+  ]
+  edge [
+    source 34
+    target 59
+  ]
+  edge [
+    source 34
+    target 60
+  ]
+  edge [
+    source 34
+    target 61
+  ]
+  edge [
+    source 34
+    target 62
+  ]
+  edge [
+    source 34
+    target 63
+  ]
+  edge [
+    source 34
+    target 64
+  ]
+  edge [
+    source 34
+    target 65
+  ]
+  edge [
+    source 34
+    target 66
+  ]
+  edge [
+    source 34
+    target 67
+  ]
+  edge [
+    source 34
+    target 68
+  ]
+  edge [
+    source 34
+    target 69
+  ]
+  edge [
+    source 34
+    target 70
+  ]
+  edge [
+    source 34
+    target 71
+  ]
+  edge [
+    source 34
+    target 72
+  ]
+  edge [
+    source 34
+    target 73
+  ]
+  edge [
+    source 34
+    target 74
+  ]
+  edge [
+    source 35
+    target 36
+  ]
+  edge [
+    source 35
+    target 37
+  ]
+  edge [
+    source 35
+    target 38
+  ]
+  edge [
+    source 35
+    target 39
+  ]
+  edge [
+    source 35
+    target 40
+  ]
+  edge [
+    source 35
+    target 41
+  ]
+  edge [
+    source 35
+    target 42
+  ]
+  edge [
+    source 35
+    target 43
+  ]
+  edge [
+    source 35
+    target 44
+  ]
+  edge [
+    source 35
+    target 45
+  ]
+  edge [
+    source 35
+    target 46
+  ]
+  edge [
+    source 35
+    target 47
+  ]
+  edge [
+    source 35
+    target 48
+  ]
+  edge [
+    source 35
+    target 49
+  ]
+  edge [
+    source 35
+    target 50
+  ]
+  edge [
+    source 35
+    target 51
+  ]
+  edge [
+    source 35
+    target 52
+  ]
+  edge [
+    source 35
+    target 53
+  ]
+  edge [
+    source 35
+    target 54
+  ]
+  edge [
+    source 35
+    target 55
+  ]
+  edge [
+    source 35
+    target 56
+  ]
+  edge [
+    source 35
+    target 57
+  ]
+  edge [
+    source 35
+    target 58
+  ]
+  edge [
+    source 35
+    target 59
+  ]
+  edge [
+    source 35
+    target 60
+  ]
+  edge [
+    source 35
+    target 61
+  ]
+  edge [
+    source 35
+    target 62
+  ]
+  edge [
+    source 35
+    target 63
+  ]
+  edge [
+    source 35
+    target 64
+  ]
+  edge [
+    source 35
+    target 65
+  ]
+  edge [
+    source 35
+    target 66
+  ]
+  edge [
+    source 35
+    target 67
+  ]
+  edge [
+    source 35
+    target 68
+  ]
+  edge [
+    source 35
+    target 69
+  ]
+  edge [
+    source 35
+    target 70
+  ]
+  edge [
+    source 35
+    target 71
+  ]
+  edge [
+    source 35
+    target 72
+  ]
+  edge [
+    source 35
+    target 73
+  ]
+  edge [
+    source 35
+    target 74
+  ]
+  edge [
+    source 36
+    target 37
+  ]
+  edge [
+    source 36
+    target 38
+  ]
+  edge [
+    source 36
+    target 39
+  ]
+  edge [
+    source 36
+    target 40
+  ]
+  edge [
+    source 36
+    target 41
+  ]
+  edge [
+    source 36
+    target 42
+  ]
+  edge [
+    source 36
+    target 43
+  ]
+  edge [
+    source 36
+    target 44
+  ]
+  edge [
+    source 36
+    target 45
+  ]
+  edge [
+    source 36
+    target 46
+  ]
+  edge [
+    source 36
+    target 47
+  ]
+  edge [
+    source 36
+    target 48
+  ]
+  edge [
+    source 36
+    target 49
+  ]
+  edge [
+    source 36
+    target 50
+  ]
+  edge [
+    source 36
+    target 51
+  ]
+  edge [
+    source 36
+    target 52
+  ]
+  edge [
+    source 36
+    target 53
+  ]
+  edge [
+    source 36
+    target 54
+  ]
+  edge [
+    source 36
+    target 55
+  ]
+  edge [
+    source 36
+    target 56
+  ]
+  edge [
+    source 36
+    target 57
+  ]
+  edge [
+    source 36
+    target 58
+  ]
+  edge [
+    source 36
+    target 59
+  ]
+  edge [
+    source 36
+    target 60
+  ]
+  edge [
+    source 36
+    target 61
+  ]
+  edge [
+    source 36
+    target 62
+  ]
+  edge [
+    source 36
+    target 63
+  ]
+  edge [
+    source 36
+    target 64
+  ]
+  edge [
+    source 36
+    target 65
+  ]
+  edge [
+    source 36
+    target 66
+  ]
+  edge [
+    source 36
+    target 67
+  ]
+  edge [
+    source 36
+    target 68
+  ]
+  edge [
+    source 36
+    target 69
+  ]
+  edge [
+    source 36
+    target 70
+  ]
+  edge [
+    source 36
+    target 71
+  ]
+  edge [
+    source 36
+    target 72
+  ]
+  edge [
+    source 36
+    target 73
+  ]
+  edge [
+    source 36
+    target 74
+  ]
+  edge [
+    source 37
+    target 38
+  ]
+  edge [
+    source 37
+    target 39
+  ]
+  edge [
+    source 37
+    target 40
+  ]
+  edge [
+    source 37
+    target 41
+  ]
+  edge [
+    source 37
+    target 42
+  ]
+  edge [
+    source 37
+    target 43
+  ]
+  edge [
+    source 37
+    target 44
+  ]
+  edge [
+    source 37
+    target 45
+  ]
+  edge [
+    source 37
+    target 46
+  ]
+  edge [
+    source 37
+    target 47
+  ]
+  edge [
+    source 37
+    target 48
+  ]
+  edge [
+    source 37
+    target 49
+  ]
+  edge [
+    source 37
+    target 50
+  ]
+  edge [
+    source 37
+    target 51
+  ]
+  edge [
+    source 37
+    target 52
+  ]
+  edge [
+    source 37
+    target 53
+  ]
+  edge [
+    source 37
+    target 54
+  ]
+  edge [
+    source 37
+    target 55
+  ]
+  edge [
+    source 37
+    target 56
+  ]
+  edge [
+    source 37
+    target 57
+  ]
+  edge [
+    source 37
+    target 58
+  ]
+  edge [
+    source 37
+    target 59
+  ]
+  edge [
+    source 37
+    target 60
+  ]
+  edge [
+    source 37
+    target 61
+  ]
+  edge [
+    source 37
+    target 62
+  ]
+  edge [
+    source 37
+    target 63
+  ]
+  edge [
+    source 37
+    target 64
+  ]
+  edge [
+    source 37
+    target 65
+  ]
+  edge [
+    source 37
+    target 66
+  ]
+  edge [
+    source 37
+    target 67
+  ]
+  edge [
+    source 37
+    target 68
+  ]
+  edge [
+    source 37
+    target 69
+  ]
+  edge [
+    source 37
+    target 70
+  ]
+  edge [
+    source 37
+    target 71
+  ]
+  edge [
+    source 37
+    target 72
+  ]
+  edge [
+    source 37
+    target 73
+  ]
+  edge [
+    source 37
+    target 74
+  ]
+  edge [
+    source 38
+    target 39
+  ]
+  edge [
+    source 38
+    target 40
+  ]
+  edge [
+    source 38
+    target 41
+  ]
+  edge [
+    source 38
+    target 42
+  ]
+  edge [
+    source 38
+    target 43
+  ]
+  edge [
+    source 38
+    target 44
+  ]
+  edge [
+    source 38
+    target 45
+  ]
+  edge [
+    source 38
+    target 46
+  ]
+  edge [
+    source 38
+    target 47
+  ]
+  edge [
+    source 38
+    target 48
+  ]
+  edge [
+    source 38
+    target 49
+  ]
+  edge [
+    source 38
+    target 50
+  ]
+  edge [
+    source 38
+    target 51
+  ]
+  edge [
+    source 38
+    target 52
+  ]
+  edge [
+    source 38
+    target 53
+  ]
+  edge [
+    source 38
+    target 54
+  ]
+  edge [
+    source 38
+    target 55
+  ]
+  edge [
+    source 38
+    target 56
+  ]
+  edge [
+    source 38
+    target 57
+  ]
+  edge [
+    source 38
+    target 58
+  ]
+  edge [
+    source 38
+    target 59
+  ]
+  edge [
+    source 38
+    target 60
+  ]
+  edge [
+    source 38
+    target 61
+  ]
+  edge [
+    source 38
+    target 62
+  ]
+  edge [
+    source 38
+    target 63
+  ]
+  edge [
+    source 38
+    target 64
+  ]
+  edge [
+    source 38
+    target 65
+  ]
+  edge [
+    source 38
+    target 66
+  ]
+  edge [
+    source 38
+    target 67
+  ]
+  edge [
+    source 38
+    target 68
+  ]
+  edge [
+    source 38
+    target 69
+  ]
+  edge [
+    source 38
+    target 70
+  ]
+  edge [
+    source 38
+    target 71
+  ]
+  edge [
+    source 38
+    target 72
+  ]
+  edge [
+    source 38
+    target 73
+  ]
+  edge [
+    source 38
+    target 74
+  ]
+  edge [
+    source 39
+    target 40
+  ]
+  edge [
+    source 39
+    target 41
+  ]
+  edge [
+    source 39
+    target 42
+  ]
+  edge [
+    source 39
+    target 43
+  ]
+  edge [
+    source 39
+    target 44
+  ]
+  edge [
+    source 39
+    target 45
+  ]
+  edge [
+    source 39
+    target 46
+  ]
+  edge [
+    source 39
+    target 47
+  ]
+  edge [
+    source 39
+    target 48
+  ]
+  edge [
+    source 39
+    target 49
+  ]
+  edge [
+    source 39
+    target 50
+  ]
+  edge [
+    source 39
+    target 51
+  ]
+  edge [
+    source 39
+    target 52
+  ]
+  edge [
+    source 39
+    target 53
+  ]
+  edge [
+    source 39
+    target 54
+  ]
+  edge [
+    source 39
+    target 55
+  ]
+  edge [
+    source 39
+    target 56
+  ]
+  edge [
+    source 39
+    target 57
+  ]
+  edge [
+    source 39
+    target 58
+  ]
+  edge [
+    source 39
+    target 59
+  ]
+  edge [
+    source 39
+    target 60
+  ]
+  edge [
+    source 39
+    target 61
+  ]
+  edge [
+    source 39
+    target 62
+  ]
+  edge [
+    source 39
+    target 63
+  ]
+  edge [
+    source 39
+    target 64
+  ]
+  edge [
+    source 39
+    target 65
+  ]
+  edge [
+    source 39
+    target 66
+  ]
+  edge [
+    source 39
+    target 67
+  ]
+  edge [
+    source 39
+    target 68
+  ]
+  edge [
+    source 39
+    target 69
+  ]
+  edge [
+    source 39
+    target 70
+  ]
+  edge [
+    source 39
+    target 71
+  ]
+  edge [
+    source 39
+    target 72
+  ]
+  edge [
+    source 39
+    target 73
+  ]
+  edge [
+    source 39
+    target 74
+  ]
+  edge [
+    source 40
+    target 41
+  ]
+  edge [
+    source 40
+    target 42
+  ]
+  edge [
+    source 40
+    target 43
+  ]
+  edge [
+    source 40
+    target 44
+  ]
+  edge [
+    source 40
+    target 45
+  ]
+  edge [
+    source 40
+    target 46
+  ]
+  edge [
+    source 40
+    target 47
+  ]
+  edge [
+    source 40
+    target 48
+  ]
+  edge [
+    source 40
+    target 49
+  ]
+  edge [
+    source 40
+    target 50
+  ]
+  edge [
+    source 40
+    target 51
+  ]
+  edge [
+    source 40
+    target 52
+  ]
+  edge [
+    source 40
+    target 53
+  ]
+  edge [
+    source 40
+    target 54
+  ]
+  edge [
+    source 40
+    target 55
+  ]
+  edge [
+    source 40
+    target 56
+  ]
+  edge [
+    source 40
+    target 57
+  ]
+  edge [
+    source 40
+    target 58
+  ]
+  edge [
+    source 40
+    target 59
+  ]
+  edge [
+    source 40
+    target 60
+  ]
+  edge [
+    source 40
+    target 61
+  ]
+  edge [
+    source 40
+    target 62
+  ]
+  edge [
+    source 40
+    target 63
+  ]
+  edge [
+    source 40
+    target 64
+  ]
+  edge [
+    source 40
+    target 65
+  ]
+  edge [
+    source 40
+    target 66
+  ]
+  edge [
+    source 40
+    target 67
+  ]
+  edge [
+    source 40
+    target 68
+  ]
+  edge [
+    source 40
+    target 69
+  ]
+  edge [
+    source 40
+    target 70
+  ]
+  edge [
+    source 40
+    target 71
+  ]
+  edge [
+    source 40
+    target 72
+  ]
+  edge [
+    source 40
+    target 73
+  ]
+  edge [
+    source 40
+    target 74
+  ]
+  edge [
+    source 41
+    target 42
+  ]
+  edge [
+    source 41
+    target 43
+  ]
+  edge [
+    source 41
+    target 44
+  ]
+  edge [
+    source 41
+    target 45
+  ]
+  edge [
+    source 41
+    target 46
+  ]
+  edge [
+    source 41
+    target 47
+  ]
+  edge [
+    source 41
+    target 48
+  ]
+  edge [
+    source 41
+    target 49
+  ]
+  edge [
+    source 41
+    target 50
+  ]
+  edge [
+    source 41
+    target 51
+  ]
+  edge [
+    source 41
+    target 52
+  ]
+  edge [
+    source 41
+    target 53
+  ]
+  edge [
+    source 41
+    target 54
+  ]
+  edge [
+    source 41
+    target 55
+  ]
+  edge [
+    source 41
+    target 56
+  ]
+  edge [
+    source 41
+    target 57
+  ]
+  edge [
+    source 41
+    target 58
+  ]
+  edge [
+    source 41
+    target 59
+  ]
+  edge [
+    source 41
+    target 60
+  ]
+  edge [
+    source 41
+    target 61
+  ]
+  edge [
+    source 41
+    target 62
+  ]
+  edge [
+    source 41
+    target 63
+  ]
+  edge [
+    source 41
+    target 64
+  ]
+  edge [
+    source 41
+    target 65
+  ]
+  edge [
+    source 41
+    target 66
+  ]
+  edge [
+    source 41
+    target 67
+  ]
+  edge [
+    source 41
+    target 68
+  ]
+  edge [
+    source 41
+    target 69
+  ]
+  edge [
+    source 41
+    target 70
+  ]
+  edge [
+    source 41
+    target 71
+  ]
+  edge [
+    source 41
+    target 72
+  ]
+  edge [
+    source 41
+    target 73
+  ]
+  edge [
+    source 41
+    target 74
+  ]
+  edge [
+    source 42
+    target 43
+  ]
+  edge [
+    source 42
+    target 44
+  ]
+  edge [
+    source 42
+    target 45
+  ]
+  edge [
+    source 42
+    target 46
+  ]
+  edge [
+    source 42
+    target 47
+  ]
+  edge [
+    source 42
+    target 48
+  ]
+  edge [
+    source 42
+    target 49
+  ]
+  edge [
+    source 42
+    target 50
+  ]
+  edge [
+    source 42
+    target 51
+  ]
+  edge [
+    source 42
+    target 52
+  ]
+  edge [
+    source 42
+    target 53
+  ]
+  edge [
+    source 42
+    target 54
+  ]
+  edge [
+    source 42
+    target 55
+  ]
+  edge [
+    source 42
+    target 56
+  ]
+  edge [
+    source 42
+    target 57
+  ]
+  edge [
+    source 42
+    target 58
+  ]
+  edge [
+    source 42
+    target 59
+  ]
+  edge [
+    source 42
+    target 60
+  ]
+  edge [
+    source 42
+    target 61
+  ]
+  edge [
+    source 42
+    target 62
+  ]
+  edge [
+    source 42
+    target 63
+  ]
+  edge [
+    source 42
+    target 64
+  ]
+  edge [
+    source 42
+    target 65
+  ]
+  edge [
+    source 42
+    target 66
+  ]
+  edge [
+    source 42
+    target 67
+  ]
+  edge [
+    source 42
+    target 68
+  ]
+  edge [
+    source 42
+    target 69
+  ]
+  edge [
+    source 42
+    target 70
+  ]
+  edge [
+    source 42
+    target 71
+  ]
+  edge [
+    source 42
+    target 72
+  ]
+  edge [
+    source 42
+    target 73
+  ]
+  edge [
+    source 42
+    target 74
+  ]
+  edge [
+    source 43
+    target 44
+  ]
+  edge [
+    source 43
+    target 45
+  ]
+  edge [
+    source 43
+    target 46
+  ]
+  edge [
+    source 43
+    target 47
+  ]
+  edge [
+    source 43
+    target 48
+  ]
+  edge [
+    source 43
+    target 49
+  ]
+  edge [
+    source 43
+    target 50
+  ]
+  edge [
+    source 43
+    target 51
+  ]
+  edge [
+    source 43
+    target 52
+  ]
+  edge [
+    source 43
+    target 53
+  ]
+  edge [
+    source 43
+    target 54
+  ]
+  edge [
+    source 43
+    target 55
+  ]
+  edge [
+    source 43
+    target 56
+  ]
+  edge [
+    source 43
+    target 57
+  ]
+  edge [
+    source 43
+    target 58
+  ]
+  edge [
+    source 43
+    target 59
+  ]
+  edge [
+    source 43
+    target 60
+  ]
+  edge [
+    source 43
+    target 61
+  ]
+  edge [
+    source 43
+    target 62
+  ]
+  edge [
+    source 43
+    target 63
+  ]
+  edge [
+    source 43
+    target 64
+  ]
+  edge [
+    source 43
+    target 65
+  ]
+  edge [
+    source 43
+    target 66
+  ]
+  edge [
+    source 43
+    target 67
+  ]
+  edge [
+    source 43
+    target 68
+  ]
+  edge [
+    source 43
+    target 69
+  ]
+  edge [
+    source 43
+    target 70
+  ]
+  edge [
+    source 43
+    target 71
+  ]
+  edge [
+    source 43
+    target 72
+  ]
+  edge [
+    source 43
+    target 73
+  ]
+  edge [
+    source 43
+    target 74
+  ]
+  edge [
+    source 44
+    target 45
+  ]
+  edge [
+    source 44
+    target 46
+  ]
+  edge [
+    source 44
+    target 47
+  ]
+  edge [
+    source 44
+    target 48
+  ]
+  edge [
+    source 44
+    target 49
+  ]
+  edge [
+    source 44
+    target 50
+  ]
+  edge [
+    source 44
+    target 51
+  ]
+  edge [
+    source 44
+    target 52
+  ]
+  edge [
+    source 44
+    target 53
+  ]
+  edge [
+    source 44
+    target 54
+  ]
+  edge [
+    source 44
+    target 55
+  ]
+  edge [
+    source 44
+    target 56
+  ]
+  edge [
+    source 44
+    target 57
+  ]
+  edge [
+    source 44
+    target 58
+  ]
+  edge [
+    source 44
+    target 59
+  ]
+  edge [
+    source 44
+    target 60
+  ]
+  edge [
+    source 44
+    target 61
+  ]
+  edge [
+    source 44
+    target 62
+  ]
+  edge [
+    source 44
+    target 63
+  ]
+  edge [
+    source 44
+    target 64
+  ]
+  edge [
+    source 44
+    target 65
+  ]
+  edge [
+    source 44
+    target 66
+  ]
+  edge [
+    source 44
+    target 67
+  ]
+  edge [
+    source 44
+    target 68
+  ]
+  edge [
+    source 44
+    target 69
+  ]
+  edge [
+    source 44
+    target 70
+  ]
+  edge [
+    source 44
+    target 71
+  ]
+  edge [
+    source 44
+    target 72
+  ]
+  edge [
+    source 44
+    target 73
+  ]
+  edge [
+    source 44
+    target 74
+  ]
+  edge [
+    source 45
+    target 46
+  ]
+  edge [
+    source 45
+    target 47
+  ]
+  edge [
+    source 45
+    target 48
+  ]
+  edge [
+    source 45
+    target 49
+  ]
+  edge [
+    source 45
+    target 50
+  ]
+  edge [
+    source 45
+    target 51
+  ]
+  edge [
+    source 45
+    target 52
+  ]
+  edge [
+    source 45
+    target 53
+  ]
+  edge [
+    source 45
+    target 54
+  ]
+  edge [
+    source 45
+    target 55
+  ]
+  edge [
+    source 45
+    target 56
+  ]
+  edge [
+    source 45
+    target 57
+  ]
+  edge [
+    source 45
+    target 58
+  ]
+  edge [
+    source 45
+    target 59
+  ]
+  edge [
+    source 45
+    target 60
+  ]
+  edge [
+    source 45
+    target 61
+  ]
+  edge [
+    source 45
+    target 62
+  ]
+  edge [
+    source 45
+    target 63
+  ]
+  edge [
+    source 45
+    target 64
+  ]
+  edge [
+    source 45
+    target 65
+  ]
+  edge [
+    source 45
+    target 66
+  ]
+  edge [
+    source 45
+    target 67
+  ]
+  edge [
+    source 45
+    target 68
+  ]
+  edge [
+    source 45
+    target 69
+  ]
+  edge [
+    source 45
+    target 70
+  ]
+  edge [
+    source 45
+    target 71
+  ]
+  edge [
+    source 45
+    target 72
+  ]
+  edge [
+    source 45
+    target 73
+  ]
+  edge [
+    source 45
+    target 74
+  ]
+  edge [
+    source 46
+    target 47
+  ]
+  edge [
+    source 46
+    target 48
+  ]
+  edge [
+    source 46
+    target 49
+  ]
+  edge [
+    source 46
+    target 50
+  ]
+  edge [
+    source 46
+    target 51
+  ]
+  edge [
+    source 46
+    target 52
+  ]
+  edge [
+    source 46
+    target 53
+  ]
+  edge [
+    source 46
+    target 54
+  ]
+  edge [
+    source 46
+    target 55
+  ]
+  edge [
+    source 46
+    target 56
+  ]
+  edge [
+    source 46
+    target 57
+  ]
+  edge [
+    source 46
+    target 58
+  ]
+  edge [
+    source 46
+    target 59
+  ]
+  edge [
+    source 46
+    target 60
+  ]
+  edge [
+    source 46
+    target 61
+  ]
+  edge [
+    source 46
+    target 62
+  ]
+  edge [
+    source 46
+    target 63
+  ]
+  edge [
+    source 46
+    target 64
+  ]
+  edge [
+    source 46
+    target 65
+  ]
+  edge [
+    source 46
+    target 66
+  ]
+  edge [
+    source 46
+    target 67
+  ]
+  edge [
+    source 46
+    target 68
+  ]
+  edge [
+    source 46
+    target 69
+  ]
+  edge [
+    source 46
+    target 70
+  ]
+  edge [
+    source 46
+    target 71
+  ]
+  edge [
+    source 46
+    target 72
+  ]
+  edge [
+    source 46
+    target 73
+  ]
+  edge [
+    source 46
+    target 74
+  ]
+  edge [
+    source 47
+    target 48
+  ]
+  edge [
+    source 47
+    target 49
+  ]
+  edge [
+    source 47
+    target 50
+  ]
+  edge [
+    source 47
+    target 51
+  ]
+  edge [
+    source 47
+    target 52
+  ]
+  edge [
+    source 47
+    target 53
+  ]
+  edge [
+    source 47
+    target 54
+  ]
+  edge [
+    source 47
+    target 55
+  ]
+  edge [
+    source 47
+    target 56
+  ]
+  edge [
+    source 47
+    target 57
+  ]
+  edge [
+    source 47
+    target 58
+  ]
+  edge [
+    source 47
+    target 59
+  ]
+  edge [
+    source 47
+    target 60
+  ]
+  edge [
+    source 47
+    target 61
+  ]
+  edge [
+    source 47
+    target 62
+  ]
+  edge [
+    source 47
+    target 63
+  ]
+  edge [
+    source 47
+    target 64
+  ]
+  edge [
+    source 47
+    target 65
+  ]
+  edge [
+    source 47
+    target 66
+  ]
+  edge [
+    source 47
+    target 67
+  ]
+  edge [
+    source 47
+    target 68
+  ]
+  edge [
+    source 47
+    target 69
+  ]
+  edge [
+    source 47
+    target 70
+  ]
+  edge [
+    source 47
+    target 71
+  ]
+  edge [
+    source 47
+    target 72
+  ]
+  edge [
+    source 47
+    target 73
+  ]
+  edge [
+    source 47
+    target 74
+  ]
+  edge [
+    source 48
+    target 49
+  ]
+  edge [
+    source 48
+    target 50
+  ]
+  edge [
+    source 48
+    target 51
+  ]
+  edge [
+    source 48
+    target 52
+  ]
+  edge [
+    source 48
+    target 53
+  ]
+  edge [
+    source 48
+    target 54
+  ]
+  edge [
+    source 48
+    target 55
+  ]
+  edge [
+    source 48
+    target 56
+  ]
+  edge [
+    source 48
+    target 57
+  ]
+  edge [
+    source 48
+    target 58
+  ]
+  edge [
+    source 48
+    target 59
+  ]
+  edge [
+    source 48
+    target 60
+  ]
+  edge [
+    source 48
+    target 61
+  ]
+  edge [
+    source 48
+    target 62
+  ]
+  edge [
+    source 48
+    target 63
+  ]
+  edge [
+    source 48
+    target 64
+  ]
+  edge [
+    source 48
+    target 65
+  ]
+  edge [
+    source 48
+    target 66
+  ]
+  edge [
+    source 48
+    target 67
+  ]
+  edge [
+    source 48
+    target 68
+  ]
+  edge [
+    source 48
+    target 69
+  ]
+  edge [
+    source 48
+    target 70
+  ]
+  edge [
+    source 48
+    target 71
+  ]
+  edge [
+    source 48
+    target 72
+  ]
+  edge [
+    source 48
+    target 73
+  ]
+  edge [
+    source 48
+    target 74
+  ]
+  edge [
+    source 49
+    target 50
+  ]
+  edge [
+    source 49
+    target 51
+  ]
+  edge [
+    source 49
+    target 52
+  ]
+  edge [
+    source 49
+    target 53
+  ]
+  edge [
+    source 49
+    target 54
+  ]
+  edge [
+    source 49
+    target 55
+  ]
+  edge [
+    source 49
+    target 56
+  ]
+  edge [
+    source 49
+    target 57
+  ]
+  edge [
+    source 49
+    target 58
+  ]
+  edge [
+    source 49
+    target 59
+  ]
+  edge [
+    source 49
+    target 60
+  ]
+  edge [
+    source 49
+    target 61
+  ]
+  edge [
+    source 49
+    target 62
+  ]
+  edge [
+    source 49
+    target 63
+  ]
+  edge [
+    source 49
+    target 64
+  ]
+  edge [
+    source 49
+    target 65
+  ]
+  edge [
+    source 49
+    target 66
+  ]
+  edge [
+    source 49
+    target 67
+  ]
+  edge [
+    source 49
+    target 68
+  ]
+  edge [
+    source 49
+    target 69
+  ]
+  edge [
+    source 49
+    target 70
+  ]
+  edge [
+    source 49
+    target 71
+  ]
+  edge [
+    source 49
+    target 72
+  ]
+  edge [
+    source 49
+    target 73
+  ]
+  edge [
+    source 49
+    target 74
+  ]
+  edge [
+    source 50
+    target 51
+  ]
+  edge [
+    source 50
+    target 52
+  ]
+  edge [
+    source 50
+    target 53
+  ]
+  edge [
+    source 50
+    target 54
+  ]
+  edge [
+    source 50
+    target 55
+  ]
+  edge [
+    source 50
+    target 56
+  ]
+  edge [
+    source 50
+    target 57
+  ]
+  edge [
+    source 50
+    target 58
+  ]
+  edge [
+    source 50
+    target 59
+  ]
+  edge [
+    source 50
+    target 60
+  ]
+  edge [
+    source 50
+    target 61
+  ]
+  edge [
+    source 50
+    target 62
+  ]
+  edge [
+    source 50
+    target 63
+  ]
+  edge [
+    source 50
+    target 64
+  ]
+  edge [
+    source 50
+    target 65
+  ]
+  edge [
+    source 50
+    target 66
+  ]
+  edge [
+    source 50
+    target 67
+  ]
+  edge [
+    source 50
+    target 68
+  ]
+  edge [
+    source 50
+    target 69
+  ]
+  edge [
+    source 50
+    target 70
+  ]
+  edge [
+    source 50
+    target 71
+  ]
+  edge [
+    source 50
+    target 72
+  ]
+  edge [
+    source 50
+    target 73
+  ]
+  edge [
+    source 50
+    target 74
+  ]
+  edge [
+    source 51
+    target 52
+  ]
+  edge [
+    source 51
+    target 53
+  ]
+  edge [
+    source 51
+    target 54
+  ]
+  edge [
+    source 51
+    target 55
+  ]
+  edge [
+    source 51
+    target 56
+  ]
+  edge [
+    source 51
+    target 57
+  ]
+  edge [
+    source 51
+    target 58
+  ]
+  edge [
+    source 51
+    target 59
+  ]
+  edge [
+    source 51
+    target 60
+  ]
+  edge [
+    source 51
+    target 61
+  ]
+  edge [
+    source 51
+    target 62
+  ]
+  edge [
+    source 51
+    target 63
+  ]
+  edge [
+    source 51
+    target 64
+  ]
+  edge [
+    source 51
+    target 65
+  ]
+  edge [
+    source 51
+    target 66
+  ]
+  edge [
+    source 51
+    target 67
+  ]
+  edge [
+    source 51
+    target 68
+  ]
+  edge [
+    source 51
+    target 69
+  ]
+  edge [
+    source 51
+    target 70
+  ]
+  edge [
+    source 51
+    target 71
+  ]
+  edge [
+    source 51
+    target 72
+  ]
+  edge [
+    source 51
+    target 73
+  ]
+  edge [
+    source 51
+    target 74
+  ]
+  edge [
+    source 52
+    target 53
+  ]
+  edge [
+    source 52
+    target 54
+  ]
+  edge [
+    source 52
+    target 55
+  ]
+  edge [
+    source 52
+    target 56
+  ]
+  edge [
+    source 52
+    target 57
+  ]
+  edge [
+    source 52
+    target 58
+  ]
+  edge [
+    source 52
+    target 59
+  ]
+  edge [
+    source 52
+    target 60
+  ]
+  edge [
+    source 52
+    target 61
+  ]
+  edge [
+    source 52
+    target 62
+  ]
+  edge [
+    source 52
+    target 63
+  ]
+  edge [
+    source 52
+    target 64
+  ]
+  edge [
+    source 52
+    target 65
+  ]
+  edge [
+    source 52
+    target 66
+  ]
+  edge [
+    source 52
+    target 67
+  ]
+  edge [
+    source 52
+    target 68
+  ]
+  edge [
+    source 52
+    target 69
+  ]
+  edge [
+    source 52
+    target 70
+  ]
+  edge [
+    source 52
+    target 71
+  ]
+  edge [
+    source 52
+    target 72
+  ]
+  edge [
+    source 52
+    target 73
+  ]
+  edge [
+    source 52
+    target 74
+  ]
+  edge [
+    source 53
+    target 54
+  ]
+  edge [
+    source 53
+    target 55
+  ]
+  edge [
+    source 53
+    target 56
+  ]
+  edge [
+    source 53
+    target 57
+  ]
+  edge [
+    source 53
+    target 58
+  ]
+  edge [
+    source 53
+    target 59
+  ]
+  edge [
+    source 53
+    target 60
+  ]
+  edge [
+    source 53
+    target 61
+  ]
+  edge [
+    source 53
+    target 62
+  ]
+  edge [
+    source 53
+    target 63
+  ]
+  edge [
+    source 53
+    target 64
+  ]
+  edge [
+    source 53
+    target 65
+  ]
+  edge [
+    source 53
+    target 66
+  ]
+  edge [
+    source 53
+    target 67
+  ]
+  edge [
+    source 53
+    target 68
+  ]
+  edge [
+    source 53
+    target 69
+  ]
+  edge [
+    source 53
+    target 70
+  ]
+  edge [
+    source 53
+    target 71
+  ]
+  edge [
+    source 53
+    target 72
+  ]
+  edge [
+    source 53
+    target 73
+  ]
+  edge [
+    source 53
+    target 74
+  ]
+  edge [
+    source 54
+    target 55
+  ]
+  edge [
+    source 54
+    target 56
+  ]
+  edge [
+    source 54
+    target 57
+  ]
+  edge [
+    source 54
+    target 58
+  ]
+  edge [
+    source 54
+    target 59
+  ]
+  edge [
+    source 54
+    target 60
+  ]
+  edge [
+    source 54
+    target 61
+  ]
+  edge [
+    source 54
+    target 62
+  ]
+  edge [
+    source 54
+    target 63
+  ]
+  edge [
+    source 54
+    target 64
+  ]
+  edge [
+    source 54
+    target 65
+  ]
+  edge [
+    source 54
+    target 66
+  ]
+  edge [
+    source 54
+    target 67
+  ]
+  edge [
+    source 54
+    target 68
+  ]
+  edge [
+    source 54
+    target 69
+  ]
+  edge [
+    source 54
+    target 70
+  ]
+  edge [
+    source 54
+    target 71
+  ]
+  edge [
+    source 54
+    target 72
+  ]
+  edge [
+    source 54
+    target 73
+  ]
+  edge [
+    source 54
+    target 74
+  ]
+  edge [
+    source 55
+    target 56
+  ]
+  edge [
+    source 55
+    target 57
+  ]
+  edge [
+    source 55
+    target 58
+  ]
+  edge [
+    source 55
+    target 59
+  ]
+  edge [
+    source 55
+    target 60
+  ]
+  edge [
+    source 55
+    target 61
+  ]
+  edge [
+    source 55
+    target 62
+  ]
+  edge [
+    source 55
+    target 63
+  ]
+  edge [
+    source 55
+    target 64
+  ]
+  edge [
+    source 55
+    target 65
+  ]
+  edge [
+    source 55
+    target 66
+  ]
+  edge [
+    source 55
+    target 67
+  ]
+  edge [
+    source 55
+    target 68
+  ]
+  edge [
+    source 55
+    target 69
+  ]
+  edge [
+    source 55
+    target 70
+  ]
+  edge [
+    source 55
+    target 71
+  ]
+  edge [
+    source 55
+    target 72
+  ]
+  edge [
+    source 55
+    target 73
+  ]
+  edge [
+    source 55
+    target 74
+  ]
+  edge [
+    source 56
+    target 57
+  ]
+  edge [
+    source 56
+    target 58
+  ]
+  edge [
+    source 56
+    target 59
+  ]
+  edge [
+    source 56
+    target 60
+  ]
+  edge [
+    source 56
+    target 61
+  ]
+  edge [
+    source 56
+    target 62
+  ]
+  edge [
+    source 56
+    target 63
+  ]
+  edge [
+    source 56
+    target 64
+  ]
+  edge [
+    source 56
+    target 65
+  ]
+  edge [
+    source 56
+    target 66
+  ]
+  edge [
+    source 56
+    target 67
+  ]
+  edge [
+    source 56
+    target 68
+  ]
+  edge [
+    source 56
+    target 69
+  ]
+  edge [
+    source 56
+    target 70
+  ]
+  edge [
+    source 56
+    target 71
+  ]
+  edge [
+    source 56
+    target 72
+  ]
+  edge [
+    source 56
+    target 73
+  ]
+  edge [
+    source 56
+    target 74
+  ]
+  edge [
+    source 57
+    target 58
+  ]
+  edge [
+    source 57
+    target 59
+  ]
+  edge [
+    source 57
+    target 60
+  ]
+  edge [
+    source 57
+    target 61
+  ]
+  edge [
+    source 57
+    target 62
+  ]
+  edge [
+    source 57
+    target 63
+  ]
+  edge [
+    source 57
+    target 64
+  ]
+  edge [
+    source 57
+    target 65
+  ]
+  edge [
+    source 57
+    target 66
+  ]
+  edge [
+    source 57
+    target 67
+  ]
+  edge [
+    source 57
+    target 68
+  ]
+  edge [
+    source 57
+    target 69
+  ]
+  edge [
+    source 57
+    target 70
+  ]
+  edge [
+    source 57
+    target 71
+  ]
+  edge [
+    source 57
+    target 72
+  ]
+  edge [
+    source 57
+    target 73
+  ]
+  edge [
+    source 57
+    target 74
+  ]
+  edge [
+    source 58
+    target 59
+  ]
+  edge [
+    source 58
+    target 60
+  ]
+  edge [
+    source 58
+    target 61
+  ]
+  edge [
+    source 58
+    target 62
+  ]
+  edge [
+    source 58
+    target 63
+  ]
+  edge [
+    source 58
+    target 64
+  ]
+  edge [
+    source 58
+    target 65
+  ]
+  edge [
+    source 58
+    target 66
+  ]
+  edge [
+    source 58
+    target 67
+  ]
+  edge [
+    source 58
+    target 68
+  ]
+  edge [
+    source 58
+    target 69
+  ]
+  edge [
+    source 58
+    target 70
+  ]
+  edge [
+    source 58
+    target 71
+  ]
+  edge [
+    source 58
+    target 72
+  ]
+  edge [
+    source 58
+    target 73
+  ]
+  edge [
+    source 58
+    target 74
+  ]
+  edge [
+    source 59
+    target 60
+  ]
+  edge [
+    source 59
+    target 61
+  ]
+  edge [
+    source 59
+    target 62
+  ]
+  edge [
+    source 59
+    target 63
+  ]
+  edge [
+    source 59
+    target 64
+  ]
+  edge [
+    source 59
+    target 65
+  ]
+  edge [
+    source 59
+    target 66
+  ]
+  edge [
+    source 59
+    target 67
+  ]
+  edge [
+    source 59
+    target 68
+  ]
+  edge [
+    source 59
+    target 69
+  ]
+  edge [
+    source 59
+    target 70
+  ]
+  edge [
+    source 59
+    target 71
+  ]
+  edge [
+    source 59
+    target 72
+  ]
+  edge [
+    source 59
+    target 73
+  ]
+  edge [
+    source 59
+    target 74
+  ]
+  edge [
+    source 60
+    target 61
+  ]
+  edge [
+    source 60
+    target 62
+  ]
+  edge [
+    source 60
+    target 63
+  ]
+  edge [
+    source 60
+    target 64
+  ]
+  edge [
+    source 60
+    target 65
+  ]
+  edge [
+    source 60
+    target 66
+  ]
+  edge [
+    source 60
+    target 67
+  ]
+  edge [
+    source 60
+    target 68
+  ]
+  edge [
+    source 60
+    target 69
+  ]
+  edge [
+    source 60
+    target 70
+  ]
+  edge [
+    source 60
+    target 71
+  ]
+  edge [
+    source 60
+    target 72
+  ]
+  edge [
+    source 60
+    target 73
+  ]
+  edge [
+    source 60
+    target 74
+  ]
+  edge [
+    source 61
+    target 62
+  ]
+  edge [
+    source 61
+    target 63
+  ]
+  edge [
+    source 61
+    target 64
+  ]
+  edge [
+    source 61
+    target 65
+  ]
+  edge [
+    source 61
+    target 66
+  ]
+  edge [
+    source 61
+    target 67
+  ]
+  edge [
+    source 61
+    target 68
+  ]
+  edge [
+    source 61
+    target 69
+  ]
+  edge [
+    source 61
+    target 70
+  ]
+  edge [
+    source 61
+    target 71
+  ]
+  edge [
+    source 61
+    target 72
+  ]
+  edge [
+    source 61
+    target 73
+  ]
+  edge [
+    source 61
+    target 74
+  ]
+  edge [
+    source 62
+    target 63
+  ]
+  edge [
+    source 62
+    target 64
+  ]
+  edge [
+    source 62
+    target 65
+  ]
+  edge [
+    source 62
+    target 66
+  ]
+  edge [
+    source 62
+    target 67
+  ]
+  edge [
+    source 62
+    target 68
+  ]
+  edge [
+    source 62
+    target 69
+  ]
+  edge [
+    source 62
+    target 70
+  ]
+  edge [
+    source 62
+    target 71
+  ]
+  edge [
+    source 62
+    target 72
+  ]
+  edge [
+    source 62
+    target 73
+  ]
+  edge [
+    source 62
+    target 74
+  ]
+  edge [
+    source 63
+    target 64
+  ]
+  edge [
+    source 63
+    target 65
+  ]
+  edge [
+    source 63
+    target 66
+  ]
+  edge [
+    source 63
+    target 67
+  ]
+  edge [
+    source 63
+    target 68
+  ]
+  edge [
+    source 63
+    target 69
+  ]
+  edge [
+    source 63
+    target 70
+  ]
+  edge [
+    source 63
+    target 71
+  ]
+  edge [
+    source 63
+    target 72
+  ]
+  edge [
+    source 63
+    target 73
+  ]
+  edge [
+    source 63
+    target 74
+  ]
+  edge [
+    source 64
+    target 65
+  ]
+  edge [
+    source 64
+    target 66
+  ]
+  edge [
+    source 64
+    target 67
+  ]
+  edge [
+    source 64
+    target 68
+  ]
+  edge [
+    source 64
+    target 69
+  ]
+  edge [
+    source 64
+    target 70
+  ]
+  edge [
+    source 64
+    target 71
+  ]
+  edge [
+    source 64
+    target 72
+  ]
+  edge [
+    source 64
+    target 73
+  ]
+  edge [
+    source 64
+    target 74
+  ]
+  edge [
+    source 65
+    target 66
+  ]
+  edge [
+    source 65
+    target 67
+  ]
+  edge [
+    source 65
+    target 68
+  ]
+  edge [
+    source 65
+    target 69
+  ]
+  edge [
+    source 65
+    target 70
+  ]
+  edge [
+    source 65
+    target 71
+  ]
+  edge [
+    source 65
+    target 72
+  ]
+  edge [
+    source 65
+    target 73
+  ]
+  edge [
+    source 65
+    target 74
+  ]
+  edge [
+    source 66
+    target 67
+  ]
+  edge [
+    source 66
+    target 68
+  ]
+  edge [
+    source 66
+    target 69
+  ]
+  edge [
+    source 66
+    target 70
+  ]
+  edge [
+    source 66
+    target 71
+  ]
+  edge [
+    source 66
+    target 72
+  ]
+  edge [
+    source 66
+    target 73
+  ]
+  edge [
+    source 66
+    target 74
+  ]
+  edge [
+    source 67
+    target 68
+  ]
+  edge [
+    source 67
+    target 69
+  ]
+  edge [
+    source 67
+    target 70
+  ]
+  edge [
+    source 67
+    target 71
+  ]
+  edge [
+    source 67
+    target 72
+  ]
+  edge [
+    source 67
+    target 73
+  ]
+  edge [
+    source 67
+    target 74
+  ]
+  edge [
+    source 68
+    target 69
+  ]
+  edge [
+    source 68
+    target 70
+  ]
+  edge [
+    source 68
+    target 71
+  ]
+  edge [
+    source 68
+    target 72
+  ]
+  edge [
+    source 68
+    target 73
+  ]
+  edge [
+    source 68
+    target 74
+  ]
+  edge [
+    source 69
+    target 70
+  ]
+  edge [
+    source 69
+    target 71
+  ]
+  edge [
+    source 69
+    target 72
+  ]
+  edge [
+    source 69
+    target 73
+  ]
+  edge [
+    source 69
+    target 74
+  ]
+  edge [
+    source 70
+    target 71
+  ]
+  edge [
+    source 70
+    target 72
+  ]
+  edge [
+    source 70
+    target 73
+  ]
+  edge [
+    source 70
+    target 74
+  ]
+  edge [
+    source 71
+    target 72
+  ]
+  edge [
+    source 71
+    target 73
+  ]
+  edge [
+    source 71
+    target 74
+  ]
+  edge [
+    source 72
+    target 73
+  ]
+  edge [
+    source 72
+    target 74
+  ]
+  edge [
+    source 73
+    target 74
+  ]
+]
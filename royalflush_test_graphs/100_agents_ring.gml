@@ -0,0 +1,1002 @@
+graph [
+  node [
+    id 0
+    label "a0"
+    jid "a0@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 1
+    label "a1"
+    jid "a1@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 2
+    label "a2"
+    jid "a2@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 3
+    label "a3"
+    jid "a3@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 4
+    label "a4"
+    jid "a4@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 5
+    label "a5"
+    jid "a5@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 6
+    label "a6"
+    jid "a6@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 7
+    label "a7"
+    jid "a7@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 8
+    label "a8"
+    jid "a8@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 9
+    label "a9"
+    jid "a9@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 10
+    label "a10"
+    jid "a10@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 11
+    label "a11"
+    jid "a11@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 12
+    label "a12"
+    jid "a12@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 13
+    label "a13"
+    jid "a13@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 14
+    label "a14"
+    jid "a14@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 15
+    label "a15"
+    jid "a15@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 16
+    label "a16"
+    jid "a16@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 17
+    label "a17"
+    jid "a17@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 18
+    label "a18"
+    jid "a18@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 19
+    label "a19"
+    jid "a19@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 20
+    label "a20"
+    jid "a20@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 21
+    label "a21"
+    jid "a21@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 22
+    label "a22"
+    jid "a22@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 23
+    label "a23"
+    jid "a23@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 24
+    label "a24"
+    jid "a24@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 25
+    label "a25"
+    jid "a25@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 26
+    label "a26"
+    jid "a26@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 27
+    label "a27"
+    jid "a27@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 28
+    label "a28"
+    jid "a28@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 29
+    label "a29"
+    jid "a29@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 30
+    label "a30"
+    jid "a30@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 31
+    label "a31"
+    jid "a31@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 32
+    label "a32"
+    jid "a32@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 33
+    label "a33"
+    jid "a33@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 34
+    label "a34"
+    jid "a34@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 35
+    label "a35"
+    jid "a35@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 36
+    label "a36"
+    jid "a36@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 37
+    label "a37"
+    jid "a37@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 38
+    label "a38"
+    jid "a38@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 39
+    label "a39"
+    jid "a39@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 40
+    label "a40"
+    jid "a40@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 41
+    label "a41"
+    jid "a41@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 42
+    label "a42"
+    jid "a42@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 43
+    label "a43"
+    jid "a43@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 44
+    label "a44"
+    jid "a44@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 45
+    label "a45"
+    jid "a45@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 46
+    label "a46"
+    jid "a46@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 47
+    label "a47"
+    jid "a47@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 48
+    label "a48"
+    jid "a48@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 49
+    label "a49"
+    jid "a49@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 50
+    label "a50"
+    jid "a50@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 51
+    label "a51"
+    jid "a51@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 52
+    label "a52"
+    jid "a52@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 53
+    label "a53"
+    jid "a53@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 54
+    label "a54"
+    jid "a54@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 55
+    label "a55"
+    jid "a55@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 56
+    label "a56"
+    jid "a56@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 57
+    label "a57"
+    jid "a57@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 58
+    label "a58"
+    jid "a58@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 59
+    label "a59"
+    jid "a59@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 60
+    label "a60"
+    jid "a60@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 61
+    label "a61"
+    jid "a61@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 62
+    label "a62"
+    jid "a62@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 63
+    label "a63"
+    jid "a63@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 64
+    label "a64"
+    jid "a64@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 65
+    label "a65"
+    jid "a65@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 66
+    label "a66"
+    jid "a66@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 67
+    label "a67"
+    jid "a67@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 68
+    label "a68"
+    jid "a68@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 69
+    label "a69"
+    jid "a69@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 70
+    label "a70"
+    jid "a70@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 71
+    label "a71"
+    jid "a71@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 72
+    label "a72"
+    jid "a72@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 73
+    label "a73"
+    jid "a73@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 74
+    label "a74"
+    jid "a74@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 75
+    label "a75"
+    jid "a75@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 76
+    label "a76"
+    jid "a76@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 77
+    label "a77"
+    jid "a77@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 78
+    label "a78"
+    jid "a78@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 79
+    label "a79"
+    jid "a79@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 80
+    label "a80"
+    jid "a80@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 81
+    label "a81"
+    jid "a81@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 82
+    label "a82"
+    jid "a82@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 83
+    label "a83"
+    jid "a83@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 84
+    label "a84"
+    jid "a84@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 85
+    label "a85"
+    jid "a85@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 86
+    label "a86"
+    jid "a86@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 87
+    label "a87"
+    jid "a87@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 88
+    label "a88"
+    jid "a88@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 89
+    label "a89"
+    jid "a89@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 90
+    label "a90"
+    jid "a90@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 91
+    label "a91"
+    jid "a91@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 92
+    label "a92"
+    jid "a92@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 93
+    label "a93"
+    jid "a93@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 94
+    label "a94"
+    jid "a94@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 95
+    label "a95"
+    jid "a95@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 96
+    label "a96"
+    jid "a96@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 97
+    label "a97"
+    jid "a97@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 98
+    label "a98"
+    jid "a98@localhost"
+    coalition_id ""
+  ]
+  node [
+    id 99
+    label "a99"
+    jid "a99@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+  edge [
+    source 0
+    target 99
+  ]
+  edge [
+    source 1
+    target 2
+  ]
+  edge [
+    source 2
+    target 3
+  ]
+  edge [
+    source 3
+    target 4
+  ]
+  edge [
+    source 4
+    target 5
+  ]
+  edge [
+    source 5
+    target 6
+  ]
+  edge [
+    source 6
+    target 7
+  ]
+  edge [
+    source 7
+    target 8
+  ]
+  edge [
+    source 8
+    target 9
+  ]
+  edge [
+    source 9
+    target 10
+  ]
+  edge [
+    source 10
+    target 11
+  ]
+  edge [
+    source 11
+    target 12
+  ]
+  edge [
+    source 12
+    target 13
+  ]
+  edge [
+    source 13
+    target 14
+  ]
+  edge [
+    source 14
+    target 15
+  ]
+  edge [
+    source 15
+    target 16
+  ]
+  edge [
+    source 16
+    target 17
+  ]
+  edge [
+    source 17
+    target 18
+  ]
+  edge [
+    source 18
+    target 19
+  ]
+  edge [
+    source 19
+    target 20
+  ]
+  edge [
+    source 20
+    target 21
+  ]
+  edge [
+    source 21
+    target 22
+  ]
+  edge [
+    source 22
+    target 23
+  ]
+  edge [
+    source 23
+    target 24
+  ]
+  edge [
+    source 24
+    target 25
+  ]
+  edge [
+    source 25
+    target 26
+  ]
+  edge [
+    source 26
+    target 27
+  ]
+  edge [
+    source 27
+    target 28
+  ]
+  edge [
+    source 28
+    target 29
+  ]
+  edge [
+    source 29
+    target 30
+  ]
+  edge [
+    source 30
+    target 31
+  ]
+  edge [
+    source 31
+    target 32
+  ]
+  edge [
+    source 32
+    target 33
+  ]
+  edge [
+    source 33
+    target 34
+  ]
+  edge [
+    source 34
+    target 35
+  ]
+  edge [
+    source 35
+    target 36
+  ]
+  edge [
+    source 36
+    target 37
+  ]
+  edge [
+    source 37
+    target 38
+  ]
+  edge [
+    source 38
+    target 39
+  ]
+  edge [
+    source 39
+    target 40
+  ]
+  edge [
+    source 40
+    target 41
+  ]
+  edge [
+    source 41
+    target 42
+  ]
+  edge [
+    source 42
+    target 43
+  ]
+  edge [
+    source 43
+    target 44
+  ]
+  edge [
+    source 44
+    target 45
+  ]
+  edge [
+    source 45
+    target 46
+  ]
+  edge [
+    source 46
+    target 47
+  ]
+  edge [
+    source 47
+    target 48
+  ]
+  edge [
+    source 48
+    target 49
+  ]
+  edge [
+    source 49
+    target 50
+  ]
+  edge [
+    source 50
+    target 51
+  ]
+  edge [
+    source 51
+    target 52
+  ]
+  edge [
+    source 52
+    target 53
+  ]
+  edge [
+    source 53
+    target 54
+  ]
+  edge [
+    source 54
+    target 55
+  ]
+  edge [
+    source 55
+    target 56
+  ]
+  edge [
+    source 56
+    target 57
+  ]
+  edge [
+    source 57
+    target 58
+  ]
+  edge [
+    source 58
+    target 59
+  ]
+  edge [
+    source 59
+    target 60
+  ]
+  edge [
+    source 60
+    target 61
+  ]
+  edge [
+    source 61
+    target 62
+  ]
+  edge [
+    source 62
+    target 63
+  ]
+  edge [
+    source 63
+    target 64
+  ]
+  edge [
+    source 64
+    target 65
+  ]
+  edge [
+    source 65
+    target 66
+  ]
+  edge [
+    source 66
+    target 67
+  ]
+  edge [
+    source 67
+    target 68
+  ]
+  edge [
+    source 68
+    target 69
+  ]
+  edge [
+    source 69
+    target 70
+  ]
+  edge [
+    source 70
+    target 71
+  ]
+  edge [
+    source 71
+    target 72
+  ]
+  edge [
+    source 72
+    target 73
+  ]
+  edge [
+    source 73
+    target 74
+  ]
+  edge [
+    source 74
+    target 75
+  ]
+  edge [
+    source 75
+    target 76
+  ]
+  edge [
+    source 76
+    target 77
+  ]
+  edge [
+    source 77
+    target 78
+  ]
+  edge [
+    source 78
+    target 79
+  ]
+  edge [
+    source 79
+    target 80
+  ]
+  edge [
+    source 80
+    target 81
+  ]
+  edge [
+    source 81
+    target 82
+  ]
+  edge [
+    source 82
+    target 83
+  ]
+  edge [
+    source 83
+    target 84
+  ]
+  edge [
+    source 84
+    target 85
+  ]
+  edge [
+    source 85
+    target 86
+  ]
+  edge [
+    source 86
+    target 87
+  ]
+  edge [
+    source 87
+    target 88
+  ]
+  edge [
+    source 88
+    target 89
+  ]
+  edge [
+    source 89
+    target 90
+  ]
+  edge [
+    source 90
+    target 91
+  ]
+  edge [
+    source 91
+    target 92
+  ]
+  edge [
+    source 92
+    target 93
+  ]
+  edge [
+    source 93
+    target 94
+  ]
+  edge [
+    source 94
+    target 95
+  ]
+  edge [
+    source 95
+    target 96
+  ]
+  edge [
+    source 96
+    target 97
+  ]
+  edge [
+    source 97
+    target 98
+  ]
+  edge [
+    source 98
+    target 99
+  ]
+]
@@ -0,0 +1,62 @@
+graph [
+  node [
+    id 0
+    label "agent1"
+    jid "agent1@localhost"
+    coalition_id 1
+  ]
+  node [
+    id 1
+    label "agent2"
+    jid "agent2@localhost"
+    coalition_id 1
+  ]
+  node [
+    id 2
+    label "agent3"
+    jid "agent3@localhost"
+    coalition_id 2
+  ]
+  node [
+    id 3
+    label "agent4"
+    jid "agent4@localhost"
+    coalition_id 2
+  ]
+  node [
+    id 4
+    label "agent5"
+    jid "agent5@localhost"
+    coalition_id 3
+  ]
+  node [
+    id 5
+    label "agent6"
+    jid "agent6@localhost"
+    coalition_id ""
+  ]
+  edge [
+    source 0
+    target 1
+  ]
+  edge [
+    source 1
+    target 2
+  ]
+  edge [
+    source 1
+    target 3
+  ]
+  edge [
+    source 2
+    target 3
+  ]
+  edge [
+    source 3
+    target 4
+  ]
+  edge [
+    source 3
+    target 5
+  ]
+]
@@ -0,0 +1,13 @@
+import pytest
+
+from royalflush._agent.agent_factory import shard_agents
+
+
+def test_shard_agents_partition() -> None:
+    localparts = [f"a{i}" for i in range(10)]
+    shards = [shard_agents(localparts, shard_index=i, num_shards=3) for i in range(3)]
+    assert shards == [["a0", "a3", "a6", "a9"], ["a1", "a4", "a7"], ["a2", "a5", "a8"]]
+    assert sorted(sum(shards, [])) == sorted(localparts)
+    assert shard_agents(localparts, shard_index=0, num_shards=1) == localparts
+    with pytest.raises(ValueError):
+        shard_agents(localparts, shard_index=3, num_shards=3)
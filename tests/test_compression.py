@@ -0,0 +1,46 @@
+import torch
+from torch import nn
+
+from royalflush.message.compression import (
+    COMPRESSION_CODECS,
+    ShuffleZlibCodec,
+    get_compression_codec,
+    negotiate_compression_codec,
+)
+from royalflush.message.layer_format import BinaryLayerFormat
+
+
+def build_payload() -> bytes | bytearray:
+    return BinaryLayerFormat().encode(dict(nn.Linear(64, 32).state_dict()))
+
+
+def test_round_trip_all_codecs() -> None:
+    payload = build_payload()
+    for name, codec in COMPRESSION_CODECS.items():
+        assert bytes(codec.decompress(codec.compress(payload))) == bytes(payload), f"Codec '{name}' fails."
+
+
+def test_shuffle_with_trailing_bytes() -> None:
+    codec = ShuffleZlibCodec(element_size=4)
+    payload = bytes(range(23))
+    assert bytes(codec.decompress(codec.compress(payload))) == payload
+
+
+def test_shuffle_compresses_float_tensors() -> None:
+    payload = BinaryLayerFormat().encode({"weight": torch.randn(4096) * 1e-3})
+    assert len(ShuffleZlibCodec().compress(payload)) < len(get_compression_codec("zlib").compress(payload))
+
+
+def test_negotiate_compression_codec() -> None:
+    assert negotiate_compression_codec("zlib", ["none", "zlib"]) == "zlib"
+    assert negotiate_compression_codec("lzma", ["none", "zlib"]) == "none"
+    assert negotiate_compression_codec("zlib", None) == "none"
+
+
+def test_get_compression_codec() -> None:
+    assert get_compression_codec("ZLIB").name == "zlib"
+    try:
+        get_compression_codec("zstd")
+        assert False, "An invalid compression codec must raise an error."
+    except NotImplementedError:
+        pass
@@ -1,9 +1,15 @@
+import asyncio
 import copy
+import time
 
 import torch
+from aioxmpp import JID
 
+from royalflush.datatypes.consensus import Consensus
 from royalflush.datatypes.consensus_manager import ConsensusManager
 
+from .test_flat_state import build_consensus_manager
+
 
 def test_consensus_update_tensors_2agents():
     max_order = 1  # real max order
@@ -161,3 +167,33 @@ def test_initial_model_not_modified_during_consensus():
     assert torch.allclose(
         freeze_model_a["weight"], model_state_a["weight"]
     ), "The initial model has been modified during consensus process"
+
+
+def test_wait_receive_consensus_wakes_up_with_the_last_response() -> None:
+    manager = build_consensus_manager(batched_consensus=False)
+    neighbours = [JID.fromstr(f"neighbour{i}@localhost") for i in range(2)]
+    manager.waiting_responses = {neighbour: ["3.bias"] for neighbour in neighbours}
+
+    async def wait() -> tuple[bool, float]:
+        loop = asyncio.get_running_loop()
+        for i, neighbour in enumerate(neighbours):
+            consensus = Consensus(layers={"3.bias": torch.zeros(4)}, sender=neighbour)
+            loop.call_later(0.05 * (i + 1), manager.add_consensus, consensus, None)
+        start = time.monotonic()
+        received = await manager.wait_receive_consensus(timeout=10)
+        return received, time.monotonic() - start
+
+    received, elapsed = asyncio.run(wait())
+    assert received
+    assert 0.1 <= elapsed < 1
+    assert len(manager.received_consensus) == 2
+
+
+def test_wait_receive_consensus_deadline() -> None:
+    manager = build_consensus_manager(batched_consensus=False)
+    manager.waiting_responses = {JID.fromstr("neighbour@localhost"): ["3.bias"]}
+    start = time.monotonic()
+    assert not asyncio.run(manager.wait_receive_consensus(timeout=0.2))
+    assert 0.2 <= time.monotonic() - start < 1
+    manager.waiting_responses = {}
+    assert asyncio.run(manager.wait_receive_consensus(timeout=10))
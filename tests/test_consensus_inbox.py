@@ -0,0 +1,50 @@
+import pytest
+import torch
+from aioxmpp import JID
+
+from royalflush.datatypes.consensus import Consensus
+from royalflush.datatypes.consensus_inbox import ConsensusInbox
+
+
+def build_consensus(sender: str, value: float) -> Consensus:
+    return Consensus(layers={"bias": torch.full((2,), value)}, sender=JID.fromstr(f"{sender}@localhost/resource"))
+
+
+def values(consensus: list[Consensus]) -> list[float]:
+    return [ct.layers["bias"][0].item() for ct in consensus]
+
+
+def test_replace_by_sender_keeps_the_position() -> None:
+    inbox = ConsensusInbox(replace_by_sender=True)
+    for sender, value in [("a", 1), ("b", 2), ("a", 3), ("c", 4), ("b", 5)]:
+        assert inbox.put(build_consensus(sender, value))
+    assert len(inbox) == 3
+    assert values(inbox.pop_all()) == [3, 5, 4]
+    assert len(inbox) == 0
+    assert inbox.pop_all() == []
+
+
+def test_without_replacement() -> None:
+    inbox = ConsensusInbox(replace_by_sender=False)
+    for sender, value in [("a", 1), ("a", 2), ("b", 3)]:
+        inbox.put(build_consensus(sender, value))
+    assert values(inbox.pop_all()) == [1, 2, 3]
+
+
+def test_overflow_policies() -> None:
+    inbox = ConsensusInbox(replace_by_sender=True, capacity=2, overflow="drop_oldest")
+    for sender, value in [("a", 1), ("b", 2), ("c", 3)]:
+        assert inbox.put(build_consensus(sender, value))
+    assert inbox.put(build_consensus("b", 4))  # Replacements do not overflow
+    assert inbox.dropped == 1
+    assert values(inbox.pop_all()) == [4, 3]
+
+    inbox = ConsensusInbox(replace_by_sender=False, capacity=2, overflow="drop_newest")
+    assert [inbox.put(build_consensus("a", value)) for value in [1, 2, 3]] == [True, True, False]
+    assert inbox.dropped == 1
+    assert values(inbox.pop_all()) == [1, 2]
+
+    with pytest.raises(NotImplementedError):
+        ConsensusInbox(overflow="block")
+    with pytest.raises(ValueError):
+        ConsensusInbox(capacity=0)
@@ -114,6 +114,52 @@ class TestConsensusTransmission(unittest.TestCase):
         self.assertEqual(received_transmission.sender, consensus_transmission.sender)
         self.assertEqual(received_transmission.sent_time_z, consensus_transmission.sent_time_z)
 
+    def test_round_trip_all_layer_formats(self):
+        model_state = nn.Linear(10, 5).state_dict()
+        sender = JID.fromstr("sender@localhost")
+
+        for layer_format in ["binary", "pickle"]:
+            message = Consensus(layers=model_state, sender=sender).to_message(layer_format=layer_format)
+            message.sender = str(sender.bare())
+            self.assertEqual(json.loads(message.body)["layers_format"], layer_format)
+
+            received_transmission = Consensus.from_message(message)
+            for key in model_state.keys():
+                assert torch.equal(received_transmission.layers[key], model_state[key])
+
+    def test_round_trip_all_compression_codecs(self):
+        model_state = nn.Linear(10, 5).state_dict()
+        sender = JID.fromstr("sender@localhost")
+
+        for compression in ["none", "zlib", "lzma", "shuffle_zlib"]:
+            for layer_format in ["binary", "pickle"]:
+                message = Consensus(layers=model_state, sender=sender).to_message(
+                    layer_format=layer_format, compression=compression
+                )
+                message.sender = str(sender.bare())
+                self.assertEqual(json.loads(message.body)["layers_compression"], compression)
+
+                received_transmission = Consensus.from_message(message)
+                for key in model_state.keys():
+                    assert torch.equal(received_transmission.layers[key], model_state[key])
+
+    def test_from_legacy_message(self):
+        model_state = nn.Linear(10, 5).state_dict()
+        now = datetime.now(tz=timezone.utc)
+
+        # Messages of previous versions do not have the layers format and are always pickled
+        content = {
+            "layers": ModelManager.export_layers(model_state),
+            "sender": "sender@localhost",
+            "request_reply": False,
+            "sent_time_z": now.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        }
+        message = Message(sender="sender@localhost", body=json.dumps(content))
+
+        received_transmission = Consensus.from_message(message)
+        for key in model_state.keys():
+            assert torch.equal(received_transmission.layers[key], model_state[key])
+
     def test_datetime_format(self):
         now = datetime.now(tz=timezone.utc)
         formatted_time = now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
@@ -0,0 +1,69 @@
+import torch
+from aioxmpp import JID
+from torch import nn
+
+from royalflush.datatypes.consensus import Consensus
+from royalflush.datatypes.delta import DeltaManager, xor_layers
+
+SENDER = JID.fromstr("sender@localhost")
+RECEIVER = JID.fromstr("receiver@localhost")
+
+
+def transmit(sender: DeltaManager, receiver: DeltaManager, layers: dict[str, torch.Tensor]) -> tuple[Consensus, int]:
+    version, encoded, bases = sender.encode(RECEIVER, layers)
+    consensus = Consensus(layers=encoded, sender=SENDER, version=version, delta_bases=bases)
+    message = consensus.to_message(compression="shuffle_zlib")
+    message.sender = str(SENDER)
+    received = Consensus.from_message(message)
+    decoded = receiver.decode(SENDER, version=received.version, layers=received.layers, bases=received.delta_bases)
+    assert decoded is not None
+    for name, layer in layers.items():
+        assert torch.equal(decoded[name], layer), f"Layer '{name}' does not match."
+    return received, len(message.body)
+
+
+def test_xor_layers() -> None:
+    for dtype in [torch.float32, torch.float16, torch.bfloat16, torch.float64, torch.int8, torch.int64, torch.bool]:
+        layer = (torch.randn(4, 5) * 10).to(dtype)
+        base = (torch.randn(4, 5) * 10).to(dtype)
+        delta = xor_layers(layer, base)
+        assert delta.dtype == dtype
+        assert torch.equal(xor_layers(delta, base), layer)
+    layer = torch.randn(3, 3)
+    assert not torch.any(xor_layers(layer, layer).view(torch.int32))
+
+
+def test_delta_against_acknowledged_version() -> None:
+    sender, receiver = DeltaManager(), DeltaManager()
+    model = nn.Linear(128, 64)
+    layers = {name: layer.clone() for name, layer in model.state_dict().items()}
+
+    received, dense_size = transmit(sender, receiver, layers)
+    assert not received.delta_bases
+    sender.acknowledge(RECEIVER, version=receiver.get_acknowledgement(SENDER))
+
+    layers["weight"][0, :4] += 1  # Few changes between consensus iterations
+    received, delta_size = transmit(sender, receiver, layers)
+    assert received.delta_bases == {"weight": 0, "bias": 0}
+    assert delta_size * 10 < dense_size
+
+
+def test_without_acknowledgement_the_layers_are_complete_when_the_base_is_old() -> None:
+    sender, receiver = DeltaManager(cache_size=2), DeltaManager(cache_size=2)
+    layers = {"weight": torch.randn(16)}
+    transmit(sender, receiver, layers)
+    sender.acknowledge(RECEIVER, version=0)
+    received, _ = transmit(sender, receiver, layers)
+    assert received.delta_bases == {"weight": 0}
+    received, _ = transmit(sender, receiver, layers)
+    assert not received.delta_bases  # The receiver could have removed the version 0 from its cache
+
+
+def test_missing_base_is_not_acknowledged() -> None:
+    sender, receiver = DeltaManager(), DeltaManager()
+    layers = {"weight": torch.randn(16)}
+    sender.encode(RECEIVER, layers)  # Lost message
+    sender.acknowledge(RECEIVER, version=0)
+    version, encoded, bases = sender.encode(RECEIVER, layers)
+    assert receiver.decode(SENDER, version=version, layers=encoded, bases=bases) is None
+    assert receiver.get_acknowledgement(SENDER) is None
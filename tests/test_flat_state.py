@@ -0,0 +1,118 @@
+import copy
+
+import torch
+from aioxmpp import JID
+from torch import nn
+from torch.optim import SGD
+from torch.utils.data import DataLoader, TensorDataset
+
+from royalflush.datatypes.consensus import Consensus
+from royalflush.datatypes.consensus_manager import ConsensusManager
+from royalflush.datatypes.data import DataLoaders
+from royalflush.datatypes.flat_state import FlatModelState
+from royalflush.datatypes.models import ModelManager
+from royalflush.message.precision import reduce_layers_precision
+
+
+def build_model() -> nn.Module:
+    torch.manual_seed(13)
+    return nn.Sequential(nn.Linear(8, 16), nn.BatchNorm1d(16), nn.ReLU(), nn.Linear(16, 4))
+
+
+def build_consensus_manager(batched_consensus: bool) -> ConsensusManager:
+    model = build_model()
+    dataloader = DataLoader(TensorDataset(torch.randn(8, 8), torch.zeros(8, dtype=torch.int64)), batch_size=4)
+    model_manager = ModelManager(
+        model=model,
+        criterion=nn.CrossEntropyLoss(),
+        optimizer=SGD(model.parameters(), lr=0.1),
+        batch_size=4,
+        training_epochs=1,
+        dataloaders=DataLoaders(train=dataloader, validation=dataloader, test=dataloader),
+        device="cpu",
+    )
+    return ConsensusManager(
+        model_manager=model_manager,
+        max_order=3,
+        max_seconds_to_accept_consensus=60,
+        only_one_consensus_model_per_agent=False,
+        batched_consensus=batched_consensus,
+    )
+
+
+def test_tensors_are_views_of_flat_buffers() -> None:
+    model = build_model()
+    state = copy.deepcopy(model.state_dict())
+    flat_state = FlatModelState(model)
+    assert flat_state.is_bound()
+    assert len(flat_state.buffers) == 2  # float32 parameters and buffers, int64 number of batches tracked
+    flat = flat_state.buffers[(torch.float32, torch.device("cpu"))]
+    assert flat.numel() == sum(tensor.numel() for tensor in state.values() if tensor.is_floating_point())
+    for name, tensor in model.state_dict().items():
+        assert torch.equal(tensor, state[name])
+        if tensor.is_floating_point():
+            assert flat.data_ptr() <= tensor.data_ptr() < flat.data_ptr() + flat.numel() * flat.element_size()
+
+    # Training updates the flat buffers
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    model(torch.randn(4, 8)).sum().backward()
+    optimizer.step()
+    assert flat_state.is_bound()
+    assert torch.equal(flat_state.tensors["0.weight"], model.state_dict()["0.weight"])
+    assert not torch.equal(flat_state.tensors["0.weight"], state["0.weight"])
+
+
+def test_lerp_matches_out_of_place_consensus() -> None:
+    model, foreign_model = build_model(), build_model()
+    with torch.no_grad():
+        for parameter in foreign_model.parameters():
+            parameter.add_(torch.randn_like(parameter))
+    foreign_model.state_dict()["1.num_batches_tracked"].fill_(10)
+    for precision in ["fp32", "fp16", "int8"]:
+        flat_state = FlatModelState(model)
+        pointers = {name: tensor.data_ptr() for name, tensor in model.state_dict().items()}
+        layers, quantization = reduce_layers_precision(foreign_model.state_dict(), precision=precision)
+        expected = ConsensusManager.apply_consensus_to_model_with_layers(
+            full_model=model.state_dict(), layers=layers, max_order=2, quantization=quantization
+        )
+        flat_state.lerp_(layers, weight=ConsensusManager.get_epsilon(max_order=2), quantization=quantization)
+        for name, tensor in model.state_dict().items():
+            assert tensor.data_ptr() == pointers[name], f"Layer '{name}' was reallocated."
+            assert torch.allclose(tensor, expected[name].to(tensor.dtype), atol=1e-6), f"Layer '{name}' differs."
+
+
+def test_rebind_after_replacing_the_tensors() -> None:
+    model = build_model()
+    flat_state = FlatModelState(model)
+    model.load_state_dict(copy.deepcopy(model.state_dict()), assign=True)
+    assert not flat_state.is_bound()
+    layers = {"3.bias": torch.ones(4)}
+    flat_state.lerp_(layers, weight=0.5)
+    assert flat_state.is_bound()
+    assert torch.equal(model.state_dict()["3.bias"], flat_state.tensors["3.bias"])
+
+
+def test_batched_consensus_matches_sequential_consensus() -> None:
+    sequential, batched = build_consensus_manager(False), build_consensus_manager(True)
+    for i in range(4):
+        layers = {
+            name: tensor + torch.randn_like(tensor) if tensor.is_floating_point() else tensor + 3
+            for name, tensor in build_model().state_dict().items()
+        }
+        if i == 1:
+            del layers["0.weight"]  # Partial layer sets keep the order of the sequential consensus
+        layers, quantization = reduce_layers_precision(layers, precision="int8" if i == 2 else "fp32")
+        for manager in [sequential, batched]:
+            manager.add_consensus(
+                Consensus(layers=layers, sender=JID.fromstr(f"neighbour{i}@localhost"), quantization=quantization),
+                thread=None,
+            )
+    version = batched.model_manager.version
+    applied = batched.apply_all_consensus()
+    assert len(applied) == len(sequential.apply_all_consensus()) == 4
+    assert batched.model_manager.version == version + 1
+    assert all(ct.processed_end_time_z is not None for ct in applied)
+    expected = sequential.model_manager.model.state_dict()
+    for name, tensor in batched.model_manager.model.state_dict().items():
+        assert torch.allclose(tensor, expected[name], atol=1e-6), f"Layer '{name}' differs."
+    assert batched.apply_all_consensus() == []
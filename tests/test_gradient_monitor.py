@@ -0,0 +1,48 @@
+import logging
+
+import pytest
+import torch
+from torch import nn
+
+from royalflush.datatypes.gradient_monitor import GradientMonitor
+
+from .test_model_manager import build_model_manager
+
+
+def test_gradients_are_sampled_on_the_first_step_of_each_epoch_and_every_interval() -> None:
+    model_manager, _ = build_model_manager(double_buffered=False)
+    model_manager.gradient_monitor = GradientMonitor(model_manager.model, interval=3)
+    model_manager.train(epochs=2)  # 4 batches per epoch
+    steps, norms = model_manager.gradient_monitor.history()
+    assert steps.tolist() == [1, 3, 5, 6]
+    assert norms.shape == (4, 2)
+    assert torch.isfinite(norms).all()
+    assert set(model_manager.gradient_monitor.latest()) == {"weight", "bias"}
+
+
+def test_gradient_monitor_ring_buffer() -> None:
+    model = nn.Linear(4, 2)
+    monitor = GradientMonitor(model, capacity=2)
+    assert monitor.latest() == {}
+    for step in range(3):
+        model.zero_grad()
+        model(torch.ones(1, 4)).sum().mul(step + 1).backward()
+        monitor.on_step(first_of_epoch=True)
+    steps, norms = monitor.history()
+    assert steps.tolist() == [2, 3]
+    assert monitor.latest()["bias"] == pytest.approx(norms[-1, 1].item())
+    assert monitor.latest()["bias"] == pytest.approx(3 * 2**0.5)
+    with pytest.raises(ValueError):
+        GradientMonitor(model, interval=-1)
+
+
+def test_gradient_monitor_warns_without_gradients(caplog: pytest.LogCaptureFixture) -> None:
+    model = nn.Linear(4, 2)
+    monitor = GradientMonitor(model)
+    with caplog.at_level(logging.WARNING):
+        monitor.on_step(first_of_epoch=True)
+    assert "No gradients" in caplog.text
+    assert monitor.samples == 0
+    model.bias.grad = torch.ones(2)
+    monitor.record()
+    assert monitor.latest() == {"bias": pytest.approx(2**0.5)}
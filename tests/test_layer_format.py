@@ -0,0 +1,67 @@
+import struct
+import sys
+
+import pytest
+import torch
+from torch import nn
+
+from royalflush.message.layer_format import BinaryLayerFormat, PickleLayerFormat, get_layer_format
+
+
+def build_layers() -> dict[str, torch.Tensor]:
+    layers = dict(nn.Linear(10, 5).state_dict())
+    layers["half"] = torch.randn(3, 4).half()
+    layers["bfloat"] = torch.randn(7).bfloat16()
+    layers["counter"] = torch.tensor(12, dtype=torch.int64)
+    layers["mask"] = torch.tensor([True, False, True])
+    layers["empty"] = torch.empty((0, 3))
+    layers["transposed"] = torch.randn(4, 6).t()
+    return layers
+
+
+def test_binary_round_trip() -> None:
+    layers = build_layers()
+    fmt = BinaryLayerFormat()
+    decoded = fmt.decode(fmt.encode(layers))
+    assert list(decoded.keys()) == list(layers.keys())
+    for key, tensor in layers.items():
+        assert decoded[key].dtype == tensor.dtype, f"Dtype of '{key}' does not match."
+        assert decoded[key].shape == tensor.shape, f"Shape of '{key}' does not match."
+        assert torch.equal(decoded[key], tensor), f"Values of '{key}' do not match."
+
+
+def test_binary_decoded_tensors_are_views_of_the_payload() -> None:
+    fmt = BinaryLayerFormat()
+    payload = bytearray(fmt.encode({"weight": torch.zeros(8)}))
+    decoded = fmt.decode(payload)
+    decoded["weight"] += 1
+    assert torch.equal(fmt.decode(payload)["weight"], torch.ones(8))
+
+
+def test_binary_payload_is_little_endian_on_big_endian_hosts(monkeypatch: pytest.MonkeyPatch) -> None:
+    layers = build_layers()
+    fmt = BinaryLayerFormat()
+    native = bytes(fmt.encode({"value": torch.tensor([1.5])}))
+    assert struct.pack("<f", 1.5) in native
+    monkeypatch.setattr(sys, "byteorder", "big" if sys.byteorder == "little" else "little")
+    # The host order is faked, so the payload is written and read in the opposite order of the native one
+    swapped = bytes(fmt.encode({"value": torch.tensor([1.5])}))
+    assert struct.pack(">f", 1.5) in swapped
+    decoded = fmt.decode(fmt.encode(layers))
+    for key, tensor in layers.items():
+        assert torch.equal(decoded[key], tensor), f"Values of '{key}' do not match."
+
+
+def test_binary_smaller_than_pickle() -> None:
+    layers = dict(nn.Linear(256, 128).state_dict())
+    assert len(BinaryLayerFormat().encode(layers)) < len(PickleLayerFormat().encode(layers))
+
+
+def test_get_layer_format() -> None:
+    assert isinstance(get_layer_format("BINARY"), BinaryLayerFormat)
+    assert isinstance(get_layer_format("pickle"), PickleLayerFormat)
+    try:
+        get_layer_format("protobuf")
+        assert False, "An invalid layer format must raise an error."
+    except NotImplementedError:
+        pass
@@ -1,9 +1,11 @@
 import random
 import sys
+from pathlib import Path
 
 import spade
 from aioxmpp import JID
 
+from royalflush._commands.analyze_logs import load_run_dataset
 from royalflush.datatypes import ModelMetrics
 from royalflush.log import (
     AlgorithmLogManager,
@@ -74,3 +76,16 @@ def test_fill_logs():
         algorithm_logger.log(current_round=100 + i, agent=sender, seconds=random.random() * 100)
     general_logger.info(f"Handlers: {algorithm_logger.logger.handlers}")
     general_logger.info(f"Effective Level: {algorithm_logger.logger.getEffectiveLevel()}")
+
+
+def test_analyzer_merges_the_logs_of_the_shards(tmp_path: Path) -> None:
+    header = "agent,timestamp,description,algorithm_round,layer,weight,weight_id\n"
+    (tmp_path / "nn_convergence.csv").write_text(header, encoding="utf-8")  # Main process without agents
+    for shard in range(2):
+        (tmp_path / f"nn_convergence.shard{shard}.csv").write_text(
+            header + f"a{shard}@localhost,2025-01-01T00:00:0{shard}Z,PRE-TRAIN,1,fc.weight,0.5,-1\n",
+            encoding="utf-8",
+        )
+    data = load_run_dataset(tmp_path, "nn_convergence")
+    assert sorted(data["agent"]) == ["a0@localhost", "a1@localhost"]
+    assert load_run_dataset(tmp_path, "nn_train").empty
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+import torch
+from aioxmpp import JID
+from spade.template import Template
+
+from royalflush._agent.premiofl.macofl import MacoflAgent
+from royalflush.datatypes.consensus import Consensus
+from royalflush.message.loopback import LOOPBACK_TRANSPORT
+from royalflush.similarity.function import EuclideanDistanceFunction
+from royalflush.similarity.similarity_manager import SimilarityManager
+from royalflush.similarity.similarity_vector import SimilarityVector
+
+from .test_flat_state import build_consensus_manager
+
+
+def build_agent(localpart: str, transport: str = "loopback") -> MacoflAgent:
+    consensus_manager = build_consensus_manager(batched_consensus=False)
+    agent = MacoflAgent(
+        jid=f"{localpart}@localhost",
+        password="123",
+        max_message_size=1_000,
+        consensus_manager=consensus_manager,
+        model_manager=consensus_manager.model_manager,
+        similarity_manager=SimilarityManager(consensus_manager.model_manager, function=EuclideanDistanceFunction()),
+        transport=transport,
+    )
+    agent.add_behaviour(agent.layer_receiver_behaviour, Template(metadata={"rf.conversation": "layers"}))
+    agent.add_behaviour(agent.similarity_receiver_behaviour, Template(metadata={"rf.conversation": "similarity"}))
+    LOOPBACK_TRANSPORT.register(agent)
+    return agent
+
+
+@pytest.fixture(autouse=True)
+def reset_loopback_transport():
+    yield
+    LOOPBACK_TRANSPORT.reset()
+
+
+def test_messages_are_routed_by_template() -> None:
+    sender, receiver = build_agent("sender"), build_agent("receiver")
+    neighbour = JID.fromstr("receiver@localhost")
+    assert sender.is_loopback_reachable(neighbour)
+    assert not sender.is_loopback_reachable(JID.fromstr("remote@localhost"))
+    assert not build_agent("xmpp", transport="xmpp").is_loopback_reachable(neighbour)
+
+    async def send() -> None:
+        await sender.send_similarity_vector(
+            neighbour=neighbour, vector=SimilarityVector(vector={}), metadata={"rf.conversation": "similarity"}
+        )
+        await asyncio.sleep(0.01)
+
+    asyncio.run(send())
+    assert LOOPBACK_TRANSPORT.delivered == 1
+    assert receiver.similarity_receiver_behaviour.mailbox_size() == 1
+    assert receiver.layer_receiver_behaviour.mailbox_size() == 0
+    with pytest.raises(NotImplementedError):
+        build_agent("invalid", transport="tcp")
+
+
+def test_layers_are_delivered_as_snapshots() -> None:
+    sender, receivers = build_agent("sender"), [build_agent("receiver0"), build_agent("receiver1")]
+    bias = sender.model_manager.get_layers(["3.bias"])["3.bias"]
+    expected = bias.clone()
+
+    async def exchange() -> list[Consensus]:
+        for receiver in receivers:
+            await sender.send_local_layers(
+                neighbour=receiver.jid,
+                request_reply=False,
+                layers={"3.bias": bias},
+                metadata={"rf.conversation": "layers"},
+            )
+        with torch.no_grad():
+            bias.add_(1)  # Training after sending does not modify the layers received
+        await asyncio.sleep(0.01)
+        for receiver in receivers:
+            await receiver.layer_receiver_behaviour.run()
+        return [ct for receiver in receivers for ct in receiver.consensus_manager.received_consensus.pop_all()]
+
+    received = asyncio.run(exchange())
+    assert len(received) == 2
+    for ct in received:
+        assert ct.sender == sender.jid.bare()
+        assert torch.equal(ct.layers["3.bias"], expected)
+    # The neighbours share one snapshot per model version
+    assert received[0].layers["3.bias"] is received[1].layers["3.bias"]
+    assert received[0].layers["3.bias"].data_ptr() != bias.data_ptr()
+
+
+def test_loopback_message_size_is_the_size_of_the_tensors() -> None:
+    layers = {"weight": torch.zeros(4, 3), "bias": torch.zeros(3, dtype=torch.float16)}
+    consensus = Consensus(layers=layers, sparse_indices={"weight": torch.arange(2, dtype=torch.int32)})
+    message = consensus.to_loopback_message()
+    assert message.body == ""
+    assert Consensus.get_message_size(message) == 4 * 3 * 4 + 3 * 2 + 2 * 4
+    assert Consensus.get_message_size(consensus.to_message()) == len(consensus.to_message().body)
@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+import pytest
+import torch
+
+from royalflush.datatypes.metrics import MetricsAccumulator, ModelMetrics
+
+
+def test_accumulator_matches_the_metrics_of_the_labels() -> None:
+    torch.manual_seed(13)
+    now = datetime.now(tz=timezone.utc)
+    accumulator = MetricsAccumulator()
+    true_labels: list[int] = []
+    predicted_labels: list[int] = []
+    total_loss = 0.0
+    for _ in range(5):
+        outputs = torch.randn(8, 6)
+        labels = torch.randint(0, 4, (8,))  # Classes 4 and 5 are only predicted
+        loss = torch.rand(())
+        accumulator.update(outputs=outputs, labels=labels, loss=loss)
+        true_labels.extend(labels.tolist())
+        predicted_labels.extend(outputs.argmax(dim=1).tolist())
+        total_loss += loss.item()
+    # The padding of a masked batch is not counted
+    outputs, labels = torch.randn(4, 6), torch.randint(0, 4, (4,))
+    accumulator.update(outputs=outputs, labels=labels, loss=torch.tensor(0.5), mask=torch.tensor([1.0, 1.0, 0, 0]))
+    true_labels.extend(labels[:2].tolist())
+    predicted_labels.extend(outputs[:2].argmax(dim=1).tolist())
+    total_loss += 0.5
+
+    expected = ModelMetrics.compute_metrics(
+        true_labels=true_labels,
+        predicted_labels=predicted_labels,
+        total_loss=total_loss,
+        num_batches=6,
+        start_time_z=now,
+        end_time_z=now,
+    )
+    metrics = accumulator.compute(start_time_z=now, end_time_z=now)
+    assert accumulator.confusion_matrix is not None
+    assert int(accumulator.confusion_matrix.sum()) == len(true_labels)
+    assert metrics.accuracy == pytest.approx(expected.accuracy)
+    assert metrics.loss == pytest.approx(expected.loss)
+    assert metrics.precision == pytest.approx(expected.precision)
+    assert metrics.recall == pytest.approx(expected.recall)
+    assert metrics.f1_score == pytest.approx(expected.f1_score)
+    assert accumulator.compute(start_time_z=now, end_time_z=now, num_batches=3).loss == pytest.approx(2 * metrics.loss)
+
+    with pytest.raises(ValueError):
+        MetricsAccumulator().compute(start_time_z=now, end_time_z=now)
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import torch
+from torch import Tensor, nn
+from torch.optim import SGD
+from torch.utils.data import DataLoader, TensorDataset
+
+from royalflush.datatypes.compiled_forward import COMPILED_FORWARD_CACHE
+from royalflush.datatypes.data import DataLoaders
+from royalflush.datatypes.models import ModelManager
+
+
+class RecordingLoss(nn.CrossEntropyLoss):
+    """Cross entropy that records the layers served by the model manager during the training."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.model_manager: None | ModelManager = None
+        self.served: list[tuple[bool, Tensor]] = []
+        self.threads: set[str] = set()
+        self.delay = 0.0
+
+    def forward(self, input: Tensor, target: Tensor) -> Tensor:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        if self.model_manager is not None:
+            self.served.append(
+                (
+                    self.model_manager.can_serve_layers(),
+                    self.model_manager.get_published_layers(["weight"])["weight"].clone(),
+                )
+            )
+        return super().forward(input, target)
+
+
+def build_model_manager(
+    double_buffered: bool, training_executor: str = "inline", mixed_precision: str = "fp32", compile_model: bool = False
+) -> tuple[ModelManager, RecordingLoss]:
+    torch.manual_seed(13)
+    model = nn.Linear(8, 2)
+    dataloader = DataLoader(TensorDataset(torch.randn(16, 8), torch.randint(0, 2, (16,))), batch_size=4)
+    criterion = RecordingLoss()
+    model_manager = ModelManager(
+        model=model,
+        criterion=criterion,
+        optimizer=SGD(model.parameters(), lr=0.5),
+        batch_size=4,
+        training_epochs=1,
+        dataloaders=DataLoaders(train=dataloader, validation=dataloader, test=dataloader),
+        device="cpu",
+        double_buffered=double_buffered,
+        training_executor=training_executor,
+        mixed_precision=mixed_precision,
+        compile_model=compile_model,
+    )
+    criterion.model_manager = model_manager
+    return model_manager, criterion
+
+
+def test_double_buffered_serves_the_published_snapshot_while_training() -> None:
+    model_manager, criterion = build_model_manager(double_buffered=True)
+    initial_weight = model_manager.get_layers(["weight"])["weight"].clone()
+    model_manager.train()
+    assert len(criterion.served) == 4
+    for can_serve, weight in criterion.served:
+        assert can_serve
+        assert torch.equal(weight, initial_weight)
+    assert not torch.equal(model_manager.get_published_layers(["weight"])["weight"], initial_weight)
+    assert torch.equal(
+        model_manager.get_published_layers(["weight"])["weight"], model_manager.get_layers(["weight"])["weight"]
+    )
+
+
+def test_single_buffered_does_not_serve_while_training() -> None:
+    model_manager, criterion = build_model_manager(double_buffered=False)
+    model_manager.train()
+    assert [can_serve for can_serve, _ in criterion.served] == [False] * 4
+    assert not model_manager.published_layers
+    assert model_manager.can_serve_layers()
+
+
+def test_thread_executor_keeps_the_event_loop_running() -> None:
+    model_manager, criterion = build_model_manager(double_buffered=True, training_executor="thread")
+    criterion.delay = 0.05
+
+    async def train() -> tuple[int, int]:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        metrics = await model_manager.run_in_executor(model_manager.train)
+        ticker.cancel()
+        return len(metrics), ticks
+
+    epochs, ticks = asyncio.run(train())
+    assert epochs == 1
+    assert ticks >= 5
+    assert all(name.startswith("rf-train") for name in criterion.threads)
+    assert not model_manager.is_training()
+    assert asyncio.run(model_manager.run_in_executor(model_manager.inference)).accuracy >= 0
+    with pytest.raises(NotImplementedError):
+        build_model_manager(double_buffered=False, training_executor="process")
+
+
+def test_training_session_is_opened_before_the_executor_starts() -> None:
+    model_manager, _ = build_model_manager(double_buffered=False, training_executor="thread")
+    version = model_manager.version
+
+    async def train() -> list[bool]:
+        served: list[bool] = []
+        with model_manager.training_session():
+            future = asyncio.ensure_future(model_manager.run_in_executor(model_manager.train))
+            served.append(model_manager.can_serve_layers())  # Before the executor runs the training
+            await future
+            served.append(model_manager.can_serve_layers())
+        served.append(model_manager.can_serve_layers())
+        return served
+
+    assert asyncio.run(train()) == [False, False, True]
+    assert not model_manager.is_training()
+    assert model_manager.version == version + 2  # The nested session of train does not increment the version
+
+
+def test_bf16_autocast_keeps_the_weights_in_fp32() -> None:
+    model_manager, criterion = build_model_manager(double_buffered=False, mixed_precision="bf16")
+    reference, _ = build_model_manager(double_buffered=False)
+    dtypes: list[torch.dtype] = []
+    model_manager.model.register_forward_hook(lambda module, inputs, output: dtypes.append(output.dtype))
+    metrics = model_manager.train()
+    reference_metrics = reference.train()
+    assert set(dtypes) == {torch.bfloat16}
+    assert len(criterion.served) == 4
+    assert model_manager.model.weight.dtype == torch.float32
+    assert torch.allclose(model_manager.model.weight, reference.model.weight, atol=0.05)
+    assert metrics[0].loss == pytest.approx(reference_metrics[0].loss, abs=0.05)
+    assert model_manager.inference().accuracy >= 0
+    with pytest.raises(NotImplementedError):
+        build_model_manager(double_buffered=False, mixed_precision="fp8")
+
+
+def test_compiled_models_share_the_compiled_forward() -> None:
+    COMPILED_FORWARD_CACHE.clear()
+    compiled = [build_model_manager(double_buffered=False, compile_model=True)[0] for _ in range(2)]
+    reference, _ = build_model_manager(double_buffered=False)
+    for model_manager in compiled:
+        model_manager.train()
+    reference.train()
+    assert len(COMPILED_FORWARD_CACHE) == 1  # One architecture in training mode
+    for model_manager in compiled:
+        assert torch.allclose(model_manager.model.weight, reference.model.weight, atol=1e-6)
+        assert model_manager.flat_state.is_bound()
+    assert compiled[0].inference().loss == pytest.approx(reference.inference().loss, abs=1e-5)
+    assert len(COMPILED_FORWARD_CACHE) == 2
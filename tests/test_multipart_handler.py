@@ -1,5 +1,7 @@
+import copy
 import math
 import random
+import time
 
 import torch
 from spade.message import Message
@@ -82,3 +84,159 @@ def test_model_message_transmission() -> None:
         assert torch.allclose(
             model.initial_state[key], model_reconstruct[key]
         ), f"Reconstructed '{key}' tensor does not match the initial model"
+
+
+def test_parse_header() -> None:
+    mh = MultipartHandler()
+    header = mh.parse_header("multipart#3/12#1234-abcd|content|with#tokens")
+    assert header.part_number == 3
+    assert header.total_parts == 12
+    assert header.uuid4 == "1234-abcd"
+    assert "multipart#3/12#1234-abcd|content|with#tokens"[header.content_start :] == "content|with#tokens"
+
+
+def test_duplicated_parts_and_completion() -> None:
+    mh_sender = MultipartHandler()
+    mh_dest = MultipartHandler()
+    original_content = "".join(str(i) for i in range(200))
+    msg = Message(to="dest", sender="sender", body=original_content)
+
+    msgs = mh_sender.generate_multipart_messages(
+        content=original_content, max_size=50 + mh_sender.metadata_header_size, message_base=msg
+    )
+    assert msgs is not None
+
+    # A duplicated part must not complete the transfer
+    assert mh_dest.rebuild_multipart(copy.deepcopy(msgs[0])) is None
+    assert mh_dest.rebuild_multipart(copy.deepcopy(msgs[0])) is None
+    assert mh_dest.is_multipart_complete(msgs[0]) is False
+    results = [mh_dest.rebuild_multipart(m) for m in msgs[1:]]
+    assert all(result is None for result in results[:-1])
+    assert results[-1] is not None and results[-1].body == original_content
+    assert not mh_dest.any_multipart_waiting()
+
+
+def generate_messages(mh: MultipartHandler, content: str, part_size: int) -> list[Message]:
+    msg = Message(to="dest", sender="sender", body=content)
+    msgs = mh.generate_multipart_messages(
+        content=content, max_size=part_size + mh.metadata_header_size, message_base=msg
+    )
+    assert msgs is not None
+    return msgs
+
+
+def test_expired_transfers_are_removed() -> None:
+    mh_sender = MultipartHandler()
+    mh_dest = MultipartHandler(transfer_ttl=60)
+    msgs = generate_messages(mh_sender, "x" * 100, part_size=10)
+    assert mh_dest.rebuild_multipart(msgs[0]) is None
+    assert mh_dest.get_stats()["stored_size"] == 10
+    assert mh_dest.remove_expired_transfers(now=time.monotonic() + 30) == 0
+    assert mh_dest.remove_expired_transfers(now=time.monotonic() + 61) == 1
+    assert not mh_dest.any_multipart_waiting()
+    assert mh_dest.get_stats()["stored_size"] == 0
+    assert mh_dest.get_stats()["expired_transfers"] == 1
+
+
+def test_least_recently_updated_transfers_are_evicted() -> None:
+    mh_sender = MultipartHandler()
+    mh_dest = MultipartHandler(max_stored_size=35)
+    transfers = [generate_messages(mh_sender, str(i) * 100, part_size=10) for i in range(3)]
+    mh_dest.rebuild_multipart(transfers[0][0])
+    mh_dest.rebuild_multipart(transfers[1][0])
+    mh_dest.rebuild_multipart(transfers[0][1])  # The first transfer is now the most recently updated
+    mh_dest.rebuild_multipart(transfers[2][0])  # Exceeds the maximum, the second transfer is evicted
+    stats = mh_dest.get_stats()
+    assert stats["evicted_transfers"] == 1 and stats["waiting_transfers"] == 2 and stats["stored_size"] == 30
+    for msg in transfers[0][2:]:
+        result = mh_dest.rebuild_multipart(msg)  # The third transfer is evicted
+    assert result is not None and result.body == "0" * 100
+    stats = mh_dest.get_stats()
+    assert stats["completed_transfers"] == 1 and stats["evicted_transfers"] == 2 and stats["stored_size"] == 0
+
+
+def test_retransmission_of_missing_parts() -> None:
+    mh_sender = MultipartHandler()
+    mh_dest = MultipartHandler(nack_deadline=1, max_nacks=2)
+    msgs = generate_messages(mh_sender, "".join(str(i) for i in range(100)), part_size=20)
+    for i, msg in enumerate(msgs):
+        if i not in [1, 3]:  # Lost parts
+            mh_dest.rebuild_multipart(copy.deepcopy(msg))
+
+    assert not mh_dest.get_missing_parts_to_request()  # Before the deadline
+    requests = mh_dest.get_missing_parts_to_request(now=time.monotonic() + 1)
+    assert len(requests) == 1
+    sender, uuid4, missing_parts = requests[0]
+    assert str(sender) == "sender" and missing_parts == [2, 4]
+    assert not mh_dest.get_missing_parts_to_request(now=time.monotonic() + 1.5)  # Already requested
+
+    nack = mh_dest.generate_nack_message(to=sender, uuid4=uuid4, part_numbers=missing_parts)
+    assert nack.get_metadata("rf.multipart") == "nack"
+    nack_uuid4, nack_parts = MultipartHandler.parse_nack_message(nack)
+    result = None
+    for msg in mh_sender.get_sent_parts(uuid4=nack_uuid4, part_numbers=nack_parts):
+        result = mh_dest.rebuild_multipart(msg)
+    assert result is not None and result.body == "".join(str(i) for i in range(100))
+    assert mh_sender.get_stats()["retransmitted_parts"] == 2
+
+    # Late duplicated parts of a completed transfer are ignored
+    assert mh_dest.rebuild_multipart(copy.deepcopy(msgs[1])) is None
+    assert not mh_dest.any_multipart_waiting()
+
+
+def test_sent_cache_expires() -> None:
+    mh_sender = MultipartHandler(sent_cache_ttl=0)
+    msgs = generate_messages(mh_sender, "x" * 100, part_size=10)
+    uuid4 = mh_sender.parse_header(msgs[0].body).uuid4
+    time.sleep(0.01)
+    assert not mh_sender.get_sent_parts(uuid4=uuid4, part_numbers=[1])
+
+
+def test_sent_cache_is_bounded_by_size() -> None:
+    mh_sender = MultipartHandler(max_sent_cache_bytes=250)
+    transfers = [generate_messages(mh_sender, str(i) * 100, part_size=10) for i in range(3)]
+    uuid4s = [mh_sender.parse_header(msgs[0].body).uuid4 for msgs in transfers]
+    assert mh_sender.get_stats()["sent_cache_size"] == 200  # The oldest transfer is removed
+    assert not mh_sender.get_sent_parts(uuid4=uuid4s[0], part_numbers=[1])
+    assert mh_sender.get_sent_parts(uuid4=uuid4s[2], part_numbers=[1])
+    # A transfer larger than the maximum is kept until the next one
+    generate_messages(mh_sender, "x" * 300, part_size=10)
+    assert mh_sender.get_stats()["sent_cache_size"] == 300
+
+
+def test_nack_requests_gaps_before_the_tail() -> None:
+    mh_sender = MultipartHandler()
+    mh_dest = MultipartHandler(nack_deadline=1, max_nacks=3)
+    msgs = generate_messages(mh_sender, "x" * 100, part_size=10)
+    for i, msg in enumerate(msgs[:6]):
+        if i != 2:
+            mh_dest.rebuild_multipart(msg)
+    now = time.monotonic()
+    # The tail of the transfer could still be on its way, only the gap is requested
+    assert [parts for _, _, parts in mh_dest.get_missing_parts_to_request(now=now + 1)] == [[3]]
+    mh_dest.rebuild_multipart(copy.deepcopy(msgs[2]))
+    assert not mh_dest.get_missing_parts_to_request(now=now + 2)
+    # Without gaps, the tail is requested after twice the deadline since the last NACK, doubled after every NACK
+    assert not mh_dest.get_missing_parts_to_request(now=now + 4.5)
+    assert [parts for _, _, parts in mh_dest.get_missing_parts_to_request(now=now + 5.1)] == [[7, 8, 9, 10]]
+
+
+def test_iter_multipart_messages_is_lazy() -> None:
+    mh_sender = MultipartHandler()
+    mh_dest = MultipartHandler()
+    content = "".join(str(i) for i in range(1000))
+    msg = Message(to="dest@localhost", sender="sender@localhost", body=content, thread="th")
+    msg.metadata = {"rf.conversation": "layers"}
+
+    messages = mh_sender.iter_multipart_messages(content=content, max_size=300, message_base=msg)
+    first = next(messages)
+    assert first.body.startswith("multipart#1/")
+    assert first.metadata is msg.metadata and first.thread == "th" and str(first.to) == "dest@localhost"
+    result = None
+    for m in [first] + list(messages):
+        assert len(m.body) <= 300
+        result = mh_dest.rebuild_multipart(m)
+    assert result is not None and result.body == content
+
+    # The content that does not exceed the maximum size is sent in the message base
+    assert list(mh_sender.iter_multipart_messages(content="small", max_size=300, message_base=msg)) == [msg]
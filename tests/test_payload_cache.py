@@ -0,0 +1,45 @@
+import pytest
+import torch
+from aioxmpp import JID
+from torch import nn
+
+from royalflush.datatypes.consensus import Consensus
+from royalflush.datatypes.payload_cache import PayloadCache
+from royalflush.message.precision import reduce_layers_precision
+
+SENDER = JID.fromstr("sender@localhost")
+
+
+def test_payload_reused_across_messages() -> None:
+    layers = {name: layer.clone() for name, layer in nn.Linear(16, 4).state_dict().items()}
+    reduced, quantization = reduce_layers_precision(layers, precision="int8")
+    payload = Consensus(layers=reduced, quantization=quantization).encode_payload(compression="zlib")
+    for request_reply in [True, False]:
+        message = Consensus(layers=layers, sender=SENDER, request_reply=request_reply).to_message(
+            compression="zlib", payload=payload
+        )
+        message.sender = str(SENDER)
+        received = Consensus.from_message(message)
+        assert received.request_reply == request_reply
+        assert received.quantization.keys() == layers.keys()
+        for name, layer in reduced.items():
+            assert torch.equal(received.layers[name], layer)
+    assert "sent_time_z" not in payload
+
+
+def test_payload_cache_hits_and_versions() -> None:
+    cache = PayloadCache(max_entries=2)
+    assert cache.get(version=0, key="a") is None
+    cache.put(version=0, key="a", payload={"layers": "a"})
+    cache.put(version=0, key="b", payload={"layers": "b"})
+    assert cache.get(version=0, key="a") == {"layers": "a"}
+    cache.put(version=0, key="c", payload={"layers": "c"})
+    assert cache.get(version=0, key="b") is None  # Least recently used
+    assert len(cache) == 2
+    cache.put(version=1, key="a", payload={"layers": "a1"})
+    assert len(cache) == 1
+    assert cache.get(version=0, key="a") is None
+    assert cache.get(version=1, key="a") == {"layers": "a1"}
+    assert (cache.hits, cache.misses) == (2, 3)
+    with pytest.raises(ValueError):
+        PayloadCache(max_entries=0)
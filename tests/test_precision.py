@@ -0,0 +1,88 @@
+import json
+
+import torch
+from aioxmpp import JID
+from torch import nn
+
+from royalflush.datatypes.consensus import Consensus
+from royalflush.datatypes.consensus_manager import ConsensusManager
+from royalflush.message.precision import (
+    check_layer_precision,
+    dequantize_int8,
+    quantize_int8,
+    reduce_layers_precision,
+)
+
+
+def build_layers() -> dict[str, torch.Tensor]:
+    layers = dict(nn.Sequential(nn.Conv2d(3, 8, 3), nn.BatchNorm2d(8), nn.Linear(16, 4)).state_dict())
+    layers["0.weight"][0] *= 100  # A channel with a much wider range than the others
+    return layers
+
+
+def test_quantize_int8_error() -> None:
+    tensor = torch.randn(16, 32)
+    for per_channel in [False, True]:
+        quantized, scale, zero_point = quantize_int8(tensor, per_channel=per_channel)
+        assert quantized.dtype == torch.int8
+        restored = dequantize_int8(quantized, scale=scale, zero_point=zero_point, dtype=torch.float32)
+        assert torch.all((restored - tensor).abs() <= scale / 2 + 1e-6)
+
+
+def test_quantize_int8_zero_is_exact() -> None:
+    tensor = torch.tensor([0.0, 0.5, 1.0, 3.0])
+    quantized, scale, zero_point = quantize_int8(tensor)
+    assert dequantize_int8(quantized, scale=scale, zero_point=zero_point, dtype=torch.float32)[0] == 0
+
+
+def test_per_channel_is_more_accurate() -> None:
+    layer = build_layers()["0.weight"]
+    errors = []
+    for per_channel in [False, True]:
+        quantized, scale, zero_point = quantize_int8(layer, per_channel=per_channel)
+        restored = dequantize_int8(quantized, scale=scale, zero_point=zero_point, dtype=torch.float32)
+        errors.append((restored - layer)[1:].abs().max())
+    assert errors[1] < errors[0]
+
+
+def test_reduce_layers_precision() -> None:
+    layers = build_layers()
+    reduced, quantization = reduce_layers_precision(layers, precision="fp32")
+    assert reduced is layers and not quantization
+    reduced, quantization = reduce_layers_precision(layers, precision="bf16")
+    assert reduced["0.weight"].dtype == torch.bfloat16 and not quantization
+    reduced, quantization = reduce_layers_precision(layers, precision="int8_channel")
+    assert reduced["0.weight"].dtype == torch.int8
+    assert reduced["1.num_batches_tracked"].dtype == torch.int64
+    assert "1.num_batches_tracked" not in quantization
+    assert quantization["0.weight"][0].shape == (8, 1, 1, 1)
+    assert quantization["2.bias"][0].shape == ()
+
+
+def test_consensus_with_reduced_precision() -> None:
+    layers = build_layers()
+    sender = JID.fromstr("sender@localhost")
+    for precision in ["fp16", "bf16", "int8", "int8_channel"]:
+        reduced, quantization = reduce_layers_precision(layers, precision=precision)
+        message = Consensus(layers=reduced, sender=sender, quantization=quantization).to_message()
+        message.sender = str(sender)
+        assert ("layers_quantization" in json.loads(message.body)) == precision.startswith("int8")
+        received = Consensus.from_message(message)
+        assert list(received.layers.keys()) == list(layers.keys())
+
+        model = ConsensusManager.apply_consensus_to_model_with_layers(
+            full_model=layers, layers=received.layers, max_order=2, quantization=received.quantization
+        )
+        for key, layer in layers.items():
+            if layer.is_floating_point():
+                assert model[key].dtype == layer.dtype
+                assert torch.allclose(model[key], layer, atol=0.5), f"Layer '{key}' with {precision}."
+
+
+def test_check_layer_precision() -> None:
+    assert check_layer_precision("FP16") == "fp16"
+    try:
+        check_layer_precision("int4")
+        assert False, "An invalid layer precision must raise an error."
+    except NotImplementedError:
+        pass
@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from aioxmpp import JID
+from torch import nn
+
+from royalflush.similarity.function import EuclideanDistanceFunction, OnesFunction
+from royalflush.similarity.similarity_manager import SimilarityManager
+from royalflush.similarity.similarity_vector import SimilarityVector
+
+from .test_flat_state import build_consensus_manager
+
+
+def build_similarity_manager() -> SimilarityManager:
+    model_manager = build_consensus_manager(batched_consensus=False).model_manager
+    return SimilarityManager(model_manager=model_manager, function=EuclideanDistanceFunction())
+
+
+def test_similarity_functions() -> None:
+    layers = nn.Linear(4, 2).state_dict()
+    assert OnesFunction().get_similarity_vector(layers, layers).vector == {"weight": 1, "bias": 1}
+    assert EuclideanDistanceFunction().get_similarity_vector(layers, layers).vector == {"weight": 0, "bias": 0}
+
+
+def test_wait_similarity_vectors_wakes_up_with_the_last_response() -> None:
+    manager = build_similarity_manager()
+    neighbours = [JID.fromstr(f"neighbour{i}@localhost") for i in range(3)]
+    manager.clear_waiting_responses(neighbours, thread="thread")
+
+    async def wait() -> tuple[bool, float]:
+        loop = asyncio.get_running_loop()
+        for i, neighbour in enumerate(neighbours):
+            vector = SimilarityVector(vector={"3.bias": float(i)})
+            loop.call_later(0.05 * (i + 1), manager.add_similarity_vector, neighbour, vector, "thread")
+        # Responses of other threads are stored but not awaited
+        manager.add_similarity_vector(neighbours[0], SimilarityVector(vector={}), "old-thread")
+        start = time.monotonic()
+        received = await manager.wait_similarity_vectors(timeout=10)
+        return received, time.monotonic() - start
+
+    received, elapsed = asyncio.run(wait())
+    assert received
+    assert 0.15 <= elapsed < 1
+    assert list(manager.response_latencies.keys()) == neighbours
+    assert manager.response_latencies[neighbours[0]] < manager.response_latencies[neighbours[2]]
+    assert manager.get_vector(neighbours[2]).vector == {"3.bias": 2.0}
+
+
+def test_wait_similarity_vectors_deadline() -> None:
+    manager = build_similarity_manager()
+    neighbours = [JID.fromstr(f"neighbour{i}@localhost") for i in range(2)]
+    manager.clear_waiting_responses(neighbours, thread="thread")
+    manager.add_similarity_vector(neighbours[0], SimilarityVector(vector={}), "thread")
+    start = time.monotonic()
+    assert not asyncio.run(manager.wait_similarity_vectors(timeout=0.2))
+    assert 0.2 <= time.monotonic() - start < 1
+    assert list(manager.waiting_responses.keys()) == [neighbours[1]]
+    assert list(manager.response_latencies.keys()) == [neighbours[0]]
@@ -0,0 +1,106 @@
+import pytest
+import torch
+from aioxmpp import JID
+from torch import nn
+from torch.optim import SGD
+from torch.utils.data import DataLoader, TensorDataset
+
+from royalflush._agent.agent_factory import create_experiment_agent
+from royalflush._agent.base import PremioFlAgent
+from royalflush.datatypes.consensus_manager import ConsensusManager
+from royalflush.datatypes.data import DataLoaders
+from royalflush.datatypes.models import ModelManager
+from royalflush.similarity.function import EuclideanDistanceFunction
+from royalflush.similarity.similarity_manager import SimilarityManager
+from royalflush.simulation.engine import NetworkModel, SimulationEngine
+from royalflush.simulation.simulator import PremioFlSimulation
+
+
+def build_consensus_manager() -> ConsensusManager:
+    torch.manual_seed(13)
+    model = nn.Sequential(nn.Linear(8, 16), nn.ReLU(), nn.Linear(16, 4))
+    dataloader = DataLoader(TensorDataset(torch.randn(8, 8), torch.randint(0, 4, (8,))), batch_size=4)
+    model_manager = ModelManager(
+        model=model,
+        criterion=nn.CrossEntropyLoss(),
+        optimizer=SGD(model.parameters(), lr=0.1),
+        batch_size=4,
+        training_epochs=1,
+        dataloaders=DataLoaders(train=dataloader, validation=dataloader, test=dataloader),
+        device="cpu",
+    )
+    return ConsensusManager(
+        model_manager=model_manager, max_order=2, max_seconds_to_accept_consensus=60, consensus_iterations=2
+    )
+
+
+def build_ring(algorithm: str, num_agents: int = 3, max_rounds: int = 3) -> list[PremioFlAgent]:
+    jids = [JID.fromstr(f"a{i}@localhost") for i in range(num_agents)]
+    agents: list[PremioFlAgent] = []
+    for i, jid in enumerate(jids):
+        consensus_manager = build_consensus_manager()
+        agents.append(
+            create_experiment_agent(
+                algorithm=algorithm,
+                jid=str(jid),
+                password="123",
+                max_message_size=1_000,
+                consensus_manager=consensus_manager,
+                model_manager=consensus_manager.model_manager,
+                similarity_manager=SimilarityManager(
+                    consensus_manager.model_manager,
+                    function=None if algorithm == "acol" else EuclideanDistanceFunction(),
+                ),
+                observers=[],
+                neighbours=[jids[(i - 1) % num_agents], jids[(i + 1) % num_agents]],
+                coordinator=JID.fromstr("coordinator@localhost"),
+                max_rounds=max_rounds,
+            )
+        )
+    return agents
+
+
+def test_engine_runs_the_events_in_order() -> None:
+    engine = SimulationEngine()
+    calls: list[tuple[str, float]] = []
+    engine.schedule(2, lambda: calls.append(("c", engine.now)))
+    engine.schedule(1, lambda: calls.append(("a", engine.now)))
+    engine.schedule(1, lambda: engine.schedule(0.5, lambda: calls.append(("b", engine.now))))
+    engine.schedule(5, lambda: calls.append(("cancelled", engine.now))).cancel()
+    assert engine.run() == 2
+    assert calls == [("a", 1), ("b", 1.5), ("c", 2)]
+    assert engine.processed == 4
+    with pytest.raises(ValueError):
+        engine.schedule(-1, lambda: None)
+
+    network = NetworkModel(latency=0.1, bandwidth=1_000)
+    assert network.transfer_seconds(500) == pytest.approx(0.6)
+    assert NetworkModel(latency=0.1).transfer_seconds(10**9) == 0.1
+    with pytest.raises(ValueError):
+        NetworkModel(bandwidth=0)
+
+
+@pytest.mark.parametrize("algorithm", ["acol", "macofl", "pmacofl_min", "pmacofl_max"])
+def test_simulation_runs_all_the_rounds(algorithm: str) -> None:
+    agents = build_ring(algorithm)
+    initial = [agent.model_manager.get_layers(["2.bias"], deepcopy_layers=True)["2.bias"] for agent in agents]
+    simulation = PremioFlSimulation(agents=agents, network=NetworkModel(latency=0.5, bandwidth=10_000))
+    seconds = simulation.run()
+    if algorithm == "acol":
+        assert seconds >= 0.5  # The agents do not wait for the replies, the last one arrives after the latency
+    else:
+        assert seconds >= 3 * 2 * 2 * 0.5  # Each consensus iteration waits for the similarity vector replies
+    assert len(simulation.engine) == 0
+    for agent, layer in zip(agents, initial):
+        assert simulation.nodes[agent.jid.bare()].finished
+        assert agent.current_round == 4
+        assert not torch.equal(agent.model_manager.get_layers(["2.bias"])["2.bias"], layer)
+    # All the models started from the same weights and the consensus keeps them close
+    assert all(
+        torch.allclose(
+            agents[0].model_manager.get_layers(["2.bias"])["2.bias"],
+            agent.model_manager.get_layers(["2.bias"])["2.bias"],
+            atol=0.5,
+        )
+        for agent in agents
+    )
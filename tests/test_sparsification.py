@@ -0,0 +1,166 @@
+import torch
+from aioxmpp import JID
+from torch import nn
+from torch.optim import SGD
+from torch.utils.data import DataLoader, TensorDataset
+
+from royalflush.datatypes.consensus import Consensus
+from royalflush.datatypes.consensus_manager import ConsensusManager
+from royalflush.datatypes.data import DataLoaders
+from royalflush.datatypes.models import ModelManager
+from royalflush.datatypes.sparsification import TopKSparsifier
+from royalflush.message.precision import reduce_layers_precision
+
+SENDER = JID.fromstr("sender@localhost")
+RECEIVER = JID.fromstr("receiver@localhost")
+
+
+def build_consensus_manager(model: nn.Module) -> ConsensusManager:
+    dataloader = DataLoader(TensorDataset(torch.randn(8, 64), torch.zeros(8, dtype=torch.int64)), batch_size=4)
+    model_manager = ModelManager(
+        model=model,
+        criterion=nn.CrossEntropyLoss(),
+        optimizer=SGD(model.parameters(), lr=0.1),
+        batch_size=4,
+        training_epochs=1,
+        dataloaders=DataLoaders(train=dataloader, validation=dataloader, test=dataloader),
+        device="cpu",
+    )
+    return ConsensusManager(model_manager=model_manager, max_order=2, max_seconds_to_accept_consensus=60)
+
+
+def transmit(
+    sparsifier: TopKSparsifier,
+    layers: dict[str, torch.Tensor],
+    precision: str = "fp32",
+    acknowledge: bool = True,
+) -> Consensus:
+    dtypes = {name: layer.dtype for name, layer in layers.items()}
+    sent, indices, base_version = sparsifier.sparsify(RECEIVER, layers)
+    sent, quantization = reduce_layers_precision(sent, precision=precision)
+    version = sparsifier.update_references(
+        RECEIVER, base_version, sent, indices, quantization=quantization, dtypes=dtypes
+    )
+    if acknowledge:
+        sparsifier.acknowledge(RECEIVER, version)
+    consensus = Consensus(
+        layers=sent,
+        sender=SENDER,
+        quantization=quantization,
+        sparse_indices=indices,
+        sparse_stream=True,
+        sparse_version=version,
+        sparse_base_version=base_version,
+    )
+    message = consensus.to_message()
+    message.sender = str(SENDER)
+    return Consensus.from_message(message)
+
+
+def acknowledge(sparsifier: TopKSparsifier, receiver: ConsensusManager) -> None:
+    # The receiver acknowledges the last version in a message sent back to the sender
+    reply = Consensus(
+        layers={}, sender=RECEIVER, sparse_acknowledged_version=receiver.get_sparse_acknowledgement(SENDER)
+    )
+    message = reply.to_message()
+    message.sender = str(RECEIVER)
+    sender = build_consensus_manager(nn.Linear(64, 32))
+    sender.sparsifier = sparsifier
+    sender.reconstruct_sparse_layers(Consensus.from_message(message))
+
+
+def test_first_exchange_is_dense() -> None:
+    sparsifier = TopKSparsifier(ratio=0.05)
+    layers = dict(nn.Linear(64, 2).state_dict())
+    sent, indices, base_version = sparsifier.sparsify(RECEIVER, layers)
+    assert not indices and base_version is None
+    version = sparsifier.update_references(RECEIVER, base_version, sent, indices)
+    sent, indices, base_version = sparsifier.sparsify(RECEIVER, layers)
+    assert not indices  # Not acknowledged yet
+    sparsifier.acknowledge(RECEIVER, version)
+    sent, indices, base_version = sparsifier.sparsify(RECEIVER, layers)
+    assert base_version == version
+    assert indices["weight"].numel() == sent["weight"].numel() == 7
+    assert "bias" not in indices  # 2 * k >= numel, sent dense
+
+
+def test_receiver_is_synchronized_with_sender() -> None:
+    model = nn.Linear(64, 32)
+    for precision in ["fp32", "fp16", "int8"]:
+        receiver = build_consensus_manager(nn.Linear(64, 32))
+        sparsifier = TopKSparsifier(ratio=0.05)
+        for _ in range(5):
+            with torch.no_grad():
+                model.weight.add_(torch.randn_like(model.weight) * 0.01)
+            consensus = transmit(sparsifier, dict(model.state_dict()), precision=precision, acknowledge=False)
+            assert receiver.reconstruct_sparse_layers(consensus)
+            acknowledge(sparsifier, receiver)
+            assert not consensus.sparse_indices
+            reference = sparsifier.references[str(RECEIVER)]
+            for name, layer in consensus.layers.items():
+                assert torch.allclose(layer, reference[name]), f"Layer '{name}' with {precision}."
+                layer.zero_()  # The consensus layers are copies of the references of the receiver
+
+
+def test_lost_message_does_not_desynchronize_the_receiver() -> None:
+    model = nn.Linear(64, 32)
+    receiver = build_consensus_manager(nn.Linear(64, 32))
+    sparsifier = TopKSparsifier(ratio=0.05)
+    for lost in [False, True, False, True, True, False]:
+        with torch.no_grad():
+            model.weight.add_(torch.randn_like(model.weight) * 0.01)
+        sent_layers = dict(model.state_dict())
+        consensus = transmit(sparsifier, sent_layers, acknowledge=False)
+        if lost:
+            continue
+        assert receiver.reconstruct_sparse_layers(consensus)
+        acknowledge(sparsifier, receiver)
+        # The sparse layers are deltas of the acknowledged references, which the receiver has
+        expected = sparsifier.references[str(RECEIVER)]
+        for name, layer in consensus.layers.items():
+            assert torch.allclose(layer, expected[name]), name
+
+
+def test_dense_layers_without_acknowledgement() -> None:
+    sparsifier = TopKSparsifier(ratio=0.05, cache_size=2)
+    layers = dict(nn.Linear(64, 2).state_dict())
+    transmit(sparsifier, layers)
+    assert transmit(sparsifier, layers, acknowledge=False).sparse_base_version == 0
+    assert transmit(sparsifier, layers, acknowledge=False).sparse_base_version is None
+
+
+def test_error_feedback_carries_dropped_updates() -> None:
+    sparsifier = TopKSparsifier(ratio=0.1)
+    layers = {"weight": torch.zeros(100)}
+    transmit(sparsifier, layers)
+    layers = {"weight": torch.linspace(1, 2, 100)}
+    for _ in range(10):
+        consensus = transmit(sparsifier, layers)
+    # After 10 exchanges of 10% of the entries, every update has been sent once
+    assert torch.equal(sparsifier.references[str(RECEIVER)]["weight"], layers["weight"])
+    assert consensus.layers["weight"].numel() == 10
+
+
+def test_sparse_message_is_smaller() -> None:
+    layers = dict(nn.Linear(256, 128).state_dict())
+    sparsifier = TopKSparsifier(ratio=0.01)
+    dense = transmit(sparsifier, layers)
+    sparse = transmit(sparsifier, layers)
+    dense_size = len(Consensus(layers=dense.layers).to_message().body)
+    sparse_size = len(Consensus(layers=sparse.layers, sparse_indices=sparse.sparse_indices).to_message().body)
+    assert sparse_size * 10 < dense_size
+
+
+def test_sparse_layer_without_reference_is_ignored() -> None:
+    receiver = build_consensus_manager(nn.Linear(64, 32))
+    consensus = Consensus(
+        layers={"weight": torch.ones(3)},
+        sender=SENDER,
+        sparse_indices={"weight": torch.tensor([0, 1, 2], dtype=torch.int32)},
+        sparse_stream=True,
+        sparse_version=3,
+        sparse_base_version=2,
+    )
+    assert not receiver.reconstruct_sparse_layers(consensus)
+    assert not consensus.layers
+    assert receiver.get_sparse_acknowledgement(SENDER) is None
@@ -0,0 +1,71 @@
+import pytest
+import torch
+from torch import nn
+from torch.optim import SGD, Adam
+from torch.utils.data import DataLoader, TensorDataset
+
+from royalflush.datatypes.data import DataLoaders
+from royalflush.datatypes.models import ModelManager
+from royalflush.nn.stacked_trainer import StackedTrainer
+
+
+def build_model_manager(seed: int, samples: int, model: None | nn.Module = None) -> ModelManager:
+    torch.manual_seed(seed)
+    model = nn.Sequential(nn.Linear(8, 16), nn.ReLU(), nn.Linear(16, 4)) if model is None else model
+    dataloader = DataLoader(
+        TensorDataset(torch.randn(samples, 8), torch.randint(0, 4, (samples,))), batch_size=4, shuffle=False
+    )
+    return ModelManager(
+        model=model,
+        criterion=nn.CrossEntropyLoss(),
+        optimizer=Adam(model.parameters(), lr=1e-2, weight_decay=1e-3),
+        batch_size=4,
+        training_epochs=2,
+        dataloaders=DataLoaders(train=dataloader, validation=dataloader, test=dataloader),
+        device="cpu",
+    )
+
+
+def test_stacked_training_matches_sequential_training() -> None:
+    samples = [16, 10, 6]  # Shards with a partial last batch and fewer batches than the others
+    sequential = [build_model_manager(seed=i, samples=n) for i, n in enumerate(samples)]
+    stacked = [build_model_manager(seed=i, samples=n) for i, n in enumerate(samples)]
+    sequential[0].train(epochs=1)
+    stacked[0].train(epochs=1)  # The models start with a different number of Adam steps
+
+    expected = [model_manager.train() for model_manager in sequential]
+    versions = [model_manager.version for model_manager in stacked]
+    metrics = StackedTrainer(stacked).train()
+
+    for reference, model_manager, reference_metrics, model_metrics in zip(sequential, stacked, expected, metrics):
+        for (name, reference_param), param in zip(reference.model.named_parameters(), model_manager.model.parameters()):
+            assert torch.allclose(reference_param, param, atol=1e-5), name
+            reference_state = reference.optimizer.state[reference_param]
+            state = model_manager.optimizer.state[param]
+            assert float(reference_state["step"]) == float(state["step"])
+            assert torch.allclose(reference_state["exp_avg"], state["exp_avg"], atol=1e-6)
+        assert [m.loss for m in model_metrics] == pytest.approx([m.loss for m in reference_metrics], abs=1e-5)
+        assert [m.accuracy for m in model_metrics] == [m.accuracy for m in reference_metrics]
+    # The parameters are still views of the flat buffers and the versions are updated
+    assert all(model_manager.flat_state.is_bound() for model_manager in stacked)
+    assert all(m.version == v + 2 for m, v in zip(stacked, versions))
+    assert not any(model_manager.is_training() for model_manager in stacked)
+
+    # The model managers keep training with their own optimizer
+    sequential[1].train(epochs=1)
+    stacked[1].train(epochs=1)
+    for reference_param, param in zip(sequential[1].model.parameters(), stacked[1].model.parameters()):
+        assert torch.allclose(reference_param, param, atol=1e-5)
+
+
+def test_stacked_trainer_rejects_different_models() -> None:
+    with pytest.raises(ValueError):
+        StackedTrainer([])
+    with pytest.raises(ValueError):
+        StackedTrainer([build_model_manager(0, 8), build_model_manager(1, 8, model=nn.Sequential(nn.Linear(8, 4)))])
+    with pytest.raises(ValueError):
+        StackedTrainer([build_model_manager(0, 8, model=nn.Sequential(nn.Linear(8, 4), nn.BatchNorm1d(4)))])
+    model_manager = build_model_manager(0, 8)
+    model_manager.optimizer = SGD(model_manager.model.parameters(), lr=0.1)
+    with pytest.raises(NotImplementedError):
+        StackedTrainer([model_manager])
@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import torch
+
+from royalflush.utils.training_scheduler import TrainingScheduler
+
+
+def test_split_cpus() -> None:
+    assert TrainingScheduler.split_cpus([0, 1, 2, 3, 4], 2) == [[0, 1, 2], [3, 4]]
+    assert TrainingScheduler.split_cpus([4, 5], 3) == [[4], [5], [4]]
+
+
+def test_trainings_run_in_the_slots_with_their_budget() -> None:
+    scheduler = TrainingScheduler()
+    cpus = TrainingScheduler.get_available_cpus()[:1]
+    scheduler.configure(max_concurrent=2, threads=1, cpu_affinity=True, cpus=cpus)
+    lock = threading.Lock()
+    running, peak = 0, 0
+
+    def train(seconds: float) -> tuple[int, set[int]]:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(seconds)
+        with lock:
+            running -= 1
+        return torch.get_num_threads(), os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else set(cpus)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda i: scheduler.run(f"a{i}", train, seconds=0.05), range(4)))
+    assert peak == 2
+    assert scheduler.waits >= 1
+    assert scheduler.runs == 4
+    assert all(result == (1, set(cpus)) for result in results)
+
+    scheduler.reset()
+    assert scheduler.run("a0", lambda: 42) == 42
+
+
+def test_invalid_configuration() -> None:
+    scheduler = TrainingScheduler()
+    with pytest.raises(ValueError):
+        scheduler.configure(max_concurrent=0)
+    with pytest.raises(ValueError):
+        scheduler.configure(threads=-1)
+    with pytest.raises(ValueError):
+        scheduler.configure(cpu_affinity=True)
+
+
+def test_thread_budget_and_affinity_are_restored_after_the_training() -> None:
+    scheduler = TrainingScheduler()
+    available = TrainingScheduler.get_available_cpus()
+    scheduler.configure(max_concurrent=1, threads=1, cpu_affinity=True, cpus=available[:1])
+    threads = torch.get_num_threads()
+    affinity = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+
+    def train() -> None:
+        raise RuntimeError("Training failed")
+
+    with pytest.raises(RuntimeError):
+        scheduler.run("a", train)
+    assert torch.get_num_threads() == threads
+    if affinity is not None:
+        assert os.sched_getaffinity(0) == affinity